@@ -4,7 +4,6 @@ import sys
 import configparser
 import threading
 import time
-from lib.utilities.mouse import pixel as _pixel
 import subprocess
 import win32com.client
 import requests
@@ -93,7 +92,10 @@ from lib.monitors.resource_monitor import resource_monitor
 # from lib.monitors.dynamic_object_monitor import dynamic_object_monitor
 from lib.monitors.storm_monitor import storm_monitor
 from lib.monitors.bloom_monitor import bloom_monitor
+from lib.monitors.health_monitor import health_shield_monitor
+from lib.monitors.lobby_monitor import lobby_status_monitor
 from lib.monitors.match_event_monitor import match_event_monitor
+from lib.monitors.scheduler import shutdown_monitor_scheduler
 from lib.monitors.fa11y_ow_announcer import announcer as fa11y_ow_announcer
 from lib.utilities.fa11y_ow_client import client as fa11y_ow_client
 from lib.utilities.fa11y_ow_calibration import calibrate_fa11y_ow_position
@@ -257,8 +259,11 @@ def signal_handler(signum, frame):
         # dynamic_object_monitor.stop_monitoring()
         storm_monitor.stop_monitoring()
         bloom_monitor.stop_monitoring()
+        health_shield_monitor.stop_monitoring()
+        lobby_status_monitor.stop_monitoring()
         match_event_monitor.stop_monitoring()
         match_tracker.stop_monitoring()
+        shutdown_monitor_scheduler()
         fa11y_ow_announcer.stop()
         fa11y_ow_client.stop()
 
@@ -452,6 +457,8 @@ def reload_config() -> None:
             'toggle mouse passthrough': lambda: get_mouse_passthrough().toggle(),
             'calibrate fa11y-ow position': calibrate_fa11y_ow_position,
             'check display mode': announce_display_mode,
+            'announce monitor load': announce_monitor_load,
+            'reset count digits': reset_count_digits,
             'read mode status': read_mode_status,
             'toggle fill': toggle_lobby_fill,
             'toggle ranked': toggle_ranked,
@@ -520,6 +527,7 @@ from lib.app.keybind_actions import (
 )
 
 from lib.app.display_actions import announce_display_mode
+from lib.app.diagnostic_actions import announce_monitor_load, reset_count_digits
 
 
 def key_listener() -> None:
@@ -849,6 +857,8 @@ def main() -> None:
         # dynamic_object_monitor.start_monitoring()
         storm_monitor.start_monitoring()
         bloom_monitor.start_monitoring()
+        health_shield_monitor.start_monitoring()
+        lobby_status_monitor.start_monitoring()
         match_event_monitor.start_monitoring()
 
         # FA11y-OW companion-service consumer (passive equip / pickup /
@@ -1038,8 +1048,11 @@ def main() -> None:
             resource_monitor.stop_monitoring()
             # dynamic_object_monitor.stop_monitoring()
             storm_monitor.stop_monitoring()
+            health_shield_monitor.stop_monitoring()
+            lobby_status_monitor.stop_monitoring()
             match_event_monitor.stop_monitoring()
             match_tracker.stop_monitoring()
+            shutdown_monitor_scheduler()
             fa11y_ow_announcer.stop()
             fa11y_ow_client.stop()
 
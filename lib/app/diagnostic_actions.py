@@ -0,0 +1,37 @@
+"""
+Diagnostic announcements.
+
+``announce_monitor_load`` — speaks the background monitors' CPU use against
+the ``MonitorCpuBudget``, any throttling the governor applied, and the most
+expensive monitors (see ``lib.monitors.governor``).
+
+``reset_count_digits`` — forgets the learned HUD digit glyphs
+(``config/digit_glyphs.npz``) so counts are relearned from EasyOCR.
+"""
+from __future__ import annotations
+
+from lib.app import state
+
+
+def announce_monitor_load() -> None:
+    """Speak the monitor scheduler's CPU budget summary."""
+    try:
+        from lib.monitors.scheduler import get_monitor_scheduler
+        summary = get_monitor_scheduler().governor.summary()
+    except Exception as e:
+        state.logger.error(f"Could not read monitor load: {e}")
+        state.speaker.speak("Monitor load unavailable.")
+        return
+    state.speaker.speak(summary)
+
+
+def reset_count_digits() -> None:
+    """Forget the learned count digits and relearn them from EasyOCR."""
+    try:
+        from lib.detection.digit_reader import get_digit_reader
+        get_digit_reader().reset()
+    except Exception as e:
+        state.logger.error(f"Could not reset count digits: {e}")
+        state.speaker.speak("Could not reset count digits.")
+        return
+    state.speaker.speak("Count digits reset. They will be relearned from text recognition.")
@@ -12,7 +12,7 @@ import os
 from lib.app import state
 from lib.detection.match_tracker import match_tracker
 from lib.managers.game_object_manager import game_object_manager
-from lib.utilities.mouse import pixel as _pixel
+from lib.managers.screenshot_manager import color_between, probe_pixels
 from lib.utilities.utilities import read_config
 from lib.utilities.window_utils import focus_window
 
@@ -168,24 +168,21 @@ _HOTSPOT_PIXELS = [
     (1078, 639), (1232, 607), (585, 894), (957, 846), (1190, 876),
     (764, 830), (1265, 776),
 ]
+_is_white = color_between((250, 250, 250), (255, 255, 255))
+_is_black = color_between((0, 0, 0), (5, 5, 5))
 
 
 def check_hotspots() -> None:
     """Check for hotspot POIs on the map."""
     speaker = state.speaker
     try:
-        hotspot_coordinates = []
-        for x, y in _HOTSPOT_PIXELS:
-            try:
-                pixel_color = _pixel(x, y)
-                r, g, b = pixel_color
-                is_white = (250 <= r <= 255) and (250 <= g <= 255) and (250 <= b <= 255)
-                is_black = (0 <= r <= 5) and (0 <= g <= 5) and (0 <= b <= 5)
-                if not is_white and not is_black:
-                    hotspot_coordinates.append((x, y))
-            except Exception as e:
-                print(f"Error checking pixel at {x},{y}: {e}")
-                continue
+        colors = probe_pixels(_HOTSPOT_PIXELS)
+        if colors is None:
+            speaker.speak("Error checking hotspots")
+            return
+        # Every glyph pixel in one probe; a hotspot is neither white nor black.
+        active = ~(_is_white(colors) | _is_black(colors))
+        hotspot_coordinates = [p for p, hit in zip(_HOTSPOT_PIXELS, active) if hit]
 
         if not hotspot_coordinates:
             speaker.speak("No hotspots detected")
@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 _engine = None
 _lock = threading.Lock()
+_ping_scheduler = None
 
 
 def get_engine():
@@ -27,10 +28,24 @@ def get_engine():
     return _engine
 
 
+def get_ping_scheduler():
+    """Get or create the shared ping scheduler singleton."""
+    global _ping_scheduler
+    if _ping_scheduler is None:
+        with _lock:
+            if _ping_scheduler is None:
+                from lib.audio.ping_scheduler import PingScheduler
+                _ping_scheduler = PingScheduler()
+    return _ping_scheduler
+
+
 def shutdown_engine():
     """Shutdown the audio engine and release all resources."""
-    global _engine
+    global _engine, _ping_scheduler
     with _lock:
+        if _ping_scheduler is not None:
+            _ping_scheduler.shutdown()
+            _ping_scheduler = None
         if _engine is not None:
             try:
                 _engine.shutdown()
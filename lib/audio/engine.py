@@ -15,7 +15,7 @@ import math
 import threading
 import time
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 from ctypes import *
 from dataclasses import dataclass, field
 
@@ -139,6 +139,11 @@ class AudioSource:
 
     lpf_prior: float = 0.0
 
+    # Optional callable returning a fresh (x, y, z) or None. Polled once per
+    # mix chunk so a source can follow a predicted listener pose without the
+    # caller running its own update thread.
+    position_provider: Optional[Callable[[], Optional[Tuple[float, float, float]]]] = None
+
 
 # ============================================================================
 # Audio Ring Buffer
@@ -572,6 +577,14 @@ class FA11yAudioEngine:
                         sources_to_remove.append(source_id)
                         continue
 
+                if source.position_provider is not None:
+                    try:
+                        new_position = source.position_provider()
+                        if new_position is not None:
+                            source.position = new_position
+                    except Exception:
+                        source.position_provider = None
+
                 # Early cull: skip inaudible 3D sounds
                 if source.is_3d:
                     dx = source.position[0] - self.listener_position[0]
@@ -1098,6 +1111,12 @@ class FA11yAudioEngine:
                 if volume is not None:
                     self.sources[source_id].volume = max(0.0, min(1.0, volume))
 
+    def set_source_position_provider(self, source_id: int, provider) -> None:
+        """Attach a per-chunk position callback to a source (None detaches)"""
+        with self.device_lock:
+            if source_id in self.sources:
+                self.sources[source_id].position_provider = provider
+
     def is_sound_playing(self, source_id: int) -> bool:
         """Check if a source is still playing"""
         with self.device_lock:
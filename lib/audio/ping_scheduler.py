@@ -0,0 +1,233 @@
+"""
+Shared scheduler for periodic spatial-audio pings.
+
+Every pinger (dynamic objects, storm, POI sound, continuous POI ping) used
+to own a thread that slept between pings, and the "behind" double-tap
+spawned a fresh thread per ping. With many tracked objects that meant
+dozens of mostly sleeping threads, each waking up on its own to grab the
+GIL and read the player pose.
+
+``PingScheduler`` runs all of them from one thread. Jobs live in a heap
+keyed by due time; each wake-up pops every due job, reads the player pose
+once through the registered pose provider and hands it to the callbacks,
+which submit their play requests to the engine.
+
+A callback receives ``(player_position, player_angle)`` (either may be
+None) and may return a float to set the delay before its next run;
+returning None keeps the job's interval. One-shot jobs have no interval.
+Callbacks run on the scheduler thread and must stay short: no screen
+captures or detection, only cached state (the pose handed in, or the
+position tracker's last fix and sampled heading).
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Pose = Tuple[Optional[Tuple[int, int]], Optional[float]]
+
+
+class PingJob:
+    """Handle for a scheduled ping; ``cancel()`` stops it."""
+
+    __slots__ = ('callback', 'interval', 'name', 'due', 'cancelled', '_scheduler')
+
+    def __init__(self, scheduler: 'PingScheduler', callback: Callable[[Pose], Optional[float]],
+                 interval: Optional[float], name: str) -> None:
+        self._scheduler = scheduler
+        self.callback = callback
+        self.interval = interval
+        self.name = name
+        self.due = 0.0
+        self.cancelled = False
+
+    @property
+    def active(self) -> bool:
+        return not self.cancelled
+
+    def set_interval(self, interval: float) -> None:
+        """Change the interval used after the next run."""
+        self.interval = interval
+
+    def cancel(self) -> None:
+        self._scheduler.cancel(self)
+
+
+class PingScheduler:
+    """One thread, one heap, every periodic ping."""
+
+    #: Number of recent firing delays kept for the jitter statistics.
+    JITTER_HISTORY = 256
+
+    def __init__(self, pose_provider: Optional[Callable[[], Pose]] = None) -> None:
+        self._pose_provider = pose_provider
+        self._heap: List[Tuple[float, int, PingJob]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._active = 0
+
+        self._jitter: Deque[float] = deque(maxlen=self.JITTER_HISTORY)
+        self._fired = 0
+        self._ticks = 0
+        self._errors = 0
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def set_pose_provider(self, provider: Optional[Callable[[], Pose]]) -> None:
+        """Set the callable read once per tick for the player pose."""
+        self._pose_provider = provider
+
+    def schedule(self, callback: Callable[[Pose], Optional[float]],
+                 interval: Optional[float], delay: float = 0.0,
+                 name: str = '') -> PingJob:
+        """Run ``callback`` after ``delay`` and then every ``interval``
+        seconds (once only when ``interval`` is None)."""
+        job = PingJob(self, callback, interval, name)
+        with self._cond:
+            self._active += 1
+            self._push(job, time.monotonic() + max(0.0, delay))
+            self._ensure_thread()
+            self._cond.notify()
+        return job
+
+    def schedule_once(self, callback: Callable[[Pose], Optional[float]],
+                      delay: float, name: str = '') -> PingJob:
+        return self.schedule(callback, None, delay, name)
+
+    def cancel(self, job: Optional[PingJob]) -> None:
+        """Stop ``job``; safe to call from its own callback or twice."""
+        if job is None:
+            return
+        with self._cond:
+            if not job.cancelled:
+                job.cancelled = True
+                self._active -= 1
+                # The heap entry is dropped lazily when it comes due.
+                self._cond.notify()
+
+    def shutdown(self) -> None:
+        """Cancel every job and stop the thread."""
+        with self._cond:
+            for _, _, job in self._heap:
+                job.cancelled = True
+            self._heap.clear()
+            self._active = 0
+            self._running = False
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    @property
+    def scheduled_count(self) -> int:
+        """Number of live (not cancelled) jobs."""
+        with self._cond:
+            return self._active
+
+    def get_stats(self) -> dict:
+        """Scheduled count and firing jitter (how late jobs ran)."""
+        with self._cond:
+            jitter = sorted(self._jitter)
+            stats = {
+                'scheduled': self._active,
+                'fired': self._fired,
+                'ticks': self._ticks,
+                'errors': self._errors,
+            }
+        if jitter:
+            stats['jitter_avg_ms'] = sum(jitter) / len(jitter) * 1000.0
+            stats['jitter_p95_ms'] = jitter[min(len(jitter) - 1, int(len(jitter) * 0.95))] * 1000.0
+            stats['jitter_max_ms'] = jitter[-1] * 1000.0
+        else:
+            stats['jitter_avg_ms'] = stats['jitter_p95_ms'] = stats['jitter_max_ms'] = 0.0
+        return stats
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _push(self, job: PingJob, due: float) -> None:
+        job.due = due
+        heapq.heappush(self._heap, (due, next(self._counter), job))
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="PingScheduler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                if not self._running:
+                    return
+                now = time.monotonic()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, job = heapq.heappop(self._heap)
+                    if not job.cancelled:
+                        due.append(job)
+                self._ticks += 1
+            if due:
+                self._fire(due, now)
+
+    def _fire(self, jobs: List[PingJob], now: float) -> None:
+        pose = self._read_pose()
+        for job in jobs:
+            fired_at = time.monotonic()
+            try:
+                next_delay = job.callback(pose)
+            except Exception:
+                next_delay = None
+                with self._cond:
+                    self._errors += 1
+                logger.debug("Ping job %s failed", job.name or job.callback, exc_info=True)
+            with self._cond:
+                self._fired += 1
+                self._jitter.append(max(0.0, fired_at - job.due))
+                if job.cancelled:
+                    continue
+                delay = next_delay if next_delay is not None else job.interval
+                if delay is None:
+                    job.cancelled = True
+                    self._active -= 1
+                    continue
+                # Anchor to the due time so intervals don't drift with
+                # callback cost; skip ahead if we fell behind.
+                due = job.due + max(0.001, delay)
+                if due < now:
+                    due = now + max(0.001, delay)
+                self._push(job, due)
+
+    def _read_pose(self) -> Pose:
+        provider = self._pose_provider
+        if provider is None:
+            return None, None
+        try:
+            return provider()
+        except Exception:
+            return None, None
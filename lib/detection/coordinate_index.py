@@ -0,0 +1,81 @@
+"""
+Cached coordinate matrix for nearest-object queries.
+
+POI lists and game-object files store coordinates as strings, and the
+closest-object helpers used to re-parse every one of them with
+``int(float(...))`` and call ``np.linalg.norm`` per candidate on each
+query. ``CoordinateIndex`` parses the rows once into a contiguous
+``float32`` (N, 2) matrix, so a query is a single vectorized distance
+computation.
+
+Brute force is deliberate: at the few thousand objects a map carries
+(``map_main_gameobjects.txt`` has ~3.7k) one pass over the matrix takes
+tens of microseconds, and unlike a KD-tree it needs no rebuild
+bookkeeping when a subset (one object type) is queried.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class CoordinateIndex:
+    """Names plus a ``float32`` coordinate matrix, queried in one pass."""
+
+    __slots__ = ('names', 'coords')
+
+    def __init__(self, names: List[str], coords: np.ndarray) -> None:
+        self.names = names
+        self.coords = np.ascontiguousarray(coords, dtype=np.float32).reshape(-1, 2)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence], truncate: bool = False) -> 'CoordinateIndex':
+        """Build from ``(name, x, y, ...)`` rows with string or numeric
+        coordinates; malformed rows are skipped. ``truncate`` mirrors the
+        ``int(float(...))`` parsing POI lists use."""
+        names, coords = [], []
+        for row in rows:
+            try:
+                x, y = float(row[1]), float(row[2])
+            except (ValueError, TypeError, IndexError):
+                continue
+            if truncate:
+                x, y = int(x), int(y)
+            names.append(row[0])
+            coords.append((x, y))
+        return cls(names, np.array(coords, dtype=np.float32).reshape(-1, 2))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def point(self, i: int) -> Tuple[float, float]:
+        x, y = self.coords[i]
+        return float(x), float(y)
+
+    def _squared_distances(self, position) -> np.ndarray:
+        delta = self.coords - np.asarray(position, dtype=np.float32)
+        return np.einsum('ij,ij->i', delta, delta)
+
+    def nearest(self, position, exclude: Optional[np.ndarray] = None) -> Optional[Tuple[int, float]]:
+        """``(row, distance_px)`` of the closest entry, or None when empty.
+        ``exclude`` is an optional boolean mask of rows to skip."""
+        if not self.names:
+            return None
+        d2 = self._squared_distances(position)
+        if exclude is not None:
+            d2 = np.where(exclude, np.inf, d2)
+        i = int(np.argmin(d2))
+        if not np.isfinite(d2[i]):
+            return None
+        return i, float(np.sqrt(d2[i]))
+
+    def within(self, position, radius_px: float) -> List[Tuple[int, float]]:
+        """``(row, distance_px)`` of every entry within ``radius_px``,
+        nearest first (ties keep row order)."""
+        if not self.names:
+            return []
+        d2 = self._squared_distances(position)
+        rows = np.flatnonzero(d2 <= np.float32(radius_px) ** 2)
+        rows = rows[np.argsort(d2[rows], kind='stable')]
+        return [(int(i), float(np.sqrt(d2[i]))) for i in rows]
@@ -0,0 +1,419 @@
+"""
+Glyph-template digit reader for HUD counts.
+
+Material, resource, ammo, consumable and inventory counts are drawn in one
+fixed game font, so reading them doesn't need a neural OCR model. The
+reader takes the binarized count image the callers already build (digits
+white on black):
+
+* connected components are the glyphs — specks and anything much shorter
+  than the tallest glyph are dropped, pieces overlapping in x are merged;
+* each glyph is scaled to ``GLYPH_SIZE`` px tall (aspect kept, centered),
+  zero-meaned and L2-normalized, so matching is a dot product;
+* each glyph is matched against the digit exemplars learned at a similar
+  glyph height (the HUD scale) and takes the best digit.
+
+The read's confidence is the weakest glyph's score. A glyph counts as
+unsure when its best digit doesn't beat the runner-up by ``MIN_MARGIN`` or
+when some digit has no exemplar at its scale yet (there is no runner-up to
+beat), so EasyOCR keeps checking a scale until all ten digits are learned.
+
+The templates are *learned*: there is no font asset to render from, so
+``OCRManager.read_digits`` teaches the reader from every confident EasyOCR
+read whose glyph count matches its digit count, and only falls back to
+EasyOCR while the glyph reader is below ``CONFIDENCE_THRESHOLD``. A glyph
+becomes an exemplar only after ``LEARN_AGREEMENT`` EasyOCR reads agree on
+it, and a learned exemplar that EasyOCR contradicts as often is dropped,
+so one misread can't teach (or keep) a wrong digit. Learned exemplars
+persist in ``config/digit_glyphs.npz``, are checked against each other on
+load, and are wiped by ``reset`` (the "Reset Count Digits" action).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+#: Normalized glyph side (px).
+GLYPH_SIZE = 16
+
+#: Components smaller than this are specks.
+MIN_AREA = 4
+MIN_HEIGHT = 5
+
+#: Components shorter than this fraction of the tallest one aren't digits.
+MIN_HEIGHT_RATIO = 0.6
+
+#: Longest count read (HUD counts stop at 999; inventory stacks are short).
+MAX_DIGITS = 5
+
+#: Weakest glyph score for a read to be trusted without EasyOCR.
+CONFIDENCE_THRESHOLD = 0.9
+
+#: Best digit must beat the best *other* digit by this much.
+MIN_MARGIN = 0.04
+
+#: Templates only match glyphs within this height ratio (same HUD scale).
+SCALE_TOLERANCE = 0.3
+
+#: Exemplars kept per digit; the oldest goes first.
+MAX_EXEMPLARS = 8
+
+#: A new exemplar this close to a kept one of the same digit is a duplicate.
+DUPLICATE_SCORE = 0.98
+
+#: ... and this close to another digit's exemplar contradicts it.
+CONFLICT_SCORE = 0.95
+
+#: Agreeing EasyOCR reads before a glyph is learned (and contradicting
+#: reads before a learned exemplar is dropped).
+LEARN_AGREEMENT = 3
+
+#: Glyphs waiting for agreement; the oldest goes first.
+MAX_PENDING = 64
+
+#: Bumped when learning gets stricter, so older template files are dropped.
+TEMPLATES_VERSION = 2
+
+TEMPLATES_PATH = os.path.join('config', 'digit_glyphs.npz')
+
+
+class DigitRead(NamedTuple):
+    text: str
+    confidence: float
+
+
+class Glyph(NamedTuple):
+    x: int
+    height: int
+    vector: np.ndarray
+
+
+def _foreground(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 3:
+        image = cv2.cvtColor(image[..., :3], cv2.COLOR_BGR2GRAY)
+    return (image > 127).astype(np.uint8)
+
+
+def normalize_glyph(mask: np.ndarray) -> np.ndarray:
+    """``GLYPH_SIZE``-tall, centered, zero-mean unit vector of a glyph mask."""
+    h, w = mask.shape
+    scale = GLYPH_SIZE / h
+    new_w = min(GLYPH_SIZE, max(1, int(round(w * scale))))
+    glyph = cv2.resize(mask.astype(np.float32), (new_w, GLYPH_SIZE), interpolation=cv2.INTER_AREA)
+    canvas = np.zeros((GLYPH_SIZE, GLYPH_SIZE), dtype=np.float32)
+    left = (GLYPH_SIZE - new_w) // 2
+    canvas[:, left:left + new_w] = glyph
+    vector = canvas.ravel()
+    vector -= vector.mean()
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 1e-6 else vector
+
+
+def segment_glyphs(image: np.ndarray) -> List[Glyph]:
+    """Glyphs of a binarized count image, left to right."""
+    fg = _foreground(image)
+    count, _, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
+    boxes = [
+        [int(x), int(y), int(x + w), int(y + h)]
+        for x, y, w, h, area in stats[1:count]
+        if area >= MIN_AREA and h >= MIN_HEIGHT
+    ]
+    if not boxes:
+        return []
+    tallest = max(b[3] - b[1] for b in boxes)
+    boxes = sorted(b for b in boxes if b[3] - b[1] >= MIN_HEIGHT_RATIO * tallest)
+
+    merged: List[List[int]] = []
+    for box in boxes:
+        if merged:
+            prev = merged[-1]
+            overlap = min(prev[2], box[2]) - max(prev[0], box[0])
+            if overlap > 0.5 * min(prev[2] - prev[0], box[2] - box[0]):
+                prev[0], prev[1] = min(prev[0], box[0]), min(prev[1], box[1])
+                prev[2], prev[3] = max(prev[2], box[2]), max(prev[3], box[3])
+                continue
+        merged.append(box)
+
+    return [
+        Glyph(x0, y1 - y0, normalize_glyph(fg[y0:y1, x0:x1]))
+        for x0, y0, x1, y1 in merged
+    ]
+
+
+def validate_templates(vectors: np.ndarray, labels: np.ndarray,
+                       heights: np.ndarray) -> np.ndarray:
+    """Mask of the stored exemplars worth keeping: unit vectors with a digit
+    label and a plausible height that don't look like another digit's
+    exemplar at the same scale (both of such a pair are dropped)."""
+    norms = np.linalg.norm(vectors, axis=1)
+    keep = (np.isfinite(vectors).all(axis=1) & (np.abs(norms - 1.0) < 1e-3)
+            & (labels >= 0) & (labels <= 9) & (heights >= MIN_HEIGHT))
+    if keep.sum() > 1:
+        index = np.flatnonzero(keep)
+        v, l, h = vectors[index], labels[index], heights[index].astype(np.float32)
+        near = np.abs(h[:, None] / h[None, :] - 1.0) <= SCALE_TOLERANCE
+        clash = near & (l[:, None] != l[None, :]) & (v @ v.T >= CONFLICT_SCORE)
+        keep[index[clash.any(axis=1)]] = False
+    return keep
+
+
+class GlyphDigitReader:
+    """Reads digit strings by matching glyphs against learned exemplars."""
+
+    def __init__(self, path: Optional[str] = TEMPLATES_PATH,
+                 threshold: float = CONFIDENCE_THRESHOLD,
+                 agreement: int = LEARN_AGREEMENT) -> None:
+        self.path = path
+        self.threshold = threshold
+        self.agreement = max(1, agreement)
+        self._lock = threading.Lock()
+        self._vectors = np.zeros((0, GLYPH_SIZE * GLYPH_SIZE), dtype=np.float32)
+        self._labels = np.zeros(0, dtype=np.int8)
+        self._heights = np.zeros(0, dtype=np.int16)
+        # Contradicting EasyOCR reads per learned exemplar.
+        self._strikes = np.zeros(0, dtype=np.int16)
+        # Glyphs seen but not yet agreed on: (digit, glyph, votes).
+        self._pending: List[list] = []
+        self.reads = 0
+        self.confident = 0
+        self.learned = 0
+        self.dropped = 0
+        if path:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @property
+    def known_digits(self) -> str:
+        with self._lock:
+            return ''.join(str(d) for d in sorted(set(self._labels.tolist())))
+
+    def read(self, image: np.ndarray) -> Optional[DigitRead]:
+        """Digits in ``image`` with the weakest glyph's score, or None when
+        nothing digit-like (or too much) is there."""
+        glyphs = segment_glyphs(image)
+        with self._lock:
+            self.reads += 1
+            if not glyphs or len(glyphs) > MAX_DIGITS or not len(self._labels):
+                return None
+            digits = []
+            confidence = 1.0
+            for glyph in glyphs:
+                digit, score = self._match(glyph)
+                if digit is None:
+                    return None
+                digits.append(str(digit))
+                confidence = min(confidence, score)
+            if confidence >= self.threshold:
+                self.confident += 1
+        return DigitRead(''.join(digits), confidence)
+
+    def read_confident(self, image: np.ndarray) -> Optional[str]:
+        """The digits when the read clears the threshold, else None."""
+        result = self.read(image)
+        if result is None or result.confidence < self.threshold:
+            return None
+        return result.text
+
+    def _match(self, glyph: Glyph) -> Tuple[Optional[int], float]:
+        """Best digit and its score among exemplars at this glyph's scale;
+        an unsure glyph (no margin over the runner-up, or a digit still
+        unlearned at this scale) scores 0. Caller holds the lock."""
+        ratio = self._heights / max(glyph.height, 1)
+        usable = np.abs(ratio - 1.0) <= SCALE_TOLERANCE
+        if not usable.any():
+            return None, 0.0
+        scores = self._vectors[usable] @ glyph.vector
+        labels = self._labels[usable]
+        best = np.full(10, -1.0, dtype=np.float32)
+        np.maximum.at(best, labels, scores)
+        order = np.argsort(best)[::-1]
+        digit, runner_up = int(order[0]), float(best[order[1]])
+        score = float(best[digit])
+        if len(np.unique(labels)) < 10 or score - runner_up < MIN_MARGIN:
+            return digit, 0.0
+        return digit, score
+
+    # ------------------------------------------------------------------
+    # Learning
+    # ------------------------------------------------------------------
+
+    def learn(self, image: np.ndarray, text: str) -> int:
+        """Count an EasyOCR read of ``image`` as ``text`` towards learning
+        its glyphs when the glyph count matches. Returns how many exemplars
+        were added (glyphs that reached ``agreement`` reads)."""
+        if not text or not text.isdigit():
+            return 0
+        glyphs = segment_glyphs(image)
+        if len(glyphs) != len(text):
+            return 0
+        added = 0
+        with self._lock:
+            before = self.dropped
+            for glyph, char in zip(glyphs, text):
+                if self._observe(int(char), glyph):
+                    added += 1
+            self.learned += added
+            changed = added or self.dropped != before
+        if changed and self.path:
+            self._save()
+        return added
+
+    def _observe(self, digit: int, glyph: Glyph) -> bool:
+        """One EasyOCR vote for ``glyph`` being ``digit``; True when it
+        made the glyph an exemplar. Caller holds the lock."""
+        if len(self._labels):
+            near = np.abs(self._heights / max(glyph.height, 1) - 1.0) <= SCALE_TOLERANCE
+            scores = self._vectors @ glyph.vector
+            same = near & (self._labels == digit)
+            other = near & (self._labels != digit)
+            if same.any() and scores[same].max() >= DUPLICATE_SCORE:
+                self._strikes[same & (scores >= DUPLICATE_SCORE)] = 0
+                return False
+            if other.any() and scores[other].max() >= CONFLICT_SCORE:
+                index = int(np.flatnonzero(other)[np.argmax(scores[other])])
+                self._strikes[index] += 1
+                if self._strikes[index] >= self.agreement:
+                    logger.info("Dropping a digit glyph learned as %d; EasyOCR keeps reading %d",
+                                self._labels[index], digit)
+                    self._remove(index)
+                    self.dropped += 1
+                return False
+
+        for i, (label, pending, votes) in enumerate(self._pending):
+            if (abs(pending.height / max(glyph.height, 1) - 1.0) > SCALE_TOLERANCE
+                    or float(pending.vector @ glyph.vector) < CONFLICT_SCORE):
+                continue
+            if label != digit:
+                # The reads disagree on this glyph: start over.
+                del self._pending[i]
+                break
+            if votes + 1 >= self.agreement:
+                del self._pending[i]
+                self._add(digit, glyph)
+                return True
+            self._pending[i][2] = votes + 1
+            return False
+
+        if self.agreement <= 1:
+            self._add(digit, glyph)
+            return True
+        self._pending.append([digit, glyph, 1])
+        if len(self._pending) > MAX_PENDING:
+            del self._pending[0]
+        return False
+
+    def _add(self, digit: int, glyph: Glyph) -> None:
+        """Caller holds the lock."""
+        mine = np.flatnonzero(self._labels == digit)
+        if len(mine) >= MAX_EXEMPLARS:
+            self._remove(int(mine[0]))
+        self._vectors = np.vstack([self._vectors, glyph.vector[None, :]])
+        self._labels = np.append(self._labels, np.int8(digit))
+        self._heights = np.append(self._heights, np.int16(glyph.height))
+        self._strikes = np.append(self._strikes, np.int16(0))
+
+    def _remove(self, index: int) -> None:
+        """Caller holds the lock."""
+        keep = np.ones(len(self._labels), dtype=bool)
+        keep[index] = False
+        self._vectors = self._vectors[keep]
+        self._labels = self._labels[keep]
+        self._heights = self._heights[keep]
+        self._strikes = self._strikes[keep]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = self._vectors[:0]
+            self._labels = self._labels[:0]
+            self._heights = self._heights[:0]
+            self._strikes = self._strikes[:0]
+            self._pending = []
+
+    def reset(self) -> None:
+        """Forget every learned and pending glyph, on disk too; counts are
+        relearned from EasyOCR."""
+        self.clear()
+        if self.path:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove digit glyph templates {self.path}: {e}")
+        logger.info("Digit glyph templates reset")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as data:
+                version = int(data['version']) if 'version' in data.files else 1
+                if version != TEMPLATES_VERSION:
+                    raise ValueError(f"version {version}, expected {TEMPLATES_VERSION}")
+                vectors = data['vectors'].astype(np.float32)
+                labels = data['labels'].astype(np.int8)
+                heights = data['heights'].astype(np.int16)
+            if vectors.shape[1:] != (GLYPH_SIZE * GLYPH_SIZE,) or not (
+                    len(vectors) == len(labels) == len(heights)):
+                raise ValueError("shape mismatch")
+        except Exception as e:
+            logger.warning(f"Ignoring digit glyph templates in {self.path}: {e}")
+            return
+        keep = validate_templates(vectors, labels, heights)
+        if not keep.all():
+            logger.warning(f"Dropped {int((~keep).sum())} inconsistent digit glyph templates "
+                           f"from {self.path}")
+        with self._lock:
+            self._vectors, self._labels, self._heights = vectors[keep], labels[keep], heights[keep]
+            self._strikes = np.zeros(int(keep.sum()), dtype=np.int16)
+        logger.info(f"Loaded {int(keep.sum())} digit glyph templates ({self.known_digits or 'none'})")
+
+    def _save(self) -> None:
+        with self._lock:
+            vectors, labels, heights = self._vectors, self._labels, self._heights
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp = self.path + '.tmp.npz'
+            np.savez(tmp, version=TEMPLATES_VERSION, vectors=vectors, labels=labels,
+                     heights=heights)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.debug(f"Could not save digit glyph templates: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'templates': int(len(self._labels)),
+                'reads': self.reads,
+                'confident': self.confident,
+                'learned': self.learned,
+                'pending': len(self._pending),
+                'dropped': self.dropped,
+            }
+
+
+_reader: Optional[GlyphDigitReader] = None
+_reader_lock = threading.Lock()
+
+
+def get_digit_reader() -> GlyphDigitReader:
+    """Shared reader backed by ``TEMPLATES_PATH``."""
+    global _reader
+    with _reader_lock:
+        if _reader is None:
+            _reader = GlyphDigitReader()
+        return _reader
@@ -5,6 +5,7 @@ import threading
 from typing import Tuple, Optional, Dict, List, NamedTuple
 from functools import lru_cache
 from mss import mss
+from lib.detection.template_bank import TemplateBank
 
 # Centralized minimap region and scale (loaded dynamically from utilities)
 from lib.utilities.utilities import get_minimap_region
@@ -34,6 +35,8 @@ class FastDynamicObjectFinder:
         self.thread_local = threading.local()
         self.scales = [0.8, 0.9, 1.0]
         self.confidence_threshold = 0.76
+        # Icons pre-scaled once at load; all matched in one pass per frame.
+        self.template_bank = TemplateBank(self.scales)
         self.icons_loaded = False
         self.load_attempted = False
         self.load_all_icons()
@@ -76,68 +79,44 @@ class FastDynamicObjectFinder:
                             'template': icon,
                             'path': icon_path
                         }
+                        self.template_bank.add(dynamic_object_name, icon)
                         loaded_count += 1
         except Exception:
             pass
         if loaded_count > 0:
             self.icons_loaded = True
 
-    def fast_multi_scale_match(self, screen: np.ndarray, template: np.ndarray) -> Optional[DetectionResult]:
-        if screen is None or template is None:
-            return None
-        best_confidence = 0
-        best_result = None
-        template_h, template_w = template.shape[:2]
-        screen_h, screen_w = screen.shape[:2]
-        for scale in self.scales:
-            scaled_h, scaled_w = int(template_h * scale), int(template_w * scale)
-            if scaled_h > screen_h or scaled_w > screen_w:
-                continue
-            try:
-                if scale != 1.0:
-                    scaled_template = cv2.resize(template, (scaled_w, scaled_h), interpolation=cv2.INTER_AREA)
-                else:
-                    scaled_template = template
-                result = cv2.matchTemplate(screen, scaled_template, cv2.TM_CCOEFF_NORMED)
-                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-                if max_val > best_confidence:
-                    best_confidence = max_val
-                    center_x = max_loc[0] + scaled_w // 2
-                    center_y = max_loc[1] + scaled_h // 2
-                    best_result = DetectionResult(
-                        center_x=center_x,
-                        center_y=center_y,
-                        confidence=max_val,
-                        scale=scale
-                    )
-            except (cv2.error, Exception):
-                continue
-        if best_result and best_result.confidence >= self.confidence_threshold:
-            return best_result
-        return None
-
     def batch_detect_dynamic_objects(self, screen: np.ndarray, dynamic_object_names: List[str]) -> List[BatchDetectionResult]:
+        """Best instance of each requested object (coarse-to-fine search)."""
+        best = {}
+        for result in self.batch_detect_all_instances(screen, dynamic_object_names):
+            current = best.get(result.dynamic_object_name)
+            if current is None or result.confidence > current.confidence:
+                best[result.dynamic_object_name] = result
+        return list(best.values())
+
+    def batch_detect_all_instances(self, screen: np.ndarray, dynamic_object_names: List[str],
+                                   max_instances: int = 5) -> List[BatchDetectionResult]:
+        """Every instance of each requested object, up to ``max_instances`` each."""
         if screen is None or not dynamic_object_names:
             return []
-        results = []
-        for dynamic_object_name in dynamic_object_names:
-            if dynamic_object_name not in self.icon_cache:
-                continue
-            try:
-                template = self.icon_cache[dynamic_object_name]['template']
-                detection_result = self.fast_multi_scale_match(screen, template)
-                if detection_result:
-                    batch_result = BatchDetectionResult(
-                        dynamic_object_name=dynamic_object_name,
-                        center_x=detection_result.center_x,
-                        center_y=detection_result.center_y,
-                        confidence=detection_result.confidence,
-                        scale=detection_result.scale
-                    )
-                    results.append(batch_result)
-            except Exception:
-                continue
-        return results
+        try:
+            hits = self.template_bank.match_instances(
+                screen, dynamic_object_names,
+                threshold=self.confidence_threshold, top_k=max_instances
+            )
+        except Exception:
+            return []
+        return [
+            BatchDetectionResult(
+                dynamic_object_name=hit.name,
+                center_x=hit.center_x,
+                center_y=hit.center_y,
+                confidence=hit.confidence,
+                scale=hit.scale
+            )
+            for hit in hits
+        ]
 
     def capture_region(self, region: Dict) -> Optional[np.ndarray]:
         try:
@@ -238,6 +217,7 @@ class FastDynamicObjectFinder:
         return results.get(dynamic_object_name)
 
     def cleanup(self):
+        self.template_bank.close()
         if hasattr(self.thread_local, 'mss'):
             try:
                 self.thread_local.mss.close()
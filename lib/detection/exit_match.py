@@ -2,7 +2,8 @@ import time
 import traceback
 from PIL import ImageGrab
 from accessible_output2.outputs.auto import Auto
-from lib.utilities.mouse import instant_click, pixel
+from lib.managers.screenshot_manager import color_near, probe_pixels
+from lib.utilities.mouse import instant_click
 
 speaker = Auto()
 
@@ -11,17 +12,20 @@ def _log(msg):
     print(f"[exit_match] {msg}")
     speaker.speak(f"{msg}")
 
-def check_pixel_color(x, y, target_rgb, tolerance=10):
-    pixel_color = pixel(x, y)
-    _log(f"check_pixel_color({x}, {y}) => {pixel_color}, target={target_rgb}, tol={tolerance}")
-    return all(abs(a - b) <= tolerance for a, b in zip(pixel_color, target_rgb))
+def check_pixel_colors(x, y, targets, tolerance=10):
+    """Which of ``targets`` the pixel at (x, y) matches, from one probe."""
+    colors = probe_pixels([(x, y)])
+    if colors is None:
+        _log(f"check_pixel_colors({x}, {y}) => capture failed")
+        return [False] * len(targets)
+    _log(f"check_pixel_colors({x}, {y}) => {tuple(int(c) for c in colors[0])}, targets={targets}, tol={tolerance}")
+    return [bool(color_near(target, tolerance)(colors)[0]) for target in targets]
 
 def exit_match():
     """Exit match - mirrors original: pyautogui.click(x,y) + sleep(0.1) between each."""
     _log("exit_match() called")
     try:
-        white_check = check_pixel_color(1847, 74, (255, 255, 255))
-        black_check = check_pixel_color(1847, 74, (0, 0, 0))
+        white_check, black_check = check_pixel_colors(1847, 74, [(255, 255, 255), (0, 0, 0)])
         _log(f"Pixel checks: white={white_check}, black={black_check}")
 
         if white_check or black_check:
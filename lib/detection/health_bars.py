@@ -0,0 +1,125 @@
+"""
+Health / shield bar reading from two thin screen strips.
+
+The calibrated step pattern in ``HealthShieldCoords`` (``*_decreases``)
+places the 100 value marks of each bar: mark 100 sits at ``*_x`` and each
+lower mark is a few pixels further left. The value is the highest mark
+still showing the bar color, i.e. the right end of the filled run.
+
+``HealthShieldReader`` precomputes those mark positions once per
+coordinate set, so a read is: take the 1 px row of each bar (the
+``strips``), gather the marks with one index, test the color with NumPy
+and ``argmax`` the first hit. Reads are cached on a hash of the strip
+pixels, so an unchanged HUD costs only the hash.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+MARKS = 100
+
+#: Values in scan order: mark 100 first.
+VALUES = np.arange(MARKS, 0, -1)
+
+
+def bar_positions(start_x: int, decreases: Sequence[int]) -> np.ndarray:
+    """Screen x of each value mark, in ``VALUES`` order."""
+    steps = np.ones(MARKS, dtype=np.int64)
+    if decreases:
+        pattern = np.asarray(decreases, dtype=np.int64)
+        steps = pattern[VALUES % len(pattern)]
+    # x of mark i is start_x minus the steps taken from 100 down to i + 1.
+    offsets = np.concatenate(([0], np.cumsum(steps[:-1])))
+    return int(start_x) - offsets
+
+
+def read_bar_value(row: np.ndarray, marks: np.ndarray, color: Sequence[int],
+                   tolerance: int) -> Optional[int]:
+    """Value of a bar from its RGB ``row`` (marks index into it), or None
+    when no mark shows the bar color."""
+    valid = (marks >= 0) & (marks < row.shape[0])
+    pixels = row[np.clip(marks, 0, row.shape[0] - 1), :3].astype(np.int16)
+    hits = (np.abs(pixels - np.asarray(color, dtype=np.int16)) <= tolerance).all(axis=1) & valid
+    if not hits.any():
+        return None
+    return int(VALUES[hits.argmax()])
+
+
+class HealthShieldReader:
+    """Reads health and shield from their bar strips, cached per pixels."""
+
+    def __init__(self, coords) -> None:
+        self.coords = coords
+        self._lock = threading.Lock()
+        self._bars: Dict[str, Tuple[Dict[str, int], np.ndarray, Tuple[int, int, int]]] = {}
+        for name, x, y, decreases, color in (
+            ('health', coords.health_x, coords.health_y, coords.health_decreases, coords.health_color),
+            ('shield', coords.shield_x, coords.shield_y, coords.shield_decreases, coords.shield_color),
+        ):
+            positions = bar_positions(x, decreases)
+            left = int(positions.min())
+            strip = {'left': left, 'top': int(y), 'width': int(x) - left + 1, 'height': 1}
+            self._bars[name] = (strip, positions - left, tuple(color))
+        self._last_key: Optional[int] = None
+        self._last_value: Tuple[Optional[int], Optional[int]] = (None, None)
+        self.reads = 0
+        self.cache_hits = 0
+
+    @property
+    def strips(self) -> Dict[str, Dict[str, int]]:
+        """Capture regions, by bar name: one pixel row each."""
+        return {name: bar[0] for name, bar in self._bars.items()}
+
+    def read(self, frames: Dict[str, np.ndarray]) -> Tuple[Optional[int], Optional[int]]:
+        """``(health, shield)`` from RGB captures of ``strips``; a bar whose
+        strip is missing or shows no fill reads None."""
+        health_row = frames.get('health')
+        shield_row = frames.get('shield')
+        key = hash((
+            None if health_row is None else np.ascontiguousarray(health_row).tobytes(),
+            None if shield_row is None else np.ascontiguousarray(shield_row).tobytes(),
+        ))
+        with self._lock:
+            self.reads += 1
+            if key == self._last_key:
+                self.cache_hits += 1
+                return self._last_value
+        value = (self._read_bar('health', health_row), self._read_bar('shield', shield_row))
+        with self._lock:
+            self._last_key = key
+            self._last_value = value
+        return value
+
+    def _read_bar(self, name: str, strip: Optional[np.ndarray]) -> Optional[int]:
+        if strip is None:
+            return None
+        _, marks, color = self._bars[name]
+        row = strip.reshape(-1, strip.shape[-1])
+        return read_bar_value(row, marks, color, self.coords.tolerance)
+
+    def capture(self, capture_region) -> Tuple[Optional[int], Optional[int]]:
+        """Grab the strips with ``capture_region(region, convert_format)``
+        and read them."""
+        frames = {}
+        for name, strip in self.strips.items():
+            image = capture_region(strip, 'rgb')
+            if image is not None:
+                frames[name] = image
+        return self.read(frames)
+
+
+_readers: Dict[int, HealthShieldReader] = {}
+_readers_lock = threading.Lock()
+
+
+def get_reader(coords) -> HealthShieldReader:
+    """Shared reader for a coordinate set (built once per set)."""
+    with _readers_lock:
+        reader = _readers.get(id(coords))
+        if reader is None or reader.coords is not coords:
+            reader = HealthShieldReader(coords)
+            _readers[id(coords)] = reader
+        return reader
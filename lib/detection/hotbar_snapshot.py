@@ -0,0 +1,267 @@
+"""
+Whole-hotbar snapshots from a single capture.
+
+Slot detection used to grab the screen once per question — the primary
+slot for the item match, again for the secondary slot, again for the
+rarity, and again (plus two more grabs) for the ammo counts — each a
+separate step on its own timer thread. ``HotbarSnapshotter`` grabs the
+hotbar strip once, the rectangle covering every slot, the consumable count
+and the ammo divider search area, and answers from that one frame. Nothing
+is resolved until it is asked for:
+
+* a slot's item match (primary or secondary) through the caller's matcher
+  (``SlotIndex.lookup``) and its rarity (``RarityClassifier``);
+* the selected slot — the one whose surrounding frame is mostly near-white
+  while the others' aren't;
+* ammo/consumable counts, which need OCR, read once per snapshot.
+
+Item matches and rarities are cached per slot on a CRC-32 of that slot's
+own crop with its selection frame blanked (the ammo counters lie outside
+every slot), so
+switching slots (which redraws both) re-resolves nothing that didn't
+change, and a slot check is a crop, a CRC and a dictionary lookup.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+Rect = Tuple[int, int, int, int]  # left, top, right, bottom (exclusive)
+
+#: Region ``detect_divider`` searches (its y row is relative to this top).
+AMMO_SEARCH_RECT: Rect = (1200, 900, 2000, 1100)
+SCREEN_SIZE = (1920, 1080)
+
+#: Frame around a slot checked for the selection highlight (px).
+SELECTION_FRAME = 3
+
+#: Near-white share the selected slot's frame needs, and its lead.
+SELECTION_MIN_SHARE = 0.3
+SELECTION_MIN_LEAD = 0.2
+
+ItemMatch = Tuple[Optional[str], float]
+Counts = Tuple[Optional[int], Optional[int], Optional[int]]
+
+
+class SlotState(NamedTuple):
+    primary: ItemMatch
+    secondary: ItemMatch
+    rarity: Optional[str]
+
+
+class HotbarLayout(NamedTuple):
+    primary_slots: Tuple[Rect, ...]
+    secondary_slots: Tuple[Rect, ...]
+    consumable_area: Rect
+    ammo_y: Tuple[Tuple[str, Tuple[int, int]], ...]
+    strip: Rect
+
+    @classmethod
+    def build(cls, primary_slots: Sequence[Rect], secondary_slots: Sequence[Rect],
+              consumable_area: Rect, ammo_y: Dict[str, Tuple[int, int]]) -> 'HotbarLayout':
+        """Layout with the strip covering every region (clipped to screen)."""
+        rects = list(primary_slots) + list(secondary_slots) + [consumable_area, AMMO_SEARCH_RECT]
+        rects += [(AMMO_SEARCH_RECT[0], y0, AMMO_SEARCH_RECT[2], y1) for y0, y1 in ammo_y.values()]
+        strip = (
+            max(0, min(r[0] for r in rects) - SELECTION_FRAME),
+            max(0, min(r[1] for r in rects) - SELECTION_FRAME),
+            min(SCREEN_SIZE[0], max(r[2] for r in rects) + SELECTION_FRAME),
+            min(SCREEN_SIZE[1], max(r[3] for r in rects) + SELECTION_FRAME),
+        )
+        return cls(tuple(map(tuple, primary_slots)), tuple(map(tuple, secondary_slots)),
+                   tuple(consumable_area), tuple(sorted(ammo_y.items())), strip)
+
+    @property
+    def ammo_rows(self) -> Dict[str, Tuple[int, int]]:
+        return dict(self.ammo_y)
+
+
+def crop(strip: np.ndarray, origin: Tuple[int, int], rect: Rect) -> np.ndarray:
+    """Screen ``rect`` cut from ``strip`` captured at ``origin`` (clipped)."""
+    ox, oy = origin
+    h, w = strip.shape[:2]
+    x0, y0 = max(0, rect[0] - ox), max(0, rect[1] - oy)
+    x1, y1 = min(w, rect[2] - ox), min(h, rect[3] - oy)
+    return strip[y0:max(y0, y1), x0:max(x0, x1)]
+
+
+def selected_slot(strip: np.ndarray, origin: Tuple[int, int], slots: Sequence[Rect],
+                  frame: int = SELECTION_FRAME) -> Optional[int]:
+    """Index of the slot with a near-white frame, or None."""
+    if not slots:
+        return None
+    white = np.all(strip[..., :3] >= 220, axis=2)
+    shares = []
+    for left, top, right, bottom in slots:
+        outer = crop(white, origin, (left - frame, top - frame, right + frame, bottom + frame))
+        inner = crop(white, origin, (left, top, right, bottom))
+        ring = outer.size - inner.size
+        shares.append((outer.sum() - inner.sum()) / ring if ring > 0 else 0.0)
+    order = np.argsort(shares)[::-1]
+    best = shares[order[0]]
+    runner_up = shares[order[1]] if len(order) > 1 else 0.0
+    if best >= SELECTION_MIN_SHARE and best - runner_up >= SELECTION_MIN_LEAD:
+        return int(order[0])
+    return None
+
+
+def find_divider(screenshot: np.ndarray, pattern: Sequence[Tuple[int, int]],
+                 y: int = 57) -> Optional[Tuple[int, int]]:
+    """Leftmost x where every ``pattern`` offset from (x, ``y``) is pure white
+    and the rest of the (-1..4, -20..0) box isn't; all x tested at once."""
+    white = np.all(screenshot[..., :3] == 255, axis=2)
+    height, width = white.shape
+    xs = np.arange(max(0, width - 3))
+    ok = np.ones(len(xs), dtype=bool)
+    pattern = set(pattern)
+    box = [(dx, dy) for dx in range(-1, 5) for dy in range(-20, 1)]
+    for dx, dy in list(pattern) + [p for p in box if p not in pattern]:
+        row = y + dy
+        if not 0 <= row < height:
+            return None
+        cols = xs + dx
+        inside = (cols >= 0) & (cols < width)
+        values = white[row, np.clip(cols, 0, width - 1)]
+        ok &= inside & (values if (dx, dy) in pattern else ~values)
+        if not ok.any():
+            return None
+    return int(xs[np.argmax(ok)]), y
+
+
+class HotbarSnapshot:
+    """Everything known about the hotbar at one capture, resolved on demand."""
+
+    def __init__(self, strip: np.ndarray, snapshotter: 'HotbarSnapshotter',
+                 read_counts: Callable[['HotbarSnapshot'], Counts], taken: float) -> None:
+        self.strip = strip
+        self.layout = snapshotter.layout
+        self.taken = taken
+        self._snapshotter = snapshotter
+        self._read_counts = read_counts
+        self._selected: Optional[Tuple[Optional[int]]] = None
+        self._counts: Optional[Counts] = None
+        self._counts_lock = threading.Lock()
+
+    @property
+    def origin(self) -> Tuple[int, int]:
+        return self.layout.strip[0], self.layout.strip[1]
+
+    def crop(self, rect: Rect) -> np.ndarray:
+        return crop(self.strip, self.origin, rect)
+
+    def primary(self, index: int) -> ItemMatch:
+        """Item match of slot ``index``'s primary region."""
+        return self._snapshotter.resolve(self, 'primary', index)
+
+    def secondary(self, index: int) -> ItemMatch:
+        """Item match of slot ``index``'s secondary region."""
+        return self._snapshotter.resolve(self, 'secondary', index)
+
+    def rarity(self, index: int) -> Optional[str]:
+        """Rarity of slot ``index`` from its primary region's colors."""
+        return self._snapshotter.resolve(self, 'rarity', index)
+
+    def slot(self, index: int) -> SlotState:
+        return SlotState(self.primary(index), self.secondary(index), self.rarity(index))
+
+    @property
+    def slots(self) -> List[SlotState]:
+        """Every slot, fully resolved."""
+        return [self.slot(i) for i in range(len(self.layout.primary_slots))]
+
+    @property
+    def selected(self) -> Optional[int]:
+        if self._selected is None:
+            self._selected = (selected_slot(self.strip, self.origin, self.layout.primary_slots),)
+        return self._selected[0]
+
+    def counts(self) -> Counts:
+        """(current ammo, reserve ammo, consumable count), read once."""
+        with self._counts_lock:
+            if self._counts is None:
+                self._counts = self._read_counts(self)
+            return self._counts
+
+
+class HotbarSnapshotter:
+    """Makes ``HotbarSnapshot`` s for one layout and caches each slot's
+    item matches and rarity on the CRC of the slot's own pixels."""
+
+    def __init__(self, layout: HotbarLayout,
+                 match_item: Callable[[np.ndarray], ItemMatch],
+                 classify_rarities: Callable[[List[np.ndarray]], List[Optional[str]]],
+                 read_counts: Callable[[HotbarSnapshot], Counts]) -> None:
+        self.layout = layout
+        self.match_item = match_item
+        self.classify_rarities = classify_rarities
+        self.read_counts = read_counts
+        self._lock = threading.Lock()
+        # (kind, slot index) -> (crop CRC, resolved value)
+        self._cache: Dict[Tuple[str, int], Tuple[int, object]] = {}
+        self.hits = 0
+        self.resolves = 0
+        self.resolve_ms = 0.0
+
+    def update(self, strip: np.ndarray, now: Optional[float] = None) -> HotbarSnapshot:
+        """Snapshot of ``strip``; slots resolve when first asked for."""
+        return HotbarSnapshot(strip, self, self.read_counts, time.time() if now is None else now)
+
+    def resolve(self, snapshot: HotbarSnapshot, kind: str, index: int):
+        """Item match (``kind`` 'primary' / 'secondary') or rarity
+        ('rarity') of slot ``index`` in ``snapshot``, cached per slot."""
+        rects = self.layout.secondary_slots if kind == 'secondary' else self.layout.primary_slots
+        empty = None if kind == 'rarity' else (None, 0)
+        if not 0 <= index < len(rects):
+            return empty
+        image = snapshot.crop(rects[index])
+        if not image.size:
+            return empty
+        key = self._key(image, rects[index], index)
+        with self._lock:
+            cached = self._cache.get((kind, index))
+            if cached is not None and cached[0] == key:
+                self.hits += 1
+                return cached[1]
+
+        started = time.perf_counter()
+        if kind == 'rarity':
+            value = self.classify_rarities([image])[0]
+        else:
+            value = self.match_item(image)
+        with self._lock:
+            self._cache[(kind, index)] = (key, value)
+            self.resolves += 1
+            self.resolve_ms += (time.perf_counter() - started) * 1000.0
+        return value
+
+    def _key(self, image: np.ndarray, rect: Rect, index: int) -> int:
+        """CRC of a slot crop (taken at ``rect``'s top-left) with slot
+        ``index``'s selection frame blanked; the secondary region overlaps it."""
+        if index >= len(self.layout.primary_slots):
+            return zlib.crc32(np.ascontiguousarray(image).data)
+        left, top, right, bottom = self.layout.primary_slots[index]
+        f = SELECTION_FRAME
+        ys = np.arange(image.shape[0]) + rect[1]
+        xs = np.arange(image.shape[1]) + rect[0]
+        outer = ((ys >= top - f) & (ys < bottom + f))[:, None] & ((xs >= left - f) & (xs < right + f))
+        inner = ((ys >= top) & (ys < bottom))[:, None] & ((xs >= left) & (xs < right))
+        ring = outer & ~inner
+        if ring.any():
+            image = np.where(ring[..., None] if image.ndim == 3 else ring, 0, image)
+        return zlib.crc32(np.ascontiguousarray(image).data)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'resolves': self.resolves,
+                'cache_hits': self.hits,
+                'avg_resolve_ms': round(self.resolve_ms / self.resolves, 2) if self.resolves else 0.0,
+            }
@@ -14,18 +14,20 @@ Two-path strategy:
    between calls; every H / shield keypress hits the endpoint fresh.
 
 2. **Fallback — visual bar scan**
-   When the service is unreachable (the common case), the functions below
-   walk the health/shield bars pixel-by-pixel against the calibrated
-   ``health_decreases`` step pattern. This is what ships by default and is
-   what the user's F9 settings actually tune.
+   When the service is unreachable (the common case), the two 1 px bar
+   strips are captured and read against the calibrated ``health_decreases``
+   step pattern by ``lib.detection.health_bars``. This is what ships by
+   default and is what the user's F9 settings actually tune. The same
+   reader drives the continuous ``HealthShieldMonitor``.
 
 If you need to re-calibrate: ``python dev_tools/health_calibrator.py``.
 """
-from PIL import ImageGrab
 from accessible_output2.outputs.auto import Auto
 from lib.utilities.utilities import read_config, get_config_boolean
 from lib.managers.hotbar_manager import get_last_detected_rarity
 from lib.detection.coordinate_config import get_health_shield_coords
+from lib.detection.health_bars import get_reader
+from lib.managers.screenshot_manager import capture_region
 import requests
 
 speaker = Auto()
@@ -35,36 +37,6 @@ speaker = Auto()
 API_BASE_URL = "http://127.0.0.1:6767/api"
 API_TIMEOUT = 0.01
 
-# Visual detection fallback settings
-health_color, shield_color = (247, 255, 26), (213, 255, 232)
-tolerance = 30
-
-# Full calibrated decrease pattern (100 HP -> 1 HP)
-health_decreases = [3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 3, 4, 4, 3, 4, 3, 3, 3, 4, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 3, 4, 3, 4, 3, 4, 3, 4, 3, 3]
-shield_decreases = health_decreases
-
-def pixel_within_tolerance(pixel_color, target_color, tol):
-    return all(abs(pc - tc) <= tol for pc, tc in zip(pixel_color, target_color))
-
-def check_value_visual(pixels, start_x, y, decreases, color, tolerance, name, no_value_msg):
-    """Visual fallback method for checking health/shield bars."""
-    x = start_x
-    for i in range(100, 0, -1):
-        try:
-            if pixel_within_tolerance(pixels[x, y], color, tolerance):
-                speaker.speak(f'{i} {name}')
-                return
-        except IndexError:
-            speaker.speak(f"Error reading {name} bar.")
-            return
-        
-        if decreases:
-            x -= decreases[i % len(decreases)]
-        else:
-            x -= 1
-
-    speaker.speak(no_value_msg)
-
 def get_health_shield_from_api():
     """
     Try to get health, shield, and overshield values from the FA11y-OW HTTP API.
@@ -129,18 +101,11 @@ def check_health_shields():
         current_map = config.get('POI', 'current_map', fallback='main')
         coords = get_health_shield_coords(current_map)
         
-        screenshot = ImageGrab.grab(bbox=(0, 0, 1920, 1080))
-        pixels = screenshot.load()
-        
-        # Use map-specific coordinates, colors, tolerance, and decrease patterns
-        check_value_visual(
-            pixels, coords.health_x, coords.health_y, coords.health_decreases,
-            coords.health_color, coords.tolerance, 'Health', 'Cannot find Health Value!'
-        )
-        check_value_visual(
-            pixels, coords.shield_x, coords.shield_y, coords.shield_decreases,
-            coords.shield_color, coords.tolerance, 'Shield', 'No Shield'
-        )
+        # Only the two bar strips are captured; unchanged strips reuse the
+        # cached reading.
+        health, shield = get_reader(coords).capture(capture_region)
+        speaker.speak(f'{health} Health' if health is not None else 'Cannot find Health Value!')
+        speaker.speak(f'{shield} Shield' if shield is not None else 'No Shield')
         
     except Exception as e:
         print(f"Error in check_health_shields: {e}")
@@ -12,12 +12,22 @@ Detection approach:
 - Preset-driven: each game mode defines expected team sizes; the scan validates
   by matching the number of detected button clusters to the expected count
 - This avoids false positives from fill toggles or other UI elements
+- The resolved layout (button, fill and ranked toggle positions) is cached
+  against a fingerprint of the button panel, so the scans only rerun when
+  the layout actually changes
+- While in the lobby, ``LobbyStatusMonitor`` keeps a ready-to-speak status
+  summary warm; the status key speaks it only after checking a fingerprint
+  of the status panel against a fresh capture, so it answers without
+  rescanning but never reads out a stale summary. Both capture only the
+  settings panel and the three gate pixels (``capture_status_screen``)
 """
 
 import time
 import logging
 import io
+import threading
 
+import numpy as np
 from PIL import Image
 from lib.utilities.mouse import instant_click, move_to
 from accessible_output2.outputs.auto import Auto
@@ -46,6 +56,7 @@ def safe_speak(text):
 def _click_and_recapture(x, y, delay=0.3):
     """Click a position, move the mouse away, wait, then recapture.
     Moving the mouse away prevents hover effects from interfering with pixel reads."""
+    invalidate_warm_status()
     instant_click(x, y)
     time.sleep(0.05)
     move_to(600, 540, duration=0)  # Move to center-left (neutral area)
@@ -66,6 +77,42 @@ def capture_screen():
     return screenshot_manager.capture_full_screen('rgb')
 
 
+def status_regions():
+    """Screen regions the status summary reads: the settings panel plus
+    one pixel per screen gate, by name."""
+    left, top, right, bottom = STATUS_PANEL
+    regions = {'panel': {'left': left, 'top': top, 'width': right - left, 'height': bottom - top}}
+    for i, (x, y) in enumerate(STATUS_GATES):
+        regions[f'gate{i}'] = {'left': x, 'top': y, 'width': 1, 'height': 1}
+    return regions
+
+
+def compose_status_screen(frames):
+    """1920x1080 RGB screen holding only the ``status_regions`` frames (black
+    elsewhere), so the readers keep their screen coordinates. None when a
+    frame is missing."""
+    screen = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    for name, region in status_regions().items():
+        frame = frames.get(name)
+        if frame is None:
+            return None
+        top, left = region['top'], region['left']
+        screen[top:top + region['height'], left:left + region['width']] = frame[..., :3]
+    return screen
+
+
+def capture_status_screen():
+    """Capture just what the status summary reads (see ``status_regions``)."""
+    regions = status_regions()
+    panel = screenshot_manager.capture_region(regions['panel'], 'rgb')
+    gates = screenshot_manager.probe_pixels(STATUS_GATES)
+    if panel is None or gates is None:
+        return None
+    frames = {'panel': panel}
+    frames.update({f'gate{i}': color.reshape(1, 1, 3) for i, color in enumerate(gates)})
+    return compose_status_screen(frames)
+
+
 def copy_region_to_clipboard(screen, cx, cy, label=""):
     """Copy a small region around (cx, cy) to the clipboard for calibration.
     Draws a red crosshair at the exact sample/click point."""
@@ -200,6 +247,9 @@ CREATIVE_PRIVATE_SAMPLE = (1400, 277)
 CREATIVE_FILL_SAMPLE = (1420, 317)
 CREATIVE_NOFILL_SAMPLE = (1345, 317)
 
+# Pixels outside the settings panel that decide the screen type.
+STATUS_GATES = (BR_PLAY_GATE, BR_DONE_GATE, CREATIVE_PLAY_GATE)
+
 # --- Team button scan parameters ---
 TEAM_SCAN_X_START = 1400
 TEAM_SCAN_X_END = 1900
@@ -213,6 +263,23 @@ TEAM_MIN_CLUSTER_WIDTH = 15  # Minimum pixel span to count as a button
 FILL_TOGGLE_X_CENTER = 1690
 FILL_TOGGLE_X_RANGE = (1640, 1740)
 
+# --- Layout fingerprint grid (see layout_fingerprint) ---
+FINGERPRINT_X_STEP = 20
+FINGERPRINT_Y_START = 100
+FINGERPRINT_Y_END = 700  # below the lowest fill toggle position
+FINGERPRINT_Y_STEP = TEAM_SCAN_Y_STEP
+
+# Resolved layout for the last fingerprint, plus hit / miss counters.
+_layout_cache = {'fingerprint': None, 'layout': None, 'hits': 0, 'misses': 0}
+_layout_lock = threading.Lock()
+
+# --- Warm status summary (kept by LobbyStatusMonitor) ---
+WARM_STATUS_MAX_AGE = 1.5  # seconds a background summary is kept for the status key
+STATUS_PANEL = (1200, 100, 1900, 720)  # left, top, right, bottom of the settings panel
+STATUS_KEY_STEP = 5  # every scan / sample coordinate in the panel is on this grid
+_warm_status = {'text': None, 'time': 0.0, 'key': None}
+_warm_lock = threading.Lock()
+
 # --- Mode presets per map ---
 # has_build: whether Build/Zero Build toggle exists
 # ranked_sizes: which team sizes support ranked (None = all, [] = none)
@@ -348,6 +415,13 @@ def _scan_team_buttons(screen, preset):
     This prevents false positives from fill toggles or BUILD/ZB buttons.
 
     Returns (buttons_list, scan_y) where buttons_list is [(center_x, is_selected), ...]."""
+    clusters, scan_y = _scan_team_clusters(screen, preset)
+    return [(c['cx'], c['sel']) for c in clusters], scan_y
+
+
+def _scan_team_clusters(screen, preset):
+    """``_scan_team_buttons`` returning the button clusters themselves
+    (``cx``, ``sel``, ``width``, ``pixels``)."""
 
     expected_count = len(preset['sizes'])
     logger.info(f"[lobby] team scan: looking for {expected_count} buttons")
@@ -381,9 +455,8 @@ def _scan_team_buttons(screen, preset):
                 continue
 
         # Found a valid match
-        buttons = [(c['cx'], c['sel']) for c in clusters]
-        logger.info(f"[lobby] team scan: found {len(buttons)} buttons at y={scan_y}: {[(cx, 'SEL' if s else 'unsel') for cx, s in buttons]}")
-        return buttons, scan_y
+        logger.info(f"[lobby] team scan: found {len(clusters)} buttons at y={scan_y}: {[(c['cx'], 'SEL' if c['sel'] else 'unsel') for c in clusters]}")
+        return clusters, scan_y
 
     # Nothing found — log diagnostic info at a few key y values
     for diag_y in [170, 250, 330, 350, 460]:
@@ -437,15 +510,68 @@ def _find_fill_toggle_y(screen, team_y):
     return default_y
 
 
+def layout_fingerprint(screen, preset):
+    """Fingerprint of the team / toggle panel layout.
+
+    The panel is sampled on a coarse grid and reduced to "button-colored or
+    not". Selecting a team size, ranked or fill only recolors button pixels
+    (dark blue / bright blue / green / white), so the fingerprint follows
+    the layout rather than the selection. Returns None when the screen is
+    too small to hold the panel."""
+    if screen is None or screen.shape[0] < FINGERPRINT_Y_END or screen.shape[1] < TEAM_SCAN_X_END:
+        return None
+    grid = screen[FINGERPRINT_Y_START:FINGERPRINT_Y_END:FINGERPRINT_Y_STEP,
+                  TEAM_SCAN_X_START:TEAM_SCAN_X_END:FINGERPRINT_X_STEP, :3].astype(np.int16)
+    r, g, b = grid[..., 0], grid[..., 1], grid[..., 2]
+    mask = (
+        ((b > 220) & (r < 50))
+        | ((g > 200) & (b < 50) & (r > 150))
+        | ((r > 50) & (r < 110) & (g > 30) & (g < 70) & (b > 180) & (b < 240))
+        | ((r > 230) & (g > 230) & (b > 230))
+    )
+    return hash((tuple(preset['sizes']), preset['ranked'], np.packbits(mask).tobytes()))
+
+
+def _selected_from_layout(screen, layout):
+    """Selected team size on a screen whose layout is already known."""
+    selected_name = None
+    team_y = layout['team_y']
+    for name, xs in layout['button_xs'].items():
+        if any(is_selected(get_px(screen, x, team_y)) for x in xs):
+            selected_name = name
+    return selected_name
+
+
+def clear_layout_cache():
+    """Forget the cached layout (the next read rescans)."""
+    with _layout_lock:
+        _layout_cache['fingerprint'] = None
+        _layout_cache['layout'] = None
+
+
 def find_layout(screen):
     """Scan for team size buttons and map them to the mode preset.
-    Returns (layout_dict, selected_size_name) or (None, None)."""
+    Returns (layout_dict, selected_size_name) or (None, None).
+
+    When the panel fingerprint matches the last resolved layout, that
+    layout is reused and only the selected button is re-read."""
 
     preset = _get_current_preset()
     expected_sizes = preset['sizes']
 
-    buttons, scan_y = _scan_team_buttons(screen, preset)
-    if not buttons:
+    fingerprint = layout_fingerprint(screen, preset)
+    with _layout_lock:
+        cached = _layout_cache['layout'] if (
+            fingerprint is not None and _layout_cache['fingerprint'] == fingerprint
+        ) else None
+        _layout_cache['hits' if cached else 'misses'] += 1
+    if cached is not None:
+        selected_name = _selected_from_layout(screen, cached)
+        logger.info(f"[lobby] layout: cached (team y={cached['team_y']}), selected={selected_name}")
+        return cached, selected_name
+
+    clusters, scan_y = _scan_team_clusters(screen, preset)
+    if not clusters:
         return None, None
 
     # Find fill toggle position
@@ -453,21 +579,30 @@ def find_layout(screen):
 
     # Map buttons to preset size names
     button_dict = {}
+    button_xs = {}
     selected_name = None
-    for i, (cx, is_sel) in enumerate(buttons):
+    for i, cluster in enumerate(clusters):
         name = expected_sizes[i] if i < len(expected_sizes) else f'Button{i+1}'
-        button_dict[name] = (cx, scan_y)
-        if is_sel:
+        button_dict[name] = (cluster['cx'], scan_y)
+        button_xs[name] = tuple(x for x, _ in cluster['pixels'])
+        if cluster['sel']:
             selected_name = name
 
     layout = {
         'buttons': button_dict,
+        'button_xs': button_xs,
         'team_y': scan_y,
         'fill_toggle': (FILL_TOGGLE_X_CENTER, fill_y),
         'ranked_available': preset['ranked'],
+        'ranked_y': _find_ranked_toggle_y(screen, scan_y) if preset['ranked'] else None,
     }
 
-    logger.info(f"[lobby] layout: {len(buttons)} buttons at y={scan_y}, fill at y={fill_y}, selected={selected_name}")
+    if fingerprint is not None:
+        with _layout_lock:
+            _layout_cache['fingerprint'] = fingerprint
+            _layout_cache['layout'] = layout
+
+    logger.info(f"[lobby] layout: {len(clusters)} buttons at y={scan_y}, fill at y={fill_y}, selected={selected_name}")
     return layout, selected_name
 
 
@@ -505,9 +640,10 @@ def _find_ranked_toggle_y(screen, team_y):
     return None
 
 
-def read_ranked_state(screen, preset=None, team_y=None):
+def read_ranked_state(screen, preset=None, team_y=None, ranked_y=None):
     """Returns 'On', 'Off', or 'Unavailable'.
-    Uses preset to check availability, then scans for the toggle."""
+    Uses preset to check availability, then scans for the toggle (unless
+    ``ranked_y`` from a resolved layout is given)."""
     if preset is None:
         preset = _get_current_preset()
 
@@ -516,13 +652,13 @@ def read_ranked_state(screen, preset=None, team_y=None):
         return 'Unavailable'
 
     # Find the ranked toggle position dynamically
-    if team_y is None:
-        # Fallback: scan for team buttons first
-        buttons, team_y = _scan_team_buttons(screen, preset)
-        if not buttons:
-            return 'Unavailable'
-
-    ranked_y = _find_ranked_toggle_y(screen, team_y)
+    if ranked_y is None:
+        if team_y is None:
+            # Fallback: scan for team buttons first
+            buttons, team_y = _scan_team_buttons(screen, preset)
+            if not buttons:
+                return 'Unavailable'
+        ranked_y = _find_ranked_toggle_y(screen, team_y)
     if ranked_y is None:
         logger.info("[lobby] ranked: toggle not found on screen")
         return 'Unavailable'
@@ -665,13 +801,9 @@ def _build_debug_composite(screen, points):
 # Public action functions — wired to keybinds in FA11y.py
 # =====================================================================
 
-def read_mode_status():
-    """Read and announce the full lobby mode status."""
-    screen = capture_screen()
-    if screen is None:
-        safe_speak("Cannot capture screen")
-        return
-
+def summarize_mode_status(screen):
+    """Build the spoken lobby mode summary for a screen.
+    Returns (text, debug_points)."""
     screen_type = detect_screen_type(screen)
 
     debug_points = [
@@ -696,7 +828,7 @@ def read_mode_status():
 
             # Read ranked state
             preset = _get_current_preset()
-            ranked = read_ranked_state(screen, preset, layout.get('team_y'))
+            ranked = read_ranked_state(screen, preset, layout.get('team_y'), layout.get('ranked_y'))
             if ranked == 'On':
                 parts.append("Ranked On")
             elif ranked == 'Off':
@@ -712,10 +844,9 @@ def read_mode_status():
             if fill and fill != 'Locked':
                 parts.append(fill)
 
-        _build_debug_composite(screen, debug_points)
-        safe_speak(", ".join(parts) if parts else "Could not read mode settings")
+        return (", ".join(parts) if parts else "Could not read mode settings"), debug_points
 
-    elif screen_type == 'creative':
+    if screen_type == 'creative':
         privacy, fill = read_creative_state(screen)
         parts = []
         if privacy:
@@ -726,12 +857,101 @@ def read_mode_status():
         debug_points.append((*CREATIVE_PRIVATE_SAMPLE, "PRIVATE"))
         debug_points.append((*CREATIVE_FILL_SAMPLE, "FILL"))
         debug_points.append((*CREATIVE_NOFILL_SAMPLE, "NOFILL"))
-        _build_debug_composite(screen, debug_points)
-        safe_speak(", ".join(parts) if parts else "Could not read creative settings")
+        return (", ".join(parts) if parts else "Could not read creative settings"), debug_points
+
+    return "Not on a mode selection screen", debug_points
+
+
+def _status_classes(pixels):
+    """One byte per pixel: the colour checks the status reads apply to it.
+    Pixels that pass the same checks read the same, so the animated lobby
+    background (which passes none of them) doesn't change the result."""
+    p = pixels[..., :3].astype(np.int16)
+    r, g, b = p[..., 0], p[..., 1], p[..., 2]
+    checks = np.stack([
+        (b > 220) & (r < 50),                                          # selected blue
+        (g > 200) & (b < 50) & (r > 150),                              # selected green
+        (g > 200) & (b < 80) & (r > 150),                              # ranked / fill on
+        (r > 50) & (r < 110) & (g > 30) & (g < 70) & (b > 180) & (b < 240),  # unselected
+        (r > 200) & (g > 200) & (b > 200),                             # toggle knob
+        (r > 230) & (g > 230) & (b > 230),                             # button icon
+        (r >= 190) & (g >= 200) & (b < 100),                           # PLAY
+        (r > 100) & (b > 150) & (g < 100),                             # DONE
+    ], axis=-1)
+    return np.packbits(checks, axis=-1)
+
+
+def status_fingerprint(screen):
+    """Fingerprint of what the summary can read: the settings panel on a
+    ``STATUS_KEY_STEP`` grid and the screen gates, reduced to the colour
+    checks applied to them, plus the creative privacy / fill brightness
+    comparisons. Returns None when the screen is too small."""
+    left, top, right, bottom = STATUS_PANEL
+    if screen is None or screen.shape[0] < bottom or screen.shape[1] < right:
+        return None
+    panel = screen[top:bottom:STATUS_KEY_STEP, left:right:STATUS_KEY_STEP]
+    gates = np.array([get_px(screen, x, y) for x, y in STATUS_GATES], dtype=np.uint8)
+    return hash((_status_classes(panel).tobytes(), _status_classes(gates).tobytes(),
+                 read_creative_state(screen)))
+
+
+def prepare_mode_status(screen, now=None):
+    """Summarize ``screen`` and keep the text warm for ``read_mode_status``.
+    Called in the background by ``LobbyStatusMonitor``; a screen with the
+    same status fingerprint only refreshes the summary's age."""
+    now = time.monotonic() if now is None else now
+    key = status_fingerprint(screen)
+    with _warm_lock:
+        if key == _warm_status['key'] and _warm_status['text'] is not None:
+            _warm_status['time'] = now
+            return _warm_status['text']
+    text, _ = summarize_mode_status(screen)
+    with _warm_lock:
+        _warm_status['text'] = text
+        _warm_status['time'] = now
+        _warm_status['key'] = key
+    return text
+
+
+def warm_mode_status(now=None, screen=None):
+    """The background summary if it is fresh enough to speak, else None.
+    With ``screen`` it is also only returned while the status panel still
+    matches the fingerprint it was read from."""
+    now = time.monotonic() if now is None else now
+    key = status_fingerprint(screen) if screen is not None else None
+    with _warm_lock:
+        text = _warm_status['text']
+        if text is None or now - _warm_status['time'] > WARM_STATUS_MAX_AGE:
+            return None
+        if screen is not None and (key is None or key != _warm_status['key']):
+            return None
+        return text
+
+
+def invalidate_warm_status():
+    """Drop the background summary (FA11y is about to change the screen)."""
+    with _warm_lock:
+        _warm_status['text'] = None
+        _warm_status['key'] = None
 
-    else:
-        _build_debug_composite(screen, debug_points)
-        safe_speak("Not on a mode selection screen")
+
+def read_mode_status():
+    """Read and announce the full lobby mode status.
+    Speaks the background summary when it is fresh and the status panel
+    hasn't changed since it was read, else reads the screen."""
+    screen = capture_status_screen()
+    if screen is None:
+        safe_speak("Cannot capture screen")
+        return
+
+    text = warm_mode_status(screen=screen)
+    if text is not None:
+        safe_speak(text)
+        return
+
+    text, debug_points = summarize_mode_status(screen)
+    _build_debug_composite(screen, debug_points)
+    safe_speak(text)
 
 
 def toggle_lobby_fill():
@@ -809,7 +1029,7 @@ def set_team_size(requested_name):
     ranked_sizes = preset.get('ranked_sizes')
     if ranked_sizes is not None:
         # Check if ranked is currently on
-        ranked_state = read_ranked_state(screen, preset, layout.get('team_y'))
+        ranked_state = read_ranked_state(screen, preset, layout.get('team_y'), layout.get('ranked_y'))
         if ranked_state == 'On' and requested_name not in ranked_sizes:
             safe_speak(f"{requested_name} not available in ranked")
             return
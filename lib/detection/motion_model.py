@@ -0,0 +1,225 @@
+"""
+Dead-reckoning motion model for the player pose.
+
+``PlayerPositionTracker`` only gets a fresh fix every
+``PositionUpdateInterval`` (0.5 s by default), so anything that reads the
+pose at audio rate sees it jump in steps. This model sits between the
+tracker and its consumers and fills the gaps:
+
+* **Position** is extrapolated from a smoothed velocity estimated from
+  consecutive PPI / FA11y-OW fixes. Extrapolation is capped at
+  ``max_extrapolation`` seconds and a fix that implies an impossible speed
+  (respawn, map switch, bad match) resets the velocity instead of flinging
+  the prediction across the map.
+* **Heading** starts from the last minimap heading sample and adds every
+  mouse turn issued since then through ``smooth_move_mouse``. A turn is
+  spread linearly over its step duration, so an in-progress turn rotates
+  the prediction smoothly. The degrees-per-pixel gain is learned from
+  heading samples that bracket a turn, starting from the same
+  ``TurnSensitivity`` assumption auto-turn uses.
+
+Everything here is plain arithmetic under one lock, so ``predict`` is
+cheap enough to call from the audio mixer once per chunk.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+
+def _wrap_degrees(angle: float) -> float:
+    """Wrap an angle delta into [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+class MotionModel:
+    """Thread-safe pose predictor fed by position fixes, heading samples
+    and mouse turn commands.
+
+    Timestamps are ``time.perf_counter()`` seconds; every feed/predict
+    method defaults to "now".
+    """
+
+    #: Fixes further apart than this don't produce a velocity estimate.
+    MAX_FIX_GAP = 2.0
+
+    #: Implied speed (map px / s) above which a fix is treated as a jump.
+    MAX_SPEED = 40.0
+
+    #: Smoothing factor for the velocity EMA (1.0 = no smoothing).
+    VELOCITY_ALPHA = 0.6
+
+    #: Smoothing factor for the learned turn gain.
+    GAIN_ALPHA = 0.3
+
+    #: Sane bounds for the learned degrees-per-pixel turn gain.
+    MIN_GAIN = 0.01
+    MAX_GAIN = 10.0
+
+    #: Turns smaller than this (px) are too noisy to learn the gain from.
+    MIN_LEARN_PIXELS = 20
+
+    def __init__(self, degrees_per_pixel: float = 1.2,
+                 max_extrapolation: float = 1.0,
+                 stale_after: float = 3.0) -> None:
+        self._lock = threading.Lock()
+        self.degrees_per_pixel = degrees_per_pixel
+        #: Number of turns the gain has been learned from so far.
+        self.gain_samples = 0
+        self.max_extrapolation = max_extrapolation
+        self.stale_after = stale_after
+
+        self._fix: Optional[Tuple[float, float]] = None
+        self._fix_time: Optional[float] = None
+        self._velocity: Tuple[float, float] = (0.0, 0.0)
+        self._velocity_valid = False
+
+        self._heading: Optional[float] = None
+        self._heading_time: Optional[float] = None
+
+        # (start_time, duration, dx_pixels) for turns not yet absorbed by a
+        # heading sample.
+        self._turns: Deque[Tuple[float, float, float]] = deque(maxlen=64)
+
+    # ------------------------------------------------------------------
+    # Feeds
+    # ------------------------------------------------------------------
+
+    def add_position_fix(self, position: Tuple[float, float],
+                         timestamp: Optional[float] = None) -> None:
+        """Record a measured map position."""
+        if position is None:
+            return
+        t = time.perf_counter() if timestamp is None else timestamp
+        x, y = float(position[0]), float(position[1])
+        with self._lock:
+            if self._fix is not None and self._fix_time is not None:
+                dt = t - self._fix_time
+                if 0.0 < dt <= self.MAX_FIX_GAP:
+                    vx = (x - self._fix[0]) / dt
+                    vy = (y - self._fix[1]) / dt
+                    if math.hypot(vx, vy) > self.MAX_SPEED:
+                        self._velocity = (0.0, 0.0)
+                        self._velocity_valid = False
+                    elif not self._velocity_valid:
+                        self._velocity = (vx, vy)
+                        self._velocity_valid = True
+                    else:
+                        a = self.VELOCITY_ALPHA
+                        self._velocity = (
+                            a * vx + (1.0 - a) * self._velocity[0],
+                            a * vy + (1.0 - a) * self._velocity[1],
+                        )
+                elif dt > self.MAX_FIX_GAP:
+                    self._velocity = (0.0, 0.0)
+                    self._velocity_valid = False
+            self._fix = (x, y)
+            self._fix_time = t
+
+    def add_heading_sample(self, angle: float,
+                           timestamp: Optional[float] = None) -> None:
+        """Record a measured heading (degrees, 0 = north, clockwise)."""
+        if angle is None:
+            return
+        t = time.perf_counter() if timestamp is None else timestamp
+        angle = float(angle) % 360.0
+        with self._lock:
+            if self._heading is not None and self._heading_time is not None:
+                self._learn_gain(angle, self._heading, self._heading_time, t)
+            # Turns that finished before this sample are now baked into it.
+            while self._turns and self._turns[0][0] + self._turns[0][1] <= t:
+                self._turns.popleft()
+            self._heading = angle
+            self._heading_time = t
+
+    def add_turn_command(self, dx_pixels: float, duration: float = 0.0,
+                         timestamp: Optional[float] = None) -> None:
+        """Record a horizontal mouse turn that starts at ``timestamp`` and
+        is spread evenly over ``duration`` seconds."""
+        if not dx_pixels:
+            return
+        t = time.perf_counter() if timestamp is None else timestamp
+        with self._lock:
+            self._turns.append((t, max(0.0, float(duration)), float(dx_pixels)))
+
+    def reset(self) -> None:
+        """Forget all state (e.g. on map change or match end)."""
+        with self._lock:
+            self._fix = None
+            self._fix_time = None
+            self._velocity = (0.0, 0.0)
+            self._velocity_valid = False
+            self._heading = None
+            self._heading_time = None
+            self._turns.clear()
+
+    # ------------------------------------------------------------------
+    # Prediction
+    # ------------------------------------------------------------------
+
+    def predict(self, timestamp: Optional[float] = None
+                ) -> Tuple[Optional[Tuple[float, float]], Optional[float]]:
+        """Predicted ``(position, heading)`` at ``timestamp``.
+
+        Either element is ``None`` when there is no sample younger than
+        ``stale_after`` seconds to predict from.
+        """
+        t = time.perf_counter() if timestamp is None else timestamp
+        with self._lock:
+            position = None
+            if self._fix is not None and t - self._fix_time <= self.stale_after:
+                dt = min(max(0.0, t - self._fix_time), self.max_extrapolation)
+                position = (
+                    self._fix[0] + self._velocity[0] * dt,
+                    self._fix[1] + self._velocity[1] * dt,
+                )
+
+            heading = None
+            if (self._heading is not None
+                    and t - self._heading_time <= self.stale_after):
+                pixels = self._turn_pixels_between(self._heading_time, t)
+                heading = (self._heading + pixels * self.degrees_per_pixel) % 360.0
+
+        return position, heading
+
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        """Smoothed velocity estimate in map px / s."""
+        with self._lock:
+            return self._velocity
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _turn_pixels_between(self, t0: float, t1: float) -> float:
+        """Pixels of commanded turn executed inside ``(t0, t1]``."""
+        total = 0.0
+        for start, duration, dx in self._turns:
+            end = start + duration
+            if end <= t0 or start > t1:
+                continue
+            if duration <= 0.0:
+                total += dx
+                continue
+            overlap = min(end, t1) - max(start, t0)
+            if overlap > 0.0:
+                total += dx * (overlap / duration)
+        return total
+
+    def _learn_gain(self, angle: float, prev_angle: float,
+                    prev_time: float, t: float) -> None:
+        pixels = self._turn_pixels_between(prev_time, t)
+        if abs(pixels) < self.MIN_LEARN_PIXELS:
+            return
+        observed = _wrap_degrees(angle - prev_angle)
+        gain = observed / pixels
+        if not (self.MIN_GAIN <= gain <= self.MAX_GAIN):
+            # Opposite sign or wrap-around ambiguity — not a usable sample.
+            return
+        a = self.GAIN_ALPHA
+        self.degrees_per_pixel = a * gain + (1.0 - a) * self.degrees_per_pixel
+        self.gain_samples += 1
@@ -0,0 +1,125 @@
+"""
+Character-trigram index for correcting OCR'd item names.
+
+Hotbar and inventory OCR used to correct a read by running
+``difflib.SequenceMatcher`` against every item name of the map on every
+read. ``NameIndex`` builds a trigram inverted index over the names once:
+
+* a query's trigrams (names padded with two leading and one trailing
+  space, so short words and word starts still index) pull every name
+  sharing at least one of them from the postings lists;
+* those candidates are ranked by trigram Dice overlap and only the top
+  ``SHORTLIST`` are scored with ``SequenceMatcher.ratio`` — the same score
+  and cutoffs the callers used before, so matches don't change;
+* the final ``query -> match`` mapping is memoized, since the same raw OCR
+  string (an unchanged slot) comes back again and again.
+
+A query sharing no trigram with any name has no match.
+"""
+from __future__ import annotations
+
+import difflib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set
+
+#: Candidates scored with ``SequenceMatcher`` per query.
+SHORTLIST = 10
+
+#: Memoized queries kept per index (least recently used dropped first).
+MEMO_SIZE = 1024
+
+
+class NameMatch(NamedTuple):
+    index: int
+    name: str
+    ratio: float
+
+
+def _normalize(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Trigrams of an already normalized string, padded at both ends."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Fuzzy item-name lookup over a fixed list of names."""
+
+    def __init__(self, names: Sequence[str], shortlist: int = SHORTLIST,
+                 memo_size: int = MEMO_SIZE) -> None:
+        self.names = list(names)
+        self.shortlist_size = shortlist
+        self.memo_size = memo_size
+        self._keys = [_normalize(name) for name in self.names]
+        self._postings: Dict[str, List[int]] = {}
+        self._sizes: List[int] = []
+        for i, key in enumerate(self._keys):
+            grams = trigrams(key)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+        self._memo: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.memo_hits = 0
+        self.lookups = 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def shortlist(self, query: str) -> List[int]:
+        """Indices of the names sharing the most trigrams with ``query``."""
+        grams = trigrams(_normalize(query))
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for i in self._postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        ranked = sorted(shared, key=lambda i: (-2.0 * shared[i] / (len(grams) + self._sizes[i]), i))
+        return ranked[:self.shortlist_size]
+
+    def match(self, query: str, cutoff: float = 0.5,
+              strict: bool = False) -> Optional[NameMatch]:
+        """Best name with ``SequenceMatcher`` ratio >= ``cutoff`` (> with
+        ``strict``) among the shortlist (first listed wins ties), or None."""
+        query = _normalize(query)
+        if not query:
+            return None
+        memo_key = (query, cutoff, strict)
+        with self._lock:
+            self.lookups += 1
+            if memo_key in self._memo:
+                self._memo.move_to_end(memo_key)
+                self.memo_hits += 1
+                return self._memo[memo_key]
+
+        best = None
+        matcher = difflib.SequenceMatcher(None, b='')
+        matcher.set_seq2(query)
+        for i in sorted(self.shortlist(query)):
+            matcher.set_seq1(self._keys[i])
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
+            # As difflib.get_close_matches scores it: seq1 the name, seq2 the query
+            ratio = matcher.ratio()
+            if (ratio > cutoff if strict else ratio >= cutoff) and (
+                    best is None or ratio > best.ratio):
+                best = NameMatch(i, self.names[i], ratio)
+
+        with self._lock:
+            self._memo[memo_key] = best
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return best
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'names': len(self.names),
+                'trigrams': len(self._postings),
+                'lookups': self.lookups,
+                'memo_hits': self.memo_hits,
+                'memo_entries': len(self._memo),
+            }
@@ -0,0 +1,145 @@
+"""
+Temporally coherent dynamic-object detection.
+
+Minimap icons move a few pixels between detection cycles, so re-running the
+whole-minimap template search for every enabled object each cycle mostly
+re-discovers what the previous cycle already knew. ``ObjectTrackCache``
+keeps the last-seen position of every object and, per cycle:
+
+* searches a small window around each tracked object first
+  (``TemplateBank.match_near``);
+* runs the global search for every object without a track, so a newly
+  appeared icon is reported on the first cycle it is on screen;
+* runs it straight away for a tracked object whose local search missed
+  (the icon jumped), and then only every ``global_every`` cycles while the
+  track stays lost (the icon is hidden or gone);
+* ages out objects that have not been confirmed for ``timeout`` seconds.
+
+The cache works on minimap-crop coordinates and only needs a
+``TemplateBank`` and a screen array, so it runs without the game.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from lib.detection.template_bank import TemplateBank
+
+
+class _Track(NamedTuple):
+    position: Tuple[int, int]
+    confidence: float
+    last_seen: float
+    misses: int = 0
+
+
+class ObjectTrackCache:
+    """Per-object last-seen cache in front of a ``TemplateBank``."""
+
+    #: Local search radius (px) around the last-seen icon center.
+    SEARCH_RADIUS = 24
+
+    #: Retry the global search for a lost track every this many cycles.
+    GLOBAL_EVERY = 4
+
+    #: Seconds after which an unconfirmed track is dropped.
+    TIMEOUT = 8.0
+
+    def __init__(self, bank: TemplateBank, threshold: float = 0.76,
+                 search_radius: int = SEARCH_RADIUS, global_every: int = GLOBAL_EVERY,
+                 timeout: float = TIMEOUT) -> None:
+        self.bank = bank
+        self.threshold = threshold
+        self.search_radius = search_radius
+        self.global_every = max(1, global_every)
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._tracks: Dict[str, _Track] = {}
+        self._stats = {
+            'cycles': 0,
+            'local_hits': 0,
+            'local_misses': 0,
+            'global_searches': 0,
+            'global_found': 0,
+            'aged_out': 0,
+        }
+
+    def detect(self, screen: np.ndarray, names: Iterable[str],
+               now: Optional[float] = None) -> Dict[str, Tuple[int, int]]:
+        """Positions (crop coordinates) of the requested objects confirmed
+        on ``screen`` this cycle."""
+        now = time.time() if now is None else now
+        names = list(names)
+        if screen is None or not names:
+            return {}
+
+        with self._lock:
+            self._stats['cycles'] += 1
+            wanted = set(names)
+            for name in [n for n in self._tracks if n not in wanted]:
+                del self._tracks[name]
+            tracks = dict(self._tracks)
+
+        found: Dict[str, Tuple[int, int]] = {}
+        confirmed: Dict[str, float] = {}
+        missed = []
+        for name, track in tracks.items():
+            hit = self.bank.match_near(screen, name, track.position,
+                                       self.search_radius, self.threshold)
+            if hit is None:
+                missed.append(name)
+            else:
+                found[name] = (hit.center_x, hit.center_y)
+                confirmed[name] = hit.confidence
+
+        global_names = [n for n in names if n not in tracks]
+        global_names += [n for n in missed if tracks[n].misses % self.global_every == 0]
+        global_found = 0
+        if global_names:
+            for hit in self.bank.match_instances(screen, global_names,
+                                                 threshold=self.threshold, top_k=1):
+                found[hit.name] = (hit.center_x, hit.center_y)
+                confirmed[hit.name] = hit.confidence
+                global_found += 1
+
+        with self._lock:
+            self._stats['local_hits'] += len(tracks) - len(missed)
+            self._stats['local_misses'] += len(missed)
+            if global_names:
+                self._stats['global_searches'] += 1
+                self._stats['global_found'] += global_found
+            for name, position in found.items():
+                self._tracks[name] = _Track(position, confirmed[name], now)
+            for name in missed:
+                if name not in found and name in self._tracks:
+                    track = self._tracks[name]
+                    self._tracks[name] = track._replace(misses=track.misses + 1)
+            for name, track in list(self._tracks.items()):
+                if now - track.last_seen > self.timeout:
+                    del self._tracks[name]
+                    self._stats['aged_out'] += 1
+        return found
+
+    def reset(self) -> None:
+        """Forget every track (e.g. when monitoring pauses)."""
+        with self._lock:
+            self._tracks.clear()
+
+    @property
+    def tracked(self) -> Dict[str, Tuple[int, int]]:
+        """Last-seen position of every live track."""
+        with self._lock:
+            return {name: track.position for name, track in self._tracks.items()}
+
+    def get_stats(self) -> dict:
+        """Counters plus the local-search hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['tracked'] = len(self._tracks)
+        attempts = stats['local_hits'] + stats['local_misses']
+        stats['hit_rate'] = stats['local_hits'] / attempts if attempts else 0.0
+        return stats
@@ -0,0 +1,157 @@
+"""
+Translation-only fast path for PPI.
+
+The minimap is north-up at a near-constant scale, so between two position
+fixes the capture is the previous map window moved by a few pixels. Once a
+feature match has anchored the window (its four corners on the map), the
+next fix only needs that shift:
+
+* crop the anchored window's bounding box out of the grayscale map and
+  resize it to the capture size (the *reference*);
+* estimate the capture's shift against the reference with FFT phase
+  correlation (``cv2.phaseCorrelate``, Hanning-windowed);
+* when the correlation peak is strong and the shift plausible, move the
+  window by the shift scaled back to map pixels.
+
+That is two FFTs on a 250x250 image instead of ``detectAndCompute`` +
+``knnMatch`` + RANSAC. Anything that breaks the translation assumption
+(map switch, respawn, zoomed or occluded minimap) shows up as a weak peak
+or a large shift, and the caller falls back to feature matching, which
+re-anchors the tracker. Chained fast-path fixes accumulate sub-pixel
+error, so a feature match is forced every ``MAX_CHAINED`` fixes.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+#: Minimum phase-correlation peak response to accept a shift.
+RESPONSE_THRESHOLD = 0.2
+
+#: Largest accepted shift, as a fraction of the capture size per axis.
+MAX_SHIFT_FRACTION = 0.25
+
+#: Fast-path fixes in a row before a feature match is required again.
+MAX_CHAINED = 20
+
+
+def window_corners(x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+    """Axis-aligned window as (4, 1, 2) float32 corners in the order
+    ``feature_matcher.match`` produces (TL, BL, BR, TR)."""
+    return np.float32([[x0, y0], [x0, y1], [x1, y1], [x1, y0]]).reshape(-1, 1, 2)
+
+
+def corners_box(corners: np.ndarray) -> Tuple[float, float, float, float]:
+    """``(x0, y0, x1, y1)`` bounding box of a corner array."""
+    pts = np.asarray(corners, dtype=np.float64).reshape(-1, 2)
+    x0, y0 = pts.min(axis=0)
+    x1, y1 = pts.max(axis=0)
+    return float(x0), float(y0), float(x1), float(y1)
+
+
+class PhaseTracker:
+    """Tracks the minimap window on the map by phase correlation.
+
+    ``anchor`` records a feature-matched window; ``track`` returns the
+    window for a new capture, or None when the caller should feature-match.
+    """
+
+    def __init__(self, response_threshold: float = RESPONSE_THRESHOLD,
+                 max_shift_fraction: float = MAX_SHIFT_FRACTION,
+                 max_chained: int = MAX_CHAINED) -> None:
+        self.response_threshold = response_threshold
+        self.max_shift_fraction = max_shift_fraction
+        self.max_chained = max_chained
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._box: Optional[Tuple[float, float, float, float]] = None
+        self._chained = 0
+        self._window: Optional[np.ndarray] = None
+        self.last_response = 0.0
+        self.attempts = 0
+        self.hits = 0
+
+    def reset(self) -> None:
+        """Forget the anchor (map switched, match lost)."""
+        with self._lock:
+            self._box = None
+            self._chained = 0
+
+    def anchor(self, corners: np.ndarray) -> None:
+        """Start tracking from a feature-matched window."""
+        with self._lock:
+            self._box = corners_box(corners)
+            self._chained = 0
+
+    @property
+    def anchored(self) -> bool:
+        with self._lock:
+            return self._box is not None
+
+    def _hanning(self, shape: Tuple[int, int]) -> np.ndarray:
+        if self._window is None or self._window.shape != shape:
+            self._window = cv2.createHanningWindow((shape[1], shape[0]), cv2.CV_32F)
+        return self._window
+
+    def track(self, capture: np.ndarray, map_image: np.ndarray) -> Optional[np.ndarray]:
+        """Corners of ``capture`` (grayscale) on ``map_image``, or None when
+        unanchored, out of chain budget, off the map or not confident."""
+        with self._lock:
+            box = self._box
+            chained = self._chained
+        if not self.enabled or box is None or map_image is None or chained >= self.max_chained:
+            return None
+        h, w = capture.shape[:2]
+        # Corners sit on the centers of the capture's edge pixels, so the
+        # capture covers one extra scale step; crop that span (fixed integer
+        # size, so the scale doesn't wobble as the box rounds differently
+        # from fix to fix) with its left / top edge half a pixel out.
+        crop_w = int(round((box[2] - box[0]) / max(w - 1, 1) * w))
+        crop_h = int(round((box[3] - box[1]) / max(h - 1, 1) * h))
+        scale_x = crop_w / w
+        scale_y = crop_h / h
+        x0 = int(round(box[0] + 0.5 - 0.5 * scale_x))
+        y0 = int(round(box[1] + 0.5 - 0.5 * scale_y))
+        map_h, map_w = map_image.shape[:2]
+        if x0 < 0 or y0 < 0 or x0 + crop_w > map_w or y0 + crop_h > map_h or min(crop_w, crop_h) < 8:
+            return None
+        reference = cv2.resize(map_image[y0:y0 + crop_h, x0:x0 + crop_w], (w, h),
+                               interpolation=cv2.INTER_AREA)
+
+        with self._lock:
+            self.attempts += 1
+            window = self._hanning((h, w))
+        (dx, dy), response = cv2.phaseCorrelate(
+            reference.astype(np.float32), capture.astype(np.float32), window
+        )
+        self.last_response = float(response)
+        if (not np.isfinite(response) or response < self.response_threshold
+                or abs(dx) > w * self.max_shift_fraction
+                or abs(dy) > h * self.max_shift_fraction):
+            return None
+
+        # Capture content shifted by (dx, dy): the window moved the other way.
+        nx0 = x0 - 0.5 + 0.5 * scale_x - dx * scale_x
+        ny0 = y0 - 0.5 + 0.5 * scale_y - dy * scale_y
+        nx1 = nx0 + scale_x * (w - 1)
+        ny1 = ny0 + scale_y * (h - 1)
+        with self._lock:
+            if self._box != box:
+                # Re-anchored or reset while we were correlating.
+                return None
+            self._box = (nx0, ny0, nx1, ny1)
+            self._chained += 1
+            self.hits += 1
+        return window_corners(nx0, ny0, nx1, ny1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'anchored': self._box is not None,
+                'attempts': self.attempts,
+                'hits': self.hits,
+                'last_response': round(self.last_response, 3),
+            }
@@ -12,7 +12,9 @@ import math
 from typing import Optional, Tuple
 from accessible_output2.outputs.auto import Auto
 from lib.utilities.utilities import read_config, get_config_boolean, get_config_float, get_config_int, on_config_change
-from lib.managers.screenshot_manager import capture_coordinates, get_pixel
+from lib.managers.screenshot_manager import (
+    capture_coordinates, color_between, color_near, probe_pixels,
+)
 from lib.detection.dynamic_object_finder import optimized_finder, DYNAMIC_OBJECT_CONFIGS
 from lib.detection.ppi import find_player_position as ppi_find_player_position
 from lib.detection.coordinate_config import get_minimap_coords, get_px_to_meters
@@ -21,15 +23,10 @@ from lib.detection.coordinate_config import get_minimap_coords, get_px_to_meters
 def _current_px_to_meters() -> float:
     """Pixel-to-meters scaling for distance calculations on the current map.
 
-    Reads the current map from config each time (cheap — ``read_config``
-    caches) so this auto-adapts if the user switches maps mid-session.
+    Uses the current map cached by the position tracker from config-change
+    events, so this auto-adapts if the user switches maps mid-session.
     """
-    try:
-        cfg = read_config()
-        slug = cfg.get('POI', 'current_map', fallback='main')
-    except Exception:
-        slug = 'main'
-    return get_px_to_meters(slug)
+    return get_px_to_meters(position_tracker.current_map)
 
 
 def _ensure_dynamic_icon_paths():
@@ -52,7 +49,11 @@ def _ensure_dynamic_icon_paths():
         print(f"[warn] dynamic icon path normalization failed: {e}")
 
 from lib.utilities.spatial_audio import SpatialAudio
-from lib.utilities.mouse import smooth_move_mouse
+from lib.audio import get_ping_scheduler
+from lib.utilities.mouse import smooth_move_mouse, add_turn_listener
+from lib.detection.motion_model import MotionModel
+from lib.detection.position_scheduler import AdaptivePositionScheduler, HeadingSampler
+from lib.detection.coordinate_index import CoordinateIndex
 from lib.managers.custom_poi_manager import update_poi_handler
 from lib.monitors.background_monitor import monitor
 
@@ -95,6 +96,11 @@ WIDTH, HEIGHT = ROI_END_ORIG[0] - ROI_START_ORIG[0], ROI_END_ORIG[1] - ROI_START
 DYNAMIC_OBJECTS = [(name.replace('_', ' ').title(), "0", "0") for name in DYNAMIC_OBJECT_CONFIGS.keys()]
 SPECIAL_POIS = [("Safe Zone", "0", "0"), ("Closest", "0", "0")]
 
+def _match_in_lobby() -> bool:
+    """Lobby state from the Fortnite log, imported lazily."""
+    from lib.monitors.match_event_monitor import match_event_monitor
+    return match_event_monitor.in_lobby
+
 # Performance tracking for optimized player position updates
 class PlayerPositionTracker:
     """Optimized player position tracker"""
@@ -106,20 +112,88 @@ class PlayerPositionTracker:
         self.monitor_thread = None
         self.stop_event = threading.Event()
         self._cached_update_interval = 0.5
+        self._cached_current_map = 'main'
+        # Dead-reckons pose between fixes so audio can follow turns smoothly.
+        # The initial turn gain matches auto-turn's assumption that
+        # ``TurnSensitivity * 2`` mickeys is roughly 180 degrees.
+        self.motion_model = MotionModel()
+        # Picks the delay before each background fix from movement,
+        # consumer demand and lobby / map / inventory state.
+        self.scheduler = AdaptivePositionScheduler(
+            is_lobby=_match_in_lobby,
+            is_overlay_open=lambda: monitor.map_open or monitor.inventory_open,
+        )
+        # Live heading for pings, sampled off the audio ping thread.
+        self.heading_sampler = HeadingSampler(
+            lambda: find_minimap_icon_direction()[1], self.add_heading_sample)
         self._init_cached_config()
         on_config_change(self._on_config_change)
+        add_turn_listener(self._on_mouse_turn)
 
     def _init_cached_config(self):
         """Initialize cached config values."""
         try:
             config = read_config()
-            self._cached_update_interval = get_config_float(config, 'PositionUpdateInterval', 0.5)
+            self._apply_config(config)
         except Exception:
             pass
 
     def _on_config_change(self, config):
         """Update cached config values when config changes."""
+        self._apply_config(config)
+
+    def _apply_config(self, config):
         self._cached_update_interval = get_config_float(config, 'PositionUpdateInterval', 0.5)
+        self._cached_current_map = config.get('POI', 'current_map', fallback='main')
+        self.scheduler.base_interval = self._cached_update_interval
+        self.scheduler.cpu_budget = get_config_float(
+            config, 'PositionCpuBudget', AdaptivePositionScheduler.DEFAULT_CPU_BUDGET * 100) / 100.0
+        turn_sensitivity = get_config_int(config, 'TurnSensitivity', 75)
+        if turn_sensitivity > 0 and self.motion_model.gain_samples == 0:
+            self.motion_model.degrees_per_pixel = 90.0 / turn_sensitivity
+
+    @property
+    def current_map(self) -> str:
+        """Current map slug, kept fresh by config-change events."""
+        return self._cached_current_map
+
+    def _on_mouse_turn(self, dx, duration):
+        """Feed turn commands from ``smooth_move_mouse`` into the motion model."""
+        self.motion_model.add_turn_command(dx, duration)
+
+    def add_heading_sample(self, angle: Optional[float]) -> None:
+        """Record a heading read outside the tracker (e.g. by a sound updater)."""
+        if angle is not None:
+            self.last_angle = angle
+            self.motion_model.add_heading_sample(angle)
+
+    def add_position_fix(self, position: Optional[Tuple[int, int]]) -> None:
+        """Record a position found outside the tracker (e.g. by a monitor)."""
+        if position is not None:
+            self.last_position = position
+            self.motion_model.add_position_fix(position)
+
+    def set_heading_demand(self, consumer: str, active: bool) -> None:
+        """Keep the heading sampled every ``HeadingSampler.INTERVAL`` while
+        ``consumer`` (e.g. a ping) needs one; ping callbacks then read it
+        from the cache instead of capturing the minimap themselves."""
+        self.heading_sampler.set_demand(consumer, active)
+
+    def get_predicted_pose(self) -> Tuple[Optional[Tuple[float, float]], Optional[float]]:
+        """Dead-reckoned (position, angle) for right now.
+
+        Cheap enough to call per audio chunk; never captures the screen.
+        Either element is ``None`` when the tracker has no recent sample.
+        """
+        return self.motion_model.predict()
+    
+    def set_demand(self, consumer: str, active: bool) -> None:
+        """Mark a consumer (e.g. a navigation pinger) as needing fast fixes."""
+        self.scheduler.set_demand(consumer, active)
+
+    def get_scheduler_stats(self) -> dict:
+        """Current update rate, state and CPU cost of background fixes."""
+        return self.scheduler.get_stats()
     
     def get_cached_position(self) -> Optional[Tuple[int, int]]:
         """Get last cached position"""
@@ -131,8 +205,14 @@ class PlayerPositionTracker:
     
     def get_position_and_angle(self, force_update: bool = False) -> Tuple[Optional[Tuple[int, int]], Optional[float]]:
         """Get current position and angle using PPI when minimap is visible"""
+        self._take_fix()
+        return self.last_position, self.last_angle
+
+    def _take_fix(self) -> Optional[Tuple[int, int]]:
+        """Run one fix and feed the motion model. Returns the fresh position
+        or None if this attempt failed."""
+        position = None
         try:
-            position = None
             angle = None
 
             # Position via FA11y-OW when calibrated, falling back to PPI
@@ -141,15 +221,17 @@ class PlayerPositionTracker:
             position = find_player_position()
             if position is not None:
                 self.last_position = position
+                self.motion_model.add_position_fix(position)
                 _, angle = find_minimap_icon_direction()
             
             if angle is not None:
                 self.last_angle = angle
+                self.motion_model.add_heading_sample(angle)
         
         except Exception as e:
             print(f"Error updating player position: {e}")
         
-        return self.last_position, self.last_angle
+        return position
     
     def start_monitoring(self):
         """Start background position monitoring for better performance"""
@@ -170,11 +252,13 @@ class PlayerPositionTracker:
         """Background monitoring loop"""
         while not self.stop_event.is_set():
             try:
-                # Update position in background
-                self.get_position_and_angle()
+                run_fix, delay = self.scheduler.next_delay()
+                if run_fix:
+                    cpu_start = time.thread_time()
+                    position = self._take_fix()
+                    self.scheduler.record_fix(position, time.thread_time() - cpu_start)
 
-                # Sleep for the cached interval (updated via config events)
-                self.stop_event.wait(timeout=self._cached_update_interval)
+                self.stop_event.wait(timeout=delay)
 
             except Exception as e:
                 print(f"Error in position monitor loop: {e}")
@@ -182,28 +266,33 @@ class PlayerPositionTracker:
 
 # Global position tracker
 position_tracker = PlayerPositionTracker()
+# Ping jobs read the player pose once per scheduler tick from here.
+get_ping_scheduler().set_pose_provider(position_tracker.get_predicted_pose)
+
+# Map-state probe pixels: white on the minimap frame, yellow on the
+# full-screen map header.
+_MINIMAP_PIXEL = (1883, 49)
+_FULL_MAP_PIXEL = (66, 66)
+_is_minimap_white = color_between((250, 250, 250), (255, 255, 255))
+_is_full_map_yellow = color_between((232, 240, 11), (262, 270, 41))
+
+
+def check_map_state():
+    """``(minimap_present, full_map_open)`` from one pixel probe."""
+    colors = probe_pixels([_MINIMAP_PIXEL, _FULL_MAP_PIXEL])
+    if colors is None:
+        return False, False
+    return bool(_is_minimap_white(colors[:1])[0]), bool(_is_full_map_yellow(colors[1:])[0])
 
 def check_for_minimap():
     """Check if minimap is present (map not open) by checking white pixel"""
-    try:
-        pixel = get_pixel(1883, 49)
-        if pixel is None:
-            return False
-        r, g, b = pixel
-        return (250 <= r <= 255) and (250 <= g <= 255) and (250 <= b <= 255)
-    except Exception:
-        return False
+    hits = probe_pixels([_MINIMAP_PIXEL], _is_minimap_white)
+    return bool(hits is not None and hits[0])
 
 def check_for_full_map():
     """Check if full map is open by checking yellow pixel"""
-    try:
-        pixel = get_pixel(66, 66)
-        if pixel is None:
-            return False
-        r, g, b = pixel
-        return (232 <= r <= 262) and (240 <= g <= 270) and (11 <= b <= 41)
-    except Exception:
-        return False
+    hits = probe_pixels([_FULL_MAP_PIXEL], _is_full_map_yellow)
+    return bool(hits is not None and hits[0])
 
 def handle_closed_map_ppi(poi_name, poi_coords):
     """Handle PPI when map is closed - close map, get position, reopen map"""
@@ -252,8 +341,7 @@ def get_player_position_for_poi_creation():
     navigation, regardless of whether the map is open or closed.
     """
     try:
-        minimap_present = check_for_minimap()
-        full_map_open = check_for_full_map()
+        minimap_present, full_map_open = check_map_state()
 
         if full_map_open and not minimap_present:
             # Close the map so the minimap is visible, read PPI, reopen it.
@@ -704,29 +792,32 @@ def find_player_position():
         pass
     return ppi_find_player_position()
 
+# Coordinate matrix for the last POI list queried: (list, length, index)
+_poi_index_cache = None
+
+def _get_poi_index(poi_list) -> CoordinateIndex:
+    """Parsed coordinates of ``poi_list``, rebuilt only when the list changes."""
+    global _poi_index_cache
+    cached = _poi_index_cache
+    if cached is not None and cached[0] is poi_list and cached[1] == len(poi_list):
+        return cached[2]
+    index = CoordinateIndex.from_rows(poi_list, truncate=True)
+    _poi_index_cache = (poi_list, len(poi_list), index)
+    return index
+
 def find_closest_poi(icon_location, poi_list):
     """Find closest POI to the player"""
     if not icon_location or not poi_list:
         return None, None
     
-    distances = []
-    for poi_data in poi_list:
-        poi_name = poi_data[0]
-        try:
-            coord_x = int(float(poi_data[1]))
-            coord_y = int(float(poi_data[2]))
-            distance = np.linalg.norm(
-                np.array(icon_location) - np.array([coord_x, coord_y])
-            ) * _current_px_to_meters()
-            distances.append((poi_name, (coord_x, coord_y), distance))
-        except (ValueError, TypeError, IndexError):
-            continue
-            
-    if not distances:
+    index = _get_poi_index(poi_list)
+    found = index.nearest(icon_location)
+    if found is None:
         return None, None
-        
-    closest = min(distances, key=lambda x: x[2])
-    return closest[0], closest[1]
+    
+    row, _ = found
+    x, y = index.point(row)
+    return index.names[row], (int(x), int(y))
 
 def find_closest_dynamic_object(player_location: Tuple[int, int], use_ppi: bool = False) -> Optional[Tuple[str, Tuple[int, int]]]:
     """
@@ -752,22 +843,16 @@ def find_closest_dynamic_object(player_location: Tuple[int, int], use_ppi: bool
         if not found_objects:
             return None
         
-        # Calculate distances and find closest
-        closest_object = None
-        min_distance = float('inf')
-        
-        for obj_name, obj_coords in found_objects.items():
-            distance = np.linalg.norm(
-                np.array(player_location) - np.array(obj_coords)
-            )
-            
-            if distance < min_distance:
-                min_distance = distance
-                # Convert internal name to display name
-                display_name = obj_name.replace('_', ' ').title()
-                closest_object = (display_name, obj_coords)
+        # One vectorized distance pass over the detections
+        names = list(found_objects)
+        found = CoordinateIndex(names, np.array([found_objects[n] for n in names])).nearest(player_location)
+        if found is None:
+            return None
         
-        return closest_object
+        obj_name = names[found[0]]
+        # Convert internal name to display name
+        display_name = obj_name.replace('_', ' ').title()
+        return (display_name, found_objects[obj_name])
         
     except Exception as e:
         print(f"Error finding closest dynamic object: {e}")
@@ -785,33 +870,20 @@ def find_closest_game_object(player_location: Tuple[int, int]) -> Optional[Tuple
     """
     try:
         from lib.managers.game_object_manager import game_object_manager
-        from lib.utilities.utilities import calculate_distance
         
         if not player_location:
             return None
         
-        config = read_config()
-        current_map = config.get('POI', 'current_map', fallback='main')
-        
-        # Find all objects within a reasonable radius
-        nearby_objects = game_object_manager.find_all_objects_within_radius(
-            current_map, player_location, 1000.0  # 1000 meter radius
+        nearest = game_object_manager.find_nearest_object(
+            position_tracker.current_map, player_location
         )
         
-        if not nearby_objects:
+        # Keep the old reach: only objects within 1000 meters count
+        if nearest is None or nearest[2] > 1000.0:
             return None
         
-        # Find the closest object across all types
-        closest_object = None
-        min_distance = float('inf')
-        
-        for obj_type, objects in nearby_objects.items():
-            for obj_name, coords, distance in objects:
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_object = (obj_name, coords)
-        
-        return closest_object
+        obj_name, coords, _ = nearest
+        return (obj_name, coords)
         
     except Exception as e:
         print(f"Error finding closest game object: {e}")
@@ -1029,56 +1101,58 @@ def play_spatial_poi_sound(player_location, player_angle, poi_location):
     return active_sound_updater
 
 class POISoundUpdater:
-    """Handles real-time updates for POI spatial sound as player turns."""
+    """Handles real-time updates for POI spatial sound as player turns.
+
+    The audio engine re-aims the ping every mix chunk from the tracker's
+    dead-reckoned pose. The tracker's heading sampler keeps real heading
+    samples coming so the prediction stays anchored; a job on the shared
+    ping scheduler only watches for the ping to finish.
+    """
+    
+    UPDATE_INTERVAL = 0.1
     
     def __init__(self, player_location, poi_location, volume):
         """Initialize with fixed positions and volume."""
         self.player_location = player_location
         self.poi_location = poi_location
         self.volume = volume
-        self.stop_event = threading.Event()
-        self.update_thread = None
+        self.job = None
+        spatial_poi.follow_target(poi_location, self._predicted_pose)
+        position_tracker.set_demand('poi_sound', True)
+        position_tracker.set_heading_demand('poi_sound', True)
         self.start_updates()
+
+    def _predicted_pose(self):
+        position, angle = position_tracker.get_predicted_pose()
+        return position or self.player_location, angle
     
     def start_updates(self):
-        """Start the thread that updates panning based on player rotation."""
-        self.update_thread = threading.Thread(target=self._update_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
-    
-    def _update_loop(self):
-        """Continuously update panning based on player's current angle."""
-        update_interval = 0.1
-        
-        while not self.stop_event.is_set() and spatial_poi.is_playing:
-            try:
-                _, current_player_angle = find_minimap_icon_direction()
-                
-                if current_player_angle is not None:
-                    # Use universal spatial positioning
-                    distance, relative_angle = SpatialAudio.calculate_distance_and_angle(
-                        self.player_location, current_player_angle, self.poi_location
-                    )
-                    
-                    spatial_poi.update_spatial_position(distance, relative_angle, self.volume)
-            
-            except Exception:
-                pass
-            
-            time.sleep(update_interval)
+        """Schedule the end-of-ping check."""
+        self.job = get_ping_scheduler().schedule(
+            self._sample_heading, self.UPDATE_INTERVAL,
+            delay=self.UPDATE_INTERVAL, name='poi_sound')
+    
+    def _sample_heading(self, _pose):
+        """Release the fast fixes and heading samples once the ping ends."""
+        if not spatial_poi.is_playing:
+            # Ping finished on its own; nothing needs fast fixes any more.
+            self.job.cancel()
+            position_tracker.set_demand('poi_sound', False)
+            position_tracker.set_heading_demand('poi_sound', False)
     
     def stop(self):
-        """Stop the update thread."""
-        self.stop_event.set()
-        if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=0.5)
+        """Stop sampling."""
+        if self.job is not None:
+            self.job.cancel()
+        spatial_poi.stop_following()
+        position_tracker.set_demand('poi_sound', False)
+        position_tracker.set_heading_demand('poi_sound', False)
 
 class ContinuousPOIPinger:
     """Handles continuous pinging for a POI with variable interval."""
     def __init__(self, poi_location: Tuple[int, int]):
         self.poi_location = poi_location
-        self.stop_event = threading.Event()
-        self.thread = None
+        self.job = None
         self.config = read_config()
         self.min_interval = get_config_float(self.config, 'ContinuousPingMinInterval', 0.5)
         self.max_interval = get_config_float(self.config, 'ContinuousPingMaxInterval', 2.0)
@@ -1086,41 +1160,44 @@ class ContinuousPOIPinger:
         self.max_distance_for_interval = get_config_float(self.config, 'PingVolumeMaxDistance', 1000.0)
 
     def start(self):
-        if not self.thread or not self.thread.is_alive():
-            self.stop_event.clear()
-            self.thread = threading.Thread(target=self._audio_loop, daemon=True)
-            self.thread.start()
+        if self.job is None or not self.job.active:
+            # The tracker's own thread keeps the pose fresh; pings only
+            # read it.
+            position_tracker.start_monitoring()
+            position_tracker.set_demand('continuous_ping', True)
+            self.job = get_ping_scheduler().schedule(
+                self._ping, self.max_interval, name='continuous_ping')
 
     def stop(self):
-        self.stop_event.set()
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+        position_tracker.set_demand('continuous_ping', False)
+
+    def _ping(self, pose):
+        """Play one ping; returns the delay before the next one."""
+        player_pos, player_angle = pose
+        if player_pos is None:
+            player_pos = position_tracker.get_cached_position()
+        if player_angle is None:
+            player_angle = position_tracker.get_cached_angle()
 
-    def _audio_loop(self):
-        while not self.stop_event.is_set():
-            player_pos = find_player_position()
-            _, player_angle = find_minimap_icon_direction()
+        if not (player_pos and player_angle is not None):
+            # If player position is not available, wait a bit before retrying
+            return self.max_interval
 
-            if player_pos and player_angle is not None:
-                distance, _ = SpatialAudio.calculate_distance_and_angle(player_pos, player_angle, self.poi_location)
-                
-                # Play sound
-                play_spatial_poi_sound(player_pos, player_angle, self.poi_location)
-                
-                # Calculate next interval
-                distance_ratio = min(distance / self.max_distance_for_interval, 1.0)
-                interval_range = self.max_interval - self.min_interval
-                # Inverted relationship: closer means smaller ratio, faster interval
-                current_interval = self.min_interval + (interval_range * (distance_ratio ** self.distance_exponent))
-                
-                sleep_time = max(self.min_interval, min(current_interval, self.max_interval))
-                
-                if self.stop_event.wait(timeout=sleep_time):
-                    break
-            else:
-                # If player position is not available, wait a bit before retrying
-                if self.stop_event.wait(timeout=self.max_interval):
-                    break
+        distance, _ = SpatialAudio.calculate_distance_and_angle(player_pos, player_angle, self.poi_location)
+        
+        # Play sound
+        play_spatial_poi_sound(player_pos, player_angle, self.poi_location)
+        
+        # Calculate next interval
+        distance_ratio = min(distance / self.max_distance_for_interval, 1.0)
+        interval_range = self.max_interval - self.min_interval
+        # Inverted relationship: closer means smaller ratio, faster interval
+        current_interval = self.min_interval + (interval_range * (distance_ratio ** self.distance_exponent))
+        
+        return max(self.min_interval, min(current_interval, self.max_interval))
 
 def start_icon_detection(use_ppi=False):
     """Start icon detection with manual trigger handling"""
@@ -1135,8 +1212,7 @@ def start_icon_detection(use_ppi=False):
     position_tracker.start_monitoring()
     
     # Check pixel conditions
-    minimap_present = check_for_minimap()
-    full_map_open = check_for_full_map()
+    minimap_present, full_map_open = check_map_state()
     
     if minimap_present:
         # Minimap present, map not open - just use PPI
@@ -1360,22 +1436,16 @@ def get_position_with_fallback():
         
     return position
 
+_is_pixel_white = color_near((255, 255, 255), 10)
+_is_pixel_slate = color_near((60, 61, 80), 10)
+
+
 def check_for_pixel():
     """Check if the pixel at a specific location is white or (60, 61, 80)"""
-    try:
-        pixel = get_pixel(1877, 50)
-        if pixel is None:
-            return False
-        r, g, b = pixel
-        # Check white (tolerance=10)
-        if all(abs(c - t) <= 10 for c, t in zip((r, g, b), (255, 255, 255))):
-            return True
-        # Check (60, 61, 80) (tolerance=10)
-        if all(abs(c - t) <= 10 for c, t in zip((r, g, b), (60, 61, 80))):
-            return True
-        return False
-    except Exception:
+    colors = probe_pixels([(1877, 50)])
+    if colors is None:
         return False
+    return bool(_is_pixel_white(colors)[0] or _is_pixel_slate(colors)[0])
 
 def cleanup_object_detection():
     """Clean up object detection resources"""
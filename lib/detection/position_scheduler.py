@@ -0,0 +1,238 @@
+"""
+Adaptive update scheduler for ``PlayerPositionTracker``.
+
+A fixed ``PositionUpdateInterval`` spends the same PPI work on a player
+standing in a menu as on one skydiving across the map. The scheduler picks
+the next interval from what is actually going on:
+
+* **paused** — lobby (per ``MatchEventMonitor``). No fixes at all; the loop
+  just re-checks the state every ``PAUSE_POLL`` seconds.
+* **overlay** — full map or inventory open (per ``BackgroundMonitor``). The
+  minimap is hidden or irrelevant, so fixes drop to ``OVERLAY_FACTOR`` times
+  the base interval.
+* **active** — recent fixes show motion, or a consumer (navigation pinger,
+  POI sound) has registered demand. Runs at ``ACTIVE_FACTOR`` times the
+  base interval, never faster than ``MIN_INTERVAL``.
+* **idle** — several consecutive fixes without motion. ``IDLE_FACTOR``
+  times the base interval.
+* **normal** — anything else, i.e. the configured interval.
+
+Outside the active state the measured CPU time per fix is compared
+against a CPU budget (fraction of one core, ``PositionCpuBudget`` in
+config); when the chosen rate would exceed it the interval is stretched
+until it fits. Active fixes are never stretched: a moving player or a
+navigation consumer gets the configured rate whatever a fix costs.
+
+State sources are plain callables so the logic can be driven from a
+recorded sequence in tests without the monitors running.
+
+``HeadingSampler`` keeps a live heading for spatial-audio pings: while any
+consumer asks for one it reads the minimap icon direction every
+``interval`` seconds on its own thread, so ping callbacks on the audio
+scheduler only ever read cached values.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Set, Tuple
+
+
+class AdaptivePositionScheduler:
+    """Chooses the delay before the next position fix."""
+
+    MIN_INTERVAL = 0.1
+    ACTIVE_FACTOR = 0.5
+    IDLE_FACTOR = 2.0
+    OVERLAY_FACTOR = 4.0
+    PAUSE_POLL = 1.0
+
+    #: Displacement (map px) between fixes that counts as moving.
+    MOTION_THRESHOLD = 1.5
+
+    #: Consecutive still fixes before dropping to idle.
+    IDLE_AFTER_FIXES = 4
+
+    #: Number of fixes kept for motion / cost estimates.
+    HISTORY = 8
+
+    #: Default ``cpu_budget`` (``PositionCpuBudget`` is in percent).
+    DEFAULT_CPU_BUDGET = 0.05
+
+    def __init__(self, base_interval: float = 0.5, cpu_budget: float = DEFAULT_CPU_BUDGET,
+                 is_lobby: Optional[Callable[[], bool]] = None,
+                 is_overlay_open: Optional[Callable[[], bool]] = None) -> None:
+        self.base_interval = base_interval
+        #: Fraction of one core the tracker may spend on fixes.
+        self.cpu_budget = cpu_budget
+        self.is_lobby = is_lobby or (lambda: False)
+        self.is_overlay_open = is_overlay_open or (lambda: False)
+
+        self._lock = threading.Lock()
+        self._fixes: Deque[Tuple[float, Optional[Tuple[float, float]]]] = deque(maxlen=self.HISTORY)
+        self._costs: Deque[float] = deque(maxlen=self.HISTORY)
+        self._still_fixes = 0
+        self._demand: Dict[str, bool] = {}
+
+        self.state = 'normal'
+        self.interval = base_interval
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+
+    def set_demand(self, consumer: str, active: bool) -> None:
+        """Register or clear a consumer that needs fresh positions."""
+        with self._lock:
+            if active:
+                self._demand[consumer] = True
+            else:
+                self._demand.pop(consumer, None)
+
+    def record_fix(self, position: Optional[Tuple[float, float]],
+                   cpu_seconds: float = 0.0,
+                   timestamp: Optional[float] = None) -> None:
+        """Record the outcome of one fix attempt and what it cost."""
+        t = time.perf_counter() if timestamp is None else timestamp
+        with self._lock:
+            self._costs.append(max(0.0, cpu_seconds))
+            if position is None:
+                return
+            previous = next((p for _, p in reversed(self._fixes) if p is not None), None)
+            self._fixes.append((t, position))
+            if previous is None:
+                return
+            moved = math.hypot(position[0] - previous[0], position[1] - previous[1])
+            if moved >= self.MOTION_THRESHOLD:
+                self._still_fixes = 0
+            else:
+                self._still_fixes += 1
+
+    # ------------------------------------------------------------------
+    # Decision
+    # ------------------------------------------------------------------
+
+    def next_delay(self) -> Tuple[bool, float]:
+        """Return ``(run_fix, delay)``: whether the next wake-up should take
+        a fix, and how long to wait before it."""
+        if self._safe(self.is_lobby):
+            with self._lock:
+                self.state = 'paused'
+                self.interval = self.PAUSE_POLL
+            return False, self.PAUSE_POLL
+
+        overlay = self._safe(self.is_overlay_open)
+        with self._lock:
+            base = max(self.MIN_INTERVAL, self.base_interval)
+            if overlay:
+                state, interval = 'overlay', base * self.OVERLAY_FACTOR
+            elif self._demand or self._is_moving():
+                state, interval = 'active', max(self.MIN_INTERVAL, base * self.ACTIVE_FACTOR)
+            elif self._still_fixes >= self.IDLE_AFTER_FIXES:
+                state, interval = 'idle', base * self.IDLE_FACTOR
+            else:
+                state, interval = 'normal', base
+
+            cost = self._avg_cost()
+            if state != 'active' and self.cpu_budget > 0 and cost > 0:
+                interval = max(interval, cost / self.cpu_budget)
+
+            self.state = state
+            self.interval = interval
+        return True, interval
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    @property
+    def current_rate(self) -> float:
+        """Fixes per second under the last decision (0 while paused)."""
+        with self._lock:
+            if self.state == 'paused' or self.interval <= 0:
+                return 0.0
+            return 1.0 / self.interval
+
+    def get_stats(self) -> dict:
+        """Snapshot of the scheduler state for dev tools / logging."""
+        rate = self.current_rate
+        with self._lock:
+            cost = self._avg_cost()
+            return {
+                'state': self.state,
+                'interval': self.interval,
+                'rate_hz': rate,
+                'avg_fix_cpu_ms': cost * 1000.0,
+                'cpu_fraction': cost * rate,
+                'cpu_budget': self.cpu_budget,
+                'demand': sorted(self._demand),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _is_moving(self) -> bool:
+        return bool(self._fixes) and self._still_fixes == 0 and len(self._fixes) >= 2
+
+    def _avg_cost(self) -> float:
+        if not self._costs:
+            return 0.0
+        return sum(self._costs) / len(self._costs)
+
+    @staticmethod
+    def _safe(check: Callable[[], bool]) -> bool:
+        try:
+            return bool(check())
+        except Exception:
+            return False
+
+
+class HeadingSampler:
+    """Samples the player heading on a private thread while demanded."""
+
+    INTERVAL = 0.1
+
+    def __init__(self, read_heading: Callable[[], Optional[float]],
+                 sink: Callable[[Optional[float]], None],
+                 interval: float = INTERVAL) -> None:
+        self.read_heading = read_heading
+        self.sink = sink
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._demand: Set[str] = set()
+        self._thread: Optional[threading.Thread] = None
+        self.samples = 0
+
+    def set_demand(self, consumer: str, active: bool) -> None:
+        """Register or clear a consumer that needs a live heading; the
+        thread starts with the first consumer and exits after the last."""
+        with self._lock:
+            if active:
+                self._demand.add(consumer)
+            else:
+                self._demand.discard(consumer)
+            if self._demand and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="HeadingSampler", daemon=True)
+                self._thread.start()
+
+    @property
+    def active(self) -> bool:
+        with self._lock:
+            return bool(self._demand)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._demand:
+                    self._thread = None
+                    return
+            started = time.monotonic()
+            try:
+                self.sink(self.read_heading())
+                self.samples += 1
+            except Exception:
+                pass
+            time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
@@ -6,6 +6,11 @@ Feature-matching backend is pluggable (SIFT / AKAZE / ORB) with optional
 CLAHE preprocessing. See ``lib.detection.feature_matcher`` for the
 abstraction and ``lib.detection.coordinate_config`` for per-map defaults
 (Reload / Stranger Things maps override to AKAZE+CLAHE or SIFT+CLAHE).
+
+Once a feature match has found the minimap window, later fixes try
+``lib.detection.phase_tracker`` first (translation by phase correlation)
+and only feature-match again when it isn't confident (``[POI]
+phase_tracking``).
 """
 import cv2
 import logging
@@ -20,6 +25,7 @@ from lib.utilities.utilities import (
 from lib.detection import feature_matcher
 from lib.detection.feature_matcher import DetectorType, MatcherConfig, MatchOutcome
 from lib.detection.coordinate_config import get_matcher_config as _get_map_matcher_override
+from lib.detection.phase_tracker import PhaseTracker
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +82,9 @@ WIDTH, HEIGHT = ROI_END_ORIG[0] - ROI_START_ORIG[0], ROI_END_ORIG[1] - ROI_START
 # Cached current map from config (updated via config change events)
 _cached_current_map = 'main'
 
+# Phase-correlation fast path, anchored by each successful feature match.
+phase_tracker = PhaseTracker()
+
 def _on_config_change(config):
     """Update cached config values when config changes.
 
@@ -90,12 +99,14 @@ def _on_config_change(config):
         except Exception:
             pass
     _cached_current_map = new_map
+    phase_tracker.enabled = get_config_boolean(config, 'phase_tracking', True)
 
 on_config_change(_on_config_change)
 # Initialize from current config
 try:
     _init_config = read_config()
     _cached_current_map = _init_config.get('POI', 'current_map', fallback='main')
+    phase_tracker.enabled = get_config_boolean(_init_config, 'phase_tracking', True)
 except Exception:
     pass
 
@@ -144,6 +155,7 @@ class MapManager:
     def __init__(self):
         self.current_map: Optional[str] = None
         self.current_image_dims = None
+        self.current_image: Optional[np.ndarray] = None
         self.current_keypoints = None
         self.current_descriptors = None
         self.current_matcher_cfg: Optional[MatcherConfig] = None
@@ -173,10 +185,15 @@ class MapManager:
         if self.current_map == map_name and self.current_matcher_cfg == cfg:
             return True
 
+        # The tracked window belongs to the old map.
+        if self.current_map != map_name:
+            phase_tracker.reset()
+
         if key in self.map_load_cache:
             entry = self.map_load_cache[key]
             self.current_map = map_name
             self.current_image_dims = entry['dims']
+            self.current_image = entry['image']
             self.current_keypoints = entry['keypoints']
             self.current_descriptors = entry['descriptors']
             self._rebuild_capture_tools(cfg)
@@ -194,6 +211,7 @@ class MapManager:
             return False
         self.current_map = map_name
         self.current_image_dims = cpu_image.shape
+        self.current_image = cpu_image
 
         # Apply identical preprocessing to the map image as will run on captures.
         pre = feature_matcher.preprocess_image(cpu_image, cfg)
@@ -206,6 +224,7 @@ class MapManager:
 
         self.map_load_cache[key] = {
             'dims': self.current_image_dims,
+            'image': cpu_image,
             'keypoints': self.current_keypoints,
             'descriptors': self.current_descriptors,
         }
@@ -335,6 +354,22 @@ def find_best_match(captured_area):
     # Fallback: full resolution for difficult areas
     return _match_at_scale(captured_area, scale_factor=1)
 
+def track_or_match(captured_area):
+    """Map corners of the capture: phase-correlation tracking from the
+    last fix when it is confident, feature matching otherwise (which
+    re-anchors the tracker)."""
+    global last_match_failure
+    corners = phase_tracker.track(captured_area, map_manager.current_image)
+    if corners is not None:
+        last_match_failure = None
+        return corners
+    corners = find_best_match(captured_area)
+    if corners is not None:
+        phase_tracker.anchor(corners)
+    else:
+        phase_tracker.reset()
+    return corners
+
 def find_player_position() -> Optional[Tuple[int, int]]:
     """Find player position using the map"""
     current_map_id = _cached_current_map
@@ -361,7 +396,9 @@ def find_player_position() -> Optional[Tuple[int, int]]:
     roi_height = roi_end[1] - roi_start[1]
 
     captured_area = capture_map_screen(map_filename_to_load)
-    matched_region = find_best_match(captured_area)
+    if captured_area is None:
+        return None
+    matched_region = track_or_match(captured_area)
 
     global last_matched_region
     if matched_region is not None:
@@ -393,15 +430,18 @@ def get_ppi_status() -> dict:
         'using_gpu_acceleration': use_gpu,
         'keypoints_count': len(map_manager.current_keypoints) if map_manager.current_keypoints else 0,
         'descriptors_count': desc_count,
-        'cached_maps': list(map_manager.map_load_cache.keys())
+        'cached_maps': list(map_manager.map_load_cache.keys()),
+        'phase_tracking': phase_tracker.stats(),
     }
 
 def cleanup_ppi():
     """Clean up PPI resources"""
     global map_manager
+    phase_tracker.reset()
     if map_manager:
         map_manager.map_load_cache.clear()
         map_manager.current_map = None
         map_manager.current_image_dims = None
+        map_manager.current_image = None
         map_manager.current_keypoints = None
         map_manager.current_descriptors = None
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Lookup-table rarity classifier for hotbar and inventory slots.
+
+Rarity is the slot's background color. Instead of testing every rarity's
+color range against the slot's average color and then counting in-range
+pixels rarity by rarity, ``RarityClassifier`` builds one table up front:
+
+* RGB is quantized to 32 levels per channel (``>> 3``), giving a 32^3
+  lookup table;
+* each cell holds the id of the palette color nearest to the cell center
+  (largest per-channel difference), or "none" when even the nearest is
+  farther than the tolerance.
+
+Classifying a slot is then one vectorized pass: quantize the border
+pixels (where the background shows around the item icon), look up their
+ids, ``bincount`` them, and take the winner if it covers enough of the
+border and beats the runner-up by a margin.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+#: Quantization shift: 256 levels -> 32 per channel.
+QUANT_SHIFT = 3
+LEVELS = 256 >> QUANT_SHIFT
+
+#: Border width (px) sampled from a slot image.
+BORDER = 3
+
+#: Winner must cover this fraction of the sampled pixels ...
+MIN_SHARE = 0.25
+
+#: ... and beat the runner-up by this fraction of them.
+MIN_MARGIN = 0.1
+
+NONE_ID = 255
+
+RGB = Tuple[int, int, int]
+
+
+class RarityResult(NamedTuple):
+    rarity: str
+    confidence: float  # share of sampled pixels voting for the rarity
+    margin: float      # lead over the runner-up, as a share
+
+
+def border_pixels(image: np.ndarray, width: int = BORDER) -> np.ndarray:
+    """The ``width``-px frame of an (H, W, 3) image as (N, 3)."""
+    h, w = image.shape[:2]
+    width = max(1, min(width, h // 2, w // 2))
+    return np.concatenate([
+        image[:width].reshape(-1, 3),
+        image[h - width:].reshape(-1, 3),
+        image[width:h - width, :width].reshape(-1, 3),
+        image[width:h - width, w - width:].reshape(-1, 3),
+    ])
+
+
+class RarityClassifier:
+    """Maps pixels to rarities through a quantized RGB lookup table."""
+
+    def __init__(self, palette: Dict[str, RGB], tolerance: int = 30,
+                 min_share: float = MIN_SHARE, min_margin: float = MIN_MARGIN) -> None:
+        self.names = list(palette)
+        self.palette = np.array([palette[n] for n in self.names], dtype=np.float32).reshape(-1, 3)
+        self.tolerance = tolerance
+        self.min_share = min_share
+        self.min_margin = min_margin
+        self.lut = self._build_lut()
+
+    def _build_lut(self) -> np.ndarray:
+        centers = (np.arange(LEVELS, dtype=np.float32) * (1 << QUANT_SHIFT)
+                   + ((1 << QUANT_SHIFT) - 1) / 2.0)
+        grid = np.stack(np.meshgrid(centers, centers, centers, indexing='ij'), axis=-1).reshape(-1, 3)
+        lut = np.full(len(grid), NONE_ID, dtype=np.uint8)
+        if len(self.palette):
+            dist = np.abs(grid[:, None, :] - self.palette[None, :, :]).max(axis=2)
+            nearest = dist.argmin(axis=1)
+            close = dist[np.arange(len(grid)), nearest] <= self.tolerance
+            lut[close] = nearest[close]
+        return lut.reshape(LEVELS, LEVELS, LEVELS)
+
+    def ids(self, pixels: np.ndarray) -> np.ndarray:
+        """Rarity id per RGB pixel (``NONE_ID`` for no rarity)."""
+        q = np.asarray(pixels, dtype=np.uint8).reshape(-1, 3) >> QUANT_SHIFT
+        return self.lut[q[:, 0], q[:, 1], q[:, 2]]
+
+    def classify(self, pixels: np.ndarray) -> Optional[RarityResult]:
+        """Majority rarity of RGB ``pixels`` if it clears share and margin."""
+        ids = self.ids(pixels)
+        if not len(ids) or not self.names:
+            return None
+        counts = np.bincount(ids, minlength=NONE_ID + 1)[:len(self.names)]
+        return self._decide(counts, len(ids))
+
+    def _decide(self, counts: np.ndarray, total: int) -> Optional[RarityResult]:
+        if not total:
+            return None
+        order = np.argsort(counts)[::-1]
+        best = int(order[0])
+        runner_up = int(counts[order[1]]) if len(order) > 1 else 0
+        confidence = counts[best] / total
+        margin = (counts[best] - runner_up) / total
+        if counts[best] == 0 or confidence < self.min_share or margin < self.min_margin:
+            return None
+        return RarityResult(self.names[best], float(confidence), float(margin))
+
+    def classify_slot(self, image: np.ndarray, bgr: bool = True,
+                      border: int = BORDER) -> Optional[RarityResult]:
+        """Classify a slot image from its border pixels."""
+        pixels = border_pixels(image, border)
+        return self.classify(pixels[:, ::-1] if bgr else pixels)
+
+    def classify_slots(self, images: Sequence[np.ndarray], bgr: bool = True,
+                       border: int = BORDER) -> List[Optional[RarityResult]]:
+        """``classify_slot`` for several slots with one table read and one
+        ``bincount`` over all their border pixels."""
+        if not images or not self.names:
+            return [None] * len(images)
+        groups = [border_pixels(image, border) for image in images]
+        pixels = np.concatenate(groups)
+        ids = self.ids(pixels[:, ::-1] if bgr else pixels).astype(np.int64)
+        sizes = np.array([len(g) for g in groups])
+        slot_of = np.repeat(np.arange(len(groups)), sizes)
+        width = NONE_ID + 1
+        counts = np.bincount(slot_of * width + ids, minlength=len(groups) * width)
+        counts = counts.reshape(len(groups), width)[:, :len(self.names)]
+        return [self._decide(row, int(n)) for row, n in zip(counts, sizes)]
+
+
+def palette_from_samples(defaults: Dict[str, RGB],
+                         samples: Dict[str, Sequence[np.ndarray]]) -> Dict[str, RGB]:
+    """``defaults`` with each rarity replaced by the mean of its samples."""
+    palette = dict(defaults)
+    for rarity, colors in samples.items():
+        if len(colors):
+            palette[rarity] = tuple(int(c) for c in np.mean(colors, axis=0).round())
+    return palette
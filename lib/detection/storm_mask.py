@@ -0,0 +1,179 @@
+"""
+Incremental storm mask for ``StormMonitor``.
+
+The storm overlay is found by comparing the live minimap against the
+reference map aligned to it: a purple shift above ``PURPLE_THRESHOLD``
+marks storm, followed by three morphology passes. Doing that over the
+whole frame every cycle repeats the same work while the player stands
+still and the storm is not moving.
+
+``IncrementalStormMask`` keeps the raw threshold mask and the cleaned
+mask between cycles. Each update splits the frame into ``TILE`` x ``TILE``
+tiles, marks the tiles whose live (or reference) pixels changed, and
+recomputes only those. The morphology chain reads pixels up to
+``HALO`` away, so each dirty tile is cleaned in a window padded by twice
+the halo and only the inner, halo-padded part is written back. That keeps
+the result identical to a full recompute, give or take pixels that drifted
+by less than ``CHANGE_TOLERANCE`` since their tile was last recomputed. When most tiles are dirty
+(e.g. the minimap scrolled) a plain full recompute is cheaper and is used
+instead.
+"""
+from __future__ import annotations
+
+from typing import Hashable, Optional, Tuple
+
+import cv2
+import numpy as np
+
+#: Purple shift ((R + B) / 2 - G, live minus reference) that counts as storm.
+PURPLE_THRESHOLD = 50
+
+_KERNEL_SMALL = np.ones((3, 3), np.uint8)
+_KERNEL_LARGE = np.ones((15, 15), np.uint8)
+
+
+def purple_shift(live: np.ndarray, ref: np.ndarray) -> np.ndarray:
+    """Per-pixel purple tint the storm overlay adds (RGB inputs)."""
+    diff = live.astype(np.float32) - ref.astype(np.float32)
+    return ((diff[:, :, 0] + diff[:, :, 2]) * 0.5) - diff[:, :, 1]
+
+
+def raw_storm_mask(live: np.ndarray, ref: np.ndarray) -> np.ndarray:
+    return (purple_shift(live, ref) > PURPLE_THRESHOLD).astype(np.uint8) * 255
+
+
+def clean_storm_mask(mask: np.ndarray) -> np.ndarray:
+    """Morphological cleanup: small close, small open, large close."""
+    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, _KERNEL_SMALL)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _KERNEL_SMALL)
+    return cv2.morphologyEx(mask, cv2.MORPH_CLOSE, _KERNEL_LARGE)
+
+
+def compute_storm_mask(live: np.ndarray, ref: np.ndarray) -> np.ndarray:
+    """Full-frame storm mask (uint8, 0/255)."""
+    return clean_storm_mask(raw_storm_mask(live, ref))
+
+
+class IncrementalStormMask:
+    """Persistent storm mask that only recomputes changed tiles."""
+
+    TILE = 32
+
+    #: Reach of the morphology chain: 2 (3x3 close) + 2 (3x3 open)
+    #: + 14 (15x15 close).
+    HALO = 18
+
+    #: Per-channel difference below which a pixel counts as unchanged.
+    CHANGE_TOLERANCE = 6
+
+    #: Above this fraction of dirty tiles a full recompute is cheaper.
+    FULL_RECOMPUTE_FRACTION = 0.5
+
+    def __init__(self) -> None:
+        self._live: Optional[np.ndarray] = None
+        self._ref: Optional[np.ndarray] = None
+        self._ref_key: Optional[Hashable] = None
+        self._raw: Optional[np.ndarray] = None
+        self.mask: Optional[np.ndarray] = None
+
+        #: Fraction of tiles recomputed by the last update (1.0 = full).
+        self.last_fraction = 0.0
+        self.updates = 0
+        self.full_recomputes = 0
+        self._fraction_sum = 0.0
+
+    def reset(self) -> None:
+        self._live = self._ref = self._raw = self.mask = None
+        self._ref_key = None
+
+    def update(self, live: np.ndarray, ref: np.ndarray,
+               ref_key: Optional[Hashable] = None) -> Tuple[np.ndarray, bool]:
+        """Bring the mask up to date with ``live`` against ``ref``.
+
+        ``ref_key`` identifies the aligned reference; while it is unchanged
+        the reference is assumed identical to the previous one. Returns
+        ``(mask, changed)`` where ``changed`` is False when no tile needed
+        recomputing.
+        """
+        self.updates += 1
+        if (self.mask is None or self._live is None or live.shape != self._live.shape
+                or ref.shape != self._ref.shape):
+            return self._full(live, ref, ref_key), True
+
+        dirty = self._changed_tiles(live, self._live)
+        if ref_key is None or ref_key != self._ref_key:
+            dirty |= self._changed_tiles(ref, self._ref)
+
+        fraction = float(dirty.mean()) if dirty.size else 0.0
+        if fraction >= self.FULL_RECOMPUTE_FRACTION:
+            return self._full(live, ref, ref_key), True
+
+        self._record(fraction)
+        self._ref_key = ref_key
+        if fraction == 0.0:
+            return self.mask, False
+
+        # Dirty tiles are handled as rectangles of touching tiles, so a
+        # blip spanning a tile corner costs one window, not four.
+        h, w = live.shape[:2]
+        t = self.TILE
+        _, _, components, _ = cv2.connectedComponentsWithStats(dirty.astype(np.uint8), connectivity=8)
+        regions = [(ty * t, tx * t, min(h, (ty + th) * t), min(w, (tx + tw) * t))
+                   for tx, ty, tw, th, _ in components[1:]]
+        for y0, x0, y1, x1 in regions:
+            # Only recomputed regions advance the stored frames, so changes
+            # below the tolerance accumulate until they are picked up.
+            self._live[y0:y1, x0:x1] = live[y0:y1, x0:x1]
+            self._ref[y0:y1, x0:x1] = ref[y0:y1, x0:x1]
+            self._raw[y0:y1, x0:x1] = raw_storm_mask(live[y0:y1, x0:x1], ref[y0:y1, x0:x1])
+        halo = self.HALO
+        for y0, x0, y1, x1 in regions:
+            # Outputs within HALO of the region may change; they depend on
+            # raw pixels up to another HALO further out.
+            oy0, ox0 = max(0, y0 - halo), max(0, x0 - halo)
+            oy1, ox1 = min(h, y1 + halo), min(w, x1 + halo)
+            wy0, wx0 = max(0, oy0 - halo), max(0, ox0 - halo)
+            wy1, wx1 = min(h, oy1 + halo), min(w, ox1 + halo)
+            cleaned = clean_storm_mask(self._raw[wy0:wy1, wx0:wx1])
+            self.mask[oy0:oy1, ox0:ox1] = cleaned[oy0 - wy0:oy1 - wy0, ox0 - wx0:ox1 - wx0]
+        return self.mask, True
+
+    @property
+    def average_fraction(self) -> float:
+        return self._fraction_sum / self.updates if self.updates else 0.0
+
+    def get_stats(self) -> dict:
+        return {
+            'updates': self.updates,
+            'full_recomputes': self.full_recomputes,
+            'last_fraction': self.last_fraction,
+            'avg_fraction': self.average_fraction,
+        }
+
+    # ------------------------------------------------------------------
+
+    def _full(self, live: np.ndarray, ref: np.ndarray, ref_key: Optional[Hashable]) -> np.ndarray:
+        self._raw = raw_storm_mask(live, ref)
+        self.mask = clean_storm_mask(self._raw)
+        self._live, self._ref, self._ref_key = live.copy(), ref.copy(), ref_key
+        self.full_recomputes += 1
+        self._record(1.0)
+        return self.mask
+
+    def _record(self, fraction: float) -> None:
+        self.last_fraction = fraction
+        self._fraction_sum += fraction
+
+    def _changed_tiles(self, current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+        """Boolean (tiles_y, tiles_x) grid of tiles with a changed pixel."""
+        h, w = current.shape[:2]
+        channels = current.shape[2] if current.ndim == 3 else 1
+        # Channels stay interleaved along x; a tile is TILE * channels wide.
+        changed = cv2.absdiff(current, previous).reshape(h, w * channels)
+        t = self.TILE
+        ty, tx = -(-h // t), -(-w // t)
+        if (h, w) != (ty * t, tx * t):
+            padded = np.zeros((ty * t, tx * t * channels), dtype=np.uint8)
+            padded[:h, :w * channels] = changed
+            changed = padded
+        return changed.reshape(ty, t, tx, t * channels).max(axis=(1, 3)) > self.CHANGE_TOLERANCE
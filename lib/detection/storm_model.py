@@ -0,0 +1,241 @@
+"""
+Storm circle model and shrink predictor.
+
+The safe zone is a circle, so instead of re-deriving the storm edge from
+raw purple-pixel contours every cycle, ``fit_storm_circle`` fits a circle
+(center, radius, residual) to the boundary of the storm mask, and
+``StormPredictor`` carries it forward in time between fits:
+
+* while the storm is **holding** (per ``MatchEventMonitor``'s phase step)
+  the circle is static;
+* while it is **shrinking** the radius and center move linearly at the
+  rate measured from the fits taken during the current shrink;
+* any other step (or no log data) uses the measured rate if recent fits
+  show one, else treats the circle as static.
+
+``StormCircle.nearest_edge`` then gives the closest point on the zone
+edge (and the distance to it) analytically, so pings need no image work
+between fits. The monitor decides how often to refit with
+``StormPredictor.refit_interval``.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, NamedTuple, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+class StormCircle(NamedTuple):
+    center_x: float
+    center_y: float
+    radius: float
+    #: RMS distance (px) of the fitted boundary points from the circle.
+    residual: float = 0.0
+
+    def nearest_edge(self, position: Sequence[float]) -> Tuple[Tuple[int, int], float, bool]:
+        """``(edge_point, distance, inside)`` for a player at ``position``:
+        the closest point on the zone edge, how far it is, and whether the
+        player is inside the safe zone."""
+        dx = position[0] - self.center_x
+        dy = position[1] - self.center_y
+        d = math.hypot(dx, dy)
+        if d < 1e-6:
+            # Dead center: every edge point is equally close; pick north.
+            dx, dy, d = 0.0, -1.0, 1.0
+            offset = 0.0
+        else:
+            offset = d
+        ex = self.center_x + dx / d * self.radius
+        ey = self.center_y + dy / d * self.radius
+        return (int(round(ex)), int(round(ey))), abs(self.radius - offset), offset <= self.radius
+
+
+def fit_circle(points: np.ndarray, iterations: int = 3,
+               trim: float = 2.5) -> Optional[StormCircle]:
+    """Least-squares (Kasa) circle through ``points`` (N, 2), refit a few
+    times with outliers beyond ``trim`` times the RMS residual dropped."""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(pts) < 3:
+        return None
+    circle = None
+    for _ in range(max(1, iterations)):
+        if len(pts) < 3:
+            break
+        x, y = pts[:, 0], pts[:, 1]
+        a = np.column_stack((x, y, np.ones_like(x)))
+        b = x * x + y * y
+        try:
+            sol, *_ = np.linalg.lstsq(a, b, rcond=None)
+        except np.linalg.LinAlgError:
+            return circle
+        cx, cy = sol[0] / 2.0, sol[1] / 2.0
+        r2 = sol[2] + cx * cx + cy * cy
+        if r2 <= 0:
+            return circle
+        r = math.sqrt(r2)
+        errors = np.abs(np.hypot(x - cx, y - cy) - r)
+        rms = float(np.sqrt(np.mean(errors ** 2)))
+        circle = StormCircle(float(cx), float(cy), r, rms)
+        keep = errors <= max(1.0, trim * rms)
+        if keep.all():
+            break
+        pts = pts[keep]
+    return circle
+
+
+def storm_boundary_points(mask: np.ndarray, margin: int = 2) -> np.ndarray:
+    """Pixels on the storm / safe-zone boundary of a 0/255 mask, excluding
+    those within ``margin`` of the frame edge (where the minimap crop, not
+    the storm, ends the region)."""
+    contours, _ = cv2.findContours(mask, cv2.RETR_LIST, cv2.CHAIN_APPROX_NONE)
+    if not contours:
+        return np.empty((0, 2), dtype=np.int32)
+    pts = np.concatenate([c.reshape(-1, 2) for c in contours])
+    h, w = mask.shape[:2]
+    keep = ((pts[:, 0] >= margin) & (pts[:, 0] < w - margin) &
+            (pts[:, 1] >= margin) & (pts[:, 1] < h - margin))
+    return pts[keep]
+
+
+def fit_storm_circle(mask: np.ndarray, min_points: int = 40,
+                     max_residual: float = 3.0) -> Optional[StormCircle]:
+    """Circle of the safe zone in ``mask`` pixel coordinates, or None when
+    the boundary is too short or too irregular to be the zone edge."""
+    pts = storm_boundary_points(mask)
+    if len(pts) < min_points:
+        return None
+    circle = fit_circle(pts)
+    if circle is None or circle.residual > max_residual:
+        return None
+    # The safe zone is the inside: the storm must be outside the circle.
+    # Check the mask just inside and outside the fitted edge at a few
+    # boundary points.
+    h, w = mask.shape[:2]
+    inside_votes = outside_votes = 0
+    for px, py in pts[:: max(1, len(pts) // 16)]:
+        dx, dy = px - circle.center_x, py - circle.center_y
+        d = math.hypot(dx, dy) or 1.0
+        for sign in (-1, 1):
+            sx = int(round(px + sign * 3 * dx / d))
+            sy = int(round(py + sign * 3 * dy / d))
+            if 0 <= sx < w and 0 <= sy < h and mask[sy, sx]:
+                if sign < 0:
+                    inside_votes += 1
+                else:
+                    outside_votes += 1
+    if inside_votes > outside_votes:
+        return None
+    return circle
+
+
+class _Fit(NamedTuple):
+    timestamp: float
+    circle: StormCircle
+
+
+class StormPredictor:
+    """Carries the fitted safe-zone circle forward between fits."""
+
+    #: Fits kept for rate estimation.
+    HISTORY = 6
+
+    #: Refit intervals (s) per storm phase step.
+    REFIT_HOLDING = 10.0
+    REFIT_SHRINKING = 3.0
+    REFIT_DEFAULT = 4.0
+
+    #: A model older than this is not trusted at all.
+    MAX_AGE = 30.0
+
+    #: Radius change (px/s) below which the circle counts as static.
+    MIN_RATE = 0.05
+
+    def __init__(self, storm_step: Optional[Callable[[], Optional[str]]] = None) -> None:
+        self.storm_step = storm_step or (lambda: None)
+        self._lock = threading.Lock()
+        self._fits: Deque[_Fit] = deque(maxlen=self.HISTORY)
+        self._step: Optional[str] = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._fits.clear()
+            self._step = None
+
+    def add_fit(self, circle: StormCircle, timestamp: Optional[float] = None) -> None:
+        t = time.monotonic() if timestamp is None else timestamp
+        step = self._current_step()
+        with self._lock:
+            if step != self._step:
+                # Rates from the previous step don't carry over.
+                self._step = step
+                self._fits.clear()
+            self._fits.append(_Fit(t, circle))
+
+    @property
+    def last_fit_time(self) -> Optional[float]:
+        with self._lock:
+            return self._fits[-1].timestamp if self._fits else None
+
+    def needs_fit(self, timestamp: Optional[float] = None) -> bool:
+        t = time.monotonic() if timestamp is None else timestamp
+        last = self.last_fit_time
+        if last is None:
+            return True
+        if self._current_step() != self._step:
+            return True
+        return t - last >= self.refit_interval()
+
+    def refit_interval(self) -> float:
+        step = self._current_step()
+        if step == 'StormHolding':
+            return self.REFIT_HOLDING
+        if step == 'StormShrinking':
+            return self.REFIT_SHRINKING
+        return self.REFIT_DEFAULT
+
+    def rates(self) -> Tuple[float, float, float]:
+        """``(dcx/dt, dcy/dt, dr/dt)`` over the current step's fits."""
+        with self._lock:
+            fits = list(self._fits)
+        if len(fits) < 2 or self._step == 'StormHolding':
+            return 0.0, 0.0, 0.0
+        t = np.array([f.timestamp for f in fits])
+        if t[-1] - t[0] <= 0:
+            return 0.0, 0.0, 0.0
+        values = np.array([(f.circle.center_x, f.circle.center_y, f.circle.radius) for f in fits])
+        t = t - t.mean()
+        slopes = (t[:, None] * (values - values.mean(axis=0))).sum(axis=0) / (t * t).sum()
+        dcx, dcy, dr = (float(v) for v in slopes)
+        if dr > -self.MIN_RATE:
+            # The zone never grows; anything else is fit noise.
+            return 0.0, 0.0, 0.0
+        return dcx, dcy, dr
+
+    def predict(self, timestamp: Optional[float] = None) -> Optional[StormCircle]:
+        """The circle extrapolated to ``timestamp`` (None without a fresh model)."""
+        t = time.monotonic() if timestamp is None else timestamp
+        with self._lock:
+            if not self._fits:
+                return None
+            last = self._fits[-1]
+        age = t - last.timestamp
+        if age > self.MAX_AGE:
+            return None
+        if age <= 0:
+            return last.circle
+        dcx, dcy, dr = self.rates()
+        radius = max(0.0, last.circle.radius + dr * age)
+        return StormCircle(last.circle.center_x + dcx * age,
+                           last.circle.center_y + dcy * age,
+                           radius, last.circle.residual)
+
+    def _current_step(self) -> Optional[str]:
+        try:
+            return self.storm_step()
+        except Exception:
+            return None
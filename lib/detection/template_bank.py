@@ -0,0 +1,328 @@
+"""
+Pre-scaled template bank for dynamic-object icon matching.
+
+``FastDynamicObjectFinder`` used to resize every icon to each search scale
+on every call and then match icons one after another. The bank does the
+scaling once when an icon is added and keeps the results as contiguous
+``uint8`` arrays, so a detection pass is nothing but ``matchTemplate``
+calls against one shared, preprocessed screen.
+
+``cv2.matchTemplate`` releases the GIL, so on machines with spare cores
+the bank fans the (template, scale) jobs out over a small thread pool and
+gathers the best hit per icon in one pass. OpenCV already
+switches to DFT-based correlation internally for large templates, so no
+separate FFT path is needed for the icon sizes used here.
+
+``match_instances`` adds a coarse-to-fine search that can return several
+instances of the same icon: half-resolution templates are matched on a
+half-resolution screen, the top peaks survive non-max suppression, and
+only small full-resolution windows around those peaks are matched again.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+class TemplateHit(NamedTuple):
+    name: str
+    center_x: int
+    center_y: int
+    confidence: float
+    scale: float
+
+
+class _ScaledTemplate(NamedTuple):
+    name: str
+    scale: float
+    image: np.ndarray
+    # Half-resolution copy for the coarse pass; None when too small to be
+    # discriminative, in which case the job is matched at full resolution.
+    coarse: Optional[np.ndarray] = None
+
+
+def prepare_screen(screen: np.ndarray) -> np.ndarray:
+    """Convert a capture to the contiguous 3-channel ``uint8`` layout the
+    bank's templates use. Done once per frame, shared by every template."""
+    if screen.ndim == 3 and screen.shape[2] == 4:
+        screen = cv2.cvtColor(screen, cv2.COLOR_BGRA2BGR)
+    if screen.dtype != np.uint8:
+        screen = screen.astype(np.uint8)
+    return np.ascontiguousarray(screen)
+
+
+def _top_peaks(result: np.ndarray, k: int, threshold: float,
+               suppress_hw: Tuple[int, int]) -> List[Tuple[Tuple[int, int], float]]:
+    """Up to ``k`` peaks of a correlation map above ``threshold``, each
+    blanking a ``suppress_hw`` half-window around itself (greedy NMS)."""
+    peaks = []
+    if k <= 0:
+        return peaks
+    result = result.copy()
+    sh, sw = max(1, suppress_hw[0]), max(1, suppress_hw[1])
+    for _ in range(k):
+        _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+        if not max_val >= threshold:
+            break
+        peaks.append(((x, y), float(max_val)))
+        result[max(0, y - sh):y + sh + 1, max(0, x - sw):x + sw + 1] = -1.0
+    return peaks
+
+
+class TemplateBank:
+    """Icons pre-scaled once at load, matched together against one screen."""
+
+    #: Below this many jobs a thread pool costs more than it saves.
+    PARALLEL_MIN_JOBS = 4
+
+    #: Smallest half-resolution template side used for the coarse pass.
+    MIN_COARSE_SIZE = 8
+
+    #: Coarse peaks are kept down to ``threshold - COARSE_SLACK``; halving
+    #: the resolution costs some correlation on real icons.
+    COARSE_SLACK = 0.15
+
+    #: Extra full-resolution pixels searched around each coarse peak.
+    REFINE_MARGIN = 3
+
+    def __init__(self, scales: Sequence[float] = (0.8, 0.9, 1.0),
+                 max_workers: Optional[int] = None) -> None:
+        self.scales = tuple(scales)
+        # A pool only pays off with spare cores; on a single core it is
+        # pure dispatch overhead.
+        if max_workers is None:
+            max_workers = min(4, max(1, (os.cpu_count() or 1) - 1))
+        self.max_workers = max_workers
+        self._entries: Dict[str, List[_ScaledTemplate]] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add(self, name: str, template: np.ndarray) -> None:
+        """Pre-scale ``template`` to every bank scale and store it."""
+        template = prepare_screen(template)
+        h, w = template.shape[:2]
+        scaled = []
+        for scale in self.scales:
+            sw, sh = int(w * scale), int(h * scale)
+            if sw < 1 or sh < 1:
+                continue
+            if scale != 1.0:
+                image = cv2.resize(template, (sw, sh), interpolation=cv2.INTER_AREA)
+            else:
+                image = template
+            coarse = None
+            if min(sw, sh) // 2 >= self.MIN_COARSE_SIZE:
+                coarse = np.ascontiguousarray(cv2.resize(
+                    image, (sw // 2, sh // 2), interpolation=cv2.INTER_AREA))
+            scaled.append(_ScaledTemplate(name, scale, np.ascontiguousarray(image), coarse))
+        if scaled:
+            self._entries[name] = scaled
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by all scaled templates."""
+        return sum(t.image.nbytes for entries in self._entries.values() for t in entries)
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def match_all(self, screen: np.ndarray, names: Optional[Iterable[str]] = None,
+                  threshold: float = 0.76, parallel: bool = True) -> List[TemplateHit]:
+        """Best hit per icon across all scales, for every icon that clears
+        ``threshold``. ``screen`` may be BGR or BGRA."""
+        if screen is None:
+            return []
+        screen = prepare_screen(screen)
+        jobs = self._jobs(names, screen.shape[:2])
+        if not jobs:
+            return []
+
+        if parallel and self.max_workers > 1 and len(jobs) >= self.PARALLEL_MIN_JOBS:
+            outcomes = list(self._get_pool().map(lambda j: self._match_one(screen, j), jobs))
+        else:
+            outcomes = [self._match_one(screen, job) for job in jobs]
+
+        best: Dict[str, TemplateHit] = {}
+        for hit in outcomes:
+            if hit is None:
+                continue
+            current = best.get(hit.name)
+            if current is None or hit.confidence > current.confidence:
+                best[hit.name] = hit
+        return [hit for hit in best.values() if hit.confidence >= threshold]
+
+    def match_instances(self, screen: np.ndarray, names: Optional[Iterable[str]] = None,
+                        threshold: float = 0.76, top_k: int = 5,
+                        parallel: bool = True) -> List[TemplateHit]:
+        """Every instance of every icon that clears ``threshold`` (up to
+        ``top_k`` per icon and scale), via the coarse-to-fine search."""
+        if screen is None:
+            return []
+        screen = prepare_screen(screen)
+        jobs = self._jobs(names, screen.shape[:2])
+        if not jobs:
+            return []
+        half = cv2.resize(screen, (screen.shape[1] // 2, screen.shape[0] // 2),
+                          interpolation=cv2.INTER_AREA)
+
+        def run(job):
+            return self._match_pyramid(screen, half, job, threshold, top_k)
+
+        if parallel and self.max_workers > 1 and len(jobs) >= self.PARALLEL_MIN_JOBS:
+            outcomes = list(self._get_pool().map(run, jobs))
+        else:
+            outcomes = [run(job) for job in jobs]
+
+        # Merge scales: the same icon found at 0.9 and 1.0 is one instance.
+        by_name: Dict[str, List[TemplateHit]] = {}
+        for hits in outcomes:
+            for hit in hits:
+                by_name.setdefault(hit.name, []).append(hit)
+        merged: List[TemplateHit] = []
+        for name, hits in by_name.items():
+            radius = self._suppression_radius(name)
+            kept: List[TemplateHit] = []
+            for hit in sorted(hits, key=lambda h: h.confidence, reverse=True):
+                if all((hit.center_x - k.center_x) ** 2 + (hit.center_y - k.center_y) ** 2
+                       > radius * radius for k in kept):
+                    kept.append(hit)
+            merged.extend(kept[:top_k])
+        return merged
+
+    def match_near(self, screen: np.ndarray, name: str, center: Tuple[int, int],
+                   radius: int, threshold: float = 0.76) -> Optional[TemplateHit]:
+        """Best hit for one icon whose center lies within ``radius`` pixels
+        of ``center`` (a square window), or None below ``threshold``."""
+        if screen is None or name not in self._entries:
+            return None
+        screen = prepare_screen(screen)
+        screen_h, screen_w = screen.shape[:2]
+        cx, cy = int(center[0]), int(center[1])
+        best: Optional[TemplateHit] = None
+        for entry in self._entries[name]:
+            th, tw = entry.image.shape[:2]
+            x0 = max(0, cx - radius - tw // 2)
+            y0 = max(0, cy - radius - th // 2)
+            x1 = min(screen_w, cx + radius + tw - tw // 2)
+            y1 = min(screen_h, cy + radius + th - th // 2)
+            window = screen[y0:y1, x0:x1]
+            if window.shape[0] < th or window.shape[1] < tw:
+                continue
+            try:
+                result = cv2.matchTemplate(window, entry.image, cv2.TM_CCOEFF_NORMED)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            except cv2.error:
+                continue
+            if best is None or max_val > best.confidence:
+                best = TemplateHit(name, x0 + max_loc[0] + tw // 2, y0 + max_loc[1] + th // 2,
+                                   float(max_val), entry.scale)
+        if best is None or best.confidence < threshold:
+            return None
+        return best
+
+    def _match_pyramid(self, screen: np.ndarray, half: np.ndarray, job: _ScaledTemplate,
+                       threshold: float, top_k: int) -> List[TemplateHit]:
+        th, tw = job.image.shape[:2]
+        if job.coarse is None or job.coarse.shape[0] > half.shape[0] or job.coarse.shape[1] > half.shape[1]:
+            # Too small for a meaningful coarse pass; search at full resolution.
+            try:
+                result = cv2.matchTemplate(screen, job.image, cv2.TM_CCOEFF_NORMED)
+            except cv2.error:
+                return []
+            peaks = _top_peaks(result, top_k, threshold, (th // 2, tw // 2))
+            return [TemplateHit(job.name, x + tw // 2, y + th // 2, conf, job.scale)
+                    for (x, y), conf in peaks]
+
+        try:
+            coarse_result = cv2.matchTemplate(half, job.coarse, cv2.TM_CCOEFF_NORMED)
+        except cv2.error:
+            return []
+        ch, cw = job.coarse.shape[:2]
+        candidates = _top_peaks(coarse_result, top_k, threshold - self.COARSE_SLACK,
+                                (ch // 2, cw // 2))
+
+        hits = []
+        m = self.REFINE_MARGIN
+        screen_h, screen_w = screen.shape[:2]
+        for (cx, cy), _ in candidates:
+            x0 = max(0, 2 * cx - m)
+            y0 = max(0, 2 * cy - m)
+            x1 = min(screen_w, 2 * cx + m + tw + 1)
+            y1 = min(screen_h, 2 * cy + m + th + 1)
+            window = screen[y0:y1, x0:x1]
+            if window.shape[0] < th or window.shape[1] < tw:
+                continue
+            try:
+                result = cv2.matchTemplate(window, job.image, cv2.TM_CCOEFF_NORMED)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            except cv2.error:
+                continue
+            if max_val >= threshold:
+                hits.append(TemplateHit(job.name, x0 + max_loc[0] + tw // 2,
+                                        y0 + max_loc[1] + th // 2, float(max_val), job.scale))
+        return hits
+
+    def _suppression_radius(self, name: str) -> float:
+        entries = self._entries.get(name)
+        if not entries:
+            return 1.0
+        th, tw = entries[0].image.shape[:2]
+        return max(1.0, min(th, tw) / 2.0)
+
+    def _jobs(self, names: Optional[Iterable[str]],
+              screen_hw: Tuple[int, int]) -> List[_ScaledTemplate]:
+        screen_h, screen_w = screen_hw
+        selected = self._entries.keys() if names is None else names
+        jobs = []
+        for name in selected:
+            for entry in self._entries.get(name, ()):
+                th, tw = entry.image.shape[:2]
+                if th <= screen_h and tw <= screen_w:
+                    jobs.append(entry)
+        return jobs
+
+    @staticmethod
+    def _match_one(screen: np.ndarray, job: _ScaledTemplate) -> Optional[TemplateHit]:
+        try:
+            result = cv2.matchTemplate(screen, job.image, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        except cv2.error:
+            return None
+        th, tw = job.image.shape[:2]
+        return TemplateHit(job.name, max_loc[0] + tw // 2, max_loc[1] + th // 2,
+                           float(max_val), job.scale)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="TemplateBank")
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool (recreated lazily if matching resumes)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
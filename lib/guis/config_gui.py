@@ -54,7 +54,10 @@ ADVANCED_KEYS = frozenset({
     "ContinuousPingMaxInterval",
     "ContinuousPingDistanceExponent",
     "PositionUpdateInterval",
+    "PositionCpuBudget",
     "MaxInstancesForGameObjectPositioning",
+    "MonitorCpuBudget",
+    "PauseMonitorsByGameState",
     # Onboarding wizard re-run toggle.
     "FirstRunComplete",
 })
@@ -9,6 +9,7 @@ from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 import numpy as np
 from lib.utilities.utilities import calculate_distance
+from lib.detection.coordinate_index import CoordinateIndex
 
 # Map image dimensions and screen bounds
 MAP_IMAGE_WIDTH = 866
@@ -16,6 +17,9 @@ MAP_IMAGE_HEIGHT = 926
 SCREEN_BOUNDS_X1, SCREEN_BOUNDS_Y1 = 524, 84
 SCREEN_BOUNDS_X2, SCREEN_BOUNDS_Y2 = 1390, 1010
 
+# Meters per screen pixel; the default scale of ``calculate_distance``.
+DISTANCE_SCALE = 2.65
+
 @dataclass
 class GameObjectData:
     """Represents game object data for a specific map"""
@@ -23,6 +27,20 @@ class GameObjectData:
     objects: Dict[str, List[Tuple[str, str, str]]] = field(default_factory=dict)  # type -> [(name, x, y), ...]
     load_time: float = 0.0
     file_modified_time: float = 0.0
+    # Parsed float32 coordinates for vectorized nearest-object queries
+    index: Optional[CoordinateIndex] = None
+    type_indices: Dict[str, CoordinateIndex] = field(default_factory=dict)
+
+    def build_indices(self):
+        """Parse every object's coordinates once into per-type and
+        whole-map coordinate matrices."""
+        self.type_indices = {
+            object_type: CoordinateIndex.from_rows(objects)
+            for object_type, objects in self.objects.items()
+        }
+        self.index = CoordinateIndex.from_rows(
+            obj for objects in self.objects.values() for obj in objects
+        )
 
 class GameObjectManager:
     """Manages game objects across multiple maps"""
@@ -174,6 +192,8 @@ class GameObjectManager:
                 print(f"Error loading game objects from {file_path}: {e}")
             return game_object_data
         
+        game_object_data.build_indices()
+        
         total_objects = sum(len(objs) for objs in game_object_data.objects.values())
         
         # Only print loading message if it's different from last time or first load
@@ -215,6 +235,36 @@ class GameObjectManager:
         game_objects = self.get_game_objects_for_map(map_name)
         return game_objects.get(object_type, [])
     
+    def _get_map_data(self, map_name: str) -> GameObjectData:
+        """Loaded data (with coordinate indices) for a map, reloading if stale"""
+        self.get_game_objects_for_map(map_name)
+        data = self.loaded_maps[map_name]
+        if data.index is None:
+            data.build_indices()
+        return data
+    
+    def find_nearest_object(self, map_name: str, player_position: Tuple[int, int],
+                            object_type: Optional[str] = None) -> Optional[Tuple[str, Tuple[float, float], float]]:
+        """Find the nearest object on the map, optionally of one type
+        
+        Args:
+            map_name: Name of the map
+            player_position: Current player position (x, y)
+            object_type: Restrict to this object type (None for any)
+            
+        Returns:
+            Tuple of (object_name, (x, y), distance) or None if not found
+        """
+        data = self._get_map_data(map_name)
+        index = data.index if object_type is None else data.type_indices.get(object_type)
+        if index is None:
+            return None
+        found = index.nearest(player_position)
+        if found is None:
+            return None
+        row, distance_px = found
+        return index.names[row], index.point(row), distance_px * DISTANCE_SCALE
+    
     def find_nearest_object_of_type(self, map_name: str, object_type: str, 
                                   player_position: Tuple[int, int]) -> Optional[Tuple[str, Tuple[float, float], float]]:
         """Find the nearest object of a specific type
@@ -227,26 +277,7 @@ class GameObjectManager:
         Returns:
             Tuple of (object_name, (x, y), distance) or None if not found
         """
-        objects = self.get_objects_of_type(map_name, object_type)
-        if not objects:
-            return None
-        
-        nearest = None
-        min_distance = float('inf')
-        
-        for obj_name, x_str, y_str in objects:
-            try:
-                x, y = float(x_str), float(y_str)
-                distance = calculate_distance(player_position, (x, y))
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest = (obj_name, (x, y), distance)
-                    
-            except (ValueError, TypeError):
-                continue
-        
-        return nearest
+        return self.find_nearest_object(map_name, player_position, object_type)
     
     def find_nearest_unvisited_object_of_type(self, map_name: str, object_type: str, 
                                             player_position: Tuple[int, int],
@@ -301,26 +332,16 @@ class GameObjectManager:
         Returns:
             Dictionary mapping object type to list of (name, (x, y), distance) tuples
         """
-        all_objects = self.get_game_objects_for_map(map_name)
+        data = self._get_map_data(map_name)
+        radius_px = radius / DISTANCE_SCALE
         nearby_objects = {}
         
-        for object_type, objects in all_objects.items():
-            nearby_of_type = []
-            
-            for obj_name, x_str, y_str in objects:
-                try:
-                    x, y = float(x_str), float(y_str)
-                    distance = calculate_distance(player_position, (x, y))
-                    
-                    if distance <= radius:
-                        nearby_of_type.append((obj_name, (x, y), distance))
-                        
-                except (ValueError, TypeError):
-                    continue
-            
+        for object_type, index in data.type_indices.items():
+            nearby_of_type = [
+                (index.names[row], index.point(row), distance_px * DISTANCE_SCALE)
+                for row, distance_px in index.within(player_position, radius_px)
+            ]
             if nearby_of_type:
-                # Sort by distance
-                nearby_of_type.sort(key=lambda x: x[2])
                 nearby_objects[object_type] = nearby_of_type
         
         return nearby_objects
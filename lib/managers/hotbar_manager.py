@@ -2,7 +2,6 @@ import cv2
 import numpy as np
 import os
 import time
-import difflib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,12 +10,19 @@ from accessible_output2.outputs.auto import Auto
 from threading import Thread, Event, Lock
 import configparser
 from lib.utilities.utilities import read_config, get_config_boolean, on_config_change
-import zlib
-import pickle
 from pathlib import Path
 from threading import Thread, Event, Lock
 from queue import Queue
 from lib.managers.ocr_manager import get_ocr_manager
+from lib.managers.ocr_queue import CancelToken, PRIORITY_USER
+from lib.detection.name_index import NameIndex
+from lib.detection.slot_index import SlotIndex, pixel_match
+from lib.detection.rarity import RarityClassifier, border_pixels, palette_from_samples
+from lib.detection.hotbar_snapshot import (
+    AMMO_SEARCH_RECT, HotbarLayout, HotbarSnapshotter, find_divider,
+)
+from lib.managers.screenshot_manager import capture_coordinates
+from lib.managers.reference_store import get_reference_store
 from lib.detection.coordinate_config import get_hotbar_coords
 
 # OCR region for item name text (shared BR-style HUD position)
@@ -26,6 +32,7 @@ ITEM_NAME_OCR_REGION = {'left': 1131, 'top': 984, 'width': 1297 - 1131, 'height'
 # matching. A map is cached as None when it has no loot file, which routes
 # detection down the legacy image-matching path instead.
 _loot_items_cache = {}
+_loot_index_cache = {}
 
 def _normalize_map_slug(raw):
     """Fold a current_map config value to the canonical file slug
@@ -56,6 +63,18 @@ def _get_map_items(map_name):
         _loot_items_cache[map_name] = (None, None)
     return _loot_items_cache[map_name]
 
+def _get_map_index(map_name):
+    """Trigram name index over a map's loot list, built on first use.
+
+    Returns:
+        NameIndex or None if the map has no loot file.
+    """
+    map_name = _normalize_map_slug(map_name)
+    if map_name not in _loot_index_cache:
+        items = _get_map_items(map_name)[0]
+        _loot_index_cache[map_name] = NameIndex(items) if items else None
+    return _loot_index_cache[map_name]
+
 def _map_has_loot_file(map_name):
     """True if this map ships a map_<map>_loot.txt list (OCR-based detection)."""
     return _get_map_items(map_name)[0] is not None
@@ -155,7 +174,7 @@ rarity_tolerance = 30
 
 # New variables for averaged rarity colors
 rarity_color_averages = {}
-rarity_color_ranges = {}
+rarity_classifier = None  # RarityClassifier over rarity_color_averages
 rarity_averages_initialized = False
 
 # Store last detected rarity information
@@ -163,52 +182,15 @@ last_detected_rarity = None
 last_detected_slot = None
 last_detected_item = None
 
-class ImageCache:
-    """Handles loading and managing cached weapon images."""
-    
-    def __init__(self, compression_level: int = 6):
-        """
-        Initialize the image cache.
-        
-        Args:
-            compression_level (int): zlib compression level (0-9)
-        """
-        self.compression_level = compression_level
-        self.cache = {}
-    
-    def load_cached_image(self, image_name: str, cache_file: str = "image_cache.pkl") -> np.ndarray:
-        """
-        Load and decompress an image from the cache.
-        
-        Args:
-            image_name (str): Name of the image to load
-            cache_file (str): Path to the cache file
-            
-        Returns:
-            np.ndarray: Decompressed image as numpy array, or None if failed
-        """
-        try:
-            # Load cache if not already loaded
-            if not self.cache:
-                with open(cache_file, 'rb') as f:
-                    self.cache = pickle.load(f)
-            
-            if image_name in self.cache:
-                # Decompress the image data
-                compressed_data = self.cache[image_name]['data']
-                decompressed_data = zlib.decompress(compressed_data)
-                # Convert bytes back to numpy array
-                nparr = np.frombuffer(decompressed_data, np.uint8)
-                return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            return None
-        except Exception as e:
-            print(f"Error loading {image_name} from cache: {str(e)}")
-            return None
+# Cancelled when a newer slot detection starts, dropping its queued OCR
+detection_token = CancelToken()
 
 # Initialize global variables
 speaker = Auto()  # Text-to-speech output
 reference_images = {}  # Cached weapon images
-image_cache = ImageCache()  # Image cache manager
+reference_index = None  # Fingerprint index over reference_images (SlotIndex)
+_snapshotter = None  # HotbarSnapshotter for the current layout
+_snapshotter_lock = Lock()
 item_rarity_map = {}  # Map from item names to rarities
 rarity_map_initialized = False
 
@@ -229,19 +211,15 @@ def initialize_item_rarity_map():
         return
     
     try:
-        # Load the cache file directly
+        # Names come from the reference store index; the pickle is only
+        # read when the store is stale
         cache_file = os.path.join(IMAGES_FOLDER, "image_cache.pkl")
         if not os.path.exists(cache_file):
             print("Image cache not found. Cannot initialize item rarity map.")
             return
         
-        with open(cache_file, 'rb') as f:
-            cache_data = pickle.load(f)
-        
         # Extract rarity from image names
-        for image_name in cache_data.keys():
-            name_without_ext = os.path.splitext(image_name)[0]
-            
+        for name_without_ext in get_reference_store(cache_file).names():
             # Try to determine rarity from name
             for rarity in rarity_colors.keys():
                 if name_without_ext.startswith(rarity):
@@ -255,138 +233,45 @@ def initialize_item_rarity_map():
         print(f"Error initializing item rarity map: {e}")
 
 def initialize_rarity_colors():
-    """Calculate average colors for each rarity from reference images."""
-    global rarity_color_averages, rarity_color_ranges, rarity_averages_initialized
+    """Average each rarity's slot background color over the reference images
+    and build the lookup-table classifier from them."""
+    global rarity_color_averages, rarity_classifier, rarity_averages_initialized
     
     if rarity_averages_initialized:
         return
     
-    # Start with default colors
-    rarity_color_averages = rarity_colors.copy()
-    
-    # Initialize collections to store color samples for each rarity
+    # Collect the median border color (RGB) of every reference with a rarity prefix
     rarity_samples = {rarity: [] for rarity in rarity_colors.keys()}
-    
-    # Count how many items we have for each rarity
-    items_per_rarity = {rarity: 0 for rarity in rarity_colors.keys()}
-    
-    # Go through all reference images and collect color samples
     for name, img in reference_images.items():
-        item_rarity = None
-        
-        # Extract rarity from item name
         for rarity in rarity_colors.keys():
             if name.startswith(rarity):
-                item_rarity = rarity
-                items_per_rarity[rarity] += 1
+                rarity_samples[rarity].append(np.median(border_pixels(img)[:, ::-1], axis=0))
                 break
-        
-        if item_rarity:
-            # Calculate the average color for this item
-            avg_color = np.mean(img, axis=(0, 1)).astype(int)
-            rarity_samples[item_rarity].append(avg_color)
     
-    # Calculate the average color for each rarity
-    for rarity, samples in rarity_samples.items():
-        if samples:
-            # Calculate the average of all samples for this rarity
-            avg = np.mean(samples, axis=0).astype(int)
-            rarity_color_averages[rarity] = tuple(avg)
-            
-            # Calculate color ranges (min and max for each channel)
-            if len(samples) > 1:
-                samples_array = np.array(samples)
-                min_values = np.min(samples_array, axis=0)
-                max_values = np.max(samples_array, axis=0)
-                
-                # Add a small buffer to the range
-                buffer = 10
-                min_values = np.maximum(0, min_values - buffer)
-                max_values = np.minimum(255, max_values + buffer)
-                
-                rarity_color_ranges[rarity] = (
-                    tuple(min_values.astype(int)),
-                    tuple(max_values.astype(int))
-                )
-            else:
-                # If only one sample, use tolerance-based range
-                avg_color = np.array(rarity_color_averages[rarity])
-                rarity_color_ranges[rarity] = (
-                    tuple(np.maximum(0, avg_color - rarity_tolerance).astype(int)),
-                    tuple(np.minimum(255, avg_color + rarity_tolerance).astype(int))
-                )
+    rarity_color_averages = palette_from_samples(rarity_colors, rarity_samples)
+    rarity_classifier = RarityClassifier(rarity_color_averages, rarity_tolerance)
     
     print("Rarity color averages initialized:")
     for rarity, color in rarity_color_averages.items():
-        count = items_per_rarity[rarity]
-        print(f"  {rarity}: {color} (from {count} items)")
-        if rarity in rarity_color_ranges:
-            print(f"    Range: {rarity_color_ranges[rarity]}")
+        print(f"  {rarity}: {color} (from {len(rarity_samples[rarity])} items)")
     
     rarity_averages_initialized = True
 
 def detect_rarity_by_color(slot_img):
-    """Detect rarity based on average color analysis of the item image."""
+    """Detect rarity from the slot's border color in one lookup-table pass."""
     # Make sure rarity colors are initialized
     if not rarity_averages_initialized:
         initialize_rarity_colors()
     
-    # Calculate the average color of the slot image
-    # First, filter out black pixels that are likely background
-    non_black_mask = ~np.all(slot_img < 40, axis=2)
-    if np.sum(non_black_mask) > 0:
-        # Calculate average color using only non-black pixels
-        avg_color = np.mean(slot_img[non_black_mask], axis=0).astype(int)
-    else:
-        # Fallback if no non-black pixels are found
-        avg_color = np.mean(slot_img, axis=(0, 1)).astype(int)
-    
-    # For each rarity, check if the average color falls within its range
-    best_match = None
-    best_match_score = 0
-    
-    for rarity, (min_color, max_color) in rarity_color_ranges.items():
-        # Check if the average color is within the range for this rarity
-        if all(min_color[i] <= avg_color[i] <= max_color[i] for i in range(3)):
-            # Calculate a match score based on how close to the center of the range
-            center_color = np.mean([min_color, max_color], axis=0)
-            distance = np.sum(np.abs(avg_color - center_color))
-            
-            # Invert distance to get a score (closer is better)
-            score = 1000 - distance
-            
-            if score > best_match_score:
-                best_match = rarity
-                best_match_score = score
-    
-    if best_match:
-        return best_match
-    
-    # Fallback to the old pixel-counting method if no range match is found
-    rarity_matches = {}
-    for rarity, color in rarity_color_averages.items():
-        # Create a color mask with tolerance
-        lower_bound = np.array([max(0, c - rarity_tolerance) for c in color])
-        upper_bound = np.array([min(255, c + rarity_tolerance) for c in color])
-        mask = cv2.inRange(slot_img, lower_bound, upper_bound)
-        
-        # Count matching pixels
-        pixel_count = np.count_nonzero(mask)
-        rarity_matches[rarity] = pixel_count
-    
-    # Find the rarity with the most matching pixels
-    max_rarity = max(rarity_matches.items(), key=lambda x: x[1]) if rarity_matches else (None, 0)
-    
-    # Set minimum pixel count threshold
-    if max_rarity[1] >= 50:  # At least 50 matching pixels
-        return max_rarity[0]
-    return None
+    result = rarity_classifier.classify_slot(slot_img)
+    return result.rarity if result else None
 
 def load_reference_images():
     """
-    Load weapon images from the cache file and resize them to slot dimensions.
+    Load weapon images, resized to slot dimensions, from the memory-mapped
+    reference store (rebuilt from the cache file when stale).
     """
-    global reference_images
+    global reference_images, reference_index
     
     # Get slot dimensions from dynamic coords (using first slot)
     # Note: Assumes slot size is consistent across maps or re-calls this on map change
@@ -395,19 +280,41 @@ def load_reference_images():
     slot_height = coords[0][3] - coords[0][1]
     
     cache_file = os.path.join(IMAGES_FOLDER, "image_cache.pkl")
-    if not os.path.exists(cache_file):
-        raise FileNotFoundError(f"Cache file not found at {cache_file}")
-    
-    # Load all images from cache
-    with open(cache_file, 'rb') as f:
-        cached_data = pickle.load(f)
+    start = time.perf_counter()
+    store = get_reference_store(cache_file)
+    # Read-only views into the mapped array; no per-image copies
+    reference_images = store.as_dict((slot_width, slot_height))
+    logger.info(f"Loaded {len(reference_images)} hotbar reference images in "
+                f"{(time.perf_counter() - start) * 1000:.0f} ms"
+                f"{' (store rebuilt)' if store.rebuilt else ''}")
+    
+    # Fingerprint every reference once so check_slot only pixel-diffs a shortlist
+    start = time.perf_counter()
+    index = SlotIndex(verify=pixel_based_matching)
+    index.build(reference_images)
+    reference_index = index
+    if _snapshotter is not None:
+        _snapshotter.invalidate()
+    logger.info(f"Indexed {len(index)} hotbar reference images in "
+                f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+def get_reference_index_stats(evaluate=False):
+    """
+    Size and lookup latency of the hotbar reference index.
     
-    for image_name in cached_data.keys():
-        # Strip the file extension from the image name
-        name_without_ext = os.path.splitext(image_name)[0]
-        img = image_cache.load_cached_image(image_name, cache_file)
-        if img is not None:
-            reference_images[name_without_ext] = cv2.resize(img, (slot_width, slot_height))
+    Args:
+        evaluate (bool): Also measure match accuracy against the full
+            pixel-diff scan on perturbed copies of the references (slow)
+        
+    Returns:
+        dict: Index statistics, empty if the references aren't loaded
+    """
+    if reference_index is None:
+        return {}
+    stats = reference_index.stats()
+    if evaluate:
+        stats['evaluation'] = reference_index.evaluate()
+    return stats
 
 def pixel_based_matching(screenshot, template, threshold=30):
     """
@@ -421,11 +328,7 @@ def pixel_based_matching(screenshot, template, threshold=30):
     Returns:
         float: Matching confidence score (0-1)
     """
-    if screenshot.shape != template.shape:
-        return 0
-    diff = np.abs(screenshot.astype(np.int32) - template.astype(np.int32))
-    matching_pixels = np.sum(np.all(diff <= threshold, axis=2))
-    return matching_pixels / (screenshot.shape[0] * screenshot.shape[1])
+    return pixel_match(screenshot, template, threshold)
 
 def timer_thread_function(delay, function, *args):
     """
@@ -450,11 +353,45 @@ def check_slot(coord):
     Returns:
         tuple: (weapon_name, confidence_score)
     """
-    with mss() as sct:
-        screenshot = cv2.cvtColor(np.array(sct.grab(coord)), cv2.COLOR_RGBA2RGB)
-    return max(((name, pixel_based_matching(screenshot, ref_img)) 
-                for name, ref_img in reference_images.items()), 
-               key=lambda x: x[1], default=(None, 0))
+    screenshot = capture_coordinates(coord[0], coord[1], coord[2] - coord[0], coord[3] - coord[1])
+    if screenshot is None or reference_index is None:
+        return None, 0
+    return reference_index.lookup(screenshot)
+
+def _match_slot_item(slot_img):
+    if reference_index is None:
+        return None, 0
+    return reference_index.lookup(slot_img)
+
+def _classify_slot_rarities(slot_imgs):
+    if not rarity_averages_initialized:
+        initialize_rarity_colors()
+    return [r.rarity if r else None for r in rarity_classifier.classify_slots(slot_imgs)]
+
+def get_hotbar_snapshot():
+    """
+    Capture the hotbar strip once; slots are resolved from it on demand.
+    
+    Item matches and rarities are cached per slot on that slot's pixels,
+    so a slot switch (which only moves the highlight and the ammo counters)
+    costs a strip grab and a CRC per slot asked about.
+    
+    Returns:
+        HotbarSnapshot or None if the capture failed
+    """
+    global _snapshotter
+    layout = HotbarLayout.build(SLOT_COORDS, SECONDARY_SLOT_COORDS, CONSUMABLE_COUNT_AREA, AMMO_Y_COORDS)
+    with _snapshotter_lock:
+        if _snapshotter is None or _snapshotter.layout != layout:
+            _snapshotter = HotbarSnapshotter(layout, _match_slot_item, _classify_slot_rarities,
+                                             _read_snapshot_counts)
+        snapshotter = _snapshotter
+    left, top, right, bottom = layout.strip
+    strip = capture_coordinates(left, top, right - left, bottom - top)
+    if strip is None:
+        return None
+    return snapshotter.update(strip)
+
 
 def detect_rarity_for_slot(slot_coord):
     """
@@ -467,23 +404,16 @@ def detect_rarity_for_slot(slot_coord):
         str: Detected rarity or None if not detected
     """
     try:
-        with mss() as sct:
-            slot_img_rgba = np.array(sct.grab(slot_coord))
-            if slot_img_rgba.shape[2] == 4: # Check if image has alpha channel
-                slot_img = cv2.cvtColor(slot_img_rgba, cv2.COLOR_BGRA2BGR)
-            else:
-                slot_img = slot_img_rgba # Assuming it's already BGR
-            
-            color_rarity = detect_rarity_by_color(slot_img)
-            if color_rarity:
-                return color_rarity
-                
+        slot_img = capture_coordinates(slot_coord[0], slot_coord[1],
+                                       slot_coord[2] - slot_coord[0], slot_coord[3] - slot_coord[1])
+        if slot_img is not None:
+            return detect_rarity_by_color(slot_img)
     except Exception as e:
         print(f"Error in rarity detection: {e}")
     
     return None
 
-def _ocr_detect_item_name(current_map='main'):
+def _ocr_detect_item_name(current_map='main', token=None):
     """
     OCR-based item name detection for any map with a loot list file.
     Captures the item name region, filters to near-white pixels with 2px dilation,
@@ -525,7 +455,9 @@ def _ocr_detect_item_name(current_map='main'):
         binary = cv2.resize(binary, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
 
         # Run EasyOCR
-        results = ocr_manager.read_text(binary, paragraph=False, min_size=5, text_threshold=0.4)
+        # Same item in the slot -> same crop up to a few noisy pixels
+        results = ocr_manager.read_text(binary, paragraph=False, min_size=5, text_threshold=0.4,
+                                        near_duplicate=True, priority=PRIORITY_USER, token=token)
         if not results:
             logger.info("OCR hotbar: no text detected")
             return None
@@ -540,16 +472,13 @@ def _ocr_detect_item_name(current_map='main'):
             return None
 
         # Fuzzy match against this map's item list
-        items, items_lower = _get_map_items(current_map)
-        if not items:
+        index = _get_map_index(current_map)
+        if index is None:
             return None
-        raw_lower = raw_text.lower()
-        matches = difflib.get_close_matches(raw_lower, items_lower, n=1, cutoff=0.5)
-        if matches:
-            idx = items_lower.index(matches[0])
-            match_ratio = difflib.SequenceMatcher(None, raw_lower, matches[0]).ratio()
-            logger.info(f"OCR hotbar match: '{raw_text}' -> '{items[idx]}' (ocr_conf: {ocr_conf:.3f}, match_ratio: {match_ratio:.3f})")
-            return items[idx]
+        match = index.match(raw_text, cutoff=0.5)
+        if match:
+            logger.info(f"OCR hotbar match: '{raw_text}' -> '{match.name}' (ocr_conf: {ocr_conf:.3f}, match_ratio: {match.ratio:.3f})")
+            return match.name
 
         logger.info(f"OCR hotbar: no fuzzy match for '{raw_text}' (ocr_conf: {ocr_conf:.3f})")
         return None
@@ -565,7 +494,7 @@ def detect_hotbar_item(slot_index):
     Args:
         slot_index (int): Index of the slot to check (0-4)
     """
-    global current_detection_thread, timer_thread, stop_event, timer_stop_event, last_detected_rarity, last_detected_item, last_detected_slot
+    global current_detection_thread, timer_thread, stop_event, timer_stop_event, last_detected_rarity, last_detected_item, last_detected_slot, detection_token
     
     # Initialize the item rarity map if needed
     if not rarity_map_initialized:
@@ -574,6 +503,8 @@ def detect_hotbar_item(slot_index):
     # Stop any ongoing detection
     if current_detection_thread and current_detection_thread.is_alive():
         stop_event.set()
+    detection_token.cancel()
+    detection_token = CancelToken()
     
     if timer_thread and timer_thread.is_alive():
         timer_stop_event.set()
@@ -589,15 +520,16 @@ def detect_hotbar_item(slot_index):
     last_detected_slot = slot_index
     
     # Start new detection thread
-    current_detection_thread = Thread(target=detect_hotbar_item_thread, args=(slot_index,))
+    current_detection_thread = Thread(target=detect_hotbar_item_thread, args=(slot_index, detection_token))
     current_detection_thread.start()
 
-def detect_hotbar_item_thread(slot_index):
+def detect_hotbar_item_thread(slot_index, token=None):
     """
     Thread function for hotbar item detection.
 
     Args:
         slot_index (int): Index of the slot to check (0-4)
+        token (CancelToken): Cancelled when a newer detection starts
     """
     global timer_thread, last_detected_rarity, last_detected_slot, last_detected_item
 
@@ -614,7 +546,7 @@ def detect_hotbar_item_thread(slot_index):
         if stop_event.is_set():
             return
 
-        item_name = _ocr_detect_item_name(current_map)
+        item_name = _ocr_detect_item_name(current_map, token)
         if item_name and not stop_event.is_set():
             speaker.speak(item_name)
             last_detected_item = item_name
@@ -630,12 +562,13 @@ def detect_hotbar_item_thread(slot_index):
                 timer_thread.start()
         return
 
-    # Non-main maps: existing image-based detection
-    # Get dynamic coordinates
-    current_slot_coords = get_slot_coords()
+    # Non-main maps: existing image-based detection, read from one
+    # snapshot of the whole hotbar for the primary, secondary and rarity
+    # checks alike
+    snapshot = get_hotbar_snapshot()
 
     # Check primary slot
-    best_match_name, best_score = check_slot(current_slot_coords[slot_index])
+    best_match_name, best_score = snapshot.primary(slot_index) if snapshot else (None, 0)
 
     if best_score > CONFIDENCE_THRESHOLD and not stop_event.is_set():
         # Found a match, announce weapon name
@@ -660,18 +593,21 @@ def detect_hotbar_item_thread(slot_index):
             timer_thread.start()
     else:
         # If no match in primary slot, check secondary slot
-        timer_thread = Thread(target=timer_thread_function, args=(0.05, check_secondary_slot, slot_index))
+        timer_thread = Thread(target=timer_thread_function,
+                              args=(0.05, check_secondary_slot, slot_index, snapshot))
         timer_thread.start()
 
-def check_secondary_slot(slot_index):
-    """Check the secondary weapon slot if primary slot check fails."""
+def check_secondary_slot(slot_index, snapshot=None):
+    """Check the secondary weapon slot if primary slot check fails.
+    Reuses the primary check's ``snapshot`` when given."""
     global last_detected_rarity, last_detected_slot, last_detected_item, timer_thread
     
     if stop_event.is_set():
         return
         
-    current_secondary_coords = get_secondary_slot_coords()
-    best_match_name, best_score = check_slot(current_secondary_coords[slot_index])
+    if snapshot is None:
+        snapshot = get_hotbar_snapshot()
+    best_match_name, best_score = snapshot.secondary(slot_index) if snapshot else (None, 0)
     
     if best_score > CONFIDENCE_THRESHOLD:
         speaker.speak(best_match_name)
@@ -696,21 +632,22 @@ def check_secondary_slot(slot_index):
             timer_thread.start()
     else:
         # If no match in secondary slot either, try to detect rarity
-        timer_thread = Thread(target=timer_thread_function, args=(0.05, check_unknown_item_rarity, slot_index))
+        timer_thread = Thread(target=timer_thread_function,
+                              args=(0.05, check_unknown_item_rarity, slot_index, snapshot))
         timer_thread.start()
 
-def check_unknown_item_rarity(slot_index):
-    """Check rarity for an unrecognized item. Does not speak."""
+def check_unknown_item_rarity(slot_index, snapshot=None):
+    """Check rarity for an unrecognized item. Does not speak.
+    Reuses the earlier checks' ``snapshot`` when given."""
     global last_detected_rarity, last_detected_slot, last_detected_item, timer_thread
     
     if stop_event.is_set():
         return
     
-    # Get dynamic coordinates
-    current_slot_coords = get_slot_coords()
-
     # Detect rarity from primary slot
-    detected_rarity_value = detect_rarity_for_slot(current_slot_coords[slot_index])
+    if snapshot is None:
+        snapshot = get_hotbar_snapshot()
+    detected_rarity_value = snapshot.rarity(slot_index) if snapshot else None
     
     if detected_rarity_value:
         last_detected_rarity = detected_rarity_value
@@ -815,8 +752,7 @@ def announce_ammo():
     if _try_announce_ammo_via_ow(simplify):
         return
 
-    with mss() as sct:
-        current_ammo, reserve_ammo, consumable_count = detect_ammo(sct)
+    current_ammo, reserve_ammo, consumable_count = detect_ammo()
 
     if consumable_count is not None:
         if simplify:
@@ -841,8 +777,7 @@ def announce_ammo_manually():
     if _try_announce_ammo_via_ow(simplify):
         return
 
-    sct = mss()
-    current_ammo, reserve_ammo, consumable_count = detect_ammo(sct)
+    current_ammo, reserve_ammo, consumable_count = detect_ammo()
 
     if consumable_count is not None:
         if simplify:
@@ -866,35 +801,18 @@ def detect_divider(screenshot):
     Detect the ammo count divider in the screenshot.
     
     Args:
-        screenshot (np.ndarray): Screenshot to analyze
+        screenshot (np.ndarray): Screenshot to analyze, top-left at (1200, 900)
         
     Returns:
         tuple: (x, y) coordinates of divider if found, None otherwise
     """
-    height, width = screenshot.shape[:2]
-    for x in range(width - 3):
-        y = 57  # 957 on screen, adjusted for the screenshot's top at 900
-        
-        if all(0 <= x + dx < width and 0 <= y + dy < height and 
-               is_white(screenshot[y + dy, x + dx]) for dx, dy in DIVIDER_PATTERN):
-            
-            surrounding_coords = [
-                (dx, dy) for dx in range(-1, 5) for dy in range(-20, 1)
-                if (dx, dy) not in DIVIDER_PATTERN
-            ]
-            
-            if all(0 <= x + dx < width and 0 <= y + dy < height and 
-                   not is_white(screenshot[y + dy, x + dx]) for dx, dy in surrounding_coords):
-                return x, y
-    
-    return None
+    # y = 57 is 957 on screen, adjusted for the screenshot's top at 900
+    return find_divider(screenshot, DIVIDER_PATTERN, y=57)
 
-def detect_ammo(sct):
+def detect_ammo():
     """
-    Detect current and reserve ammo counts or consumable count.
-    
-    Args:
-        sct (mss.mss): Screenshot context
+    Detect current and reserve ammo counts or consumable count from the
+    hotbar snapshot (read once per snapshot).
         
     Returns:
         tuple: (current_ammo, reserve_ammo, consumable_count)
@@ -902,75 +820,32 @@ def detect_ammo(sct):
     if not ocr_manager.is_ready():
         return None, None, None
     
-    try:
-        screenshot_rgba = np.array(sct.grab({'left': 1200, 'top': 900, 'width': 800, 'height': 200}))
-        if screenshot_rgba.shape[2] == 4:
-            screenshot = cv2.cvtColor(screenshot_rgba, cv2.COLOR_BGRA2BGR)
-        else:
-            screenshot = screenshot_rgba
-    except Exception as e:
-        print(f"Error grabbing screenshot for ammo detection: {e}")
+    snapshot = get_hotbar_snapshot()
+    if snapshot is None:
         return None, None, None
+    return snapshot.counts()
 
-    divider_pos = detect_divider(screenshot)
-    
-    # Get dynamic coordinates
-    ammo_coords = get_ammo_y_coords()
-    consumable_area_coords = get_consumable_count_area()
+def _read_snapshot_counts(snapshot):
+    """Ammo or consumable counts from the regions of a hotbar snapshot."""
+    divider_pos = detect_divider(snapshot.crop(AMMO_SEARCH_RECT))
+    ammo_coords = snapshot.layout.ammo_rows
     
     if divider_pos:
         # Regular ammo detection logic
-        divider_x, _ = divider_pos
-        
-        current_ammo_area = {'left': divider_x + 1200 - 75, 'top': ammo_coords['current'][0], 
-                             'width': 75, 'height': ammo_coords['current'][1] - ammo_coords['current'][0]}
-        reserve_ammo_area = {'left': divider_x + 1200 + 7, 'top': ammo_coords['reserve'][0], 
-                             'width': 40, 'height': ammo_coords['reserve'][1] - ammo_coords['reserve'][0]}
+        divider_x = divider_pos[0] + AMMO_SEARCH_RECT[0]
+        current_ammo_screenshot = snapshot.crop((divider_x - 75, ammo_coords['current'][0],
+                                                 divider_x, ammo_coords['current'][1]))
+        reserve_ammo_screenshot = snapshot.crop((divider_x + 7, ammo_coords['reserve'][0],
+                                                 divider_x + 47, ammo_coords['reserve'][1]))
         
-        try:
-            current_ammo_screenshot_rgba = np.array(sct.grab(current_ammo_area))
-            reserve_ammo_screenshot_rgba = np.array(sct.grab(reserve_ammo_area))
-
-            if current_ammo_screenshot_rgba.shape[2] == 4:
-                 current_ammo_screenshot = cv2.cvtColor(current_ammo_screenshot_rgba, cv2.COLOR_BGRA2BGR)
-            else:
-                 current_ammo_screenshot = current_ammo_screenshot_rgba
-            
-            if reserve_ammo_screenshot_rgba.shape[2] == 4:
-                reserve_ammo_screenshot = cv2.cvtColor(reserve_ammo_screenshot_rgba, cv2.COLOR_BGRA2BGR)
-            else:
-                reserve_ammo_screenshot = reserve_ammo_screenshot_rgba
-
-        except Exception as e:
-            print(f"Error grabbing ammo area screenshots: {e}")
-            return None, None, None
-            
         current_ammo = detect_ammo_count(current_ammo_screenshot)
         reserve_ammo = detect_ammo_count(reserve_ammo_screenshot)
         
         return current_ammo, reserve_ammo, None
-    else:
-        # Try to detect consumable count
-        consumable_area = {'left': consumable_area_coords[0], 'top': consumable_area_coords[1],
-                          'width': consumable_area_coords[2] - consumable_area_coords[0],
-                          'height': consumable_area_coords[3] - consumable_area_coords[1]}
-        
-        try:
-            consumable_screenshot_rgba = np.array(sct.grab(consumable_area))
-            if consumable_screenshot_rgba.shape[2] == 4:
-                consumable_screenshot = cv2.cvtColor(consumable_screenshot_rgba, cv2.COLOR_BGRA2BGR)
-            else:
-                consumable_screenshot = consumable_screenshot_rgba
-        except Exception as e:
-            print(f"Error grabbing consumable area screenshot: {e}")
-            return None, None, None
-
-        consumable_count = detect_consumable_count(consumable_screenshot)
-        
-        if consumable_count is not None:
-            return None, None, consumable_count
-        
-        return None, None, None
+    
+    # Try to detect consumable count
+    consumable_count = detect_consumable_count(snapshot.crop(snapshot.layout.consumable_area))
+    return None, None, consumable_count
 
 def detect_consumable_count(consumable_screenshot):
     """
@@ -982,20 +857,17 @@ def detect_consumable_count(consumable_screenshot):
     Returns:
         int: Detected consumable count or None if detection fails
     """
-    if not ocr_manager.is_ready():
-        return None
-
     try:
         gray = cv2.cvtColor(consumable_screenshot, cv2.COLOR_BGR2GRAY)
         _, binary = cv2.threshold(gray, 245, 255, cv2.THRESH_BINARY)
         if np.mean(binary) > 127:
             binary = cv2.bitwise_not(binary)
-        binary = cv2.resize(binary, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
         
-        results = ocr_manager.read_numbers(binary, allowlist='0123456789', paragraph=False, min_size=10, text_threshold=0.5)
+        count_text = ocr_manager.read_digits(binary, scale=2, interpolation=cv2.INTER_CUBIC,
+                                             allowlist='0123456789', paragraph=False, min_size=10, text_threshold=0.5,
+                                             priority=PRIORITY_USER)
         
-        if results:
-            count_text = results[0][1]
+        if count_text:
             count = int(count_text) if count_text.isdigit() else None
             return count if count is not None and count <= 999 else None
     except Exception as e:
@@ -1012,20 +884,17 @@ def detect_ammo_count(ammo_screenshot):
     Returns:
         int: Detected ammo count or None if detection fails
     """
-    if not ocr_manager.is_ready():
-        return None
-
     try:
         gray = cv2.cvtColor(ammo_screenshot, cv2.COLOR_BGR2GRAY)
         _, binary = cv2.threshold(gray, 245, 255, cv2.THRESH_BINARY)
         if np.mean(binary) > 127:
              binary = cv2.bitwise_not(binary)
-        binary = cv2.resize(binary, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
         
-        results = ocr_manager.read_numbers(binary, allowlist='0123456789', paragraph=False, min_size=10, text_threshold=0.5)
+        ammo_text = ocr_manager.read_digits(binary, scale=2, interpolation=cv2.INTER_CUBIC,
+                                            allowlist='0123456789', paragraph=False, min_size=10, text_threshold=0.5,
+                                            priority=PRIORITY_USER)
         
-        if results:
-            ammo_text = results[0][1]
+        if ammo_text:
             return int(ammo_text) if ammo_text.isdigit() else None
     except Exception as e:
         print(f"Error in ammo detection: {e}")
@@ -3,17 +3,19 @@ import time
 import queue
 from lib.utilities.mouse import (
     get_mouse_position, move_to, left_mouse_up, left_mouse_down,
-    pixel as read_pixel
 )
+from lib.managers.screenshot_manager import color_near, probe_pixels
 import numpy as np
 import os
-import pickle
-import difflib
 import cv2
 from accessible_output2.outputs.auto import Auto
 from lib.utilities.utilities import read_config
 from lib.utilities.input import is_key_pressed
 from lib.managers.ocr_manager import get_ocr_manager
+from lib.managers.ocr_queue import CancelToken, PRIORITY_USER
+from lib.detection.name_index import NameIndex
+from lib.detection.rarity import RarityClassifier
+from lib.managers.reference_store import get_reference_store
 
 class InventoryManager:
     def __init__(self):
@@ -29,6 +31,8 @@ class InventoryManager:
         self.last_focused_item = None
         self.navigation_timestamp = 0
         self.ocr_timers = {}
+        # Cancelled on every navigation so superseded OCR is dropped from the queue
+        self.ocr_token = CancelToken()
         
         # Threading
         self.monitoring_thread = None
@@ -95,6 +99,7 @@ class InventoryManager:
         
         # Item name cache for bottom slots
         self.item_names = []
+        self.name_index = None  # built from item_names on first match
         self.slot_name_cache = {}
         self.load_item_names()
         
@@ -109,6 +114,9 @@ class InventoryManager:
             'Exotic': (118, 191, 255)
         }
         self.rarity_tolerance = 15
+        # Single probed pixels: any pixel within tolerance decides
+        self.rarity_classifier = RarityClassifier(self.rarity_colors, self.rarity_tolerance,
+                                                  min_share=1.0, min_margin=1.0)
         
         # OCR text corrections
         self.ocr_corrections = {
@@ -200,13 +208,8 @@ class InventoryManager:
             cache_file = os.path.join(images_folder, "image_cache.pkl")
             
             if os.path.exists(cache_file):
-                with open(cache_file, 'rb') as f:
-                    cache_data = pickle.load(f)
-                
                 rarity_prefixes = ["Common ", "Uncommon ", "Rare ", "Epic ", "Legendary ", "Mythic ", "Exotic "]
-                for image_name in cache_data.keys():
-                    name_without_ext = os.path.splitext(image_name)[0]
-                    
+                for name_without_ext in get_reference_store(cache_file).names():
                     # Store both the full name and clean name (without rarity prefix)
                     clean_name = name_without_ext
                     for prefix in rarity_prefixes:
@@ -244,11 +247,13 @@ class InventoryManager:
             self.movement_thread.join(timeout=1.0)
 
     def cancel_all_ocr_timers(self):
-        """Cancel all pending OCR timers"""
+        """Cancel all pending OCR timers and any OCR they already queued"""
         for timer_key, timer in list(self.ocr_timers.items()):
             if timer and timer.is_alive():
                 timer.cancel()
         self.ocr_timers.clear()
+        self.ocr_token.cancel()
+        self.ocr_token = CancelToken()
 
     def handle_movement_queue(self):
         """Process movement requests from the queue"""
@@ -280,13 +285,8 @@ class InventoryManager:
 
     def check_pixel_color(self, x, y, target_color, tolerance=2):
         """Check if pixel at location matches target color within tolerance"""
-        try:
-            pixel_color = read_pixel(x, y)
-            if isinstance(target_color, tuple) and len(target_color) == 3:
-                return all(abs(a - b) <= tolerance for a, b in zip(pixel_color, target_color))
-            return pixel_color == target_color
-        except Exception:
-            return False
+        hits = probe_pixels([(x, y)], color_near(target_color, tolerance))
+        return bool(hits is not None and hits[0])
 
     def check_key_press(self, key):
         """Check for a single key press without repeat"""
@@ -432,6 +432,7 @@ class InventoryManager:
             section = self.current_section
             self.navigation_timestamp = new_timestamp
             self.cancel_all_ocr_timers()
+            token = self.ocr_token
         
         # Use delay to prevent immediate re-announcement
         announce_delay = 0.01
@@ -449,7 +450,7 @@ class InventoryManager:
                 timer = threading.Timer(
                     0.15, 
                     self.perform_ocr_for_hotbar_with_timestamp_check, 
-                    args=[slot_index, new_timestamp, timer_key]
+                    args=[slot_index, new_timestamp, timer_key, token]
                 )
                 timer.daemon = True
                 self.ocr_timers[timer_key] = timer
@@ -468,7 +469,7 @@ class InventoryManager:
                 timer = threading.Timer(
                     0.15, 
                     self.announce_item_count_with_timestamp_check, 
-                    args=[item_name, new_timestamp, timer_key]
+                    args=[item_name, new_timestamp, timer_key, token]
                 )
                 timer.daemon = True
                 self.ocr_timers[timer_key] = timer
@@ -487,13 +488,13 @@ class InventoryManager:
                 timer = threading.Timer(
                     0.15, 
                     self.announce_item_count_with_timestamp_check, 
-                    args=[item_name, new_timestamp, timer_key]
+                    args=[item_name, new_timestamp, timer_key, token]
                 )
                 timer.daemon = True
                 self.ocr_timers[timer_key] = timer
                 timer.start()
 
-    def perform_ocr_for_hotbar_with_timestamp_check(self, slot_index, timestamp, timer_key):
+    def perform_ocr_for_hotbar_with_timestamp_check(self, slot_index, timestamp, timer_key, token=None):
         """Perform OCR for hotbar with navigation timestamp check"""
         # Remove this timer from the tracking dictionary
         self.ocr_timers.pop(timer_key, None)
@@ -508,9 +509,9 @@ class InventoryManager:
             return
             
         # Actual OCR implementation
-        self.perform_ocr_for_hotbar(slot_index)
+        self.perform_ocr_for_hotbar(slot_index, token)
 
-    def announce_item_count_with_timestamp_check(self, item_name, timestamp, timer_key):
+    def announce_item_count_with_timestamp_check(self, item_name, timestamp, timer_key, token=None):
         """Announce item count with navigation timestamp check"""
         # Remove this timer from the tracking dictionary
         self.ocr_timers.pop(timer_key, None)
@@ -525,15 +526,15 @@ class InventoryManager:
             return
             
         # Actual OCR implementation
-        self.announce_item_count(item_name)
+        self.announce_item_count(item_name, token)
 
-    def announce_item_count(self, item_name):
+    def announce_item_count(self, item_name, token=None):
         """Detect and announce item count"""
-        count = self.detect_item_count(item_name)
-        if count is not None:
+        count = self.detect_item_count(item_name, token)
+        if count is not None and not (token and token.cancelled):
             self.speaker.speak(f"{count}")
 
-    def perform_ocr_for_hotbar(self, slot_index):
+    def perform_ocr_for_hotbar(self, slot_index, token=None):
         """Perform OCR for a hotbar slot to identify the item"""
         # Check if already OCRed (but always check rarity)
         cached_name = self.slot_name_cache.get(slot_index)
@@ -564,9 +565,10 @@ class InventoryManager:
                 _, binary = cv2.threshold(gray, 180, 255, cv2.THRESH_BINARY)
                 
                 # Perform OCR
-                results = self.ocr_manager.read_text(binary, detail=0)
+                results = self.ocr_manager.read_text(binary, detail=0, priority=PRIORITY_USER,
+                                                     token=token)
                 
-                if results:
+                if results and not (token and token.cancelled):
                     # Combine detected text
                     ocr_text = ' '.join(results).lower()
                     
@@ -591,20 +593,11 @@ class InventoryManager:
             if misread in ocr_text:
                 ocr_text = ocr_text.replace(misread, correction)
         
-        best_match = None
-        highest_ratio = 0
-        best_clean_name = None
-        
-        # Find best matching item name
-        for full_name, clean_name in self.item_names:
-            ratio = difflib.SequenceMatcher(None, ocr_text, clean_name.lower()).ratio()
-            
-            if ratio > highest_ratio and ratio > 0.4:
-                highest_ratio = ratio
-                best_match = full_name
-                best_clean_name = clean_name
-        
-        return best_clean_name if best_clean_name else ocr_text
+        # Find best matching item name among the trigram shortlist
+        if self.name_index is None:
+            self.name_index = NameIndex(list(dict.fromkeys(clean for _, clean in self.item_names)))
+        match = self.name_index.match(ocr_text, cutoff=0.4, strict=True)
+        return match.name if match else ocr_text
 
     def check_rarity_and_announce(self, item_name, slot_index):
         """Check item rarity and announce full item name"""
@@ -621,20 +614,23 @@ class InventoryManager:
     def detect_rarity(self):
         """Detect item rarity based on pixel colors"""
         try:
-            # Check common rarity indicator locations
+            # Check common rarity indicator locations, and the rarity color
+            # 5 px to the left of each, in one probe.
             check_locations = [(1210, 684), (1210, 657)]
-            
-            for x, y in check_locations:
-                if self.check_pixel_color(x, y, (255, 255, 255)):
-                    # Check pixel 5 to the left for rarity color
-                    rarity_pixel_x = x - 5
-                    rarity_pixel_color = read_pixel(rarity_pixel_x, y)
-                    
-                    # Compare with known rarity colors
-                    for rarity, color in self.rarity_colors.items():
-                        if all(abs(a - b) <= self.rarity_tolerance for a, b in zip(rarity_pixel_color, color)):
-                            return rarity
-            
+            points = check_locations + [(x - 5, y) for x, y in check_locations]
+            colors = probe_pixels(points)
+            if colors is None:
+                return ""
+            markers = color_near((255, 255, 255), 2)(colors[:len(check_locations)])
+            for i, is_marker in enumerate(markers):
+                if not is_marker:
+                    continue
+                rarity_pixel_color = colors[len(check_locations) + i:len(check_locations) + i + 1]
+                # Look up the known rarity colors in one table read
+                result = self.rarity_classifier.classify(rarity_pixel_color)
+                if result:
+                    return result.rarity
+
             return ""
         except Exception:
             return ""
@@ -653,11 +649,8 @@ class InventoryManager:
         self.last_announcement_time = current_time
         return True
 
-    def detect_item_count(self, item_name):
-        """Detect item count using OCR"""
-        if not self.ocr_manager.is_ready():
-            return None
-            
+    def detect_item_count(self, item_name, token=None):
+        """Detect item count using OCR; gives up once ``token`` is cancelled"""
         if item_name not in self.count_regions:
             return None
             
@@ -695,20 +688,22 @@ class InventoryManager:
                 
                 # Try each approach until we get a valid count
                 for approach_fn in ocr_approaches:
+                    if token and token.cancelled:
+                        return None
                     processed = approach_fn()
                     
-                    # Apply scaling for better OCR
-                    processed = cv2.resize(processed, None, fx=2, fy=2, interpolation=cv2.INTER_NEAREST)
-                    
-                    # Run OCR
-                    results = self.ocr_manager.read_numbers(processed, detail=0, 
+                    # Glyph templates first; EasyOCR on a 2x upscale,
+                    # joining all detected digits, if unsure
+                    count_text = self.ocr_manager.read_digits(processed, scale=2,
+                                                interpolation=cv2.INTER_NEAREST,
+                                                join=True,
                                                 allowlist='0123456789',
                                                 paragraph=False,
-                                                height_ths=1.2)
+                                                height_ths=1.2,
+                                                priority=PRIORITY_USER,
+                                                token=token)
                     
-                    if results:
-                        # Join all detected digits
-                        count_text = ''.join(results)
+                    if count_text:
                         # Remove any non-digit characters
                         count_text = ''.join(c for c in count_text if c.isdigit())
                         
@@ -1,16 +1,55 @@
 """
 Centralized OCR management for FA11y
 Provides a single EasyOCR instance shared across all modules to reduce memory usage
+
+HUD counts go through ``read_digits``, which tries the glyph-template
+reader (``lib.detection.digit_reader``) first and only runs EasyOCR when
+that read isn't confident, teaching the glyph reader from the result.
+
+EasyOCR results are kept in a small LRU cache keyed by a hash of the
+preprocessed crop, the reader and its arguments, so an unchanged crop (a
+"999" wood count, the same hotbar item name) is recognized once. With
+``near_duplicate=True`` the crop is halved and quantized before hashing, so
+a few noisy pixels still hit. ``cache_stats`` reports hits and time saved.
+
+Cache misses run on the prioritized request queue
+(``lib.managers.ocr_queue``): hotkey reads pass ``PRIORITY_USER`` and jump
+ahead of background monitors, identical pending crops share one EasyOCR
+run, and reads carrying a cancelled ``CancelToken`` are dropped before
+they start. ``submit_text``/``submit_numbers`` return the future;
+``read_text``/``read_numbers`` wait on it. ``queue_stats`` reports queue
+depth and wait times.
 """
 import threading
 import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
 from typing import Optional, List, Tuple
 
+import cv2
+import numpy as np
+
+from lib.managers.ocr_queue import CancelToken, OCRRequestQueue, PRIORITY_BACKGROUND
+
 logger = logging.getLogger(__name__)
 
 class OCRManager:
     """Singleton OCR manager to handle all OCR operations"""
     
+    #: EasyOCR confidence needed before a read teaches the glyph reader.
+    LEARN_MIN_CONFIDENCE = 0.8
+    
+    #: Cached EasyOCR results kept (least recently used dropped first).
+    CACHE_SIZE = 256
+    
+    #: Near-duplicate keys keep this many of the 8 intensity bits.
+    NEAR_DUPLICATE_BITS = 3
+    
+    #: Queue worker threads. EasyOCR runs one recognition at a time (see
+    #: ``access_lock``), so more workers would only wait on the lock.
+    WORKERS = 1
+    
     _instance = None
     _lock = threading.Lock()
     
@@ -32,6 +71,16 @@ class OCRManager:
         self.ready_event = threading.Event()
         self.access_lock = threading.Lock()
         self.initialization_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.digit_reads = 0
+        self.glyph_reads = 0
+        self.ocr_fallbacks = 0
+        self._cache = OrderedDict()  # key -> (results, milliseconds)
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_saved_ms = 0.0
+        self.queue = OCRRequestQueue(workers=self.WORKERS)
         
         # Start initialization in background
         self._initialize_in_background()
@@ -73,42 +122,63 @@ class OCRManager:
         """
         return self.ready_event.wait(timeout=timeout) and self.available
     
-    def read_text(self, image, **kwargs) -> List[Tuple]:
+    def read_text(self, image, priority: int = PRIORITY_BACKGROUND,
+                  token: Optional[CancelToken] = None, **kwargs) -> List[Tuple]:
         """Read text from image using general text reader
         
         Args:
             image: Image to process
-            **kwargs: Additional arguments for EasyOCR
+            priority: Queue priority (``PRIORITY_USER`` for hotkey reads)
+            token: Cancel token; the read is dropped if it is cancelled
+                before EasyOCR starts
+            **kwargs: Additional arguments for EasyOCR; ``near_duplicate=True``
+                lets a slightly noisier copy of a cached crop reuse its result
             
         Returns:
-            list: OCR results or empty list if failed
+            list: OCR results or empty list if failed or cancelled
         """
         if not self.is_ready():
             return []
-        
-        try:
-            with self.access_lock:
-                if self.reader is None:
-                    return []
-                return self.reader.readtext(image, **kwargs)
-        except Exception as e:
-            logger.error(f"Error in OCR text reading: {e}")
-            return []
+        return self._wait(self.submit_text(image, priority, token, **kwargs), 'text')
     
-    def read_numbers(self, image, **kwargs) -> List[Tuple]:
+    def read_numbers(self, image, priority: int = PRIORITY_BACKGROUND,
+                     token: Optional[CancelToken] = None, **kwargs) -> List[Tuple]:
         """Read numbers from image using number-optimized reader
         
         Args:
             image: Image to process  
-            **kwargs: Additional arguments for EasyOCR
+            priority: Queue priority (``PRIORITY_USER`` for hotkey reads)
+            token: Cancel token; the read is dropped if it is cancelled
+                before EasyOCR starts
+            **kwargs: Additional arguments for EasyOCR; ``near_duplicate=True``
+                lets a slightly noisier copy of a cached crop reuse its result
             
         Returns:
-            list: OCR results or empty list if failed
+            list: OCR results or empty list if failed or cancelled
         """
         if not self.is_ready():
             return []
+        return self._wait(self.submit_numbers(image, priority, token, **kwargs), 'number')
+    
+    def submit_text(self, image, priority: int = PRIORITY_BACKGROUND,
+                    token: Optional[CancelToken] = None, **kwargs) -> Future:
+        """Queue a ``read_text``; returns a future of the OCR results"""
+        near_duplicate = kwargs.pop('near_duplicate', False)
         
-        try:
+        def _run():
+            with self.access_lock:
+                if self.reader is None:
+                    return []
+                return self.reader.readtext(image, **kwargs)
+        
+        return self._submit('text', image, kwargs, near_duplicate, _run, priority, token)
+    
+    def submit_numbers(self, image, priority: int = PRIORITY_BACKGROUND,
+                       token: Optional[CancelToken] = None, **kwargs) -> Future:
+        """Queue a ``read_numbers``; returns a future of the OCR results"""
+        near_duplicate = kwargs.pop('near_duplicate', False)
+        
+        def _run():
             with self.access_lock:
                 if self.number_reader is None:
                     # Lazy-load number reader on first use
@@ -121,18 +191,171 @@ class OCRManager:
                             return []
                         return self.reader.readtext(image, **kwargs)
                 return self.number_reader.readtext(image, **kwargs)
+        
+        return self._submit('numbers', image, kwargs, near_duplicate, _run, priority, token)
+    
+    def _submit(self, reader: str, image, kwargs: dict, near_duplicate: bool, run,
+                priority: int, token: Optional[CancelToken]) -> Future:
+        """Cached result as a finished future, else ``run`` on the queue
+        (coalesced with an identical pending crop)"""
+        key = self._cache_key(reader, image, kwargs, near_duplicate)
+        cached = self._cache_get(key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+        
+        def _job():
+            started = time.perf_counter()
+            results = run()
+            self._cache_put(key, results, (time.perf_counter() - started) * 1000.0)
+            return results
+        
+        return self.queue.submit(_job, priority, key=key, token=token)
+    
+    def _wait(self, future: Future, what: str) -> List[Tuple]:
+        try:
+            return list(future.result())
+        except CancelledError:
+            return []
         except Exception as e:
-            logger.error(f"Error in OCR number reading: {e}")
+            logger.error(f"Error in OCR {what} reading: {e}")
             return []
     
+    def _cache_key(self, reader: str, image, kwargs: dict, near_duplicate: bool):
+        """Hash of the crop (quantized when ``near_duplicate``), reader and
+        arguments; None for inputs that aren't arrays."""
+        if not isinstance(image, np.ndarray):
+            return None
+        crop = image
+        if near_duplicate and crop.ndim >= 2 and crop.shape[0] >= 2 and crop.shape[1] >= 2:
+            crop = cv2.resize(crop, (crop.shape[1] // 2, crop.shape[0] // 2), interpolation=cv2.INTER_AREA)
+            if crop.dtype == np.uint8:
+                crop = crop >> (8 - self.NEAR_DUPLICATE_BITS)
+        args = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+        return hash((reader, near_duplicate, crop.shape, str(crop.dtype),
+                     np.ascontiguousarray(crop).tobytes(), args))
+    
+    def _cache_get(self, key) -> Optional[list]:
+        """Copy of the cached results for ``key``, counting the hit or miss"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            self.cache_saved_ms += entry[1]
+            return list(entry[0])
+    
+    def _cache_put(self, key, results, elapsed_ms: float):
+        if key is None or results is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = (list(results), elapsed_ms)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def cache_stats(self) -> dict:
+        """OCR result cache and glyph-reader counters
+        
+        Returns:
+            dict: Cache size, hits, misses, hit rate and milliseconds of
+            EasyOCR work saved, plus how many digit reads skipped EasyOCR
+        """
+        with self._cache_lock:
+            lookups = self.cache_hits + self.cache_misses
+            stats = {
+                'entries': len(self._cache),
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'hit_rate': round(self.cache_hits / lookups, 3) if lookups else 0.0,
+                'saved_ms': round(self.cache_saved_ms, 1),
+            }
+        with self._stats_lock:
+            stats['digit_reads'] = self.digit_reads
+            stats['glyph_reads'] = self.glyph_reads
+            stats['ocr_fallbacks'] = self.ocr_fallbacks
+        return stats
+    
+    def queue_stats(self) -> dict:
+        """OCR request queue metrics
+        
+        Returns:
+            dict: Pending depth (total and per priority), peak depth,
+            submitted/completed/coalesced/dropped counts and wait times
+        """
+        return self.queue.stats()
+    
+    def clear_cache(self):
+        """Drop every cached OCR result"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def read_digits(self, binary, scale: float = 2.0,
+                    interpolation: int = cv2.INTER_NEAREST, join: bool = False,
+                    **kwargs) -> Optional[str]:
+        """Read a HUD count from a binarized image (digits white on black)
+        
+        Tries the glyph-template reader first. Below its confidence
+        threshold (where it stays until every digit is learned at the
+        count's scale), runs EasyOCR on the image upscaled by ``scale`` and
+        teaches the glyph reader from a confident, digits-only result.
+        
+        Args:
+            binary: Binarized count image, before any upscaling
+            scale: Upscale factor for the EasyOCR fallback
+            interpolation: cv2 interpolation for the upscale
+            join: Join every EasyOCR box (else the first box only)
+            **kwargs: Additional arguments for ``read_numbers`` (EasyOCR
+                arguments, ``priority``, ``token``)
+            
+        Returns:
+            str: The text read (digits from the glyph reader; EasyOCR's raw
+            text otherwise), or None
+        """
+        from lib.detection.digit_reader import get_digit_reader
+        
+        glyphs = get_digit_reader()
+        with self._stats_lock:
+            self.digit_reads += 1
+        text = glyphs.read_confident(binary)
+        if text is not None:
+            with self._stats_lock:
+                self.glyph_reads += 1
+            return text
+        
+        if not self.is_ready():
+            return None
+        image = cv2.resize(binary, None, fx=scale, fy=scale, interpolation=interpolation)
+        kwargs['detail'] = 1
+        results = self.read_numbers(image, **kwargs)
+        if not results:
+            return None
+        with self._stats_lock:
+            self.ocr_fallbacks += 1
+        if join:
+            text = ''.join(r[1] for r in results)
+        else:
+            text = results[0][1]
+        confidence = min(float(r[2]) for r in (results if join else results[:1]))
+        if text.isdigit() and confidence >= self.LEARN_MIN_CONFIDENCE:
+            glyphs.learn(binary, text)
+        return text
+    
     def cleanup(self):
         """Clean up OCR resources"""
+        self.queue.shutdown()
         with self.access_lock:
             self.reader = None
             if hasattr(self, 'number_reader'):
                 self.number_reader = None
             self.available = False
             logger.info("OCR resources cleaned up")
+        self.clear_cache()
 
 # Global OCR manager instance
 ocr_manager = OCRManager()
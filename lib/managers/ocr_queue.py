@@ -0,0 +1,230 @@
+"""
+Prioritized OCR request queue for FA11y.
+
+EasyOCR can only run one recognition at a time, so callers used to queue
+up on ``OCRManager.access_lock`` in whatever order the lock happened to
+wake them: a hotbar item-name read from a key press could wait behind a
+background material count, and an inventory read for a slot the player has
+already left still ran. Requests now go through this queue instead:
+
+* **Priorities** — ``PRIORITY_USER`` (hotkeys, inventory navigation) runs
+  before ``PRIORITY_BACKGROUND`` (monitors); FIFO within a priority.
+* **Coalescing** — a request whose key (``OCRManager``'s cache key: crop
+  hash, reader and arguments) matches a pending one shares its future, and
+  raises its priority if needed.
+* **Cancellation** — a request carries ``CancelToken`` s; once every
+  token on it is cancelled it is dropped before it runs and its future is
+  cancelled. A request without a token is never dropped.
+
+Results come back as ``concurrent.futures.Future`` objects. ``stats``
+reports queue depth and wait times.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 1
+
+_PRIORITY_NAMES = {PRIORITY_USER: 'user', PRIORITY_BACKGROUND: 'background'}
+
+
+class CancelToken:
+    """Cancellation flag shared by the requests of one logical operation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.debug("OCR cancel callback failed", exc_info=True)
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Call ``callback()`` on cancel (now, if already cancelled)."""
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+class _Request:
+    __slots__ = ('key', 'fn', 'priority', 'tokens', 'future', 'enqueued')
+
+    def __init__(self, key, fn, priority, token):
+        self.key = key
+        self.fn = fn
+        self.priority = priority
+        self.tokens: List[Optional[CancelToken]] = [token]
+        self.future: Future = Future()
+        self.enqueued = time.perf_counter()
+
+    def abandoned(self) -> bool:
+        return all(t is not None and t.cancelled for t in self.tokens)
+
+
+class OCRRequestQueue:
+    """Priority queue of OCR jobs run by a small pool of worker threads."""
+
+    def __init__(self, workers: int = 1) -> None:
+        self.workers = max(1, workers)
+        self._cond = threading.Condition()
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._pending: Dict[Hashable, _Request] = {}
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self.submitted = 0
+        self.completed = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self._wait_total = {p: 0.0 for p in _PRIORITY_NAMES}
+        self._wait_max = {p: 0.0 for p in _PRIORITY_NAMES}
+        self._wait_count = {p: 0 for p in _PRIORITY_NAMES}
+
+    def submit(self, fn: Callable[[], object], priority: int = PRIORITY_BACKGROUND,
+               key: Optional[Hashable] = None,
+               token: Optional[CancelToken] = None) -> Future:
+        """Queue ``fn()``; returns its future. ``key`` enables coalescing."""
+        with self._cond:
+            if self._stopping:
+                future: Future = Future()
+                future.cancel()
+                return future
+            self.submitted += 1
+            request = self._pending.get(key) if key is not None else None
+            if request is not None:
+                self.coalesced += 1
+                request.tokens.append(token)
+                if priority < request.priority:
+                    request.priority = priority
+                    heapq.heappush(self._heap, (priority, next(self._seq), request))
+                    self._cond.notify()
+            else:
+                request = _Request(key, fn, priority, token)
+                if key is not None:
+                    self._pending[key] = request
+                heapq.heappush(self._heap, (priority, next(self._seq), request))
+                self.max_depth = max(self.max_depth, self._depth())
+                self._ensure_workers()
+                self._cond.notify()
+        if token is not None:
+            token.add_callback(lambda: self._on_cancel(request))
+        return request.future
+
+    def _depth(self) -> int:
+        return sum(1 for _, _, r in self._heap if not r.future.done()) if self._heap else 0
+
+    def _ensure_workers(self) -> None:
+        """Start the worker threads on first use. Caller holds the lock."""
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f"OCRWorker-{len(self._threads)}",
+                                      daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _on_cancel(self, request: _Request) -> None:
+        with self._cond:
+            if not request.abandoned() or request.future.running():
+                return
+            if request.key is not None and self._pending.get(request.key) is request:
+                del self._pending[request.key]
+            if request.future.cancel():
+                self.dropped += 1
+
+    def _next(self) -> Optional[_Request]:
+        """Highest-priority live request, or None on shutdown."""
+        with self._cond:
+            while True:
+                while self._heap:
+                    priority, _, request = heapq.heappop(self._heap)
+                    if request.future.done() or priority != request.priority:
+                        continue  # cancelled, or a stale entry from a priority raise
+                    if request.key is not None and self._pending.get(request.key) is request:
+                        del self._pending[request.key]
+                    if request.abandoned():
+                        request.future.cancel()
+                        self.dropped += 1
+                        continue
+                    if not request.future.set_running_or_notify_cancel():
+                        continue
+                    waited = time.perf_counter() - request.enqueued
+                    self._wait_total[priority] = self._wait_total.get(priority, 0.0) + waited
+                    self._wait_max[priority] = max(self._wait_max.get(priority, 0.0), waited)
+                    self._wait_count[priority] = self._wait_count.get(priority, 0) + 1
+                    return request
+                if self._stopping:
+                    return None
+                self._cond.wait()
+
+    def _worker(self) -> None:
+        while True:
+            request = self._next()
+            if request is None:
+                return
+            try:
+                request.future.set_result(request.fn())
+            except BaseException as e:
+                request.future.set_exception(e)
+            with self._cond:
+                self.completed += 1
+
+    def shutdown(self) -> None:
+        """Cancel everything pending and stop the workers."""
+        with self._cond:
+            self._stopping = True
+            for _, _, request in self._heap:
+                request.future.cancel()
+            self._heap.clear()
+            self._pending.clear()
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            by_priority = {}
+            for _, _, request in self._heap:
+                if not request.future.done():
+                    name = _PRIORITY_NAMES.get(request.priority, str(request.priority))
+                    by_priority[name] = by_priority.get(name, 0) + 1
+            waits = {}
+            for priority, name in _PRIORITY_NAMES.items():
+                count = self._wait_count.get(priority, 0)
+                waits[name] = {
+                    'runs': count,
+                    'avg_wait_ms': round(self._wait_total[priority] / count * 1000.0, 1) if count else 0.0,
+                    'max_wait_ms': round(self._wait_max[priority] * 1000.0, 1),
+                }
+            return {
+                'depth': sum(by_priority.values()),
+                'depth_by_priority': by_priority,
+                'max_depth': self.max_depth,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'coalesced': self.coalesced,
+                'dropped': self.dropped,
+                'waits': waits,
+            }
@@ -0,0 +1,182 @@
+"""
+Memory-mapped store of hotbar reference images for FA11y.
+
+The reference images ship as ``assets/images/image_cache.pkl``, a pickled
+dict of zlib-compressed, encoded images. Reading it meant unpickling the
+whole file (once per caller), decompressing and decoding every image, and
+resizing each one to the slot size — on every start.
+
+``ReferenceStore`` does that work once and keeps the result next to the
+pickle:
+
+* ``image_cache.refs.npy`` — every reference, already resized, in one
+  contiguous ``(N, height, width, 3)`` uint8 array;
+* ``image_cache.refs.json`` — store version, slot size, item names and the
+  source pickle's size, mtime and SHA-1.
+
+On later starts the index is checked against the source (size and mtime
+first; the SHA-1 only when those changed, so a touched but identical file
+is still accepted) and the array is opened with ``mmap_mode='r'``: the
+images are read-only views into the mapped file and pages load when a slot
+is first compared. A stale or missing store is rebuilt from the pickle; if
+it can't be written the freshly decoded array is used in memory.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+#: Bump when the store layout or the decode/resize steps change.
+STORE_VERSION = 1
+
+DEFAULT_CACHE_FILE = os.path.join("assets", "images", "image_cache.pkl")
+
+
+def decode_cached_image(entry: dict) -> Optional[np.ndarray]:
+    """Decompress and decode one ``image_cache.pkl`` entry to BGR."""
+    data = zlib.decompress(entry['data'])
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+
+
+def _file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ReferenceStore:
+    """Pre-resized reference images for one source pickle."""
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        base = os.path.splitext(cache_file)[0]
+        self.array_path = base + '.refs.npy'
+        self.index_path = base + '.refs.json'
+        self.rebuilt = False
+
+    # ------------------------------------------------------------------
+    # Index validation
+    # ------------------------------------------------------------------
+
+    def _source_stat(self) -> dict:
+        st = os.stat(self.cache_file)
+        return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+    def _read_index(self) -> Optional[dict]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get('version') != STORE_VERSION:
+            return None
+        source = index.get('source', {})
+        current = self._source_stat()
+        if source.get('size') != current['size']:
+            return None
+        if source.get('mtime_ns') != current['mtime_ns']:
+            if source.get('sha1') != _file_sha1(self.cache_file):
+                return None
+            source['mtime_ns'] = current['mtime_ns']
+            self._write_index(index)
+        return index
+
+    def _write_index(self, index: dict) -> None:
+        tmp = self.index_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp, self.index_path)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def names(self) -> List[str]:
+        """Reference names (file extensions stripped) without decoding any
+        image; reads the pickle only when the store is stale."""
+        if not os.path.exists(self.cache_file):
+            raise FileNotFoundError(f"Cache file not found at {self.cache_file}")
+        index = self._read_index()
+        if index is not None:
+            return list(index['names'])
+        with open(self.cache_file, 'rb') as f:
+            return [os.path.splitext(name)[0] for name in pickle.load(f)]
+
+    def load(self, slot_size: Tuple[int, int]) -> Tuple[List[str], np.ndarray]:
+        """Names and the ``(N, height, width, 3)`` reference array at
+        ``slot_size`` (width, height), memory-mapped when the store is
+        current and rebuilt from the pickle otherwise."""
+        if not os.path.exists(self.cache_file):
+            raise FileNotFoundError(f"Cache file not found at {self.cache_file}")
+        self.rebuilt = False
+        index = self._read_index()
+        if index is not None and tuple(index.get('slot_size', ())) == tuple(slot_size):
+            try:
+                images = np.load(self.array_path, mmap_mode='r')
+                if images.shape[0] == len(index['names']) and images.shape[1:3] == (slot_size[1], slot_size[0]):
+                    return list(index['names']), images
+            except (OSError, ValueError) as e:
+                logger.warning(f"Reference store unreadable, rebuilding: {e}")
+        self.rebuilt = True
+        return self.build(slot_size)
+
+    def build(self, slot_size: Tuple[int, int]) -> Tuple[List[str], np.ndarray]:
+        """Decode and resize every reference once and write the store."""
+        with open(self.cache_file, 'rb') as f:
+            cached_data = pickle.load(f)
+        width, height = slot_size
+        names: List[str] = []
+        frames: List[np.ndarray] = []
+        for image_name, entry in cached_data.items():
+            try:
+                img = decode_cached_image(entry)
+            except Exception as e:
+                logger.warning(f"Error loading {image_name} from cache: {e}")
+                continue
+            if img is None:
+                continue
+            names.append(os.path.splitext(image_name)[0])
+            frames.append(cv2.resize(img, (width, height)))
+        images = np.stack(frames) if frames else np.zeros((0, height, width, 3), dtype=np.uint8)
+
+        try:
+            tmp = self.array_path + '.tmp.npy'
+            np.save(tmp, images)
+            os.replace(tmp, self.array_path)
+            self._write_index({
+                'version': STORE_VERSION,
+                'source': dict(self._source_stat(), sha1=_file_sha1(self.cache_file)),
+                'slot_size': [width, height],
+                'names': names,
+                'shape': list(images.shape),
+            })
+            logger.info(f"Built reference store with {len(names)} images at {width}x{height}")
+            images = np.load(self.array_path, mmap_mode='r')
+        except OSError as e:
+            logger.warning(f"Could not write reference store, using it in memory: {e}")
+        return names, images
+
+    def as_dict(self, slot_size: Tuple[int, int]) -> Dict[str, np.ndarray]:
+        """``load`` as a name -> image mapping of read-only views."""
+        names, images = self.load(slot_size)
+        return {name: images[i] for i, name in enumerate(names)}
+
+
+_stores: Dict[str, ReferenceStore] = {}
+
+
+def get_reference_store(cache_file: str = DEFAULT_CACHE_FILE) -> ReferenceStore:
+    """Shared store for ``cache_file``."""
+    if cache_file not in _stores:
+        _stores[cache_file] = ReferenceStore(cache_file)
+    return _stores[cache_file]
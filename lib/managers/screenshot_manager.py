@@ -6,13 +6,86 @@ import threading
 import time
 import logging
 from collections import OrderedDict
-from typing import Dict, Tuple, Optional, Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 from mss import mss
 import cv2
 
 logger = logging.getLogger(__name__)
 
+# Fixed cost of one grab (a GDI round trip), expressed in pixels of copy
+# work. Pixel probes are grouped into one bounding box while that is
+# cheaper than grabbing the groups separately.
+PROBE_GRAB_COST = 100_000
+
+Point = Tuple[int, int]
+Rect = Tuple[int, int, int, int]  # left, top, right, bottom (exclusive)
+ColorPredicate = Callable[[np.ndarray], np.ndarray]
+
+
+def color_near(target: Sequence[int], tolerance: int) -> ColorPredicate:
+    """Predicate for ``probe_pixels``: every RGB channel within
+    ``tolerance`` of ``target``."""
+    target_arr = np.asarray(target, dtype=np.int16)
+
+    def predicate(colors: np.ndarray) -> np.ndarray:
+        return (np.abs(colors.astype(np.int16) - target_arr) <= tolerance).all(axis=1)
+    return predicate
+
+
+def color_between(low: Sequence[int], high: Sequence[int]) -> ColorPredicate:
+    """Predicate for ``probe_pixels``: every RGB channel in ``[low, high]``."""
+    low_arr = np.asarray(low, dtype=np.int16)
+    high_arr = np.asarray(high, dtype=np.int16)
+
+    def predicate(colors: np.ndarray) -> np.ndarray:
+        c = colors.astype(np.int16)
+        return ((c >= low_arr) & (c <= high_arr)).all(axis=1)
+    return predicate
+
+
+def group_points(points: Sequence[Point], grab_cost: Optional[int] = None) -> List[Tuple[Rect, List[int]]]:
+    """Group screen points into bounding rectangles to grab.
+
+    Greedily merges the pair of groups whose union saves the most grab
+    cost until no merge saves anything.
+
+    Args:
+        points: ``(x, y)`` screen points
+        grab_cost: Fixed per-grab cost in pixels (default ``PROBE_GRAB_COST``)
+
+    Returns:
+        list: ``(rect, indices)`` pairs; ``indices`` index into ``points``
+    """
+    fixed = PROBE_GRAB_COST if grab_cost is None else grab_cost
+
+    def cost(rect: Rect) -> int:
+        return fixed + (rect[2] - rect[0]) * (rect[3] - rect[1])
+
+    groups: Dict[Point, List[int]] = {}
+    for i, (x, y) in enumerate(points):
+        groups.setdefault((int(x), int(y)), []).append(i)
+    rects: List[Tuple[Rect, List[int]]] = [
+        ((x, y, x + 1, y + 1), idx) for (x, y), idx in groups.items()
+    ]
+    while len(rects) > 1:
+        best = None
+        for i in range(len(rects)):
+            for j in range(i + 1, len(rects)):
+                a, b = rects[i][0], rects[j][0]
+                union = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                saving = cost(a) + cost(b) - cost(union)
+                if saving >= 0 and (best is None or saving > best[0]):
+                    best = (saving, i, j, union)
+        if best is None:
+            break
+        _, i, j, union = best
+        merged = (union, rects[i][1] + rects[j][1])
+        del rects[j]
+        rects[i] = merged
+    return rects
+
+
 class ScreenshotManager:
     """Singleton screenshot manager for centralized screen capture operations"""
     
@@ -45,6 +118,7 @@ class ScreenshotManager:
             'screenshots_taken': 0,
             'cache_hits': 0,
             'cache_misses': 0,
+            'pixel_probes': 0,
             'errors': 0
         }
         
@@ -161,18 +235,56 @@ class ScreenshotManager:
     def get_pixel(self, x: int, y: int) -> Optional[tuple]:
         """Read a single pixel from the screen. Returns (R, G, B) tuple or None on error.
 
-        Uses the thread-local mss instance directly for minimal overhead.
+        Prefer ``probe_pixels`` when checking several pixels.
+        """
+        colors = self.probe_pixels([(x, y)])
+        if colors is None:
+            return None
+        r, g, b = colors[0]
+        return (int(r), int(g), int(b))
+
+    def probe_pixels(self, points: Sequence[Point],
+                     predicate: Optional[ColorPredicate] = None) -> Optional[np.ndarray]:
+        """Read several screen pixels with as few grabs as possible
+
+        Points are grouped into bounding regions (see ``group_points``) and
+        each region is grabbed once.
+
+        Args:
+            points: ``(x, y)`` screen points
+            predicate: Optional vectorized test (e.g. ``color_near``)
+                applied to the (N, 3) RGB colors
+
+        Returns:
+            np.ndarray: (N, 3) uint8 RGB colors, or (N,) bools when a
+            predicate is given; None if any grab failed
         """
+        pts = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        colors = np.zeros((len(pts), 3), dtype=np.uint8)
         try:
-            mss_instance = self.get_mss_instance()
-            if mss_instance is None:
-                return None
-            img = mss_instance.grab({'left': x, 'top': y, 'width': 1, 'height': 1})
-            # mss returns BGRA
-            b, g, r = img.pixel(0, 0)[:3]
-            return (r, g, b)
-        except Exception:
+            if len(pts):
+                mss_instance = self.get_mss_instance()
+                if mss_instance is None:
+                    return None
+                for rect, indices in group_points(pts.tolist()):
+                    region = {'left': rect[0], 'top': rect[1],
+                              'width': rect[2] - rect[0], 'height': rect[3] - rect[1]}
+                    img = np.asarray(mss_instance.grab(region))
+                    self.stats['screenshots_taken'] += 1
+                    sel = pts[indices]
+                    # mss returns BGRA
+                    colors[indices] = img[sel[:, 1] - rect[1], sel[:, 0] - rect[0], 2::-1]
+                self.stats['pixel_probes'] += len(pts)
+        except Exception as e:
+            current_time = time.time()
+            if current_time - self.error_cooldown.get('probe', 0) > 10.0:
+                logger.error(f"Error probing pixels: {e}")
+                self.error_cooldown['probe'] = current_time
+            self.stats['errors'] += 1
             return None
+        if predicate is None:
+            return colors
+        return np.asarray(predicate(colors), dtype=bool)
 
     def capture_coordinates(self, x: int, y: int, width: int, height: int,
                           convert_format: str = 'bgr') -> Optional[np.ndarray]:
@@ -257,6 +369,7 @@ class ScreenshotManager:
             'screenshots_taken': 0,
             'cache_hits': 0,
             'cache_misses': 0,
+            'pixel_probes': 0,
             'errors': 0
         }
     
@@ -318,4 +431,10 @@ def capture_full_screen(convert_format: str = 'bgr') -> Optional[np.ndarray]:
 
 def get_pixel(x: int, y: int) -> Optional[tuple]:
     """Convenience function to read a single pixel. Returns (R, G, B) or None."""
-    return screenshot_manager.get_pixel(x, y)
\ No newline at end of file
+    return screenshot_manager.get_pixel(x, y)
+
+def probe_pixels(points: Sequence[Point],
+                 predicate: Optional[ColorPredicate] = None) -> Optional[np.ndarray]:
+    """Convenience function to read several pixels in as few grabs as possible.
+    Returns (N, 3) RGB colors, (N,) bools with a predicate, or None."""
+    return screenshot_manager.probe_pixels(points, predicate)
@@ -8,9 +8,19 @@ from lib.utilities.utilities import read_config, get_config_boolean, on_config_c
 from lib.managers.screenshot_manager import screenshot_manager as _ss_mgr
 
 from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import INVENTORY_OPEN, MAP_OPEN, game_state
+from lib.monitors.scheduler import PRIORITY_HIGH
+
+# Single pixel sampled for the full-screen map's yellow header.
+MAP_PIXEL_REGION = {'left': 220, 'top': 60, 'width': 1, 'height': 1}
 
 
 class BackgroundMonitor(BaseMonitor):
+    # Map / inventory state gates most other monitors; the CPU governor
+    # never slows it down.
+    _SCHEDULE_PERIOD = 0.15
+    _SCHEDULE_PRIORITY = PRIORITY_HIGH
+
     def __init__(self):
         super().__init__()
         self.speaker = Auto()
@@ -73,6 +83,8 @@ class BackgroundMonitor(BaseMonitor):
     def map_open(self, value):
         with self._status_lock:
             self._map_open = value
+        # Published whether the pixel check or the game log set it.
+        game_state.set_overlay(MAP_OPEN, value)
 
     @property
     def inventory_open(self):
@@ -83,6 +95,7 @@ class BackgroundMonitor(BaseMonitor):
     def inventory_open(self, value):
         with self._status_lock:
             self._inventory_open = value
+        game_state.set_overlay(INVENTORY_OPEN, value)
 
     def get_mss(self):
         """Get MSS instance via shared ScreenshotManager."""
@@ -137,8 +150,9 @@ class BackgroundMonitor(BaseMonitor):
         """Read a single pixel using shared ScreenshotManager. Returns (R, G, B) or None."""
         return _ss_mgr.get_pixel(x, y)
 
-    def check_map_status(self):
-        """Check if the map is open/closed with throttling."""
+    def check_map_status(self, frame=None):
+        """Check if the map is open/closed with throttling. ``frame`` is an
+        optional raw capture of ``MAP_PIXEL_REGION``."""
         if self._external_map_source:
             # MatchEventMonitor is providing authoritative map state from
             # Fortnite log events; skip the pixel scan.
@@ -151,7 +165,11 @@ class BackgroundMonitor(BaseMonitor):
         self.last_map_check = current_time
         
         try:
-            pixel_color = self._get_pixel(220, 60)
+            if frame is not None:
+                b, g, r = frame[0, 0, :3]
+                pixel_color = (int(r), int(g), int(b))
+            else:
+                pixel_color = self._get_pixel(220, 60)
             if pixel_color is None:
                 return
             is_map_color = all(abs(a - b) <= 10 for a, b in zip(pixel_color, (247, 255, 26)))
@@ -167,8 +185,9 @@ class BackgroundMonitor(BaseMonitor):
             if current_time - self.last_error_time > self.error_cooldown:
                 self.last_error_time = current_time
 
-    def check_inventory_status(self):
-        """Check if inventory is open/closed using template matching."""
+    def check_inventory_status(self, screenshot=None):
+        """Check if inventory is open/closed using template matching.
+        ``screenshot`` is an optional raw capture of ``inventory_region``."""
         if self.map_open:  # Don't check if map is open
             return
         if self._external_inventory_source:
@@ -177,7 +196,8 @@ class BackgroundMonitor(BaseMonitor):
             return
             
         try:
-            screenshot = _ss_mgr.capture_region(self.inventory_region, convert_format='raw')
+            if screenshot is None:
+                screenshot = _ss_mgr.capture_region(self.inventory_region, convert_format='raw')
             if screenshot is None:
                 return
             is_escape_visible = self.detect_escape_key(screenshot)
@@ -195,25 +215,21 @@ class BackgroundMonitor(BaseMonitor):
             if current_time - self.last_error_time > self.error_cooldown:
                 self.last_error_time = current_time
 
-    def _monitor_loop(self):
-        """Main monitoring loop with performance optimizations."""
-        try:
-            while not self.stop_event.is_set():
-                try:
-                    if self.wizard_paused():
-                        time.sleep(0.25)
-                        continue
-                    if self.announce_map:
-                        self.check_map_status()
-                    if self.announce_inventory:
-                        self.check_inventory_status()
-                    time.sleep(0.15)
-                except Exception:
-                    time.sleep(1.0)
-        except Exception:
-            pass
-        finally:
-            self.cleanup_mss()
+    def capture_regions(self):
+        regions = {}
+        if self.announce_map and not self._external_map_source:
+            regions['map'] = MAP_PIXEL_REGION
+        if (self.announce_inventory and not self._external_inventory_source
+                and not self.map_open):
+            regions['inventory'] = self.inventory_region
+        return regions
+
+    def tick(self, frames, now):
+        if self.announce_map and 'map' in frames:
+            self.check_map_status(frames['map'])
+        if self.announce_inventory and 'inventory' in frames:
+            self.check_inventory_status(frames['inventory'])
+        return None
 
     def stop_monitoring(self):
         """Stop the thread via BaseMonitor, then clean up mss instances."""
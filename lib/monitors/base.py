@@ -1,12 +1,17 @@
 """Base class for background monitors with lifecycle management.
 
-Subclasses implement ``_monitor_loop``; use ``self.stop_event.wait(t)``
-inside it so ``stop_monitoring()`` can break out cleanly.
+Subclasses either implement ``_monitor_loop`` (run on a dedicated thread;
+use ``self.stop_event.wait(t)`` inside it so ``stop_monitoring()`` can
+break out cleanly), or set ``_SCHEDULE_PERIOD`` and implement ``tick`` to
+run on the shared ``MonitorScheduler`` (see ``lib.monitors.scheduler``).
+Scheduled monitors can also declare the game states they are useful in
+(``_ACTIVE_STATES`` / ``_SUSPEND_STATES``, see ``lib.monitors.game_state``)
+and are suspended on the scheduler everywhere else.
 """
 from __future__ import annotations
 
 import threading
-from typing import Optional
+from typing import Dict, FrozenSet, Optional
 
 
 class BaseMonitor:
@@ -18,9 +23,14 @@ class BaseMonitor:
         ``self.running``        — True between start and stop
         ``self.stop_event``     — ``threading.Event`` the loop should observe
         ``self.thread``         — the current daemon thread (or ``None``)
+        ``self.task``           — the scheduler task of a scheduled monitor
+        ``self.suspended``      — True while gated off by the game state
 
     Subclass contract:
-        override ``_monitor_loop`` (the function run on the daemon thread).
+        override ``_monitor_loop`` (the function run on the daemon thread),
+        or set ``_SCHEDULE_PERIOD`` and override ``tick`` (plus
+        ``capture_regions`` for screen input) to run on the shared
+        monitor scheduler instead of owning a thread.
     """
 
     #: Timeout passed to ``thread.join()`` inside ``stop_monitoring``.
@@ -29,10 +39,38 @@ class BaseMonitor:
     #: Optional thread name for debuggers / ``threading.enumerate()``.
     _THREAD_NAME: Optional[str] = None
 
+    #: Period (s) of ``tick`` on the shared monitor scheduler; None keeps
+    #: the dedicated thread running ``_monitor_loop``.
+    _SCHEDULE_PERIOD: Optional[float] = None
+
+    #: Scheduler priority (``PRIORITY_*`` in ``lib.monitors.scheduler``).
+    _SCHEDULE_PRIORITY: int = 1
+
+    #: True for ticks that can block for a long time (OCR, PPI matching);
+    #: they run on their own scheduler lane instead of the shared pool.
+    _SCHEDULE_BLOCKING: bool = False
+
+    #: Format of the frames handed to ``tick`` ('raw', 'bgr', 'rgb', 'gray').
+    _CAPTURE_FORMAT: str = 'raw'
+
+    #: Delay (s) between scheduled ticks while the first-run wizard is open.
+    _WIZARD_PAUSE: float = 0.5
+
+    #: Game activities (``lib.monitors.game_state``) a scheduled monitor
+    #: runs in; None runs in all of them.
+    _ACTIVE_STATES: Optional[FrozenSet[str]] = None
+
+    #: Game states (activities or overlays such as ``map_open``) that
+    #: suspend the monitor even inside ``_ACTIVE_STATES``.
+    _SUSPEND_STATES: FrozenSet[str] = frozenset()
+
     def __init__(self) -> None:
         self.running: bool = False
         self.stop_event: threading.Event = threading.Event()
         self.thread: Optional[threading.Thread] = None
+        self.task = None
+        self.suspended: bool = False
+        self._gate_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -51,6 +89,23 @@ class BaseMonitor:
             pass
         self.running = True
         self.stop_event.clear()
+        if self._SCHEDULE_PERIOD is not None:
+            from lib.monitors.scheduler import get_monitor_scheduler
+            self.task = get_monitor_scheduler().register(
+                self._scheduled_tick,
+                self._SCHEDULE_PERIOD,
+                priority=self._SCHEDULE_PRIORITY,
+                regions=self._scheduled_regions,
+                convert_format=self._CAPTURE_FORMAT,
+                name=self._THREAD_NAME or type(self).__name__,
+                blocking=self._SCHEDULE_BLOCKING,
+            )
+            if self._ACTIVE_STATES is not None or self._SUSPEND_STATES:
+                from lib.monitors.game_state import get_game_state
+                state = get_game_state()
+                state.subscribe(self._on_game_state)
+                self._on_game_state(state)
+            return
         self.thread = threading.Thread(
             target=self._run_safely,
             daemon=True,
@@ -59,9 +114,21 @@ class BaseMonitor:
         self.thread.start()
 
     def stop_monitoring(self) -> None:
-        """Signal the loop to stop and wait briefly for the thread to exit."""
+        """Signal the loop to stop and wait briefly for the thread (or an
+        in-flight scheduled tick) to exit."""
         self.stop_event.set()
         self.running = False
+        task, self.task = self.task, None
+        if task is not None:
+            if self._ACTIVE_STATES is not None or self._SUSPEND_STATES:
+                from lib.monitors.game_state import game_state
+                game_state.unsubscribe(self._on_game_state)
+            self.suspended = False
+            task.cancel()
+            if threading.current_thread().name.startswith("MonitorWorker"):
+                # Stopping from inside a tick; it can't wait on itself.
+                return
+            task.wait_idle(timeout=self._JOIN_TIMEOUT)
         t = self.thread
         if t is not None and t.is_alive():
             t.join(timeout=self._JOIN_TIMEOUT)
@@ -77,6 +144,51 @@ class BaseMonitor:
             f"{type(self).__name__} must implement _monitor_loop()"
         )
 
+    def tick(self, frames: Dict, now: float) -> Optional[float]:
+        """Override in scheduled monitors: one poll, given the frames for
+        ``capture_regions()``. Return a delay (s) to override the period
+        for the next run, or None."""
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement tick()"
+        )
+
+    def capture_regions(self) -> Dict[str, dict]:
+        """Screen regions ``tick`` needs next, by name. Return nothing to
+        skip the capture (e.g. while disabled)."""
+        return {}
+
+    def _on_wizard_paused(self) -> None:
+        """Called instead of ``tick`` while the first-run wizard is open;
+        scheduled monitors release audio / state here."""
+
+    def _on_suspended(self) -> None:
+        """Called when the game state suspends the monitor; by default
+        releases the same things as a wizard pause."""
+        self._on_wizard_paused()
+
+    def _on_game_state(self, state) -> None:
+        """Suspend or resume the scheduler task for a game-state change."""
+        with self._gate_lock:
+            task = self.task
+            if task is None:
+                return
+            allowed = state.allows(self._ACTIVE_STATES, self._SUSPEND_STATES)
+            if allowed == (not self.suspended):
+                return
+            self.suspended = not allowed
+            if allowed:
+                task.resume()
+            else:
+                task.suspend()
+        if not allowed:
+            try:
+                self._on_suspended()
+            except Exception:
+                import logging
+                logging.getLogger(type(self).__module__).debug(
+                    "%s suspend hook failed", type(self).__name__, exc_info=True,
+                )
+
     @staticmethod
     def wizard_paused() -> bool:
         """True while the first-run wizard owns the screen.
@@ -96,6 +208,26 @@ class BaseMonitor:
     # silently kill the whole thread and leave ``self.running`` stale.
     # ------------------------------------------------------------------
 
+    def _scheduled_regions(self) -> Dict[str, dict]:
+        if self.stop_event.is_set() or self.wizard_paused():
+            return {}
+        return self.capture_regions()
+
+    def _scheduled_tick(self, frames: Dict, now: float) -> Optional[float]:
+        if self.stop_event.is_set():
+            return None
+        if self.wizard_paused():
+            self._on_wizard_paused()
+            return self._WIZARD_PAUSE
+        try:
+            return self.tick(frames, now)
+        except Exception:
+            import logging
+            logging.getLogger(type(self).__module__).exception(
+                "%s.tick failed", type(self).__name__,
+            )
+            return None
+
     def _run_safely(self) -> None:
         try:
             self._monitor_loop()
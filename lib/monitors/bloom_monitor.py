@@ -5,28 +5,26 @@ Detects bloom lines radiating from screen center and plays a pitch-shifted
 440 Hz tone that increases as bloom grows. Also detects pickaxe equip via
 center pixel pattern.
 
-Runs at 10 FPS, scanning a 300x300 region around screen center (960, 540).
+Runs at 10 FPS on the shared monitor scheduler, scanning the 151x151
+region the bloom rays reach around screen center (960, 540); the ray scan
+itself is vectorized in ``lib.detection.bloom``.
 """
 
-import threading
 import time
-import numpy as np
 from accessible_output2.outputs.auto import Auto
+from lib.detection.bloom import RAY_END, is_crosshair_center, measure_bloom
 from lib.utilities.utilities import read_config, get_config_boolean, on_config_change
 from lib.monitors.background_monitor import monitor
-from lib.managers.screenshot_manager import screenshot_manager
+from lib.monitors.scheduler import PRIORITY_LOW
 
 # Screen center
 CX, CY = 960, 540
 
-# Capture region: 300x300 around center
-REGION = {'left': CX - 150, 'top': CY - 150, 'width': 300, 'height': 300}
+# Capture region: just the square the bloom rays reach around center
+REGION = {'left': CX - RAY_END, 'top': CY - RAY_END,
+          'width': 2 * RAY_END + 1, 'height': 2 * RAY_END + 1}
 # Local center within the captured region
-LCX, LCY = 150, 150
-
-# Color checks
-CENTER_COLOR = np.array([242, 245, 242], dtype=np.uint8)
-COLOR_TOLERANCE = 6
+LCX, LCY = RAY_END, RAY_END
 
 # Pitch range: base pitch to 2x pitch, over 0-50 pixel distance
 MIN_PITCH = 0.8
@@ -41,36 +39,23 @@ TONE_COOLDOWN = 0.05  # Minimum seconds between tone plays
 FRAME_INTERVAL = 1.0 / 10.0
 
 
-def _color_match(pixel, target, tol=COLOR_TOLERANCE):
-    """Check if an RGB pixel matches target within tolerance."""
-    return all(abs(int(pixel[i]) - int(target[i])) <= tol for i in range(3))
-
-
-def _find_bloom_line_distance(img, lcx, lcy, dx, dy, max_dist=75):
-    """
-    Search outward from center in direction (dx, dy) for a bloom line.
-    Returns the distance from center to the closest white pixel of the line,
-    or None if no line found.
-
-    Starts searching from 5px out (skip the crosshair itself).
-    """
-    h, w = img.shape[:2]
-    for dist in range(5, max_dist):
-        px = lcx + dx * dist
-        py = lcy + dy * dist
-        if 0 <= px < w and 0 <= py < h:
-            r, g, b = img[py, px, 0], img[py, px, 1], img[py, px, 2]
-            if r >= 245 and g >= 245 and b >= 245:
-                return dist
-    return None
-
-
 from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import GROUNDED, OVERLAYS
 
 
 class BloomMonitor(BaseMonitor):
     """Monitors crosshair bloom and pickaxe equip state."""
 
+    _SCHEDULE_PERIOD = FRAME_INTERVAL
+    # Aim feedback, not navigation: first to be slowed over CPU budget.
+    _SCHEDULE_PRIORITY = PRIORITY_LOW
+    _CAPTURE_FORMAT = 'rgb'
+    # No crosshair on the bus, while skydiving, dead or behind the map.
+    # (Off the OG map nothing sees an early drop, so the bus counts too;
+    # see ``GameState.allows``.)
+    _ACTIVE_STATES = frozenset({GROUNDED})
+    _SUSPEND_STATES = OVERLAYS
+
     def __init__(self):
         super().__init__()
         self._last_bloom_dist = None
@@ -116,30 +101,15 @@ class BloomMonitor(BaseMonitor):
 
     def _is_center_crosshair(self, img):
         """Check if the center pixel matches the crosshair color."""
-        pixel = img[LCY, LCX]
-        return _color_match(pixel, CENTER_COLOR)
+        return is_crosshair_center(img, (LCX, LCY))
 
     def _detect_bloom(self, img):
         """
         Detect bloom lines in 4 cardinal directions.
         Returns closest distance if >= 2 lines found, else None.
         """
-        directions = [
-            (0, -1),  # up
-            (0, 1),   # down
-            (-1, 0),  # left
-            (1, 0),   # right
-        ]
-
-        distances = []
-        for dx, dy in directions:
-            d = _find_bloom_line_distance(img, LCX, LCY, dx, dy)
-            if d is not None:
-                distances.append(d)
-
-        if len(distances) >= 2:
-            return min(distances)
-        return None
+        distance = measure_bloom(img, (LCX, LCY))
+        return None if distance is None else int(distance)
 
     def _play_bloom_tone(self, distance):
         """Play bloom tone with pitch based on distance. Fire-and-forget, rate-limited."""
@@ -169,52 +139,37 @@ class BloomMonitor(BaseMonitor):
         except Exception:
             pass
 
-    def _monitor_loop(self):
-        """Main monitor loop at 24 FPS."""
-        while not self.stop_event.is_set():
-            loop_start = time.perf_counter()
-
-            try:
-                if self.wizard_paused():
-                    self._last_bloom_dist = None
-                    time.sleep(0.25)
-                    continue
-                # Skip if map is open or disabled in config
-                if monitor.map_open or not self.is_enabled():
-                    self._last_bloom_dist = None
-                    time.sleep(0.25)
-                    continue
-
-                # Capture region via shared ScreenshotManager (thread-local mss reuse)
-                img = screenshot_manager.capture_region(REGION, convert_format='rgb')
-                if img is None:
-                    time.sleep(FRAME_INTERVAL)
-                    continue
-
-                # Check if crosshair is visible
-                if not self._is_center_crosshair(img):
-                    self._last_bloom_dist = None
-                    elapsed = time.perf_counter() - loop_start
-                    remaining = FRAME_INTERVAL - elapsed
-                    if remaining > 0:
-                        time.sleep(remaining)
-                    continue
-
-                # Detect bloom - only play when distance changes
-                bloom_dist = self._detect_bloom(img)
-                if bloom_dist is not None:
-                    if bloom_dist != self._last_bloom_dist:
-                        self._play_bloom_tone(bloom_dist)
-                        self._last_bloom_dist = bloom_dist
-                else:
-                    self._last_bloom_dist = None
-
-            except Exception:
-                pass
-
-            elapsed = time.perf_counter() - loop_start
-            remaining = FRAME_INTERVAL - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
+    def _on_wizard_paused(self):
+        self._last_bloom_dist = None
+
+    def capture_regions(self):
+        if monitor.map_open or not self.is_enabled():
+            return {}
+        return {'crosshair': REGION}
+
+    def tick(self, frames, now):
+        """One 10 FPS frame: play the tone when the bloom distance changes."""
+        img = frames.get('crosshair')
+        if img is None:
+            self._last_bloom_dist = None
+            # Map open or disabled in config: check back less often.
+            if monitor.map_open or not self.is_enabled():
+                return 0.25
+            return None
+
+        # Check if crosshair is visible
+        if not self._is_center_crosshair(img):
+            self._last_bloom_dist = None
+            return None
+
+        # Detect bloom - only play when distance changes
+        bloom_dist = self._detect_bloom(img)
+        if bloom_dist is not None:
+            if bloom_dist != self._last_bloom_dist:
+                self._play_bloom_tone(bloom_dist)
+                self._last_bloom_dist = bloom_dist
+        else:
+            self._last_bloom_dist = None
+        return None
 
 bloom_monitor = BloomMonitor()
@@ -4,80 +4,92 @@ Background dynamic object detection and spatial audio system
 import threading
 import time
 import os
+import numpy as np
 from typing import Dict, Optional, Tuple
 from accessible_output2.outputs.auto import Auto
-from lib.utilities.utilities import read_config, get_config_boolean, get_config_float, calculate_distance, on_config_change
+from lib.utilities.utilities import read_config, get_config_boolean, get_config_float, calculate_distance, get_minimap_region, on_config_change
 from lib.monitors.background_monitor import monitor
 from lib.detection.dynamic_object_finder import optimized_finder, DYNAMIC_OBJECT_CONFIGS
-from lib.detection.player_position import find_player_position, find_minimap_icon_direction
+from lib.detection.object_tracker import ObjectTrackCache
+from lib.detection.player_position import find_player_position, position_tracker
 from lib.utilities.spatial_audio import SpatialAudio
+from lib.audio import get_ping_scheduler
 
 class DynamicObjectAudioThread:
-    """Manages audio for a single dynamic object with configurable ping intervals"""
+    """Manages audio for a single dynamic object with configurable ping intervals.
+
+    Pings run as a job on the shared audio ping scheduler rather than on a
+    thread of their own; the name is kept for existing callers.
+    """
     
     def __init__(self, dynamic_object_name: str, audio_instance: SpatialAudio, ping_interval: float):
         self.dynamic_object_name = dynamic_object_name
         self.audio_instance = audio_instance
         self.ping_interval = ping_interval
-        self.stop_event = threading.Event()
-        self.thread = None
+        self.job = None
         self.current_position = None
         self.current_distance = None
         self.position_lock = threading.Lock()
         
     def start(self, position: Tuple[int, int], distance: float):
-        """Start the audio thread"""
+        """Start pinging"""
         with self.position_lock:
             self.current_position = position
             self.current_distance = distance
+        self._follow(position)
         
-        if not self.thread or not self.thread.is_alive():
-            self.stop_event.clear()
-            self.thread = threading.Thread(target=self._audio_loop, daemon=True)
-            self.thread.start()
+        if self.job is None or not self.job.active:
+            position_tracker.set_heading_demand(self._consumer, True)
+            self.job = get_ping_scheduler().schedule(
+                self._ping, self.ping_interval,
+                name=self._consumer
+            )
+
+    @property
+    def _consumer(self) -> str:
+        return f"dynamic_object:{self.dynamic_object_name}"
     
     def update_position(self, position: Tuple[int, int], distance: float):
         """Update the object's position and distance"""
         with self.position_lock:
             self.current_position = position
             self.current_distance = distance
+        self._follow(position)
+
+    def _follow(self, position: Tuple[int, int]):
+        """Let the engine re-aim pings at the object from the predicted pose"""
+        if self.audio_instance and position:
+            self.audio_instance.follow_target(position, position_tracker.get_predicted_pose)
     
     def stop(self):
-        """Stop the audio thread"""
-        self.stop_event.set()
+        """Stop pinging"""
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+        position_tracker.set_heading_demand(self._consumer, False)
         if self.audio_instance:
             try:
                 self.audio_instance.stop()
             except Exception:
                 pass
-        
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
     
-    def _audio_loop(self):
-        """Main audio loop that plays pings at configured intervals"""
-        while not self.stop_event.is_set():
-            try:
-                # Get current position data
-                with self.position_lock:
-                    position = self.current_position
-                    distance = self.current_distance
-                
-                if position and distance is not None:
-                    # Get player angle for spatial audio
-                    _, player_angle = find_minimap_icon_direction()
-                    if player_angle is not None:
-                        player_pos = find_player_position()
-                        if player_pos:
-                            self._play_spatial_audio(player_pos, player_angle, position, distance)
-                
-                # Wait for ping interval or stop event
-                if self.stop_event.wait(timeout=self.ping_interval):
-                    break
-                    
-            except Exception:
-                # Continue on error
-                time.sleep(0.1)
+    def _ping(self, pose):
+        """Play one ping from the scheduler's per-tick player pose"""
+        with self.position_lock:
+            position = self.current_position
+            distance = self.current_distance
+        
+        if position and distance is not None:
+            # Prefer the tracker's dead-reckoned pose, else its last fix;
+            # never capture on the ping thread.
+            player_pos, player_angle = pose
+            if player_angle is None:
+                player_angle = position_tracker.get_cached_angle()
+            if player_angle is not None:
+                if player_pos is None:
+                    player_pos = position_tracker.get_cached_position()
+                if player_pos:
+                    self._play_spatial_audio(player_pos, player_angle, position, distance)
     
     def _play_spatial_audio(self, player_pos: Tuple[int, int], player_angle: float, 
                            object_pos: Tuple[int, int], distance: float):
@@ -124,7 +136,13 @@ class DynamicObjectMonitor(BaseMonitor):
     Stopping the monitor tears the fleet down.
     """
 
-    _JOIN_TIMEOUT = 3.0  # detection loop does heavier work; give it more time
+    _JOIN_TIMEOUT = 3.0  # detection tick does heavier work; give it more time
+
+    # Minimap template search every 6 s on the shared monitor scheduler.
+    _SCHEDULE_PERIOD = 6.0
+    _CAPTURE_FORMAT = 'bgr'
+    # Template search plus a PPI fix for the player position.
+    _SCHEDULE_BLOCKING = True
 
     def __init__(self):
         super().__init__()
@@ -140,9 +158,17 @@ class DynamicObjectMonitor(BaseMonitor):
         self.detection_lock = threading.Lock()
         
         # Timing configuration
-        self.detection_interval = 6.0
+        self.detection_interval = self._SCHEDULE_PERIOD
         self.object_timeout = 8.0  # Increased timeout for better stability
         self.min_distance_for_audio = 10.0
+
+        # Last-seen positions: local window search first, global search
+        # for untracked objects and on a miss.
+        self.track_cache = ObjectTrackCache(
+            optimized_finder.template_bank,
+            threshold=optimized_finder.confidence_threshold,
+            timeout=self.object_timeout,
+        )
         
         self.initialize_audio()
         on_config_change(self._on_config_change)
@@ -215,80 +241,91 @@ class DynamicObjectMonitor(BaseMonitor):
         config_key = f"{dynamic_object_name.replace('_', '').title()}PingInterval"
         return get_config_float(config, config_key, 2.0)
     
-    def detect_objects_on_minimap(self) -> Dict[str, Tuple[int, int]]:
-        """Detects objects on the minimap and returns their screen coordinates."""
+    def detect_objects_on_minimap(self, screen: Optional[np.ndarray] = None) -> Dict[str, Tuple[int, int]]:
+        """Detects objects on the minimap and returns their screen coordinates.
+        ``screen`` is a BGR capture of the minimap region when the caller
+        already has one."""
         try:
             enabled_objects = [
                 obj_name for obj_name in DYNAMIC_OBJECT_CONFIGS.keys()
                 if self.is_object_enabled(obj_name)
             ]
             
-            if not enabled_objects:
+            if not enabled_objects or not optimized_finder.icons_loaded:
+                return {}
+            
+            minimap_region = get_minimap_region()
+            if screen is None:
+                screen = optimized_finder.capture_region(minimap_region)
+            if screen is None:
                 return {}
             
-            detected_objects = optimized_finder.find_dynamic_objects_on_minimap_screen(enabled_objects)
-            return detected_objects
+            detected = self.track_cache.detect(screen, enabled_objects)
+            return {
+                obj_name: (x + minimap_region['left'], y + minimap_region['top'])
+                for obj_name, (x, y) in detected.items()
+            }
             
         except Exception:
             return {}
     
+    def get_detection_stats(self) -> dict:
+        """Detection cache counters and local-search hit rate."""
+        return self.track_cache.get_stats()
+    
     def should_play_audio_for_distance(self, distance: float) -> bool:
         """Check if audio should play based on distance"""
         return distance > self.min_distance_for_audio
     
-    def _monitor_loop(self):
-        """Dedicated thread for object detection with fixed timing"""
-        last_detection_time = 0
-        
-        while not self.stop_event.is_set():
-            try:
-                current_time = time.time()
-                
-                if not self.should_monitor():
-                    self.cleanup_all_audio_threads()
-                    time.sleep(2.0)
-                    continue
-                
-                # Perform detection at fixed intervals only
-                if current_time - last_detection_time >= self.detection_interval:
-                    last_detection_time = current_time
-                    
-                    # Step 1: Detect on minimap, get screen coords
-                    detected_minimap_objects = self.detect_objects_on_minimap()
-                    
-                    detection_update = {}
-                    
-                    if detected_minimap_objects:
-                        # Step 2: Get player position only if objects are found
-                        player_pos = find_player_position()
-                        if player_pos:
-                            # Step 3: Convert to fullmap coords and prepare update data
-                            for obj_name, minimap_coords in detected_minimap_objects.items():
-                                fullmap_coords = optimized_finder.convert_minimap_to_fullmap_coords(
-                                    minimap_coords, player_pos
-                                )
-                                distance = calculate_distance(player_pos, fullmap_coords)
-                                detection_update[obj_name] = {
-                                    'coords': fullmap_coords,
-                                    'distance': distance,
-                                    'last_seen': current_time,
-                                    'player_pos': player_pos
-                                }
-                    
-                    # This structure ensures that if no objects are detected, or if player_pos is not found,
-                    # an empty detection_update dict is passed to update_audio_threads, which will
-                    # correctly clean up any old, no-longer-visible object threads.
-                    with self.detection_lock:
-                        self.detection_data = detection_update
-                    
-                    self.update_audio_threads(detection_update, current_time)
-                
-                # Fixed sleep time
-                time.sleep(1.5)
-                
-            except Exception:
-                time.sleep(3.0)
-    
+    def capture_regions(self):
+        if not self.should_monitor():
+            return {}
+        return {'minimap': get_minimap_region()}
+
+    def _on_wizard_paused(self):
+        self.cleanup_all_audio_threads()
+
+    def tick(self, frames, now):
+        """One detection pass over the minimap."""
+        current_time = time.time()
+
+        if not self.should_monitor():
+            self.cleanup_all_audio_threads()
+            self.track_cache.reset()
+            return 2.0
+
+        # Step 1: Detect on minimap, get screen coords
+        detected_minimap_objects = self.detect_objects_on_minimap(frames.get('minimap'))
+
+        detection_update = {}
+
+        if detected_minimap_objects:
+            # Step 2: Get player position only if objects are found
+            player_pos = find_player_position()
+            position_tracker.add_position_fix(player_pos)
+            if player_pos:
+                # Step 3: Convert to fullmap coords and prepare update data
+                for obj_name, minimap_coords in detected_minimap_objects.items():
+                    fullmap_coords = optimized_finder.convert_minimap_to_fullmap_coords(
+                        minimap_coords, player_pos
+                    )
+                    distance = calculate_distance(player_pos, fullmap_coords)
+                    detection_update[obj_name] = {
+                        'coords': fullmap_coords,
+                        'distance': distance,
+                        'last_seen': current_time,
+                        'player_pos': player_pos
+                    }
+
+        # This structure ensures that if no objects are detected, or if player_pos is not found,
+        # an empty detection_update dict is passed to update_audio_threads, which will
+        # correctly clean up any old, no-longer-visible object threads.
+        with self.detection_lock:
+            self.detection_data = detection_update
+
+        self.update_audio_threads(detection_update, current_time)
+        return None
+
     def update_audio_threads(self, detected_objects: Dict, current_time: float):
         """Update audio threads based on detected objects"""
         if not self.should_monitor():
@@ -336,7 +373,7 @@ class DynamicObjectMonitor(BaseMonitor):
 
     def stop_monitoring(self):
         """Tear down the per-object audio fleet, then let BaseMonitor
-        stop the detection thread, then release the shared audio slots."""
+        stop the detection task, then release the shared audio slots."""
         self.cleanup_all_audio_threads()
         super().stop_monitoring()
         if self.default_audio:
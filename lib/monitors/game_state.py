@@ -0,0 +1,215 @@
+"""
+Game-state model used to suspend screen monitors when they can't help.
+
+Bloom, materials, resources, height and storm used to poll the screen in
+the lobby, while dead or spectating and behind the full-screen map or the
+inventory. The monitors that already know those states publish them here:
+
+* ``MatchEventMonitor`` sets the *activity* from the game log — ``lobby``,
+  ``bus``, ``grounded``, ``dead`` and ``spectating``;
+* ``HeightMonitor`` refines ``bus`` / ``grounded`` to ``skydive`` while the
+  skydive height bar is up (Fortnite OG only, like its callouts). Only
+  then is leaving the bus seen before ``SafeZones``; without it ``bus``
+  also counts as ``skydive`` / ``grounded``, since a player who jumps early
+  is already on the island while the log still says bus;
+* ``BackgroundMonitor``'s ``map_open`` / ``inventory_open`` flags (pixel
+  checks or the log, whichever drives them) set the ``map_open`` /
+  ``inventory_open`` *overlays*.
+
+A scheduled monitor declares the activities it runs in
+(``BaseMonitor._ACTIVE_STATES``) and the states that pause it anyway
+(``_SUSPEND_STATES``); ``BaseMonitor`` listens for transitions and
+suspends or resumes its scheduler task, so a monitor wakes on the tick
+right after the state changes.
+
+Until the log has said anything the activity is unknown and every monitor
+runs, so a FA11y started mid-match (or without a log) behaves as before.
+``PauseMonitorsByGameState`` turns the gating off.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, FrozenSet, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOBBY = 'lobby'
+BUS = 'bus'
+SKYDIVE = 'skydive'
+GROUNDED = 'grounded'
+DEAD = 'dead'
+SPECTATING = 'spectating'
+MAP_OPEN = 'map_open'
+INVENTORY_OPEN = 'inventory_open'
+
+ACTIVITIES = frozenset({LOBBY, BUS, SKYDIVE, GROUNDED, DEAD, SPECTATING})
+OVERLAYS = frozenset({MAP_OPEN, INVENTORY_OPEN})
+
+#: Activities in which the local player is alive in a match.
+IN_MATCH = frozenset({BUS, SKYDIVE, GROUNDED})
+
+Listener = Callable[['GameState'], None]
+
+
+class GameState:
+    """Current activity plus open overlays, with transition listeners."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._activity: Optional[str] = None
+        self._overlays: set = set()
+        self._listeners: List[Listener] = []
+        self._skydive_detection = False
+        self.enabled = True
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def activity(self) -> Optional[str]:
+        """One of ``ACTIVITIES``, or None while unknown."""
+        with self._lock:
+            return self._activity
+
+    @property
+    def states(self) -> FrozenSet[str]:
+        """The activity (if known) and every open overlay."""
+        with self._lock:
+            states = set(self._overlays)
+            if self._activity is not None:
+                states.add(self._activity)
+            return frozenset(states)
+
+    def set_activity(self, activity: Optional[str],
+                     only_from: Optional[Iterable[Optional[str]]] = None) -> bool:
+        """Move to ``activity``. With ``only_from``, only when the current
+        activity is one of those. Returns True when the state changed."""
+        if activity is not None and activity not in ACTIVITIES:
+            raise ValueError(f"Unknown game activity {activity!r}")
+        with self._lock:
+            if only_from is not None and self._activity not in set(only_from):
+                return False
+            if activity == self._activity:
+                return False
+            previous, self._activity = self._activity, activity
+            if activity == LOBBY:
+                # No map or inventory screen in the lobby.
+                self._overlays.clear()
+        logger.info(f"GameState: {previous} -> {activity}")
+        self._notify()
+        return True
+
+    @property
+    def skydive_detection(self) -> bool:
+        """True while something (the OG height bar) reports skydiving."""
+        with self._lock:
+            return self._skydive_detection
+
+    def set_skydive_detection(self, available: bool) -> bool:
+        """Whether leaving the bus is detected. Returns True when changed."""
+        with self._lock:
+            if self._skydive_detection == bool(available):
+                return False
+            self._skydive_detection = bool(available)
+        self._notify()
+        return True
+
+    def set_overlay(self, overlay: str, is_open: bool) -> bool:
+        """Open or close an overlay. Returns True when the state changed."""
+        if overlay not in OVERLAYS:
+            raise ValueError(f"Unknown game overlay {overlay!r}")
+        with self._lock:
+            if (overlay in self._overlays) == bool(is_open):
+                return False
+            if is_open:
+                self._overlays.add(overlay)
+            else:
+                self._overlays.discard(overlay)
+        self._notify()
+        return True
+
+    def reset(self) -> None:
+        """Back to unknown (log rotated, game restarted)."""
+        with self._lock:
+            changed = self._activity is not None or bool(self._overlays)
+            self._activity = None
+            self._overlays.clear()
+        if changed:
+            self._notify()
+
+    def set_enabled(self, enabled: bool) -> None:
+        if enabled != self.enabled:
+            self.enabled = enabled
+            self._notify()
+
+    def allows(self, active_states: Optional[Iterable[str]],
+               suspend_states: Iterable[str] = ()) -> bool:
+        """Whether a monitor active in ``active_states`` (None: any
+        activity) and paused by ``suspend_states`` should run now."""
+        if not self.enabled:
+            return True
+        with self._lock:
+            activity = self._activity
+            overlays = set(self._overlays)
+            skydive_detection = self._skydive_detection
+        suspend = set(suspend_states)
+        if suspend & overlays or (activity is not None and activity in suspend):
+            return False
+        if active_states is None or activity is None:
+            return True
+        if activity == BUS and not skydive_detection:
+            # The player may have jumped already; nothing would tell us.
+            return bool(set(active_states) & IN_MATCH)
+        return activity in set(active_states)
+
+    # ------------------------------------------------------------------
+    # Listeners
+    # ------------------------------------------------------------------
+
+    def subscribe(self, listener: Listener) -> None:
+        """Call ``listener(game_state)`` after every transition."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(self)
+            except Exception:
+                logger.debug("GameState listener failed", exc_info=True)
+
+
+game_state = GameState()
+
+_config_hooked = False
+_config_lock = threading.Lock()
+
+
+def _on_config_change(config) -> None:
+    from lib.utilities.utilities import get_config_boolean
+    game_state.set_enabled(get_config_boolean(config, 'PauseMonitorsByGameState', True))
+
+
+def get_game_state() -> GameState:
+    """The shared model, synced with ``PauseMonitorsByGameState`` on first use."""
+    global _config_hooked
+    with _config_lock:
+        if not _config_hooked:
+            _config_hooked = True
+            try:
+                from lib.utilities.utilities import on_config_change, read_config
+                _on_config_change(read_config())
+                on_config_change(_on_config_change)
+            except Exception:
+                logger.debug("Game-state gating config unavailable", exc_info=True)
+    return game_state
@@ -0,0 +1,188 @@
+"""
+CPU budget governor for the shared monitor scheduler.
+
+FA11y runs next to Fortnite, so the background monitors get a CPU budget
+(``MonitorCpuBudget`` in config, percent of one core). Every scheduled
+tick reports its thread CPU time and wall time to ``CpuGovernor``, which
+keeps a sliding window of those costs per monitor.
+
+Once a second the governor compares the measured CPU load with the
+budget. Over budget it stretches the periods of the lowest priority tier
+first (bloom, height, resource counts) by ``STEP`` per evaluation, up to
+``MAX_STRETCH``, and only then moves up a tier; ``PRIORITY_HIGH`` monitors
+(map / inventory state) are never stretched. Once load drops well under
+the budget, stretching is undone in the reverse order. Navigation pings
+run on the audio ``PingScheduler`` and are not governed here.
+
+``get_stats`` exposes the budget, per-monitor costs and the recent
+throttling decisions; ``summary`` words the same for speech.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+PRIORITY_NAMES = {PRIORITY_LOW: 'low', PRIORITY_NORMAL: 'normal', PRIORITY_HIGH: 'high'}
+
+
+class CpuGovernor:
+    """Stretches low-priority monitor periods to hold a CPU budget."""
+
+    #: Default budget: 8% of one core.
+    DEFAULT_BUDGET = 0.08
+
+    #: Window (s) over which costs are averaged.
+    WINDOW = 5.0
+
+    #: Seconds between budget evaluations.
+    EVALUATE_EVERY = 1.0
+
+    #: Stretch factor applied per over-budget evaluation, and its cap.
+    STEP = 1.5
+    MAX_STRETCH = 4.0
+
+    #: Undo stretching once load is below this fraction of the budget.
+    RELAX_BELOW = 0.7
+
+    #: Throttling decisions kept for the stats API.
+    HISTORY = 32
+
+    def __init__(self, budget: float = DEFAULT_BUDGET,
+                 protected_priority: int = PRIORITY_HIGH) -> None:
+        self.budget = budget
+        self.protected_priority = protected_priority
+        self._lock = threading.Lock()
+        # (finished_at, monitor name, priority, cpu seconds, wall seconds)
+        self._samples: Deque[Tuple[float, str, int, float, float]] = deque()
+        self._stretch: Dict[int, float] = {}
+        self._decisions: Deque[dict] = deque(maxlen=self.HISTORY)
+        self._last_evaluation = 0.0
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def record(self, name: str, priority: int, cpu: float, wall: float,
+               now: Optional[float] = None) -> None:
+        """Account one tick of monitor ``name``."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._samples.append((now, name, priority, cpu, wall))
+            self._trim(now)
+
+    def load(self, now: Optional[float] = None) -> float:
+        """CPU seconds per second used by monitors over the window."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._trim(now)
+            return sum(s[3] for s in self._samples) / self.WINDOW
+
+    def stretch(self, priority: int) -> float:
+        """Current period multiplier for ``priority``."""
+        with self._lock:
+            return self._stretch.get(priority, 1.0)
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
+    def evaluate(self, priorities: Iterable[int], now: Optional[float] = None) -> Optional[dict]:
+        """Adjust stretching for the registered ``priorities``; returns the
+        decision taken, if any. Rate-limited to ``EVALUATE_EVERY``."""
+        now = time.monotonic() if now is None else now
+        if now - self._last_evaluation < self.EVALUATE_EVERY:
+            return None
+        self._last_evaluation = now
+        load = self.load(now)
+        tiers = sorted(p for p in set(priorities) if p < self.protected_priority)
+        decision = None
+        with self._lock:
+            if load > self.budget:
+                for priority in tiers:
+                    factor = self._stretch.get(priority, 1.0)
+                    if factor < self.MAX_STRETCH:
+                        factor = min(self.MAX_STRETCH, factor * self.STEP)
+                        self._stretch[priority] = factor
+                        decision = {'time': now, 'action': 'stretch', 'priority': priority,
+                                    'factor': factor, 'load': load}
+                        break
+            elif load < self.budget * self.RELAX_BELOW:
+                for priority in reversed(sorted(self._stretch)):
+                    factor = self._stretch[priority] / self.STEP
+                    if factor <= 1.0:
+                        del self._stretch[priority]
+                        factor = 1.0
+                    else:
+                        self._stretch[priority] = factor
+                    decision = {'time': now, 'action': 'relax', 'priority': priority,
+                                'factor': factor, 'load': load}
+                    break
+            if decision is not None:
+                self._decisions.append(decision)
+        return decision
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def costs(self, now: Optional[float] = None) -> Dict[str, dict]:
+        """Per-monitor CPU / wall cost over the window."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._trim(now)
+            samples = list(self._samples)
+        costs: Dict[str, dict] = {}
+        for _, name, priority, cpu, wall in samples:
+            entry = costs.setdefault(name, {'priority': priority, 'runs': 0, 'cpu': 0.0, 'wall': 0.0})
+            entry['runs'] += 1
+            entry['cpu'] += cpu
+            entry['wall'] += wall
+        for entry in costs.values():
+            runs = entry.pop('runs')
+            cpu, wall = entry.pop('cpu'), entry.pop('wall')
+            entry['runs'] = runs
+            entry['cpu_ms_avg'] = cpu / runs * 1000.0
+            entry['wall_ms_avg'] = wall / runs * 1000.0
+            entry['cpu_share'] = cpu / self.WINDOW
+        return costs
+
+    def get_stats(self, now: Optional[float] = None) -> dict:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            stretch = {PRIORITY_NAMES.get(p, str(p)): f for p, f in self._stretch.items()}
+            decisions = list(self._decisions)
+        return {
+            'budget': self.budget,
+            'load': self.load(now),
+            'stretch': stretch,
+            'monitors': self.costs(now),
+            'decisions': decisions,
+        }
+
+    def summary(self, now: Optional[float] = None) -> str:
+        """One spoken sentence set: load vs budget, throttling, top costs."""
+        stats = self.get_stats(now)
+        parts = [f"Monitors using {stats['load'] * 100:.1f} percent of a core, "
+                 f"budget {self.budget * 100:.0f} percent."]
+        if stats['stretch']:
+            slowed = ", ".join(f"{name} priority {factor:.1f} times slower"
+                               for name, factor in sorted(stats['stretch'].items()))
+            parts.append(f"Throttled: {slowed}.")
+        else:
+            parts.append("No throttling.")
+        top: List[Tuple[str, dict]] = sorted(stats['monitors'].items(),
+                                             key=lambda item: -item[1]['cpu_share'])[:3]
+        if top:
+            parts.append("Top: " + ", ".join(
+                f"{name} {entry['cpu_share'] * 100:.1f} percent" for name, entry in top) + ".")
+        return " ".join(parts)
+
+    def _trim(self, now: float) -> None:
+        while self._samples and self._samples[0][0] < now - self.WINDOW:
+            self._samples.popleft()
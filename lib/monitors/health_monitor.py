@@ -0,0 +1,107 @@
+"""
+Health / shield change monitor.
+
+Reads the health and shield bars twice a second from two 1 px strips (see
+``lib.detection.health_bars``) on the shared monitor scheduler and speaks
+the new values when they change, so damage and heals are heard without
+pressing the health keybind. Off by default
+(``AnnounceHealthShieldChanges``).
+
+A change is spoken once it has held for ``STABLE_READS`` reads, so the
+bar's drain / refill animation doesn't produce a run of announcements.
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from accessible_output2.outputs.auto import Auto
+
+from lib.detection.coordinate_config import get_health_shield_coords
+from lib.detection.health_bars import get_reader
+from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import GROUNDED, OVERLAYS, SKYDIVE
+from lib.monitors.scheduler import PRIORITY_LOW
+from lib.utilities.utilities import get_config_boolean, on_config_change, read_config
+
+speaker = Auto()
+
+
+class HealthShieldMonitor(BaseMonitor):
+    """Speak health / shield changes from the HUD bars."""
+
+    _THREAD_NAME = "HealthShieldMonitor"
+    _SCHEDULE_PERIOD = 0.5
+    _SCHEDULE_PRIORITY = PRIORITY_LOW
+    _CAPTURE_FORMAT = 'rgb'
+    # Off the OG map the bus counts as both (an early drop isn't seen), so
+    # damage taken before SafeZones is still announced.
+    _ACTIVE_STATES = frozenset({SKYDIVE, GROUNDED})
+    _SUSPEND_STATES = OVERLAYS
+
+    #: Consecutive identical reads before a change is spoken.
+    STABLE_READS = 2
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._announced: Tuple[Optional[int], Optional[int]] = (None, None)
+        self._pending: Tuple[Optional[int], Optional[int]] = (None, None)
+        self._pending_reads = 0
+        self._load_config(read_config())
+        on_config_change(self._load_config)
+
+    def _load_config(self, config) -> None:
+        self.enabled = get_config_boolean(config, 'AnnounceHealthShieldChanges', False)
+        self._reader = get_reader(get_health_shield_coords(
+            config.get('POI', 'current_map', fallback='main')
+        ))
+
+    def _on_wizard_paused(self) -> None:
+        self._announced = (None, None)
+        self._pending_reads = 0
+
+    def capture_regions(self):
+        if not self.enabled:
+            return {}
+        return self._reader.strips
+
+    def tick(self, frames, now):
+        if not self.enabled:
+            self._announced = (None, None)
+            return 2.0
+        health, shield = self._reader.read(frames)
+        if health is None:
+            # No health bar: not in play (or the HUD is hidden). Start
+            # over without speaking when it comes back.
+            self._announced = (None, None)
+            self._pending_reads = 0
+            return None
+        reading = (health, shield or 0)
+        if reading == self._announced:
+            self._pending_reads = 0
+            return None
+        if reading != self._pending:
+            self._pending = reading
+            self._pending_reads = 1
+        else:
+            self._pending_reads += 1
+        if self._pending_reads >= self.STABLE_READS:
+            self._announce(reading)
+        return None
+
+    def _announce(self, reading: Tuple[int, int]) -> None:
+        previous = self._announced
+        self._announced = reading
+        self._pending_reads = 0
+        if previous[0] is None:
+            # First reading after the bar appeared: nothing changed yet.
+            return
+        parts = []
+        if reading[0] != previous[0]:
+            parts.append(f"{reading[0]} health")
+        if reading[1] != previous[1]:
+            parts.append(f"{reading[1]} shield" if reading[1] else "No shield")
+        if parts:
+            speaker.speak(", ".join(parts))
+
+
+health_shield_monitor = HealthShieldMonitor()
@@ -1,8 +1,9 @@
 """
 Height indicator monitor (skydiving altitude).
 
-Polls a few pixels of the skydive HUD every 2.5 s; when the indicator bar
-is visible, interpolates its y-pixel into meters and speaks the value.
+Polls a few pixels of the skydive HUD every 2.5 s (on the shared monitor
+scheduler, from one small strip capture); when the indicator bar is
+visible, interpolates its y-pixel into meters and speaks the value.
 
 Scoped to the Fortnite OG map (``POI.current_map == "o_g"``): the modern
 BR mode's height bar isn't reliable, so outside OG this monitor idles. It
@@ -17,14 +18,14 @@ kept for backward compatibility with existing call sites in FA11y.py.
 from __future__ import annotations
 
 import threading
-import time
 from typing import Tuple
 
 import numpy as np
-from PIL import ImageGrab
 from accessible_output2.outputs.auto import Auto
 
 from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import BUS, GROUNDED, IN_MATCH, OVERLAYS, SKYDIVE, game_state
+from lib.monitors.scheduler import PRIORITY_LOW
 from lib.utilities.map_rotation import normalize_map_slug
 from lib.utilities.utilities import on_config_change, read_config
 
@@ -50,11 +51,11 @@ def _set_height_visible(value: bool) -> None:
     global _height_indicator_visible
     with _state_lock:
         _height_indicator_visible = value
-
-
-def _check_pixel_color(x: int, y: int, target_color: Tuple[int, int, int]) -> bool:
-    screenshot = ImageGrab.grab(bbox=(x, y, x + 1, y + 1))
-    return screenshot.getpixel((0, 0)) == target_color
+    # The height bar is the only skydive signal; the game log has none.
+    if value:
+        game_state.set_activity(SKYDIVE, only_from=(BUS, GROUNDED))
+    else:
+        game_state.set_activity(GROUNDED, only_from=(SKYDIVE,))
 
 
 def _interpolate_height(pixel_y: int):
@@ -89,6 +90,17 @@ class HeightMonitor(BaseMonitor):
     MIN_Y, MAX_Y = 47, 299
     POLL_INTERVAL_S = 2.5
 
+    # One strip covering the check points and the height column.
+    HUD_REGION = {'left': 1576, 'top': 23, 'width': 24, 'height': 297}
+
+    _SCHEDULE_PERIOD = POLL_INTERVAL_S
+    _SCHEDULE_PRIORITY = PRIORITY_LOW
+    _CAPTURE_FORMAT = 'rgb'
+    # Watches for a jump while grounded too (redeploys); the full-screen
+    # map and inventory hide the HUD.
+    _ACTIVE_STATES = IN_MATCH
+    _SUSPEND_STATES = OVERLAYS
+
     def __init__(self) -> None:
         super().__init__()
         # Altitude callouts are scoped to the Fortnite OG map via
@@ -105,66 +117,81 @@ class HeightMonitor(BaseMonitor):
 
     def _on_config_change(self, config) -> None:
         self._current_map = self._read_current_map(config)
+        if self.running:
+            game_state.set_skydive_detection(self._is_og_mode())
 
     def _is_og_mode(self) -> bool:
         return self._current_map == _OG_MAP_SLUG
 
-    def _monitor_loop(self) -> None:
-        while not self.stop_event.is_set():
-            try:
-                if self.wizard_paused():
-                    time.sleep(0.5)
-                    continue
-                # Altitude callouts are Fortnite-OG only; the modern mode's
-                # height bar isn't reliable. Idle elsewhere, and clear the
-                # shared flag so it never sticks "visible" across maps.
-                if not self._is_og_mode():
-                    if is_height_indicator_visible():
-                        _set_height_visible(False)
-                    if self.stop_event.wait(timeout=self.POLL_INTERVAL_S):
-                        return
-                    continue
-                structure_present = all(
-                    _check_pixel_color(x, y, self.TARGET_COLOR)
-                    for (x, y) in self.CHECK_POINTS
-                )
-
-                if structure_present:
-                    screenshot = ImageGrab.grab(
-                        bbox=(self.HEIGHT_X, self.MIN_Y,
-                              self.HEIGHT_X + 1, self.MAX_Y + 1)
-                    )
-                    img_array = np.array(screenshot)
-                    white_pixels = np.where(
-                        np.all(img_array == self.TARGET_COLOR, axis=1)
-                    )[0]
-
-                    if white_pixels.size > 0:
-                        if not is_height_indicator_visible():
-                            print("Height indicator appeared")
-                        _set_height_visible(True)
-                        pixel_y = self.MIN_Y + int(white_pixels[0])
-                        meters = _interpolate_height(pixel_y)
-                        if meters is not None:
-                            print(f"Height detected: {meters:.2f} meters")
-                            speaker.speak(f"{meters:.0f} meters high")
-                        else:
-                            print("Height indicator outside expected range")
+    def start_monitoring(self) -> None:
+        super().start_monitoring()
+        # Only the OG height bar sees the player leave the bus.
+        if self.running:
+            game_state.set_skydive_detection(self._is_og_mode())
+
+    def stop_monitoring(self) -> None:
+        super().stop_monitoring()
+        game_state.set_skydive_detection(False)
+
+    def capture_regions(self):
+        # Altitude callouts are Fortnite-OG only; the modern mode's height
+        # bar isn't reliable, so nothing is captured elsewhere.
+        if not self._is_og_mode():
+            return {}
+        return {'hud': self.HUD_REGION}
+
+    def _hud_pixel(self, hud: np.ndarray, x: int, y: int) -> Tuple[int, int, int]:
+        r, g, b = hud[y - self.HUD_REGION['top'], x - self.HUD_REGION['left']][:3]
+        return int(r), int(g), int(b)
+
+    def tick(self, frames, now) -> None:
+        # Idle outside OG, and clear the shared flag so it never sticks
+        # "visible" across maps.
+        if not self._is_og_mode():
+            if is_height_indicator_visible():
+                _set_height_visible(False)
+            return None
+        hud = frames.get('hud')
+        if hud is None:
+            # Capture failed; don't flip state to avoid spurious transitions.
+            return None
+        try:
+            structure_present = all(
+                self._hud_pixel(hud, x, y) == self.TARGET_COLOR
+                for (x, y) in self.CHECK_POINTS
+            )
+
+            if structure_present:
+                column = self.HEIGHT_X - self.HUD_REGION['left']
+                top = self.MIN_Y - self.HUD_REGION['top']
+                img_array = hud[top:top + self.MAX_Y - self.MIN_Y + 1, column, :3]
+                white_pixels = np.where(
+                    np.all(img_array == self.TARGET_COLOR, axis=1)
+                )[0]
+
+                if white_pixels.size > 0:
+                    if not is_height_indicator_visible():
+                        print("Height indicator appeared")
+                    _set_height_visible(True)
+                    pixel_y = self.MIN_Y + int(white_pixels[0])
+                    meters = _interpolate_height(pixel_y)
+                    if meters is not None:
+                        print(f"Height detected: {meters:.2f} meters")
+                        speaker.speak(f"{meters:.0f} meters high")
                     else:
-                        if is_height_indicator_visible():
-                            print("Height indicator disappeared")
-                        _set_height_visible(False)
+                        print("Height indicator outside expected range")
                 else:
                     if is_height_indicator_visible():
-                        print("Height indicator structure disappeared")
+                        print("Height indicator disappeared")
                     _set_height_visible(False)
-            except Exception as e:
-                print(f"Error in height detection: {e}")
-                # On error, don't flip state to avoid spurious transitions.
-
-            # Honour the stop event so shutdown is responsive.
-            if self.stop_event.wait(timeout=self.POLL_INTERVAL_S):
-                return
+            else:
+                if is_height_indicator_visible():
+                    print("Height indicator structure disappeared")
+                _set_height_visible(False)
+        except Exception as e:
+            print(f"Error in height detection: {e}")
+            # On error, don't flip state to avoid spurious transitions.
+        return None
 
 
 # Module-level singleton so callers can reach it without re-importing.
@@ -0,0 +1,66 @@
+"""
+Lobby status monitor.
+
+While the game log says the player is in the lobby, re-reads the mode
+selection screen once a second on the shared monitor scheduler and keeps
+the spoken summary warm (``lobby_reader.prepare_mode_status``), so the mode
+status key only has to check the status panel fingerprint instead of
+scanning. Only the settings panel and the three screen-gate pixels are
+captured (``lobby_reader.status_regions``), and the layout scans are cached
+on the panel fingerprint, so a background read of an unchanged screen is a
+small capture plus a few dozen pixel checks.
+
+Only runs when the lobby is *known* (not while the game state is unknown),
+and ``PrepareLobbyStatus`` turns it off.
+"""
+from __future__ import annotations
+
+from lib.detection.lobby_reader import (
+    compose_status_screen, invalidate_warm_status, prepare_mode_status, status_regions,
+)
+from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import LOBBY, get_game_state
+from lib.monitors.scheduler import PRIORITY_LOW
+from lib.utilities.utilities import get_config_boolean, on_config_change, read_config
+
+
+class LobbyStatusMonitor(BaseMonitor):
+    """Keep the lobby mode summary ready while in the lobby."""
+
+    _THREAD_NAME = "LobbyStatusMonitor"
+    _SCHEDULE_PERIOD = 1.0
+    _SCHEDULE_PRIORITY = PRIORITY_LOW
+    _CAPTURE_FORMAT = 'rgb'
+    _ACTIVE_STATES = frozenset({LOBBY})
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._load_config(read_config())
+        on_config_change(self._load_config)
+
+    def _load_config(self, config) -> None:
+        self.enabled = get_config_boolean(config, 'PrepareLobbyStatus', True)
+        # The summary names depend on the selected map's mode preset.
+        invalidate_warm_status()
+
+    def _on_wizard_paused(self) -> None:
+        invalidate_warm_status()
+
+    def _in_lobby(self) -> bool:
+        return self.enabled and get_game_state().activity == LOBBY
+
+    def capture_regions(self):
+        if not self._in_lobby():
+            return {}
+        return status_regions()
+
+    def tick(self, frames, now):
+        screen = compose_status_screen(frames)
+        if screen is None or not self._in_lobby():
+            invalidate_warm_status()
+            return 2.0
+        prepare_mode_status(screen)
+        return None
+
+
+lobby_status_monitor = LobbyStatusMonitor()
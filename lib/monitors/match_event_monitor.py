@@ -10,6 +10,9 @@ from typing import List, Optional, Tuple
 from accessible_output2.outputs.auto import Auto
 
 from lib.utilities.utilities import read_config, get_config_boolean, on_config_change
+from lib.monitors.game_state import (
+    BUS, DEAD, GROUNDED, LOBBY, SPECTATING, game_state,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -215,10 +218,17 @@ from lib.monitors.base import BaseMonitor
 
 
 class MatchEventMonitor(BaseMonitor):
-    """Tails the Fortnite log file in a background thread and speaks events."""
+    """Tails the Fortnite log file on the shared monitor scheduler and
+    speaks events."""
 
     _THREAD_NAME = "MatchEventMonitor"
 
+    # Poll the log every 250 ms; no screen capture involved.
+    _SCHEDULE_PERIOD = 0.25
+
+    #: Delay (s) between attempts to open a log that isn't there yet.
+    LOG_RETRY_INTERVAL = 5.0
+
     def __init__(self):
         super().__init__()
         self.speaker = Auto()
@@ -226,6 +236,8 @@ class MatchEventMonitor(BaseMonitor):
         # File-tracking state.
         self._log_path = os.path.join(_DEFAULT_LOG_DIR, _LOG_FILENAME)
         self._fp = None
+        self._open_attempts = 0
+        self._last_rotation_check = 0.0
         self._inode = None
 
         # Per-event de-duplication state. The log can repeat some lines
@@ -235,6 +247,9 @@ class MatchEventMonitor(BaseMonitor):
         self._last_mode = None
         self._last_phase = None
         self._last_step = None
+        # Latest EAthenaGamePhaseStep regardless of announcements; the storm
+        # predictor reads it to tell holding from shrinking.
+        self._phase_step: Optional[str] = None
         self._last_spectate_target = None
         self._last_final_countdown = None
 
@@ -244,6 +259,11 @@ class MatchEventMonitor(BaseMonitor):
         # changes that happen while we're spectating should be announced.
         self._spectating = False
 
+        # Lobby flag for consumers that should idle outside a match (e.g.
+        # the position tracker). None until the log tells us either way,
+        # so a FA11y started mid-match never assumes the lobby.
+        self._in_lobby: Optional[bool] = None
+
         # UI-panel open state, driven by UIActionRouter log lines. Stays
         # in sync with BackgroundMonitor's flags once a log event fires.
         self._inventory_open = False
@@ -301,6 +321,23 @@ class MatchEventMonitor(BaseMonitor):
         self.config = config
         self._reload_config_flags()
 
+    # -- public state -----------------------------------------------------
+
+    @property
+    def phase(self) -> Optional[str]:
+        """Last top-level game phase seen in the log (e.g. 'Aircraft')."""
+        return self._last_phase
+
+    @property
+    def phase_step(self) -> Optional[str]:
+        """Last game phase step seen in the log (e.g. 'StormShrinking')."""
+        return self._phase_step
+
+    @property
+    def in_lobby(self) -> bool:
+        """True only when the log positively shows we're in the lobby."""
+        return bool(self._in_lobby)
+
     # -- file handling ----------------------------------------------------
 
     def _open_log(self) -> bool:
@@ -347,10 +384,13 @@ class MatchEventMonitor(BaseMonitor):
             self._last_mode = None
             self._last_phase = None
             self._last_step = None
+            self._phase_step = None
             self._last_spectate_target = None
             self._last_final_countdown = None
             self._spectating = False
             self._admin_panel_open = False
+            self._in_lobby = None
+            game_state.reset()
             # Party cache is per-Fortnite-session: new game means Fortnite
             # will re-emit Adding events for any existing party members.
             self._party_member_names.clear()
@@ -387,7 +427,7 @@ class MatchEventMonitor(BaseMonitor):
             self.speaker.speak(text)
         except Exception as e:
             # Screen reader may transiently fail (COM errors with SAPI);
-            # don't let it kill the monitor thread.
+            # don't let it kill the monitor tick.
             logger.info(f"MatchEventMonitor: speak failed: {e}")
 
     def _update_external_inventory_state(self, is_open: bool) -> None:
@@ -523,6 +563,7 @@ class MatchEventMonitor(BaseMonitor):
             # Got back up - we're alive again, exit spectator mode if set.
             self._spectating = False
             self._last_spectate_target = None
+            game_state.set_activity(GROUNDED)
             if self.announce_respawn:
                 self._speak("Respawned")
             return
@@ -537,6 +578,9 @@ class MatchEventMonitor(BaseMonitor):
             text = m.group('text').strip()
             pm = _RE_PRESENCE_PLAYERS.search(text)
             if pm:
+                self._in_lobby = False
+                # Presence alone doesn't say bus / dead; only leave the lobby.
+                game_state.set_activity(GROUNDED, only_from=(None, LOBBY))
                 count = int(pm.group('count'))
                 mode = pm.group('mode').strip()
                 if self.announce_players_left and count != self._last_player_count:
@@ -550,6 +594,8 @@ class MatchEventMonitor(BaseMonitor):
                     self._last_mode = mode
             else:
                 # Empty/lobby presence - reset so next match starts fresh.
+                self._in_lobby = True
+                game_state.set_activity(LOBBY)
                 if self._last_player_count is not None:
                     self._last_player_count = None
                     self._last_mode = None
@@ -561,6 +607,7 @@ class MatchEventMonitor(BaseMonitor):
             phase = m.group('phase')
             if phase != self._last_phase:
                 self._last_phase = phase
+                self._in_lobby = False
                 # A new Warmup means a new match has started - exit any
                 # leftover spectator state from the previous round.
                 if phase in ('Setup', 'Warmup'):
@@ -572,6 +619,14 @@ class MatchEventMonitor(BaseMonitor):
                 # (deduped by self._last_phase above).
                 if phase == 'Warmup':
                     self._reset_match_tracker()
+                if phase in ('Setup', 'Warmup'):
+                    game_state.set_activity(GROUNDED)
+                elif phase == 'Aircraft':
+                    game_state.set_activity(BUS)
+                elif phase == 'SafeZones':
+                    # The height monitor may already have us skydiving;
+                    # otherwise the bus is over and we're on the island.
+                    game_state.set_activity(GROUNDED, only_from=(None, LOBBY, BUS))
                 if self.announce_phase:
                     spoken = {
                         'Warmup': 'Warmup',
@@ -583,8 +638,11 @@ class MatchEventMonitor(BaseMonitor):
             return
 
         m = _RE_PHASE_STEP.search(line)
-        if m and self.announce_phase:
+        if m:
             step = m.group('step')
+            self._phase_step = step
+            if not self.announce_phase:
+                return
             if step != self._last_step and step in _INTERESTING_STEPS:
                 self._last_step = step
                 self._speak(_INTERESTING_STEPS[step])
@@ -597,13 +655,17 @@ class MatchEventMonitor(BaseMonitor):
             # itself is muted.
             self._spectating = True
             self._last_spectate_target = None
+            game_state.set_activity(DEAD)
             if self.announce_death:
                 self._speak("You died")
             return
 
         # --- Spectating (only while in spectator mode after death) ---
         m = _RE_VIEW_TARGET.search(line)
-        if m and self._spectating and self.announce_spectate:
+        if m and self._spectating:
+            game_state.set_activity(SPECTATING, only_from=(DEAD,))
+            if not self.announce_spectate:
+                return
             src = m.group('src')
             target = m.group('name')
             # Skip self-confirmations the game emits after every real
@@ -715,71 +777,64 @@ class MatchEventMonitor(BaseMonitor):
 
     # -- main loop --------------------------------------------------------
 
-    def _monitor_loop(self):
-        logger.info(f"MatchEventMonitor: loop entered, waiting for log at {self._log_path}")
-        # Wait for log file to appear (Fortnite may not be running yet).
-        attempts = 0
-        while self.running and not self._open_log():
-            attempts += 1
-            if attempts == 1 or attempts % 12 == 0:
-                # First miss + every minute; avoid spamming the log.
-                logger.info(
-                    f"MatchEventMonitor: log not present yet, retrying "
-                    f"(attempt {attempts}, path={self._log_path})"
-                )
-            if self.stop_event.wait(timeout=5.0):
-                return
-        logger.info("MatchEventMonitor: entering main read loop")
-
-        last_rotation_check = time.monotonic()
-        while self.running:
-            if self.stop_event.wait(timeout=0.25):
-                break
-            if not self.enabled:
-                continue
-            if self.wizard_paused():
-                continue
-            try:
-                # Cheap rotation check every ~2 seconds (stat is fast but
-                # not free, and rotations only happen on game restart).
-                now = time.monotonic()
-                if now - last_rotation_check > 2.0:
-                    self._check_rotation()
-                    last_rotation_check = now
-                if self._fp is None:
-                    if not self._open_log():
-                        continue
-                for line in self._read_new_lines():
-                    self._process_line(line)
-            except Exception as e:
-                logger.debug(f"MatchEventMonitor: loop error: {e}")
-                # Brief backoff so a persistent error doesn't pin a CPU.
-                if self.stop_event.wait(timeout=1.0):
-                    break
-
-        # Cleanup on exit.
+    def tick(self, frames, now):
+        """Read and process new log lines; waits for the log to appear."""
+        if self._fp is None:
+            if not self._open_log():
+                self._open_attempts += 1
+                if self._open_attempts == 1 or self._open_attempts % 12 == 0:
+                    # First miss + every minute; avoid spamming the log.
+                    logger.info(
+                        f"MatchEventMonitor: log not present yet, retrying "
+                        f"(attempt {self._open_attempts}, path={self._log_path})"
+                    )
+                return self.LOG_RETRY_INTERVAL
+            if self._open_attempts:
+                logger.info("MatchEventMonitor: log opened, reading")
+            self._open_attempts = 0
+        if not self.enabled:
+            return None
         try:
-            if self._fp:
-                self._fp.close()
-        except Exception:
-            pass
-        self._fp = None
+            # Cheap rotation check every ~2 seconds (stat is fast but
+            # not free, and rotations only happen on game restart).
+            if now - self._last_rotation_check > 2.0:
+                self._check_rotation()
+                self._last_rotation_check = now
+            if self._fp is None:
+                return None
+            for line in self._read_new_lines():
+                self._process_line(line)
+        except Exception as e:
+            logger.debug(f"MatchEventMonitor: loop error: {e}")
+            # Brief backoff so a persistent error doesn't pin a CPU.
+            return 1.0
+        return None
 
     def start_monitoring(self):
-        """Log startup state then call BaseMonitor to do the actual threading."""
+        """Log startup state then let BaseMonitor register the tick."""
         if self.running:
             logger.info("MatchEventMonitor: start_monitoring called but already running")
             return
         logger.info(
-            f"MatchEventMonitor: starting thread "
+            f"MatchEventMonitor: starting "
             f"(enabled={self.enabled}, "
             f"announce_phase={self.announce_phase}, "
             f"announce_players_left={self.announce_players_left}, "
             f"announce_dbno={self.announce_dbno})"
         )
+        self._open_attempts = 0
+        self._last_rotation_check = time.monotonic()
         super().start_monitoring()
 
-    # stop_monitoring inherited from BaseMonitor
+    def stop_monitoring(self):
+        """Unregister from the scheduler, then close the log handle."""
+        super().stop_monitoring()
+        try:
+            if self._fp:
+                self._fp.close()
+        except Exception:
+            pass
+        self._fp = None
 
 
 # Single shared instance, matching the pattern of other monitors.
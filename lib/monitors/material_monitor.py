@@ -24,13 +24,25 @@ MATERIAL_COUNT_AREA = {
 }
 
 from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import GROUNDED, OVERLAYS
 
 
 class MaterialMonitor(BaseMonitor):
+    # Icon and count areas sit side by side, so the scheduler grabs both
+    # in one capture.
+    _SCHEDULE_PERIOD = 0.3
+    # Count reads go through EasyOCR.
+    _SCHEDULE_BLOCKING = True
+    # Materials are only gathered on foot; the HUD is hidden behind the
+    # map and inventory.
+    _ACTIVE_STATES = frozenset({GROUNDED})
+    _SUSPEND_STATES = OVERLAYS
+
     def __init__(self):
         super().__init__()
         self.speaker = Auto()
         self._mss_instance = None
+        self._last_material_time = 0
 
         # Get OCR manager instance
         self.ocr_manager = get_ocr_manager()
@@ -99,9 +111,6 @@ class MaterialMonitor(BaseMonitor):
 
     def detect_count(self, screenshot):
         """Detect number using OCR with specific color range filtering."""
-        if not self.ocr_manager.is_ready():
-            return None
-
         try:
             # Convert from BGRA to BGR if needed
             if screenshot.shape[2] == 4:
@@ -119,18 +128,16 @@ class MaterialMonitor(BaseMonitor):
             # Binary threshold
             _, gray = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
             
-            # Resize
-            gray = cv2.resize(gray, None, fx=2.5, fy=2.5, interpolation=cv2.INTER_NEAREST)
-            
-            results = self.ocr_manager.read_numbers(gray,
+            # Glyph templates first; EasyOCR on a 2.5x upscale if unsure
+            count_text = self.ocr_manager.read_digits(gray, scale=2.5,
+                                        interpolation=cv2.INTER_NEAREST,
                                         allowlist='0123456789',
                                         paragraph=False,
                                         min_size=10,
                                         text_threshold=0.4,
                                         width_ths=0.8)
             
-            if results:
-                count_text = results[0][1]
+            if count_text:
                 return int(count_text) if count_text.isdigit() else None
                     
         except Exception as e:
@@ -141,64 +148,51 @@ class MaterialMonitor(BaseMonitor):
         """Capture a screen region via shared ScreenshotManager."""
         return screenshot_manager.capture_region(region, convert_format='raw')
 
-    def _monitor_loop(self):
-        """Main monitoring loop."""
-        try:
-            last_material_time = 0
-
-            while not self.stop_event.is_set():
-                try:
-                    if self.wizard_paused():
-                        time.sleep(0.5)
-                        continue
-                    # Capture material icon area via shared ScreenshotManager
-                    icon_screenshot = self._capture(MATERIAL_ICON_AREA)
-                    if icon_screenshot is None:
-                        time.sleep(0.3)
-                        continue
-                    
-                    # Detect material
-                    detected_material = self.detect_material(icon_screenshot)
-                    current_time = time.time()
-                    
-                    if detected_material:
-                        last_material_time = current_time
-                        
-                        if self.current_material != detected_material:
-                            # Reset state for new material
-                            self.current_material = detected_material
-                            self.last_count = None
-                            
-                            # Get initial count when new material detected
-                            count_screenshot = self._capture(MATERIAL_COUNT_AREA)
-                            current_count = self.detect_count(count_screenshot)
-                            if current_count is not None:
-                                # Announce initial detection
-                                self.speaker.speak(f"plus {current_count} {detected_material}")
-                                self.last_count = current_count
-                        else:
-                            # Continue monitoring count for same material
-                            count_screenshot = self._capture(MATERIAL_COUNT_AREA)
-                            current_count = self.detect_count(count_screenshot)
-                            
-                            if current_count is not None and current_count != self.last_count:
-                                # Announce count changes
-                                if self.last_count is not None:
-                                    self.speaker.speak(f"plus {current_count}")
-                                self.last_count = current_count
-                            
-                    # Only consider material gone if not seen for 1.5 seconds
-                    elif self.current_material and current_time - last_material_time > 1.5:
-                        self.current_material = None
-                        self.last_count = None
-                    
-                    time.sleep(0.3)  # Check every 0.3 seconds
-                    
-                except Exception as e:
-                    print(f"Error in material monitor loop: {e}")
-                    time.sleep(0.5)
-        finally:
-            pass  # ScreenshotManager handles mss lifecycle
+    def capture_regions(self):
+        return {'icon': MATERIAL_ICON_AREA, 'count': MATERIAL_COUNT_AREA}
+
+    def tick(self, frames, now):
+        """Check the material icon and announce count changes."""
+        icon_screenshot = frames.get('icon')
+        if icon_screenshot is None:
+            return None
+
+        # Detect material
+        detected_material = self.detect_material(icon_screenshot)
+        current_time = time.time()
+
+        if detected_material:
+            self._last_material_time = current_time
+            count_screenshot = frames.get('count')
+            if count_screenshot is None:
+                count_screenshot = self._capture(MATERIAL_COUNT_AREA)
+
+            if self.current_material != detected_material:
+                # Reset state for new material
+                self.current_material = detected_material
+                self.last_count = None
+
+                # Get initial count when new material detected
+                current_count = self.detect_count(count_screenshot)
+                if current_count is not None:
+                    # Announce initial detection
+                    self.speaker.speak(f"plus {current_count} {detected_material}")
+                    self.last_count = current_count
+            else:
+                # Continue monitoring count for same material
+                current_count = self.detect_count(count_screenshot)
+
+                if current_count is not None and current_count != self.last_count:
+                    # Announce count changes
+                    if self.last_count is not None:
+                        self.speaker.speak(f"plus {current_count}")
+                    self.last_count = current_count
+
+        # Only consider material gone if not seen for 1.5 seconds
+        elif self.current_material and current_time - self._last_material_time > 1.5:
+            self.current_material = None
+            self.last_count = None
+        return None
 
     # Lifecycle inherited from BaseMonitor
 
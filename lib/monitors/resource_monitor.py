@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, List
 from lib.managers.screenshot_manager import screenshot_manager
 from lib.managers.ocr_manager import get_ocr_manager
+from lib.monitors.scheduler import PRIORITY_LOW
 
 # Screen monitoring configuration
 SCAN_REGION = {
@@ -59,9 +60,19 @@ class ResourceState:
         return True
 
 from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import GROUNDED, OVERLAYS
 
 
 class ResourceMonitor(BaseMonitor):
+    # The scan strip comes from the shared scheduler; the per-resource
+    # count areas depend on where icons were found and are captured here.
+    _SCHEDULE_PERIOD = 0.3
+    _SCHEDULE_PRIORITY = PRIORITY_LOW
+    # Count reads go through EasyOCR.
+    _SCHEDULE_BLOCKING = True
+    _ACTIVE_STATES = frozenset({GROUNDED})
+    _SUSPEND_STATES = OVERLAYS
+
     def __init__(self):
         super().__init__()
         self.speaker = Auto()
@@ -176,9 +187,6 @@ class ResourceMonitor(BaseMonitor):
 
     def detect_count(self, screenshot, position: Tuple[int, int], name: str, current_time: float) -> Optional[int]:
         """Enhanced count detection with position validation."""
-        if not self.ocr_manager.is_ready():
-            return None
-
         try:
             if screenshot.shape[2] == 4:
                 screenshot = cv2.cvtColor(screenshot, cv2.COLOR_BGRA2BGR)
@@ -191,17 +199,16 @@ class ResourceMonitor(BaseMonitor):
             
             gray = cv2.cvtColor(filtered, cv2.COLOR_BGR2GRAY)
             _, gray = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
-            gray = cv2.resize(gray, None, fx=2.5, fy=2.5, interpolation=cv2.INTER_LINEAR)
             
-            results = self.ocr_manager.read_numbers(gray,
+            count_text = self.ocr_manager.read_digits(gray, scale=2.5,
+                                        interpolation=cv2.INTER_LINEAR,
                                         allowlist='0123456789',
                                         paragraph=False,
                                         min_size=10,
                                         text_threshold=0.4,
                                         width_ths=0.8)
             
-            if results:
-                count_text = results[0][1]
+            if count_text:
                 if count_text.isdigit():
                     count = int(count_text)
                     if count <= 999:
@@ -221,106 +228,95 @@ class ResourceMonitor(BaseMonitor):
         """Capture a screen region via shared ScreenshotManager."""
         return screenshot_manager.capture_region(region, convert_format='raw')
 
-    def _monitor_loop(self):
-        try:
-            while not self.stop_event.is_set():
-                try:
-                    if self.wizard_paused():
-                        time.sleep(0.5)
-                        continue
-                    screenshot = self._capture(SCAN_REGION)
-                    if screenshot is None:
-                        time.sleep(0.3)
-                        continue
-                    current_time = time.time()
+    def capture_regions(self):
+        return {'scan': SCAN_REGION}
+
+    def tick(self, frames, now):
+        screenshot = frames.get('scan')
+        if screenshot is None:
+            return None
+        current_time = time.time()
+
+        # Only process if the list is stable
+        if not self.is_list_stable(current_time):
+            return 0.1
+
+        detections = self.detect_resource(screenshot)
+        list_modified = False
+        
+        with self.lock:
+            # Process new detections
+            for name, position, confidence in detections:
+                if name not in self.active_resources:
+                    template_data = self.resource_templates[name]
+                    icon_width = template_data['width']
+                    icon_height = template_data['height']
                     
-                    # Only process if the list is stable
-                    if not self.is_list_stable(current_time):
-                        time.sleep(0.1)
-                        continue
-                        
-                    detections = self.detect_resource(screenshot)
-                    list_modified = False
+                    ocr_area = {
+                        'left': SCAN_REGION['left'] + position[0] + icon_width + 5,
+                        'top': SCAN_REGION['top'] + position[1] + (icon_height // 2) - (OCR_OFFSET['height'] // 2),
+                        'width': OCR_OFFSET['width'],
+                        'height': OCR_OFFSET['height']
+                    }
                     
-                    with self.lock:
-                        # Process new detections
-                        for name, position, confidence in detections:
-                            if name not in self.active_resources:
-                                template_data = self.resource_templates[name]
-                                icon_width = template_data['width']
-                                icon_height = template_data['height']
-                                
-                                ocr_area = {
-                                    'left': SCAN_REGION['left'] + position[0] + icon_width + 5,
-                                    'top': SCAN_REGION['top'] + position[1] + (icon_height // 2) - (OCR_OFFSET['height'] // 2),
-                                    'width': OCR_OFFSET['width'],
-                                    'height': OCR_OFFSET['height']
-                                }
-                                
-                                count_screenshot = self._capture(ocr_area)
-                                count = self.detect_count(count_screenshot, position, name, current_time)
-                                
-                                if count is not None:
-                                    resource = ResourceState(
-                                        name=name,
-                                        position=position,
-                                        count=count,
-                                        last_seen=current_time,
-                                        confidence=confidence,
-                                        last_position_change=current_time,
-                                        last_global_announcement=0.0  # Allow first announcement
-                                    )
-                                    
-                                    if resource.can_announce(count, current_time):
-                                        self.speaker.speak(f"plus {count} {name.replace('_', ' ')}")
-                                        resource.announced_values[count] = current_time
-                                        resource.last_global_announcement = current_time
-                                        
-                                    self.active_resources[name] = resource
+                    count_screenshot = self._capture(ocr_area)
+                    count = self.detect_count(count_screenshot, position, name, current_time)
+                    
+                    if count is not None:
+                        resource = ResourceState(
+                            name=name,
+                            position=position,
+                            count=count,
+                            last_seen=current_time,
+                            confidence=confidence,
+                            last_position_change=current_time,
+                            last_global_announcement=0.0  # Allow first announcement
+                        )
                         
-                        # Update existing resources
-                        resources_to_remove = []
-                        for name, state in self.active_resources.items():
-                            if current_time - state.last_seen > 2.0:
-                                resources_to_remove.append(name)
-                                list_modified = True
-                                continue
-                                
-                            template_data = self.resource_templates[name]
-                            icon_width = template_data['width']
-                            icon_height = template_data['height']
-                            
-                            ocr_area = {
-                                'left': SCAN_REGION['left'] + state.position[0] + icon_width + 5,
-                                'top': SCAN_REGION['top'] + state.position[1] + (icon_height // 2) - (OCR_OFFSET['height'] // 2),
-                                'width': OCR_OFFSET['width'],
-                                'height': OCR_OFFSET['height']
-                            }
-                            
-                            count_screenshot = self._capture(ocr_area)
-                            current_count = self.detect_count(count_screenshot, state.position, name, current_time)
+                        if resource.can_announce(count, current_time):
+                            self.speaker.speak(f"plus {count} {name.replace('_', ' ')}")
+                            resource.announced_values[count] = current_time
+                            resource.last_global_announcement = current_time
                             
-                            if current_count is not None:
-                                old_count = state.count
-                                state.count = current_count
-                                state.last_seen = current_time
-                                
-                                # Only announce if count has changed and we can announce
-                                if old_count != current_count and state.can_announce(current_count, current_time):
-                                    self.speaker.speak(f"plus {current_count} {name.replace('_', ' ')}")
-                                    state.announced_values[current_count] = current_time
-                                    state.last_global_announcement = current_time
-                        
-                        # Remove inactive resources
-                        for name in resources_to_remove:
-                            del self.active_resources[name]
+                        self.active_resources[name] = resource
+            
+            # Update existing resources
+            resources_to_remove = []
+            for name, state in self.active_resources.items():
+                if current_time - state.last_seen > 2.0:
+                    resources_to_remove.append(name)
+                    list_modified = True
+                    continue
                     
-                    time.sleep(0.3)
-                except Exception as e:
-                    print(f"Error in monitor loop: {str(e)}")
-                    time.sleep(1.0)
-        finally:
-            pass  # ScreenshotManager handles mss lifecycle
+                template_data = self.resource_templates[name]
+                icon_width = template_data['width']
+                icon_height = template_data['height']
+                
+                ocr_area = {
+                    'left': SCAN_REGION['left'] + state.position[0] + icon_width + 5,
+                    'top': SCAN_REGION['top'] + state.position[1] + (icon_height // 2) - (OCR_OFFSET['height'] // 2),
+                    'width': OCR_OFFSET['width'],
+                    'height': OCR_OFFSET['height']
+                }
+                
+                count_screenshot = self._capture(ocr_area)
+                current_count = self.detect_count(count_screenshot, state.position, name, current_time)
+                
+                if current_count is not None:
+                    old_count = state.count
+                    state.count = current_count
+                    state.last_seen = current_time
+                    
+                    # Only announce if count has changed and we can announce
+                    if old_count != current_count and state.can_announce(current_count, current_time):
+                        self.speaker.speak(f"plus {current_count} {name.replace('_', ' ')}")
+                        state.announced_values[current_count] = current_time
+                        state.last_global_announcement = current_time
+            
+            # Remove inactive resources
+            for name in resources_to_remove:
+                del self.active_resources[name]
+        return None
 
     # Lifecycle inherited from BaseMonitor
 
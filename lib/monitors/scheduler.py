@@ -0,0 +1,546 @@
+"""
+Shared scheduler for the background monitors.
+
+Each monitor used to own a thread that slept between polls (bloom at
+10 Hz, background at ~7 Hz, material and resource every 0.3 s, storm,
+dynamic objects, height...) and grabbed its own screenshot on wake-up.
+``MonitorScheduler`` runs them all from one dispatcher thread:
+
+* every task declares a period, a priority and the screen regions it
+  needs (``regions`` is a callable so it can depend on state, and may
+  return nothing when no frame is needed this time);
+* on each tick the regions of all due tasks are gathered, overlapping or
+  neighbouring rectangles are merged, and every merged rectangle is
+  grabbed once; tasks get their regions sliced out of those grabs;
+* the callbacks run on a small worker pool; a task is rescheduled only
+  when its run finishes, so runs of one task never overlap;
+* tasks registered as ``blocking`` (OCR, PPI matching, minimap template
+  searches) run on a lane of their own instead of the shared pool, so a
+  slow tick only ever delays its own task and can't hold up bloom or the
+  map / inventory state;
+* each run's thread CPU time and wall time go to a ``CpuGovernor``, which
+  stretches the periods of low-priority tasks while monitors are over
+  their CPU budget (see ``lib.monitors.governor``);
+* a task can be suspended (no runs, no captures) and resumed, which puts
+  it back in the queue due immediately; ``BaseMonitor`` does this on
+  game-state transitions (see ``lib.monitors.game_state``).
+
+A callback receives ``(frames, now)``: a dict of region name to image
+(missing when the capture failed) and the tick's ``time.monotonic()``.
+Like the audio ``PingScheduler``, it may return a float to set the delay
+before its next run; returning None keeps the task's period.
+
+``BaseMonitor`` subclasses opt in by setting ``_SCHEDULE_PERIOD`` and
+implementing ``tick`` / ``capture_regions`` instead of ``_monitor_loop``.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Priorities are re-exported for the monitors.
+from lib.monitors.governor import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, CpuGovernor
+
+logger = logging.getLogger(__name__)
+
+Region = Dict[str, int]
+Rect = Tuple[int, int, int, int]  # left, top, right, bottom
+
+
+def _rect(region: Region) -> Rect:
+    return (int(region['left']), int(region['top']),
+            int(region['left']) + int(region['width']),
+            int(region['top']) + int(region['height']))
+
+
+def _area(rect: Rect) -> int:
+    return (rect[2] - rect[0]) * (rect[3] - rect[1])
+
+
+def _union(a: Rect, b: Rect) -> Rect:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def merge_rects(rects: List[Rect], slack: float = 1.25) -> List[Rect]:
+    """Greedily merge rectangles whose bounding box costs at most ``slack``
+    times the pixels of the parts, so nearby HUD regions share one grab
+    while far-apart ones (minimap vs crosshair) stay separate."""
+    merged = list(dict.fromkeys(rects))
+    changed = True
+    while changed and len(merged) > 1:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                union = _union(merged[i], merged[j])
+                if _area(union) <= slack * (_area(merged[i]) + _area(merged[j])):
+                    merged[i] = union
+                    del merged[j]
+                    changed = True
+                    break
+            if changed:
+                break
+    return merged
+
+
+def convert_frame(frame: np.ndarray, convert_format: str) -> np.ndarray:
+    """Convert a raw BGRA grab to ``'bgr'``, ``'rgb'``, ``'gray'`` or keep
+    it ``'raw'``, matching ``ScreenshotManager`` formats."""
+    if convert_format == 'bgr':
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+    if convert_format == 'rgb':
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
+    if convert_format == 'gray':
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)
+    return np.ascontiguousarray(frame)
+
+
+class MonitorTask:
+    """Handle for a registered monitor callback."""
+
+    def __init__(self, scheduler: 'MonitorScheduler', name: str,
+                 callback: Callable[[Dict[str, np.ndarray], float], Optional[float]],
+                 period: float, priority: int,
+                 regions: Optional[Callable[[], Dict[str, Region]]],
+                 convert_format: str, blocking: bool = False) -> None:
+        self._scheduler = scheduler
+        self.name = name
+        self.callback = callback
+        self.period = period
+        self.priority = priority
+        self.regions = regions
+        self.convert_format = convert_format
+        self.blocking = blocking
+        # Single-thread executor of a blocking task, created on first run.
+        self._lane: Optional[ThreadPoolExecutor] = None
+        self.due = 0.0
+        self.cancelled = False
+        self.running = False
+        self.suspended = False
+        # Sequence number of the task's live heap entry; stale entries
+        # (left behind by a suspend) are skipped when popped.
+        self._entry: Optional[int] = None
+        self._idle = threading.Event()
+        self._idle.set()
+
+        self.runs = 0
+        self.overruns = 0
+        self.errors = 0
+        self.wall_ms = 0.0
+        self.cpu_ms = 0.0
+        self.suspensions = 0
+        self.suspended_total = 0.0
+        self._suspended_at: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        return not self.cancelled and not self.suspended
+
+    def suspended_seconds(self, now: Optional[float] = None) -> float:
+        """Total time spent suspended, including the current suspension."""
+        total = self.suspended_total
+        if self._suspended_at is not None:
+            now = time.monotonic() if now is None else now
+            total += max(0.0, now - self._suspended_at)
+        return total
+
+    def cancel(self) -> None:
+        self._scheduler.unregister(self)
+
+    def suspend(self) -> None:
+        self._scheduler.suspend(self)
+
+    def resume(self) -> None:
+        self._scheduler.resume(self)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait for an in-flight run to finish."""
+        return self._idle.wait(timeout)
+
+    def get_stats(self) -> dict:
+        return {
+            'period': self.period,
+            'priority': self.priority,
+            'blocking': self.blocking,
+            'runs': self.runs,
+            'overruns': self.overruns,
+            'errors': self.errors,
+            'wall_ms': self.wall_ms,
+            'cpu_ms': self.cpu_ms,
+            'suspended': self.suspended,
+            'suspensions': self.suspensions,
+            'suspended_s': self.suspended_seconds(),
+        }
+
+
+class MonitorScheduler:
+    """One dispatcher thread, batched captures, a small worker pool."""
+
+    #: Smoothing for the per-task cost averages.
+    COST_ALPHA = 0.2
+
+    def __init__(self, workers: int = 2, budget: float = CpuGovernor.DEFAULT_BUDGET,
+                 capture: Optional[Callable[[Region], Optional[np.ndarray]]] = None,
+                 merge_slack: float = 1.25) -> None:
+        self.workers = workers
+        self.governor = CpuGovernor(budget)
+        self.merge_slack = merge_slack
+        self._capture = capture
+        self._heap: List[Tuple[float, int, MonitorTask]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running = False
+        self._tasks: List[MonitorTask] = []
+
+        self._ticks = 0
+        self._grabs = 0
+        self._grabbed_pixels = 0
+        self._requested_pixels = 0
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(self, callback: Callable[[Dict[str, np.ndarray], float], Optional[float]],
+                 period: float, priority: int = PRIORITY_NORMAL,
+                 regions: Optional[Callable[[], Dict[str, Region]]] = None,
+                 convert_format: str = 'raw', name: str = '',
+                 delay: float = 0.0, blocking: bool = False) -> MonitorTask:
+        """Run ``callback`` every ``period`` seconds starting after ``delay``;
+        ``blocking`` callbacks get a worker thread of their own."""
+        task = MonitorTask(self, name, callback, period, priority, regions, convert_format, blocking)
+        with self._cond:
+            self._tasks.append(task)
+            self._push(task, time.monotonic() + max(0.0, delay))
+            self._ensure_thread()
+            self._cond.notify()
+        return task
+
+    def unregister(self, task: Optional[MonitorTask]) -> None:
+        """Stop scheduling ``task``; an in-flight run finishes normally."""
+        if task is None:
+            return
+        with self._cond:
+            if not task.cancelled:
+                task.cancelled = True
+                if task in self._tasks:
+                    self._tasks.remove(task)
+                self._cond.notify()
+            lane, task._lane = task._lane, None
+        if lane is not None:
+            lane.shutdown(wait=False)
+
+    def suspend(self, task: Optional[MonitorTask], now: Optional[float] = None) -> None:
+        """Stop running ``task`` until ``resume``; an in-flight run finishes
+        normally but is not rescheduled."""
+        if task is None:
+            return
+        now = time.monotonic() if now is None else now
+        with self._cond:
+            if task.cancelled or task.suspended:
+                return
+            task.suspended = True
+            task.suspensions += 1
+            task._suspended_at = now
+            task._entry = None
+            self._cond.notify()
+
+    def resume(self, task: Optional[MonitorTask], now: Optional[float] = None) -> None:
+        """Make a suspended ``task`` due immediately."""
+        if task is None:
+            return
+        now = time.monotonic() if now is None else now
+        with self._cond:
+            if task.cancelled or not task.suspended:
+                return
+            task.suspended = False
+            if task._suspended_at is not None:
+                task.suspended_total += max(0.0, now - task._suspended_at)
+                task._suspended_at = None
+            if not task.running:
+                # A running task is queued again when its run finishes.
+                self._push(task, now)
+            self._cond.notify()
+
+    def shutdown(self) -> None:
+        """Cancel every task, stop the dispatcher and the worker pool."""
+        with self._cond:
+            lanes = []
+            for task in self._tasks:
+                task.cancelled = True
+                if task._lane is not None:
+                    lanes.append(task._lane)
+                    task._lane = None
+            self._tasks.clear()
+            self._heap.clear()
+            self._running = False
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        for lane in lanes:
+            lane.shutdown(wait=False)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    @property
+    def budget(self) -> float:
+        """Monitor CPU budget in cores (0.08 = 8% of one core)."""
+        return self.governor.budget
+
+    def set_budget(self, budget: float) -> None:
+        self.governor.budget = max(0.0, budget)
+
+    def load(self, now: Optional[float] = None) -> float:
+        """Monitor CPU seconds per second over the governor's window."""
+        return self.governor.load(now)
+
+    def get_stats(self) -> dict:
+        """Tick / capture counters, per-task stats and the governor's
+        budget, load, costs and throttling decisions."""
+        governor = self.governor.get_stats()
+        with self._cond:
+            tasks = {task.name or repr(task.callback): task.get_stats() for task in self._tasks}
+            for task in self._tasks:
+                tasks[task.name or repr(task.callback)]['stretch'] = self.governor.stretch(task.priority)
+            stats = {
+                'ticks': self._ticks,
+                'grabs': self._grabs,
+                'grabbed_pixels': self._grabbed_pixels,
+                'requested_pixels': self._requested_pixels,
+                'tasks': tasks,
+            }
+        stats.update(governor)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def run_due(self, now: Optional[float] = None) -> List[MonitorTask]:
+        """Dispatch every task due at ``now``; returns the tasks started.
+        Called by the dispatcher thread, and directly by tests."""
+        now = time.monotonic() if now is None else now
+        with self._cond:
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                _, entry, task = heapq.heappop(self._heap)
+                if not task.cancelled and entry == task._entry:
+                    due.append(task)
+            self._ticks += 1
+            priorities = [task.priority for task in self._tasks]
+        self.governor.evaluate(priorities, now)
+        if not due:
+            return []
+
+        started = sorted(due, key=lambda t: -t.priority)
+
+        frames = self._capture_frames(started)
+        for task in started:
+            task.running = True
+            task._idle.clear()
+            if self.workers <= 0:
+                self._run_task(task, frames.get(task), now)
+            elif task.blocking:
+                self._get_lane(task).submit(self._run_task, task, frames.get(task), now)
+            else:
+                self._get_executor().submit(self._run_task, task, frames.get(task), now)
+        return started
+
+    def _capture_frames(self, tasks: List[MonitorTask]) -> Dict[MonitorTask, Dict[str, np.ndarray]]:
+        """Grab each merged rectangle once and slice out every task's regions."""
+        wanted: List[Tuple[MonitorTask, str, Rect]] = []
+        for task in tasks:
+            if task.regions is None:
+                continue
+            try:
+                regions = task.regions() or {}
+            except Exception:
+                logger.debug("Monitor task %s regions failed", task.name, exc_info=True)
+                regions = {}
+            for region_name, region in regions.items():
+                wanted.append((task, region_name, _rect(region)))
+
+        frames: Dict[MonitorTask, Dict[str, np.ndarray]] = {task: {} for task in tasks}
+        if not wanted:
+            return frames
+
+        grabs = []
+        for rect in merge_rects([rect for _, _, rect in wanted], self.merge_slack):
+            image = self._grab(rect)
+            grabs.append((rect, image))
+        with self._cond:
+            self._grabs += len(grabs)
+            self._grabbed_pixels += sum(_area(rect) for rect, _ in grabs)
+            self._requested_pixels += sum(_area(rect) for _, _, rect in wanted)
+
+        for task, region_name, rect in wanted:
+            for grab_rect, image in grabs:
+                if (image is not None and grab_rect[0] <= rect[0] and grab_rect[1] <= rect[1]
+                        and rect[2] <= grab_rect[2] and rect[3] <= grab_rect[3]):
+                    x0, y0 = rect[0] - grab_rect[0], rect[1] - grab_rect[1]
+                    frames[task][region_name] = image[y0:y0 + rect[3] - rect[1],
+                                                      x0:x0 + rect[2] - rect[0]]
+                    break
+        return frames
+
+    def _grab(self, rect: Rect) -> Optional[np.ndarray]:
+        region = {'left': rect[0], 'top': rect[1],
+                  'width': rect[2] - rect[0], 'height': rect[3] - rect[1]}
+        capture = self._capture
+        if capture is None:
+            from lib.managers.screenshot_manager import screenshot_manager
+            capture = lambda r: screenshot_manager.capture_region(r, convert_format='raw')
+        try:
+            return capture(region)
+        except Exception:
+            logger.debug("Monitor capture of %s failed", region, exc_info=True)
+            return None
+
+    def _run_task(self, task: MonitorTask, frames: Optional[Dict[str, np.ndarray]], now: float) -> None:
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        next_delay = None
+        try:
+            converted = {}
+            for region_name, frame in (frames or {}).items():
+                converted[region_name] = convert_frame(frame, task.convert_format)
+            next_delay = task.callback(converted, now)
+        except Exception:
+            task.errors += 1
+            logger.debug("Monitor task %s failed", task.name or task.callback, exc_info=True)
+        finally:
+            cpu = time.thread_time() - cpu_start
+            duration = time.perf_counter() - start
+            task.runs += 1
+            if duration > task.period:
+                task.overruns += 1
+            task.wall_ms += (duration * 1000.0 - task.wall_ms) * self.COST_ALPHA
+            task.cpu_ms += (cpu * 1000.0 - task.cpu_ms) * self.COST_ALPHA
+            self.governor.record(task.name or repr(task.callback), task.priority, cpu, duration)
+            task.running = False
+            task._idle.set()
+            delay = next_delay if next_delay is not None else task.period
+            # Over budget, the governor stretches low-priority periods.
+            self._reschedule(task, now, delay * self.governor.stretch(task.priority))
+
+    def _reschedule(self, task: MonitorTask, now: float, delay: float) -> None:
+        with self._cond:
+            if task.cancelled or task.suspended or not self._running:
+                return
+            # Anchor to the due time so periods don't drift with callback
+            # cost; skip ahead if we fell behind.
+            due = task.due + max(0.001, delay)
+            if due < now:
+                due = now + max(0.001, delay)
+            self._push(task, due)
+            self._cond.notify()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _push(self, task: MonitorTask, due: float) -> None:
+        task.due = due
+        task._entry = next(self._counter)
+        heapq.heappush(self._heap, (due, task._entry, task))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._cond:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="MonitorWorker")
+            return self._executor
+
+    def _get_lane(self, task: MonitorTask) -> ThreadPoolExecutor:
+        with self._cond:
+            if task._lane is None:
+                # Named like the pool so BaseMonitor still recognises a
+                # stop issued from inside a tick.
+                task._lane = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"MonitorWorker-{task.name or 'blocking'}")
+            return task._lane
+
+    def _ensure_thread(self) -> None:
+        if self.workers <= 0:
+            # Synchronous mode: the caller drives ``run_due``.
+            self._running = True
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="MonitorScheduler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    while self._heap and (self._heap[0][2].cancelled
+                                          or self._heap[0][1] != self._heap[0][2]._entry):
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                if not self._running:
+                    return
+            try:
+                self.run_due()
+            except Exception:
+                logger.exception("Monitor scheduler tick failed")
+
+
+_scheduler: Optional[MonitorScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def _budget_from_config(config) -> float:
+    from lib.utilities.utilities import get_config_float
+    return get_config_float(config, 'MonitorCpuBudget', CpuGovernor.DEFAULT_BUDGET * 100) / 100.0
+
+
+def _on_config_change(config) -> None:
+    scheduler = _scheduler
+    if scheduler is not None:
+        scheduler.set_budget(_budget_from_config(config))
+
+
+def get_monitor_scheduler() -> MonitorScheduler:
+    """The process-wide monitor scheduler, created on first use with the
+    ``MonitorCpuBudget`` config value (kept in sync on config changes)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = MonitorScheduler()
+            try:
+                from lib.utilities.utilities import on_config_change, read_config
+                _scheduler.set_budget(_budget_from_config(read_config()))
+                on_config_change(_on_config_change)
+            except Exception:
+                logger.debug("Monitor CPU budget config unavailable", exc_info=True)
+        return _scheduler
+
+
+def shutdown_monitor_scheduler() -> None:
+    global _scheduler
+    with _scheduler_lock:
+        scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        scheduler.shutdown()
@@ -10,7 +10,7 @@ import time
 import os
 import numpy as np
 import cv2
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from accessible_output2.outputs.auto import Auto
 from lib.utilities.utilities import read_config, get_config_boolean, get_config_float, calculate_distance, get_minimap_region, on_config_change
 from lib.managers.screenshot_manager import capture_region
@@ -18,25 +18,32 @@ from lib.managers.screenshot_manager import capture_region
 from lib.monitors.background_monitor import monitor
 from lib.detection import ppi as ppi_module
 from lib.detection.ppi import PPI_CAPTURE_REGION, PPI_CAPTURE_REGION_LEGACY
+from lib.detection.storm_mask import IncrementalStormMask, compute_storm_mask, purple_shift
+from lib.detection.storm_model import StormCircle, StormPredictor, fit_storm_circle
 from lib.utilities.spatial_audio import SpatialAudio
+from lib.audio import get_ping_scheduler
 
 def _get_position_tracker():
     from lib.detection.player_position import position_tracker
     return position_tracker
 
-def _get_find_minimap_icon_direction():
-    from lib.detection.player_position import find_minimap_icon_direction
-    return find_minimap_icon_direction
+def _storm_phase_step():
+    from lib.monitors.match_event_monitor import match_event_monitor
+    return match_event_monitor.phase_step
 
 
 class StormAudioThread:
-    """Manages audio for storm with configurable ping intervals"""
-    def __init__(self, audio_instance: SpatialAudio, ping_interval: float, volume: float):
+    """Manages audio for storm with configurable ping intervals (as a job on
+    the shared audio ping scheduler)"""
+    def __init__(self, audio_instance: SpatialAudio, ping_interval: float, volume: float,
+                 locate: Optional[Callable] = None):
         self.audio_instance = audio_instance
         self.ping_interval = ping_interval
         self.volume = volume
-        self.stop_event = threading.Event()
-        self.thread = None
+        # Optional player_pos -> (edge_point, distance); lets each ping
+        # re-aim at the predicted storm edge instead of the last detection.
+        self.locate = locate
+        self.job = None
         self.current_position = None
         self.current_distance = None
         self.position_lock = threading.Lock()
@@ -45,42 +52,49 @@ class StormAudioThread:
         with self.position_lock:
             self.current_position = position
             self.current_distance = distance
-        if not self.thread or not self.thread.is_alive():
-            self.stop_event.clear()
-            self.thread = threading.Thread(target=self._audio_loop, daemon=True)
-            self.thread.start()
+        self._follow(position)
+        if self.job is None or not self.job.active:
+            _get_position_tracker().set_heading_demand('storm', True)
+            self.job = get_ping_scheduler().schedule(self._ping, self.ping_interval, name="storm")
 
     def update_position(self, position: Tuple[int, int], distance: float):
         with self.position_lock:
             self.current_position = position
             self.current_distance = distance
+        self._follow(position)
+
+    def _follow(self, position):
+        if self.audio_instance and position:
+            self.audio_instance.follow_target(position, _get_position_tracker().get_predicted_pose)
 
     def stop(self):
-        self.stop_event.set()
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+        _get_position_tracker().set_heading_demand('storm', False)
         if self.audio_instance:
             try:
                 self.audio_instance.stop()
             except Exception:
                 pass
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
 
-    def _audio_loop(self):
-        while not self.stop_event.is_set():
-            try:
-                with self.position_lock:
-                    position = self.current_position
-                    distance = self.current_distance
-                if position and distance is not None:
-                    _, player_angle = _get_find_minimap_icon_direction()()
-                    if player_angle is not None:
-                        player_pos = _get_position_tracker().get_cached_position()
-                        if player_pos:
-                            self._play_spatial_audio(player_pos, player_angle, position, distance)
-                if self.stop_event.wait(timeout=self.ping_interval):
-                    break
-            except Exception:
-                time.sleep(0.1)
+    def _ping(self, pose):
+        with self.position_lock:
+            position = self.current_position
+            distance = self.current_distance
+        if position and distance is not None:
+            player_pos, player_angle = pose
+            if player_angle is None:
+                player_angle = _get_position_tracker().get_cached_angle()
+            if player_angle is not None:
+                if player_pos is None:
+                    player_pos = _get_position_tracker().get_cached_position()
+                if player_pos:
+                    if self.locate is not None:
+                        located = self.locate(player_pos)
+                        if located:
+                            position, distance = located
+                    self._play_spatial_audio(player_pos, player_angle, position, distance)
 
     def _play_spatial_audio(self, player_pos, player_angle, storm_pos, distance):
         if not self.audio_instance:
@@ -100,10 +114,21 @@ class StormAudioThread:
 
 
 from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import GROUNDED, OVERLAYS, SKYDIVE
 
 
 class StormMonitor(BaseMonitor):
     """Minimap-based storm monitor using PPI-aligned reference comparison"""
+
+    _SCHEDULE_PERIOD = 0.5
+    _CAPTURE_FORMAT = 'rgb'
+    # PPI alignment of the reference map can take hundreds of ms.
+    _SCHEDULE_BLOCKING = True
+    # The storm matters once off the bus; the minimap is hidden behind
+    # the map and inventory.
+    _ACTIVE_STATES = frozenset({SKYDIVE, GROUNDED})
+    _SUSPEND_STATES = OVERLAYS
+
     def __init__(self):
         super().__init__()
         self.speaker = Auto()
@@ -113,12 +138,27 @@ class StormMonitor(BaseMonitor):
 
         self.storm_audio = None
         self.active_audio_thread = None
-        self.detection_interval = 0.5
 
         # Color reference map (cached per map)
         self._color_ref = None
         self._color_ref_name = None
 
+        # Aligned reference patch, keyed by the crop it was cut from
+        self._aligned_ref = None
+        self._aligned_ref_key = None
+
+        # Persistent storm mask, recomputed per changed tile
+        self._storm_mask = IncrementalStormMask()
+        self._last_result = None
+        self._timings = {}
+
+        # Fitted safe-zone circle (fullmap coords), carried forward between
+        # image detections
+        self.storm_predictor = StormPredictor(storm_step=_storm_phase_step)
+        self._last_circle = None
+        self._model_fits = 0
+        self._predicted_cycles = 0
+
         # Cached config values
         self._cached_enabled = True
         self._cached_storm_volume = 0.5
@@ -145,6 +185,7 @@ class StormMonitor(BaseMonitor):
             self._cached_current_map = new_map
             self._color_ref = None
             self._color_ref_name = None
+            self._reset_storm_cache()
         if self.storm_audio:
             master_volume, storm_volume = SpatialAudio.get_volume_from_config(
                 config, 'StormVolume', 'MasterVolume', 0.5
@@ -195,6 +236,14 @@ class StormMonitor(BaseMonitor):
         self._color_ref_name = name
         return self._color_ref
 
+    def _reset_storm_cache(self):
+        self._aligned_ref = None
+        self._aligned_ref_key = None
+        self._storm_mask.reset()
+        self._last_result = None
+        self._last_circle = None
+        self.storm_predictor.reset()
+
     def _get_ppi_capture_region(self) -> dict:
         """Get the PPI capture region for the current map."""
         if self._cached_current_map == "o g":
@@ -256,6 +305,12 @@ class StormMonitor(BaseMonitor):
         if ref_crop.size == 0:
             return None
 
+        # The aligned patch only depends on the integer crop and the
+        # capture size; reuse it until PPI moves the crop.
+        key = (self._color_ref_name, x1, y1, x2, y2, cap_w, cap_h)
+        if key == self._aligned_ref_key and self._aligned_ref is not None:
+            return self._aligned_ref
+
         if pad_left or pad_top or pad_right or pad_bottom:
             ref_crop = cv2.copyMakeBorder(
                 ref_crop, pad_top, pad_bottom, pad_left, pad_right,
@@ -263,88 +318,129 @@ class StormMonitor(BaseMonitor):
             )
 
         # Resize to match the minimap capture dimensions
-        return cv2.resize(ref_crop, (cap_w, cap_h), interpolation=cv2.INTER_LINEAR)
+        self._aligned_ref = cv2.resize(ref_crop, (cap_w, cap_h), interpolation=cv2.INTER_LINEAR)
+        self._aligned_ref_key = key
+        return self._aligned_ref
 
     # ── Storm detection ─────────────────────────────────────────────
 
     def detect_storm_mask(self, screenshot: np.ndarray, ref_aligned: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         Compare live minimap vs aligned reference to detect the storm overlay.
-        Returns (storm_mask, purple_shift).
+        Returns (storm_mask, purple_shift). Full-frame; the monitor loop uses
+        the incremental mask instead.
         """
-        live = screenshot.astype(np.float32)
-        ref = ref_aligned.astype(np.float32)
-        diff = live - ref
-
-        r_shift = diff[:, :, 0]
-        g_shift = diff[:, :, 1]
-        b_shift = diff[:, :, 2]
-
-        # Storm overlay adds purple tint: R and B increase, G relatively less
-        purple_shift = ((r_shift + b_shift) * 0.5) - g_shift
-        storm_mask = (purple_shift > 50).astype(np.uint8) * 255
-
-        # Morphological cleanup
-        kernel_small = np.ones((3, 3), np.uint8)
-        storm_mask = cv2.morphologyEx(storm_mask, cv2.MORPH_CLOSE, kernel_small)
-        storm_mask = cv2.morphologyEx(storm_mask, cv2.MORPH_OPEN, kernel_small)
-
-        kernel_large = np.ones((15, 15), np.uint8)
-        storm_mask = cv2.morphologyEx(storm_mask, cv2.MORPH_CLOSE, kernel_large)
-
-        return storm_mask, purple_shift
+        return compute_storm_mask(screenshot, ref_aligned), purple_shift(screenshot, ref_aligned)
 
     # ── Main detection ──────────────────────────────────────────────
 
-    def detect_storm_on_minimap(self) -> Optional[Tuple[int, int]]:
-        """Detect storm using PPI-aligned reference comparison."""
+    def detect_storm_on_minimap(self, screenshot: Optional[np.ndarray] = None) -> Optional[Tuple[int, int]]:
+        """Detect storm using PPI-aligned reference comparison. ``screenshot``
+        is an RGB capture of the PPI region when the caller already has one."""
         try:
+            t0 = time.perf_counter()
             # Capture from the SAME region PPI uses
             ppi_region = self._get_ppi_capture_region()
-            screenshot = capture_region(ppi_region, 'rgb')
+            if screenshot is None:
+                screenshot = capture_region(ppi_region, 'rgb')
             if screenshot is None:
                 return None
+            t1 = time.perf_counter()
 
             # Get aligned reference
             ref_aligned = self._get_ref_aligned(screenshot)
+            t2 = time.perf_counter()
+
+            if ref_aligned is None:
+                self._storm_mask.reset()
+                self._last_result = None
+                self._last_circle = None
+                return None
 
-            mask = None
-            purple_shift = None
-            storm_contour = None
-            closest_point = None
-            result = None
-
-            if ref_aligned is not None:
-                mask, purple_shift = self.detect_storm_mask(screenshot, ref_aligned)
-
-                contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                if contours:
-                    storm_contour = max(contours, key=cv2.contourArea)
-                    if cv2.contourArea(storm_contour) >= self.min_contour_area:
-                        h, w = mask.shape
-                        mm_cx, mm_cy = w // 2, h // 2
-                        contour_points = storm_contour.reshape(-1, 2)
-                        edge_mask = (
-                            (contour_points[:, 0] > 1) & (contour_points[:, 0] < w - 2) &
-                            (contour_points[:, 1] > 1) & (contour_points[:, 1] < h - 2)
-                        )
-                        safe_pts = contour_points[edge_mask]
-                        if len(safe_pts) == 0:
-                            safe_pts = contour_points
-                        if len(safe_pts) > 0:
-                            center = np.array((mm_cx, mm_cy))
-                            dists = np.linalg.norm(safe_pts - center, axis=1)
-                            closest_point = safe_pts[np.argmin(dists)]
-                            result = (int(closest_point[0] + ppi_region['left']),
-                                      int(closest_point[1] + ppi_region['top']))
-                    else:
-                        storm_contour = None
-
-            return result
+            mask, changed = self._storm_mask.update(screenshot, ref_aligned, self._aligned_ref_key)
+            t3 = time.perf_counter()
+            if changed:
+                self._last_result = self._find_closest_storm_point(mask, ppi_region)
+                self._last_circle = fit_storm_circle(mask) if self._last_result else None
+            self._record_storm_fit(ppi_region)
+            t4 = time.perf_counter()
+
+            self._timings = {
+                'capture_ms': (t1 - t0) * 1000.0,
+                'align_ms': (t2 - t1) * 1000.0,
+                'mask_ms': (t3 - t2) * 1000.0,
+                'contour_ms': (t4 - t3) * 1000.0,
+                'total_ms': (t4 - t0) * 1000.0,
+                'tiles_recomputed': self._storm_mask.last_fraction,
+            }
+            return self._last_result
         except Exception as e:
             print(f"[storm] detect error: {e}")
             return None
 
+    def _find_closest_storm_point(self, mask: np.ndarray, ppi_region: dict) -> Optional[Tuple[int, int]]:
+        """Screen point of the largest storm contour closest to the minimap center."""
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return None
+        storm_contour = max(contours, key=cv2.contourArea)
+        if cv2.contourArea(storm_contour) < self.min_contour_area:
+            return None
+        h, w = mask.shape
+        mm_cx, mm_cy = w // 2, h // 2
+        contour_points = storm_contour.reshape(-1, 2)
+        edge_mask = (
+            (contour_points[:, 0] > 1) & (contour_points[:, 0] < w - 2) &
+            (contour_points[:, 1] > 1) & (contour_points[:, 1] < h - 2)
+        )
+        safe_pts = contour_points[edge_mask]
+        if len(safe_pts) == 0:
+            safe_pts = contour_points
+        if len(safe_pts) == 0:
+            return None
+        center = np.array((mm_cx, mm_cy))
+        dists = np.linalg.norm(safe_pts - center, axis=1)
+        closest_point = safe_pts[np.argmin(dists)]
+        return (int(closest_point[0] + ppi_region['left']),
+                int(closest_point[1] + ppi_region['top']))
+
+    def _record_storm_fit(self, ppi_region: dict):
+        """Hand the circle fitted to the current mask to the predictor, in
+        fullmap coordinates."""
+        circle = self._last_circle
+        if circle is None:
+            return
+        player_pos = _get_position_tracker().get_cached_position()
+        if not player_pos:
+            return
+        center = self.convert_minimap_to_fullmap_coords(
+            (circle.center_x + ppi_region['left'], circle.center_y + ppi_region['top']),
+            player_pos
+        )
+        self.storm_predictor.add_fit(StormCircle(
+            center[0], center[1],
+            circle.radius * self.minimap_scale_factor,
+            circle.residual * self.minimap_scale_factor
+        ))
+        self._model_fits += 1
+
+    def locate_storm_edge(self, player_pos) -> Optional[Tuple[Tuple[int, int], float]]:
+        """``(edge_point, distance)`` from the predicted storm circle, or
+        None without a usable model."""
+        circle = self.storm_predictor.predict()
+        if circle is None or not player_pos:
+            return None
+        edge, distance, _ = circle.nearest_edge(player_pos)
+        return edge, distance
+
+    def get_detection_stats(self) -> dict:
+        """Last cycle's stage timings plus incremental-mask and model counters."""
+        stats = dict(self._timings)
+        stats.update(self._storm_mask.get_stats())
+        stats['model_fits'] = self._model_fits
+        stats['predicted_cycles'] = self._predicted_cycles
+        return stats
+
     def convert_minimap_to_fullmap_coords(self, minimap_coords: Tuple[int, int],
                                         player_fullmap_pos: Tuple[int, int]) -> Tuple[int, int]:
         minimap_x, minimap_y = minimap_coords
@@ -358,46 +454,74 @@ class StormMonitor(BaseMonitor):
         fullmap_y = int(player_fullmap_y + (offset_y * self.minimap_scale_factor))
         return (fullmap_x, fullmap_y)
 
+    def _locate_storm(self, screenshot: Optional[np.ndarray] = None) -> Optional[Tuple[Tuple[int, int], float]]:
+        """Storm edge point (fullmap) and distance for this cycle.
+
+        The minimap is only analysed when the predictor asks for a refit;
+        in between, the edge comes from the predicted circle. A detection
+        whose mask doesn't fit a circle falls back to the closest contour
+        point.
+        """
+        player_fullmap_pos = _get_position_tracker().get_cached_position()
+        if not self.storm_predictor.needs_fit():
+            located = self.locate_storm_edge(player_fullmap_pos)
+            if located:
+                self._predicted_cycles += 1
+                return located
+
+        storm_minimap_coords = self.detect_storm_on_minimap(screenshot)
+        if not storm_minimap_coords:
+            # Storm off the minimap: drop the model so pings stop.
+            self.storm_predictor.reset()
+            return None
+        player_fullmap_pos = _get_position_tracker().get_cached_position()
+        if not player_fullmap_pos:
+            return None
+        if self._last_circle is not None:
+            located = self.locate_storm_edge(player_fullmap_pos)
+            if located:
+                return located
+        else:
+            # Irregular edge (e.g. the zone cut by the minimap border and a
+            # HUD overlay); don't let pings follow an older circle.
+            self.storm_predictor.reset()
+        storm_fullmap_coords = self.convert_minimap_to_fullmap_coords(
+            storm_minimap_coords, player_fullmap_pos
+        )
+        return storm_fullmap_coords, calculate_distance(player_fullmap_pos, storm_fullmap_coords)
+
     # ── Loop & lifecycle ────────────────────────────────────────────
 
-    def _monitor_loop(self):
-        last_detection_time = 0
-        while not self.stop_event.is_set():
-            try:
-                if self.wizard_paused():
-                    self.cleanup_audio_thread()
-                    time.sleep(0.5)
-                    continue
-                current_time = time.time()
-                if not self.should_monitor():
-                    self.cleanup_audio_thread()
-                    time.sleep(2.0)
-                    continue
-                if current_time - last_detection_time >= self.detection_interval:
-                    storm_minimap_coords = self.detect_storm_on_minimap()
-                    if storm_minimap_coords:
-                        player_fullmap_pos = _get_position_tracker().get_cached_position()
-                        if player_fullmap_pos:
-                            storm_fullmap_coords = self.convert_minimap_to_fullmap_coords(
-                                storm_minimap_coords, player_fullmap_pos
-                            )
-                            distance = calculate_distance(player_fullmap_pos, storm_fullmap_coords)
-                            volume = self.get_storm_volume()
-                            ping_interval = self.get_storm_ping_interval()
-                            if self.active_audio_thread:
-                                self.active_audio_thread.update_position(storm_fullmap_coords, distance)
-                            else:
-                                if self.storm_audio:
-                                    self.active_audio_thread = StormAudioThread(
-                                        self.storm_audio, ping_interval, volume
-                                    )
-                                    self.active_audio_thread.start(storm_fullmap_coords, distance)
-                    else:
-                        self.cleanup_audio_thread()
-                    last_detection_time = current_time
-                time.sleep(0.1)
-            except Exception:
-                time.sleep(2.0)
+    def capture_regions(self):
+        # The minimap is only needed when the storm model wants a refit.
+        if not self.should_monitor() or not self.storm_predictor.needs_fit():
+            return {}
+        return {'minimap': self._get_ppi_capture_region()}
+
+    def _on_wizard_paused(self):
+        self.cleanup_audio_thread()
+
+    def tick(self, frames, now):
+        if not self.should_monitor():
+            self.cleanup_audio_thread()
+            return 2.0
+        storm = self._locate_storm(frames.get('minimap'))
+        if storm:
+            storm_fullmap_coords, distance = storm
+            volume = self.get_storm_volume()
+            ping_interval = self.get_storm_ping_interval()
+            if self.active_audio_thread:
+                self.active_audio_thread.update_position(storm_fullmap_coords, distance)
+            else:
+                if self.storm_audio:
+                    self.active_audio_thread = StormAudioThread(
+                        self.storm_audio, ping_interval, volume,
+                        locate=self.locate_storm_edge
+                    )
+                    self.active_audio_thread.start(storm_fullmap_coords, distance)
+        else:
+            self.cleanup_audio_thread()
+        return None
 
     def cleanup_audio_thread(self):
         if self.active_audio_thread:
@@ -432,7 +556,7 @@ class StormMonitor(BaseMonitor):
 
     def stop_monitoring(self):
         """Stop any active audio threads + the spatial audio loop, then
-        let BaseMonitor tear down the detection thread."""
+        let BaseMonitor unregister the detection task."""
         self.cleanup_audio_thread()
         super().stop_monitoring()
         if self.storm_audio:
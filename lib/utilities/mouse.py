@@ -12,6 +12,33 @@ config = read_config()
 _movement_lock = threading.Lock()
 _current_movement_thread = None
 
+# Callbacks notified of every horizontal turn issued by smooth_move_mouse,
+# as ``callback(dx_pixels, duration_seconds)``. The player position tracker
+# uses this to dead-reckon heading between minimap samples.
+_turn_listeners = []
+
+
+def add_turn_listener(callback):
+    """Register ``callback(dx, duration)`` for turns sent by smooth_move_mouse."""
+    if callback not in _turn_listeners:
+        _turn_listeners.append(callback)
+
+
+def remove_turn_listener(callback):
+    """Unregister a callback added with ``add_turn_listener``."""
+    try:
+        _turn_listeners.remove(callback)
+    except ValueError:
+        pass
+
+
+def _notify_turn(dx, duration):
+    for callback in list(_turn_listeners):
+        try:
+            callback(dx, duration)
+        except Exception as e:
+            print(f"[mouse.py] Turn listener error: {e}")
+
 # SystemParametersInfoW action codes for mouse settings normalisation.
 # Before every FakerInput movement batch we temporarily force speed=10 and
 # Enhanced Pointer Precision OFF so that 1 HID unit = 1 logical pixel,
@@ -203,6 +230,10 @@ def smooth_move_mouse(dx: int, dy: int, step_delay: float = 0.01, steps: int = N
         with _movement_lock:
             saved = _save_and_normalize_mouse()
             try:
+                if dx:
+                    per_step = step_speed_seconds if step_speed > 0 else step_delay
+                    _notify_turn(dx, per_step * steps if steps > 1 else 0.0)
+
                 if steps <= 1:
                     _send_fi_relative(dx, dy)
                     return
@@ -581,9 +612,16 @@ from PIL import ImageGrab
 import numpy as np
 
 def pixel(x, y):
-    """Read pixel color at screen coordinates. Returns (r, g, b) tuple."""
-    img = ImageGrab.grab(bbox=(x, y, x + 1, y + 1))
-    return img.getpixel((0, 0))[:3]
+    """Read pixel color at screen coordinates. Returns (r, g, b) tuple.
+
+    Goes through ``screenshot_manager.probe_pixels``; call that directly to
+    read several pixels with one grab.
+    """
+    from lib.managers.screenshot_manager import probe_pixels
+    colors = probe_pixels([(x, y)])
+    if colors is None:
+        raise OSError(f"Could not read pixel at {x}, {y}")
+    return tuple(int(c) for c in colors[0])
 
 def screenshot(region=None):
     """Capture a screenshot. region=(x, y, w, h) or None for full screen. Returns PIL Image."""
@@ -5,7 +5,6 @@ centralized FA11y audio engine (Steam Audio HRTF + low-latency backend).
 
 import math
 import threading
-import time
 import numpy as np
 from typing import Tuple
 
@@ -24,6 +23,10 @@ class SpatialAudio:
         self.audio_initialized = False
         self.initialization_attempted = False
 
+        # (target_position, pose_provider) set by follow_target(); sources
+        # started while following re-aim themselves every mix chunk.
+        self._follow = None
+
         self._load_into_engine()
 
     def _load_into_engine(self):
@@ -114,6 +117,7 @@ class SpatialAudio:
                         min_distance=FIXED_RADIUS, max_distance=100.0,
                         min_volume=1.0
                     )
+                    self._attach_follow(engine, self._active_playback_id)
             else:
                 # Legacy stereo panning (config_gui test playback)
                 # Play at center position (directly in front)
@@ -130,36 +134,39 @@ class SpatialAudio:
 
     def _play_behind_sound(self, x, y, z, volume, pitch):
         """Play the double-tap behind indicator"""
-        def behind_worker():
-            try:
-                from lib.audio import get_engine
-                engine = get_engine()
-                if not engine:
-                    return
+        try:
+            from lib.audio import get_engine, get_ping_scheduler
+            engine = get_engine()
+            if not engine:
+                return
 
-                pid1 = engine.play_sound(
+            pid1 = engine.play_sound(
+                self._sound_id, x, y, z,
+                volume=volume, pitch=pitch,
+                min_distance=1.0, max_distance=100.0,
+                min_volume=1.0
+            )
+            with self._playback_lock:
+                self._active_playback_id = pid1
+                self._attach_follow(engine, pid1)
+
+            def second_tap(_pose):
+                # Skipped if the sound was stopped in the meantime.
+                if self._active_playback_id is None:
+                    return
+                pid2 = engine.play_sound(
                     self._sound_id, x, y, z,
                     volume=volume, pitch=pitch,
                     min_distance=1.0, max_distance=100.0,
                     min_volume=1.0
                 )
-                with self._playback_lock:
-                    self._active_playback_id = pid1
-
-                time.sleep(0.15)
-
-                if self._active_playback_id is not None:
-                    engine.play_sound(
-                        self._sound_id, x, y, z,
-                        volume=volume, pitch=pitch,
-                        min_distance=1.0, max_distance=100.0,
-                        min_volume=1.0
-                    )
-            except Exception:
-                pass
+                self._attach_follow(engine, pid2)
 
-        t = threading.Thread(target=behind_worker, daemon=True)
-        t.start()
+            # Second tap goes through the shared ping scheduler instead of a
+            # thread per ping.
+            get_ping_scheduler().schedule_once(second_tap, 0.15, name='behind_tap')
+        except Exception:
+            pass
 
     def update_spatial_position(self, distance: float, relative_angle: float, volume: float = 1.0):
         """Update spatial position for a currently playing sound.
@@ -189,6 +196,49 @@ class SpatialAudio:
         except Exception:
             pass
 
+    def follow_target(self, target_position: Tuple[int, int], pose_provider):
+        """Keep subsequent plays aimed at ``target_position`` as the player turns.
+
+        ``pose_provider()`` must return ``(player_position, player_angle)``
+        cheaply (e.g. ``position_tracker.get_predicted_pose``); the engine
+        polls it once per mix chunk. A ``None`` in either slot leaves the
+        source where it is.
+        """
+        self._follow = (target_position, pose_provider)
+        with self._playback_lock:
+            pid = self._active_playback_id
+        if pid is not None:
+            try:
+                from lib.audio import get_engine
+                engine = get_engine()
+                if engine:
+                    self._attach_follow(engine, pid)
+            except Exception:
+                pass
+
+    def stop_following(self):
+        """Stop re-aiming sources; they keep their last direction."""
+        self._follow = None
+
+    def _attach_follow(self, engine, pid):
+        follow = self._follow
+        if pid is None or follow is None:
+            return
+        target_position, pose_provider = follow
+
+        def provider():
+            if self._follow is not follow:
+                return None
+            player_position, player_angle = pose_provider()
+            if player_position is None or player_angle is None:
+                return None
+            relative_angle = SpatialAudio.relative_angle(
+                player_position, player_angle, target_position)
+            angle_rad = math.radians(relative_angle)
+            return (math.cos(angle_rad), -math.sin(angle_rad), 0.0)
+
+        engine.set_source_position_provider(pid, provider)
+
     def update_panning(self, left_weight, right_weight, volume=None):
         """Legacy panning update - now handled by update_spatial_position"""
         pass
@@ -247,6 +297,14 @@ class SpatialAudio:
         except Exception:
             return 0.0, 0.0
 
+    @staticmethod
+    def relative_angle(player_position, player_angle: float, target_position) -> float:
+        """Relative angle only, in plain floats — cheap enough for per-chunk use."""
+        dx = target_position[0] - player_position[0]
+        dy = target_position[1] - player_position[1]
+        target_angle = (90 - math.degrees(math.atan2(-dy, dx))) % 360
+        return (target_angle - player_angle + 180) % 360 - 180
+
     @staticmethod
     def calculate_stereo_weights(relative_angle: float) -> Tuple[float, float]:
         """Calculate stereo weights from relative angle."""
@@ -407,6 +407,8 @@ MouseKeys = true "Toggles the keybinds used to look around, left click, and righ
 IgnoreNumlock = false "When enabled, mouse keys will work regardless of numlock state."
 ResetSensitivity = false "Toggles between two sensitivity values for certain mouse movements, like recentering the camera. Do not change this if you are a new player."
 AnnounceAmmo = true "Toggles the announcements of ammo count when equipping weapons."
+AnnounceHealthShieldChanges = false "Toggles announcing your health and shield whenever they change, read from the on-screen bars."
+PrepareLobbyStatus = true "Keeps the lobby mode status (build mode, ranked, team size, fill) up to date in the background while you are in the lobby, so the mode status key answers instantly."
 AutoUpdates = true "Toggles automatic updates of FA11y."
 CreateDesktopShortcut = true "Toggles the creation of a desktop shortcut for FA11y on launch."
 AutoTurn = false "Toggles the automatic turning feature when navigating to a position. When toggled on, your player will automatically turn towards your selected location when getting navigation info."
@@ -420,6 +422,7 @@ AnnounceKillFeed = true "Toggles passive announcements for every elimination in
 AnnounceItemEquip = true "Toggles passive announcements when you equip a new item from your hotbar. Requires the FA11y-OW companion service."
 AnnounceItemPickup = true "Toggles passive announcements when you pick up an item. Requires the FA11y-OW companion service."
 UseFA11yOWPosition = false "Use FA11y-OW's GEP location for player position (transformed via the calibration) instead of the visual minimap detection. Off by default because the bundled calibration can be unstable far from where it was sampled; turn on only if you have re-calibrated for your setup."
+PauseMonitorsByGameState = true "Pauses screen monitors (bloom, materials, resources, height, storm) in the lobby, while dead or spectating, and while the map or inventory is open. Turn off if a monitor stays silent when it should be running."
 
 [Values]
 TurnSensitivity = 75 "The sensitivity used for primary turning left, primary turning right, looking up, and looking down when MouseKeys is enabled."
@@ -437,6 +440,7 @@ RecenterLookDown = 1500 "The sensitivity used when moving the camera down when r
 RecenterLookUp = -820 "The sensitivity used when moving the camera up when recentering the camera."
 ResetRecenterLookDown = 1500 "The sensitivity used when moving the camera down when recentering the camera on the ResetSensitivity."
 ResetRecenterLookUp = -580 "The sensitivity used when moving the camera down when recentering the camera on the ResetSensitivity."
+MonitorCpuBudget = 8 "Percent of one CPU core the background monitors may use. When they use more, FA11y slows the lower-priority checks first (bloom, height, resource counts); map status and navigation are not slowed."
 
 [Audio]
 MasterVolume = 1.0 "Master volume control for all FA11y sounds."
@@ -459,6 +463,7 @@ ContinuousPingDistanceExponent = 1.5 "The exponent for the distance-based speed
 AnnounceNewMatch = true "Announce when a new match starts (detected from the game log's Warmup phase)."
 AnnounceObjectVisits = true "Announce when visiting game objects."
 PositionUpdateInterval = 0.5 "Interval in seconds for updating player position for match tracking."
+PositionCpuBudget = 5 "Percent of one CPU core player position tracking may use while you are standing still or not navigating. While you move or navigate the budget does not apply, and positions update twice per PositionUpdateInterval."
 MaxInstancesForGameObjectPositioning = 20 "Maximum number of instances of an object type to use detailed game object positioning information instead of standard directional info."
 
 [Keybinds]
@@ -487,6 +492,8 @@ Toggle Continuous Ping = lalt+p "Toggles a continuous ping for the currently sel
 Toggle POI Favorite = lalt+lshift+f "Toggles the currently selected POI as a favorite."
 Check Health Shields = h "Announces the players Health and Shield values."
 Check Display Mode = lalt+r "Announces Fortnite's current window mode (Fullscreen, Windowed Fullscreen, or Windowed) and render resolution, read from the game's log file, in the order window mode then resolution."
+Announce Monitor Load =  "Announces how much CPU FA11y's background monitors are using against the MonitorCpuBudget, which monitors are being slowed down, and which cost the most."
+Reset Count Digits =  "Forgets the digit shapes FA11y learned for reading material, resource, ammo and inventory counts, and relearns them from text recognition. Use this if counts are being misread."
 Announce Direction Faced = semicolon "Announces the direction the player is facing using information from the minimap."
 Announce Ammo = j "Announces the current ammo in the mag and reserves."
 Check Rarity = bracketleft "Announces the rarity of a selected item when the player is in the in-game inventory."
@@ -530,6 +537,7 @@ selected_poi = closest, 0, 0
 current_map = main
 feature_detector = sift "Feature-matching algorithm for position detection on maps without a hard-coded override. Options: sift (default, best in varied terrain), akaze (better on low-contrast / uniform terrain like reload arenas and snow), orb (fastest, lower accuracy)."
 feature_clahe = false "Apply CLAHE histogram equalization before feature matching. Dramatically improves match rate on snow / ice / sand / other low-contrast terrain at a ~0.5 ms cost. Reload arenas already have this enabled per-map."
+phase_tracking = true "After a position is found, track the minimap's movement with phase correlation (about 1 ms) instead of re-running feature matching (about 100 ms) on every check. Falls back to feature matching automatically when the minimap moves too far or the match is unsure."
 
 [Setup]
 FirstRunComplete = false "Whether the first-run setup wizard has been completed. Uncheck (set to false) and restart FA11y to re-run the onboarding wizard." """
@@ -774,7 +782,7 @@ def is_game_objects_setting(key: str) -> bool:
     }
     
     universal_game_objects_values = {
-        'PositionUpdateInterval'
+        'PositionUpdateInterval', 'PositionCpuBudget'
     }
     
     if key in universal_game_objects_toggles or key in universal_game_objects_values:
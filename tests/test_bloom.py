@@ -0,0 +1,135 @@
+"""Tests for lib/detection/bloom.py — vectorized crosshair bloom rays."""
+import time
+
+import numpy as np
+import pytest
+
+from lib.detection.bloom import (
+    CENTER_COLOR, RAY_END, bloom_ray_distances, is_crosshair_center, measure_bloom,
+)
+
+SIZE = 2 * RAY_END + 1
+C = RAY_END  # local center
+
+
+def _reticle(spread, lines=(True, True, True, True), length=10, thickness=2,
+             background=60, edge=None, seed=0):
+    """Synthetic RGB reticle: four bloom lines ``spread`` px from center.
+    ``edge`` lights the pixel in front of each line (anti-aliasing)."""
+    rng = np.random.default_rng(seed)
+    img = rng.integers(background - 20, background + 20, (SIZE, SIZE, 3)).astype(np.uint8)
+    img[C, C] = CENTER_COLOR
+    half = thickness // 2
+    up, down, left, right = lines
+    if up:
+        img[C - spread - length + 1:C - spread + 1, C - half:C + half + 1] = 255
+        if edge is not None:
+            img[C - spread + 1, C - half:C + half + 1] = edge
+    if down:
+        img[C + spread:C + spread + length, C - half:C + half + 1] = 255
+        if edge is not None:
+            img[C + spread - 1, C - half:C + half + 1] = edge
+    if left:
+        img[C - half:C + half + 1, C - spread - length + 1:C - spread + 1] = 255
+        if edge is not None:
+            img[C - half:C + half + 1, C - spread + 1] = edge
+    if right:
+        img[C - half:C + half + 1, C + spread:C + spread + length] = 255
+        if edge is not None:
+            img[C - half:C + half + 1, C + spread - 1] = edge
+    return img
+
+
+def _reference(img, center, max_dist=RAY_END):
+    """The per-pixel loop this module replaced."""
+    h, w = img.shape[:2]
+    found = []
+    for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+        for dist in range(5, max_dist):
+            px, py = center[0] + dx * dist, center[1] + dy * dist
+            if 0 <= px < w and 0 <= py < h:
+                r, g, b = img[py, px, 0], img[py, px, 1], img[py, px, 2]
+                if r >= 245 and g >= 245 and b >= 245:
+                    found.append(dist)
+                    break
+    return min(found) if len(found) >= 2 else None
+
+
+class TestBloomRays:
+    @pytest.mark.parametrize('spread', [5, 6, 12, 20, 33, 50, 64, 74])
+    def test_spread_values(self, spread):
+        img = _reticle(spread, length=min(10, RAY_END - spread + 1))
+        distances = bloom_ray_distances(img, (C, C))
+        assert distances.tolist() == [spread] * 4
+        assert measure_bloom(img, (C, C)) == spread
+        assert measure_bloom(img, (C, C)) == _reference(img, (C, C))
+
+    def test_partial_lines(self):
+        img = _reticle(20, lines=(True, False, False, True))
+        distances = bloom_ray_distances(img, (C, C))
+        assert distances[0] == 20 and distances[3] == 20
+        assert np.isnan(distances[1]) and np.isnan(distances[2])
+        assert measure_bloom(img, (C, C)) == 20
+
+    def test_single_line_is_not_bloom(self):
+        img = _reticle(20, lines=(True, False, False, False))
+        assert measure_bloom(img, (C, C)) is None
+        assert _reference(img, (C, C)) is None
+
+    def test_no_reticle(self):
+        img = _reticle(20, lines=(False, False, False, False))
+        assert np.isnan(bloom_ray_distances(img, (C, C))).all()
+
+    def test_uneven_spread_takes_closest(self):
+        img = _reticle(30)
+        img[C + 12:C + 20, C - 1:C + 2] = 255  # a nearer lower line
+        assert measure_bloom(img, (C, C)) == 12 == _reference(img, (C, C))
+
+    def test_rays_past_frame_edge(self):
+        img = _reticle(20)[:, :C + 30]  # right ray runs off the crop
+        distances = bloom_ray_distances(img, (C, C))
+        assert distances[3] == 20
+        small = np.zeros((20, 20, 3), np.uint8)
+        assert np.isnan(bloom_ray_distances(small, (10, 10))).all()
+
+    def test_random_frames_match_reference(self):
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            img = rng.integers(200, 256, (SIZE, SIZE, 3)).astype(np.uint8)
+            assert measure_bloom(img, (C, C)) == _reference(img, (C, C))
+
+    @pytest.mark.parametrize('coverage', [0.25, 0.5, 0.75])
+    def test_subpixel_edge(self, coverage):
+        background = 60
+        level = int(round(background + coverage * (255 - background)))
+        img = _reticle(30, background=background, edge=level, seed=3)
+        # Flatten the noise in front of the lines so the background is known.
+        inner = list(range(C - 28, C - 5)) + list(range(C + 6, C + 29))
+        img[inner, C - 1:C + 2] = background
+        img[C - 1:C + 2, inner] = background
+        distances = bloom_ray_distances(img, (C, C), subpixel=True)
+        assert distances == pytest.approx([30 - coverage] * 4, abs=0.02)
+
+    def test_crosshair_center(self):
+        img = _reticle(10)
+        assert is_crosshair_center(img, (C, C))
+        img[C, C] = (200, 200, 200)
+        assert not is_crosshair_center(img, (C, C))
+
+
+@pytest.mark.benchmark
+class TestBloomBenchmark:
+    def test_vectorized_vs_loop(self):
+        frames = [_reticle(s, seed=s) for s in range(8, 70, 4)]
+        start = time.perf_counter()
+        for _ in range(10):
+            for img in frames:
+                _reference(img, (C, C))
+        loop = (time.perf_counter() - start) / (10 * len(frames))
+        start = time.perf_counter()
+        for _ in range(10):
+            for img in frames:
+                measure_bloom(img, (C, C))
+        vectorized = (time.perf_counter() - start) / (10 * len(frames))
+        assert vectorized < loop, \
+            f"bloom per frame: loop {loop * 1e6:.0f} us, vectorized {vectorized * 1e6:.0f} us"
@@ -0,0 +1,100 @@
+"""Tests for lib/detection/coordinate_index.py — vectorized nearest-object queries."""
+import os
+import time
+
+import numpy as np
+import pytest
+
+from lib.detection.coordinate_index import CoordinateIndex
+
+
+GAMEOBJECTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'data', 'maps', 'map_main_gameobjects.txt')
+
+
+def _load_rows():
+    rows = []
+    with open(GAMEOBJECTS, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                rows.append(tuple(part.strip() for part in line.split(',')))
+    return rows
+
+
+def _legacy_closest(position, rows):
+    """The old per-candidate parse + np.linalg.norm loop."""
+    distances = []
+    for row in rows:
+        try:
+            x, y = int(float(row[1])), int(float(row[2]))
+        except (ValueError, TypeError, IndexError):
+            continue
+        distances.append((row[0], (x, y), np.linalg.norm(np.array(position) - np.array([x, y]))))
+    if not distances:
+        return None
+    return min(distances, key=lambda d: d[2])
+
+
+@pytest.fixture(scope='module')
+def rows():
+    return _load_rows()
+
+
+class TestCoordinateIndex:
+    def test_parses_rows_once(self, rows):
+        index = CoordinateIndex.from_rows(rows)
+        assert len(index) == len(rows) > 3000
+        assert index.coords.dtype == np.float32
+        assert index.coords.shape == (len(rows), 2)
+
+    def test_malformed_rows_are_skipped(self):
+        index = CoordinateIndex.from_rows([('a', '1', '2'), ('b', 'x', '3'), ('c',), ('d', 4, 5.5)])
+        assert index.names == ['a', 'd']
+        assert index.point(1) == (4.0, 5.5)
+
+    def test_truncate_matches_int_float_parsing(self):
+        index = CoordinateIndex.from_rows([('a', '10.9', '-3.7')], truncate=True)
+        assert index.point(0) == (10.0, -3.0)
+
+    def test_nearest_matches_legacy_loop(self, rows):
+        index = CoordinateIndex.from_rows(rows, truncate=True)
+        rng = np.random.default_rng(7)
+        for position in rng.integers(0, 900, (50, 2)):
+            position = (int(position[0]), int(position[1]))
+            row, distance = index.nearest(position)
+            legacy = _legacy_closest(position, rows)
+            assert distance == pytest.approx(legacy[2], abs=1e-3)
+            assert index.point(row) == legacy[1]
+
+    def test_nearest_with_exclusion_and_empty(self):
+        index = CoordinateIndex.from_rows([('a', 0, 0), ('b', 10, 0)])
+        assert index.nearest((1, 0))[0] == 0
+        assert index.nearest((1, 0), exclude=np.array([True, False]))[0] == 1
+        assert index.nearest((1, 0), exclude=np.array([True, True])) is None
+        assert CoordinateIndex.from_rows([]).nearest((0, 0)) is None
+
+    def test_within_sorted_by_distance(self):
+        index = CoordinateIndex.from_rows([('far', 9, 0), ('near', 1, 0), ('out', 20, 0), ('mid', 0, 5)])
+        assert [index.names[row] for row, _ in index.within((0, 0), 10)] == ['near', 'mid', 'far']
+
+
+@pytest.mark.benchmark
+class TestCoordinateIndexBenchmark:
+    def test_queries_per_second_on_main_map(self, rows):
+        """Closest-object queries/s over map_main_gameobjects.txt."""
+        positions = [tuple(p) for p in np.random.default_rng(3).integers(0, 900, (200, 2))]
+
+        start = time.perf_counter()
+        for position in positions[:20]:
+            _legacy_closest(position, rows)
+        legacy_qps = 20 / (time.perf_counter() - start)
+
+        index = CoordinateIndex.from_rows(rows, truncate=True)
+        start = time.perf_counter()
+        for position in positions:
+            index.nearest(position)
+        indexed_qps = len(positions) / (time.perf_counter() - start)
+
+        assert indexed_qps > legacy_qps * 50, \
+            f"{len(rows)} objects: legacy {legacy_qps:.0f} queries/s, indexed {indexed_qps:.0f} queries/s"
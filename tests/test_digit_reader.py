@@ -0,0 +1,211 @@
+"""Tests for lib/detection/digit_reader.py — glyph-template HUD digits,
+on synthetic renders (Hershey digits standing in for the HUD font)."""
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection import digit_reader
+from lib.detection.digit_reader import LEARN_AGREEMENT, GlyphDigitReader, segment_glyphs
+
+DIGITS = '0123456789'
+LEARNED_SCALES = (0.6, 0.9)
+
+
+def render(text, scale=0.8, thickness=2, pad=4, gap=3):
+    """Binarized count image: digits white on black, ``gap`` px apart."""
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    sizes = [cv2.getTextSize(c, font, scale, thickness) for c in text]
+    height = max(s[0][1] for s in sizes)
+    baseline = max(s[1] for s in sizes)
+    width = sum(s[0][0] for s in sizes) + gap * len(text) + 2 * pad
+    img = np.zeros((height + baseline + 2 * pad, width), dtype=np.uint8)
+    x = pad
+    for char, ((w, _), _) in zip(text, sizes):
+        cv2.putText(img, char, (x, height + pad), font, scale, 255, thickness, cv2.LINE_AA)
+        x += w + gap
+    return cv2.threshold(img, 127, 255, cv2.THRESH_BINARY)[1]
+
+
+def teach(reader, text, scale=0.8, times=LEARN_AGREEMENT):
+    """``times`` agreeing EasyOCR reads of ``text``; exemplars added."""
+    return sum(reader.learn(render(text, scale), text) for _ in range(times))
+
+
+@pytest.fixture
+def reader():
+    r = GlyphDigitReader(path=None)
+    for scale in LEARNED_SCALES:
+        assert teach(r, DIGITS, scale, LEARN_AGREEMENT - 1) == 0
+        assert r.learn(render(DIGITS, scale), DIGITS) == 10
+    return r
+
+
+def test_segment_orders_glyphs_and_drops_specks():
+    img = render('407')
+    img[0:2, 0:2] = 255           # speck
+    glyphs = segment_glyphs(img)
+    assert len(glyphs) == 3
+    assert [g.x for g in glyphs] == sorted(g.x for g in glyphs)
+
+
+def test_empty_reader_and_blank_image():
+    assert GlyphDigitReader(path=None).read(render('12')) is None
+    r = GlyphDigitReader(path=None)
+    teach(r, DIGITS)
+    assert r.read(np.zeros((20, 40), dtype=np.uint8)) is None
+
+
+@pytest.mark.parametrize("scale", LEARNED_SCALES)
+def test_reads_every_count(reader, scale):
+    for n in range(1000):
+        result = reader.read(render(str(n), scale))
+        assert result is not None and result.text == str(n), n
+        assert result.confidence >= reader.threshold, n
+
+
+def test_unlearned_scale_is_not_confident_until_learned(reader):
+    assert reader.read_confident(render('58', 0.75)) is None
+    teach(reader, DIGITS, 0.75)
+    assert reader.read_confident(render('58', 0.75)) == '58'
+
+
+def test_learn_rejects_mismatched_text(reader):
+    assert reader.learn(render('12'), '123') == 0
+    assert reader.learn(render('12'), '1a') == 0
+    # Same glyphs again are duplicates.
+    assert reader.learn(render(DIGITS, 0.6), DIGITS) == 0
+
+
+def test_learn_rejects_contradicting_digit(reader):
+    # A '3' glyph labelled 8 conflicts with the learned 3.
+    assert reader.learn(render('3', 0.6), '8') == 0
+    assert reader.read_confident(render('3', 0.6)) == '3'
+
+
+def test_single_misread_is_not_learned():
+    r = GlyphDigitReader(path=None)
+    assert r.learn(render('3'), '8') == 0
+    assert r.known_digits == ''
+    # Later reads disagree with the misread, which never gets its votes.
+    assert teach(r, '3') == 1
+    assert r.known_digits == '3'
+
+
+def test_repeatedly_contradicted_exemplar_is_dropped(reader):
+    # A misread that slipped through: the 0.6 '3' exemplars relabelled as 8.
+    for _ in range(LEARN_AGREEMENT - 1):
+        reader.learn(render('3', 0.6), '8')
+    assert reader.read_confident(render('3', 0.6)) == '3'
+    reader.learn(render('3', 0.6), '8')
+    assert reader.stats()['dropped'] == 1
+    assert reader.read_confident(render('3', 0.6)) is None
+
+
+def test_partially_learned_scale_is_never_confident():
+    # '1' and '7' have no runner-up to beat while '7' is unlearned.
+    r = GlyphDigitReader(path=None)
+    teach(r, '0123456')
+    result = r.read(render('1'))
+    assert result is not None and result.text == '1'
+    assert result.confidence == 0.0
+    teach(r, '789')
+    assert r.read_confident(render('17')) == '17'
+
+
+def test_templates_persist(tmp_path):
+    path = str(tmp_path / 'digit_glyphs.npz')
+    r = GlyphDigitReader(path=path)
+    teach(r, DIGITS)
+    again = GlyphDigitReader(path=path)
+    assert again.known_digits == DIGITS
+    assert again.read_confident(render('250')) == '250'
+    again.reset()
+    assert again.known_digits == ''
+    assert GlyphDigitReader(path=path).known_digits == ''
+
+
+def test_corrupt_templates_ignored(tmp_path):
+    path = tmp_path / 'digit_glyphs.npz'
+    path.write_bytes(b'not a npz')
+    assert GlyphDigitReader(path=str(path)).known_digits == ''
+
+
+def test_stale_or_inconsistent_templates_dropped(tmp_path, reader):
+    vectors, labels, heights = reader._vectors, reader._labels, reader._heights
+    # Files from before agreement was required carry no version.
+    old = tmp_path / 'old.npz'
+    np.savez(old, vectors=vectors, labels=labels, heights=heights)
+    assert GlyphDigitReader(path=str(old)).known_digits == ''
+
+    # A '3' exemplar also stored as an 8: both copies go, the rest stay.
+    bad = tmp_path / 'bad.npz'
+    three = np.flatnonzero(labels == 3)[0]
+    np.savez(bad, version=digit_reader.TEMPLATES_VERSION,
+             vectors=np.vstack([vectors, vectors[three]]),
+             labels=np.append(labels, np.int8(8)), heights=np.append(heights, heights[three]))
+    loaded = GlyphDigitReader(path=str(bad))
+    assert loaded.stats()['templates'] == len(labels) - 1
+    assert loaded.read_confident(render('38', 0.9)) == '38'
+
+
+class _FakeOCR:
+    """OCRManager with EasyOCR replaced by a canned reply."""
+
+    def __init__(self, monkeypatch, reply):
+        from lib.managers.ocr_manager import OCRManager
+        self.manager = OCRManager()
+        self.calls = 0
+
+        def read_numbers(image, **kwargs):
+            self.calls += 1
+            return reply
+        monkeypatch.setattr(self.manager, 'read_numbers', read_numbers)
+        monkeypatch.setattr(self.manager, 'is_ready', lambda timeout=0.1: True)
+
+
+def test_read_digits_falls_back_then_learns(monkeypatch):
+    monkeypatch.setattr(digit_reader, '_reader', GlyphDigitReader(path=None))
+    fake = _FakeOCR(monkeypatch, [(None, '1234567890', 0.99)])
+    for _ in range(LEARN_AGREEMENT):
+        assert fake.manager.read_digits(render('1234567890')) == '1234567890'
+    assert fake.calls == LEARN_AGREEMENT
+    assert fake.manager.read_digits(render('907')) == '907'
+    assert fake.calls == LEARN_AGREEMENT
+
+
+def test_read_digits_checks_easyocr_until_all_digits_learned(monkeypatch):
+    glyphs = GlyphDigitReader(path=None)
+    teach(glyphs, '12345')
+    monkeypatch.setattr(digit_reader, '_reader', glyphs)
+    fake = _FakeOCR(monkeypatch, [(None, '42', 0.99)])
+    assert fake.manager.read_digits(render('42')) == '42'
+    assert fake.manager.read_digits(render('42')) == '42'
+    assert fake.calls == 2
+
+
+def test_read_digits_does_not_learn_unsure_ocr(monkeypatch):
+    monkeypatch.setattr(digit_reader, '_reader', GlyphDigitReader(path=None))
+    fake = _FakeOCR(monkeypatch, [(None, '42', 0.3)])
+    assert fake.manager.read_digits(render('42')) == '42'
+    assert digit_reader.get_digit_reader().known_digits == ''
+
+
+@pytest.mark.benchmark
+def test_glyph_vs_easyocr_benchmark(reader):
+    easyocr = pytest.importorskip('easyocr')
+    ocr = easyocr.Reader(['en'], recognizer='number', verbose=False)
+    images = [render(str(n), 0.9) for n in (7, 42, 120, 365, 999)]
+
+    start = time.perf_counter()
+    glyph_texts = [reader.read_confident(img) for img in images]
+    glyph = (time.perf_counter() - start) / len(images)
+
+    start = time.perf_counter()
+    for img in images:
+        ocr.readtext(cv2.resize(img, None, fx=2, fy=2), allowlist=DIGITS)
+    model = (time.perf_counter() - start) / len(images)
+
+    assert glyph_texts == ['7', '42', '120', '365', '999']
+    assert glyph < model, f"glyph: {glyph * 1e3:.3f} ms/read, EasyOCR: {model * 1e3:.1f} ms/read"
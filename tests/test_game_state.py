@@ -0,0 +1,216 @@
+"""Tests for lib/monitors/game_state.py — game-state gating of monitors."""
+import time
+
+import pytest
+
+from lib.monitors import game_state as game_state_module
+from lib.monitors import scheduler as scheduler_module
+from lib.monitors.base import BaseMonitor
+from lib.monitors.game_state import (
+    BUS, DEAD, GROUNDED, IN_MATCH, LOBBY, MAP_OPEN, OVERLAYS, SKYDIVE, GameState,
+)
+from lib.monitors.scheduler import MonitorScheduler
+
+
+class TestGameState:
+    def test_unknown_allows_everything_but_overlays(self):
+        state = GameState()
+        assert state.activity is None
+        assert state.allows({GROUNDED}, OVERLAYS)
+        state.set_overlay(MAP_OPEN, True)
+        assert not state.allows({GROUNDED}, OVERLAYS)
+        assert state.allows(None)
+
+    def test_activity_gates(self):
+        state = GameState()
+        state.set_activity(LOBBY)
+        assert not state.allows({GROUNDED})
+        assert state.allows(None)
+        state.set_activity(GROUNDED)
+        assert state.allows({GROUNDED})
+        assert state.states == frozenset({GROUNDED})
+
+    def test_only_from(self):
+        state = GameState()
+        state.set_activity(DEAD)
+        assert not state.set_activity(GROUNDED, only_from=(None, LOBBY))
+        assert state.activity == DEAD
+        assert state.set_activity(GROUNDED, only_from=(DEAD,))
+
+    def test_lobby_clears_overlays(self):
+        state = GameState()
+        state.set_activity(GROUNDED)
+        state.set_overlay(MAP_OPEN, True)
+        state.set_activity(LOBBY)
+        assert state.states == frozenset({LOBBY})
+
+    def test_listeners_fire_on_change_only(self):
+        state = GameState()
+        seen = []
+        state.subscribe(lambda s: seen.append(s.states))
+        state.set_activity(BUS)
+        state.set_activity(BUS)
+        state.set_overlay(MAP_OPEN, False)
+        state.set_overlay(MAP_OPEN, True)
+        assert seen == [frozenset({BUS}), frozenset({BUS, MAP_OPEN})]
+
+    def test_disabled_allows_everything(self):
+        state = GameState()
+        state.set_activity(LOBBY)
+        state.set_enabled(False)
+        assert state.allows({GROUNDED}, OVERLAYS)
+
+    def test_bus_counts_as_in_match_without_skydive_detection(self):
+        state = GameState()
+        state.set_activity(BUS)
+        assert state.allows({GROUNDED}) and state.allows({SKYDIVE, GROUNDED})
+        assert not state.allows({LOBBY})
+        state.set_skydive_detection(True)
+        assert not state.allows({GROUNDED})
+        assert state.allows(IN_MATCH)
+
+    def test_unknown_names_rejected(self):
+        state = GameState()
+        with pytest.raises(ValueError):
+            state.set_activity('swimming')
+        with pytest.raises(ValueError):
+            state.set_overlay(GROUNDED, True)
+
+
+class _GatedMonitor(BaseMonitor):
+    _SCHEDULE_PERIOD = 0.1
+    _ACTIVE_STATES = frozenset({GROUNDED, SKYDIVE})
+    _SUSPEND_STATES = OVERLAYS
+
+    def __init__(self):
+        super().__init__()
+        self.ticks = 0
+        self.released = 0
+
+    def tick(self, frames, now):
+        self.ticks += 1
+
+    def _on_wizard_paused(self):
+        self.released += 1
+
+
+class _GroundedMonitor(_GatedMonitor):
+    _ACTIVE_STATES = frozenset({GROUNDED})
+
+
+class TestMonitorGating:
+    @pytest.fixture
+    def env(self, monkeypatch):
+        sched = MonitorScheduler(workers=0)
+        state = GameState()
+        monkeypatch.setattr(scheduler_module, '_scheduler', sched)
+        monkeypatch.setattr(game_state_module, 'game_state', state)
+        monkeypatch.setattr(game_state_module, '_config_hooked', True)
+        return sched, state
+
+    def test_suspends_outside_active_states_and_wakes_next_tick(self, env):
+        sched, state = env
+        state.set_activity(LOBBY)
+        mon = _GatedMonitor()
+        mon.start_monitoring()
+        assert mon.suspended
+        now = time.monotonic()
+        assert sched.run_due(now + 5.0) == []
+        assert mon.ticks == 0
+
+        state.set_activity(GROUNDED)
+        assert not mon.suspended
+        assert sched.run_due(time.monotonic() + 0.001) == [mon.task]
+        assert mon.ticks == 1
+        mon.stop_monitoring()
+
+    def test_overlay_suspends_and_releases(self, env):
+        sched, state = env
+        state.set_activity(GROUNDED)
+        mon = _GatedMonitor()
+        mon.start_monitoring()
+        sched.run_due(time.monotonic() + 0.01)
+        state.set_overlay(MAP_OPEN, True)
+        assert mon.suspended and mon.released == 1
+        assert sched.run_due(time.monotonic() + 5.0) == []
+        state.set_overlay(MAP_OPEN, False)
+        assert sched.run_due(time.monotonic() + 0.01) == [mon.task]
+        assert mon.ticks == 2
+        mon.stop_monitoring()
+
+    def test_suspended_time_is_tracked(self, env):
+        sched, state = env
+        state.set_activity(DEAD)
+        mon = _GatedMonitor()
+        mon.start_monitoring()
+        task = mon.task
+        time.sleep(0.05)
+        state.set_activity(GROUNDED)
+        stats = task.get_stats()
+        assert stats['suspensions'] == 1
+        assert stats['suspended_s'] >= 0.04
+        assert not stats['suspended']
+        mon.stop_monitoring()
+
+    def test_stop_unsubscribes(self, env):
+        sched, state = env
+        mon = _GatedMonitor()
+        mon.start_monitoring()
+        mon.stop_monitoring()
+        state.set_activity(LOBBY)
+        assert not mon.suspended and mon.released == 0
+
+    def test_early_drop_off_og_keeps_monitors_running(self, env):
+        # Non-OG map: no height bar, so nothing moves the state off the bus
+        # until SafeZones even if the player has already landed.
+        sched, state = env
+        mon = _GroundedMonitor()
+        mon.start_monitoring()
+        state.set_activity(GROUNDED)   # Warmup
+        state.set_activity(BUS)        # Aircraft; the player jumps and lands
+        assert not mon.suspended
+        assert sched.run_due(time.monotonic() + 0.2) == [mon.task]
+        assert state.set_activity(GROUNDED, only_from=(None, LOBBY, BUS))  # SafeZones
+        assert not mon.suspended
+        mon.stop_monitoring()
+
+    def test_skydive_grounded_monitor_ticks_on_bus_after_early_drop(self, env):
+        # HealthShieldMonitor's gating: damage after an early drop on a
+        # non-OG map is read before SafeZones.
+        sched, state = env
+        state.set_activity(LOBBY)
+        mon = _GatedMonitor()
+        mon.start_monitoring()
+        assert mon.suspended
+        state.set_activity(BUS)
+        assert not mon.suspended
+        assert sched.run_due(time.monotonic() + 0.2) == [mon.task]
+        assert mon.ticks == 1
+        mon.stop_monitoring()
+
+    def test_bus_suspends_when_height_bar_reports_skydive(self, env):
+        sched, state = env
+        state.set_skydive_detection(True)
+        mon = _GroundedMonitor()
+        mon.start_monitoring()
+        state.set_activity(BUS)
+        assert mon.suspended
+        state.set_activity(SKYDIVE)
+        state.set_activity(GROUNDED)
+        assert not mon.suspended
+        mon.stop_monitoring()
+
+    def test_ungated_monitor_ignores_state(self, env):
+        sched, state = env
+
+        class Plain(_GatedMonitor):
+            _ACTIVE_STATES = None
+            _SUSPEND_STATES = frozenset()
+        state.set_activity(LOBBY)
+        mon = Plain()
+        mon.start_monitoring()
+        assert sched.run_due(time.monotonic() + 0.01) == [mon.task]
+        mon.stop_monitoring()
+
+    def test_in_match_states(self):
+        assert IN_MATCH == {BUS, SKYDIVE, GROUNDED}
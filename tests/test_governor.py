@@ -0,0 +1,86 @@
+"""Tests for lib/monitors/governor.py — monitor CPU budget governor."""
+import pytest
+
+from lib.monitors.governor import (
+    PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, CpuGovernor,
+)
+
+ALL = (PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH)
+
+
+def _over_budget(gov, now, cpu=1.0):
+    gov.record('busy', PRIORITY_LOW, cpu, cpu, now)
+
+
+class TestCpuGovernor:
+    def test_load_over_window(self):
+        gov = CpuGovernor(budget=0.1)
+        gov.record('a', PRIORITY_LOW, 0.2, 0.3, 100.0)
+        gov.record('b', PRIORITY_HIGH, 0.3, 0.3, 101.0)
+        assert gov.load(101.0) == pytest.approx(0.5 / CpuGovernor.WINDOW)
+        assert gov.load(100.0 + CpuGovernor.WINDOW + 0.5) == pytest.approx(0.3 / CpuGovernor.WINDOW)
+
+    def test_stretches_lowest_tier_first(self):
+        gov = CpuGovernor(budget=0.01)
+        t = 100.0
+        _over_budget(gov, t)
+        decision = gov.evaluate(ALL, t)
+        assert decision['action'] == 'stretch' and decision['priority'] == PRIORITY_LOW
+        assert gov.stretch(PRIORITY_LOW) == pytest.approx(CpuGovernor.STEP)
+        assert gov.stretch(PRIORITY_NORMAL) == 1.0
+
+    def test_caps_then_moves_up_but_never_high(self):
+        gov = CpuGovernor(budget=0.01)
+        t = 100.0
+        for _ in range(20):
+            _over_budget(gov, t)
+            gov.evaluate(ALL, t)
+            t += CpuGovernor.EVALUATE_EVERY
+        assert gov.stretch(PRIORITY_LOW) == CpuGovernor.MAX_STRETCH
+        assert gov.stretch(PRIORITY_NORMAL) == CpuGovernor.MAX_STRETCH
+        assert gov.stretch(PRIORITY_HIGH) == 1.0
+
+    def test_rate_limited(self):
+        gov = CpuGovernor(budget=0.01)
+        _over_budget(gov, 100.0)
+        assert gov.evaluate(ALL, 100.0) is not None
+        assert gov.evaluate(ALL, 100.0 + CpuGovernor.EVALUATE_EVERY / 2) is None
+
+    def test_relaxes_highest_stretched_tier_first(self):
+        gov = CpuGovernor(budget=0.01)
+        t = 100.0
+        for _ in range(6):
+            _over_budget(gov, t)
+            gov.evaluate(ALL, t)
+            t += CpuGovernor.EVALUATE_EVERY
+        assert gov.stretch(PRIORITY_NORMAL) > 1.0
+        t += CpuGovernor.WINDOW + 1  # samples age out, load drops to zero
+        decision = gov.evaluate(ALL, t)
+        assert decision['action'] == 'relax' and decision['priority'] == PRIORITY_NORMAL
+        for _ in range(20):
+            t += CpuGovernor.EVALUATE_EVERY
+            gov.evaluate(ALL, t)
+        assert gov.stretch(PRIORITY_LOW) == 1.0
+        assert gov.stretch(PRIORITY_NORMAL) == 1.0
+
+    def test_within_budget_no_decision(self):
+        gov = CpuGovernor(budget=1.0)
+        gov.record('a', PRIORITY_LOW, 0.01, 0.01, 100.0)
+        assert gov.evaluate(ALL, 100.0) is None
+
+    def test_costs_and_summary(self):
+        gov = CpuGovernor(budget=0.01)
+        for i in range(4):
+            gov.record('bloom', PRIORITY_LOW, 0.002, 0.004, 100.0 + i * 0.1)
+        gov.record('storm', PRIORITY_NORMAL, 0.05, 0.06, 100.5)
+        costs = gov.costs(101.0)
+        assert costs['bloom']['runs'] == 4
+        assert costs['bloom']['cpu_ms_avg'] == pytest.approx(2.0)
+        assert costs['bloom']['wall_ms_avg'] == pytest.approx(4.0)
+        gov.evaluate(ALL, 101.0)
+        stats = gov.get_stats(101.0)
+        assert stats['stretch'] == {'low': CpuGovernor.STEP}
+        assert stats['decisions'][-1]['action'] == 'stretch'
+        text = gov.summary(101.0)
+        assert 'Throttled: low priority' in text
+        assert text.index('storm') < text.index('bloom')
@@ -0,0 +1,102 @@
+"""Tests for lib/detection/health_bars.py — health / shield bar reader."""
+import numpy as np
+import pytest
+
+from lib.detection.coordinate_config import CURRENT_COORDINATES, OG_COORDINATES
+from lib.detection.health_bars import (
+    HealthShieldReader, VALUES, bar_positions, read_bar_value,
+)
+
+COORDS = {'current': CURRENT_COORDINATES.health_shield, 'og': OG_COORDINATES.health_shield}
+EMPTY = (40, 40, 48)
+
+
+def _legacy_positions(start_x, decreases):
+    """Mark positions as the old per-pixel scan walked them."""
+    xs, x = [], start_x
+    for i in range(100, 0, -1):
+        xs.append(x)
+        x -= decreases[i % len(decreases)] if decreases else 1
+    return xs
+
+
+def _strip(reader, name, value, color, noise=0, seed=0):
+    """RGB row of a bar filled up to ``value`` (0 = empty)."""
+    region = reader.strips[name]
+    row = np.empty((1, region['width'], 3), np.uint8)
+    row[:] = EMPTY
+    if value:
+        marks = bar_positions(reader.coords.health_x if name == 'health' else reader.coords.shield_x,
+                              reader.coords.health_decreases if name == 'health'
+                              else reader.coords.shield_decreases) - region['left']
+        end = marks[100 - value]
+        row[0, :end + 1] = color
+    if noise:
+        rng = np.random.default_rng(seed)
+        row = np.clip(row.astype(np.int16) + rng.integers(-noise, noise + 1, row.shape), 0, 255).astype(np.uint8)
+    return row
+
+
+class TestBarPositions:
+    @pytest.mark.parametrize('decreases', [[4, 3, 3], CURRENT_COORDINATES.health_shield.health_decreases, []])
+    def test_matches_legacy_walk(self, decreases):
+        assert bar_positions(423, decreases).tolist() == _legacy_positions(423, decreases)
+
+    def test_read_bar_value(self):
+        row = np.zeros((10, 3), np.uint8)
+        marks = np.array([8, 5, 2])
+        row[:6] = (200, 10, 10)
+        assert read_bar_value(row, marks, (200, 10, 10), 5) == VALUES[1]
+        assert read_bar_value(np.zeros((10, 3), np.uint8), marks, (200, 10, 10), 5) is None
+
+
+class TestHealthShieldReader:
+    @pytest.mark.parametrize('coords_name', sorted(COORDS))
+    def test_every_fill_percentage(self, coords_name):
+        coords = COORDS[coords_name]
+        reader = HealthShieldReader(coords)
+        for value in range(0, 101):
+            frames = {
+                'health': _strip(reader, 'health', value, coords.health_color, noise=12, seed=value),
+                'shield': _strip(reader, 'shield', 100 - value, coords.shield_color, noise=12, seed=value + 1),
+            }
+            health, shield = reader.read(frames)
+            assert health == (value or None)
+            assert shield == ((100 - value) or None)
+
+    def test_strips_are_one_pixel_rows(self):
+        reader = HealthShieldReader(COORDS['current'])
+        for name, region in reader.strips.items():
+            assert region['height'] == 1
+            assert region['left'] + region['width'] - 1 == 408
+        assert reader.strips['health']['top'] == 1000
+
+    def test_cache_on_unchanged_pixels(self):
+        coords = COORDS['og']
+        reader = HealthShieldReader(coords)
+        frames = {'health': _strip(reader, 'health', 60, coords.health_color),
+                  'shield': _strip(reader, 'shield', 25, coords.shield_color)}
+        assert reader.read(frames) == (60, 25)
+        assert reader.read({k: v.copy() for k, v in frames.items()}) == (60, 25)
+        assert reader.cache_hits == 1
+        frames['health'] = _strip(reader, 'health', 59, coords.health_color)
+        assert reader.read(frames) == (59, 25)
+        assert reader.cache_hits == 1
+
+    def test_missing_strip(self):
+        coords = COORDS['og']
+        reader = HealthShieldReader(coords)
+        assert reader.read({'health': _strip(reader, 'health', 40, coords.health_color)}) == (40, None)
+
+    def test_capture_uses_strips(self):
+        coords = COORDS['current']
+        reader = HealthShieldReader(coords)
+        grabbed = []
+
+        def capture(region, fmt):
+            grabbed.append((region, fmt))
+            name = 'health' if region['top'] == coords.health_y else 'shield'
+            return _strip(reader, name, 77, coords.health_color if name == 'health' else coords.shield_color)
+        assert reader.capture(capture) == (77, 77)
+        assert sorted(r['top'] for r, _ in grabbed) == [coords.shield_y, coords.health_y]
+        assert all(fmt == 'rgb' for _, fmt in grabbed)
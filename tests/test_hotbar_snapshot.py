@@ -0,0 +1,162 @@
+"""Tests for lib/detection/hotbar_snapshot.py — resolving a synthetic
+hotbar strip on demand and caching each slot until its pixels change."""
+import numpy as np
+import pytest
+
+from lib.detection.hotbar_snapshot import (
+    AMMO_SEARCH_RECT, HotbarLayout, HotbarSnapshotter, crop, find_divider, selected_slot,
+)
+from lib.detection.rarity import RarityClassifier
+
+PRIMARY = [(1502, 931, 1565, 975), (1583, 931, 1646, 975), (1665, 931, 1728, 975),
+           (1747, 931, 1810, 975), (1828, 931, 1891, 975)]
+SECONDARY = [(x, y - 11, x2, y2 - 11) for x, y, x2, y2 in PRIMARY]
+CONSUMABLE = (1314, 927, 1392, 971)
+AMMO_Y = {'current': (929, 962), 'reserve': (936, 962)}
+
+PALETTE = {'Common': (116, 122, 128), 'Rare': (0, 88, 191), 'Epic': (118, 45, 211)}
+DIVIDER = [(0, 0), (1, -1), (2, -2), (3, -3)]
+
+
+@pytest.fixture
+def layout():
+    return HotbarLayout.build(PRIMARY, SECONDARY, CONSUMABLE, AMMO_Y)
+
+
+def _strip(layout, rarities=('Rare', 'Epic', None, 'Common', None), selected=1):
+    left, top, right, bottom = layout.strip
+    strip = np.full((bottom - top, right - left, 3), 20, dtype=np.uint8)
+    for i, rarity in enumerate(rarities):
+        x0, y0, x1, y1 = PRIMARY[i]
+        if i == selected:
+            strip[y0 - top - 3:y1 - top + 3, x0 - left - 3:x1 - left + 3] = 255
+        slot = strip[y0 - top:y1 - top, x0 - left:x1 - left]
+        slot[:] = PALETTE[rarity][::-1] if rarity else 20
+        slot[8:-8, 8:-8] = 10 * i
+    return strip
+
+
+def _snapshotter(layout, calls):
+    classifier = RarityClassifier(PALETTE, tolerance=30)
+
+    def match_item(image):
+        calls['match'] += 1
+        return ('Item %d' % image[10, 10, 0], 0.9) if image[10, 10, 0] else (None, 0)
+
+    def classify(images):
+        calls['rarity'] += 1
+        return [r.rarity if r else None for r in classifier.classify_slots(images)]
+
+    def counts(snapshot):
+        calls['counts'] += 1
+        return None, None, 3
+
+    return HotbarSnapshotter(layout, match_item, classify, counts)
+
+
+def test_layout_covers_every_region(layout):
+    left, top, right, bottom = layout.strip
+    for rect in PRIMARY + SECONDARY + [CONSUMABLE, AMMO_SEARCH_RECT]:
+        assert left <= rect[0] and top <= rect[1]
+        assert min(rect[2], 1920) <= right and min(rect[3], 1080) <= bottom
+    assert layout.ammo_rows == AMMO_Y
+    assert HotbarLayout.build(PRIMARY, SECONDARY, CONSUMABLE, AMMO_Y) == layout
+
+
+def test_resolves_every_slot(layout):
+    calls = {'match': 0, 'rarity': 0, 'counts': 0}
+    snapshot = _snapshotter(layout, calls).update(_strip(layout))
+    assert [s.rarity for s in snapshot.slots] == ['Rare', 'Epic', None, 'Common', None]
+    assert [s.primary[0] for s in snapshot.slots] == [None, 'Item 10', 'Item 20', 'Item 30', 'Item 40']
+    assert snapshot.selected == 1
+    assert calls == {'match': 10, 'rarity': 5, 'counts': 0}
+    np.testing.assert_array_equal(snapshot.crop(PRIMARY[3]),
+                                  crop(snapshot.strip, snapshot.origin, PRIMARY[3]))
+
+
+def test_slots_resolve_only_when_asked(layout):
+    calls = {'match': 0, 'rarity': 0, 'counts': 0}
+    snapshot = _snapshotter(layout, calls).update(_strip(layout))
+    assert calls == {'match': 0, 'rarity': 0, 'counts': 0}
+    assert snapshot.primary(2) == ('Item 20', 0.9)
+    assert calls == {'match': 1, 'rarity': 0, 'counts': 0}
+    assert snapshot.rarity(1) == 'Epic'
+    assert snapshot.primary(7) == (None, 0)
+    assert calls == {'match': 1, 'rarity': 1, 'counts': 0}
+
+
+def test_slot_switch_is_a_cache_read(layout):
+    calls = {'match': 0, 'rarity': 0, 'counts': 0}
+    snapshotter = _snapshotter(layout, calls)
+    first = snapshotter.update(_strip(layout, selected=1))
+    assert first.primary(1) == ('Item 10', 0.9) and first.rarity(1) == 'Epic'
+
+    # Switching slots redraws the highlight (and the ammo counters).
+    switched = snapshotter.update(_strip(layout, selected=3))
+    assert switched.selected == 3
+    assert switched.primary(1) == ('Item 10', 0.9) and switched.rarity(1) == 'Epic'
+    assert calls == {'match': 1, 'rarity': 1, 'counts': 0}
+    # The selection frame reaches into the secondary regions; still a hit.
+    first.secondary(3)
+    switched.secondary(3)
+    assert calls['match'] == 2
+    switched.primary(3)
+    assert calls['match'] == 3
+
+
+def test_changed_slot_is_resolved_again(layout):
+    calls = {'match': 0, 'rarity': 0, 'counts': 0}
+    snapshotter = _snapshotter(layout, calls)
+    snapshotter.update(_strip(layout)).rarity(0)
+    swapped = snapshotter.update(_strip(layout, rarities=('Epic', 'Epic', None, 'Common', None)))
+    assert swapped.rarity(0) == 'Epic'
+    assert calls['rarity'] == 2
+
+    swapped.rarity(0)
+    snapshotter.invalidate()
+    swapped.rarity(0)
+    assert snapshotter.stats()['resolves'] == 3
+    assert snapshotter.stats()['cache_hits'] == 1
+
+
+def test_counts_are_lazy_and_read_once(layout):
+    calls = {'match': 0, 'rarity': 0, 'counts': 0}
+    snapshot = _snapshotter(layout, calls).update(_strip(layout))
+    assert calls['counts'] == 0
+    assert snapshot.counts() == (None, None, 3)
+    assert snapshot.counts() == (None, None, 3)
+    assert calls['counts'] == 1
+
+
+def test_no_selection_without_highlight(layout):
+    strip = _strip(layout, selected=None)
+    assert selected_slot(strip, layout.strip[:2], PRIMARY) is None
+
+
+def _old_detect_divider(screenshot, pattern):
+    height, width = screenshot.shape[:2]
+    white = lambda p: np.all(p[:3] == [255, 255, 255])
+    for x in range(width - 3):
+        y = 57
+        if all(0 <= x + dx < width and 0 <= y + dy < height and white(screenshot[y + dy, x + dx])
+               for dx, dy in pattern):
+            others = [(dx, dy) for dx in range(-1, 5) for dy in range(-20, 1) if (dx, dy) not in pattern]
+            if all(0 <= x + dx < width and 0 <= y + dy < height and not white(screenshot[y + dy, x + dx])
+                   for dx, dy in others):
+                return x, y
+    return None
+
+
+def test_find_divider_matches_pixel_loop():
+    rng = np.random.default_rng(0)
+    for trial in range(20):
+        shot = np.zeros((200, 120, 3), dtype=np.uint8)
+        if trial % 4:
+            x = int(rng.integers(0, 120))
+            for dx, dy in DIVIDER:
+                if 0 <= x + dx < 120:
+                    shot[57 + dy, x + dx] = 255
+        if trial % 3 == 0:
+            shot[int(rng.integers(30, 60)), int(rng.integers(0, 120))] = 255
+        assert find_divider(shot, DIVIDER) == _old_detect_divider(shot, DIVIDER)
+    assert find_divider(np.zeros((40, 50, 3), dtype=np.uint8), DIVIDER) is None
@@ -0,0 +1,174 @@
+"""Tests for lib/detection/lobby_reader.py — layout fingerprint cache and
+the warm status summary, on synthetic 1920x1080 mode-select screens."""
+import numpy as np
+import pytest
+
+from lib.detection import lobby_reader as lr
+
+BACKGROUND = (25, 13, 70)
+UNSELECTED = (82, 48, 217)
+SELECTED = (0, 85, 254)
+GREEN = (200, 255, 0)
+WHITE = (255, 255, 255)
+BUTTON_CENTERS = (1450, 1560, 1670, 1780)
+
+
+def _screen(selected=1, team_y=350, ranked_on=False, fill_on=True):
+    """BR mode-select screen: Build selected, four team buttons at
+    ``team_y``, ranked toggle above and fill toggle below them."""
+    img = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    img[:] = BACKGROUND
+    img[945:965, 1190:1210] = (255, 230, 0)     # PLAY
+    img[945:965, 1590:1610] = (160, 40, 220)    # DONE
+    img[140:200, 1200:1350] = SELECTED          # Build
+    img[140:200, 1500:1630] = UNSELECTED        # Zero Build
+    for i, cx in enumerate(BUTTON_CENTERS):
+        img[team_y - 20:team_y + 20, cx - 30:cx + 30] = SELECTED if i == selected else UNSELECTED
+    ranked_y = team_y - 90
+    img[ranked_y - 10:ranked_y + 10, 1650:1730] = GREEN if ranked_on else UNSELECTED
+    if not ranked_on:
+        img[ranked_y - 10:ranked_y + 10, 1655:1685] = WHITE
+    fill_y = team_y + 140
+    img[fill_y - 10:fill_y + 10, 1650:1730] = GREEN if fill_on else UNSELECTED
+    if not fill_on:
+        img[fill_y - 10:fill_y + 10, 1655:1685] = WHITE
+    return img
+
+
+@pytest.fixture(autouse=True)
+def _fresh(monkeypatch):
+    monkeypatch.setattr(lr, '_get_current_preset', lambda: lr.MODE_PRESETS['main'])
+    lr.clear_layout_cache()
+    lr.invalidate_warm_status()
+    yield
+    lr.clear_layout_cache()
+    lr.invalidate_warm_status()
+
+
+def test_summary():
+    text, _ = lr.summarize_mode_status(_screen())
+    assert text == "Build, Ranked Off, Duo, Fill"
+    text, _ = lr.summarize_mode_status(_screen(selected=3, ranked_on=True, fill_on=False))
+    assert text == "Build, Ranked On, Squad, No Fill"
+
+
+def test_not_on_mode_screen():
+    blank = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    assert lr.summarize_mode_status(blank)[0] == "Not on a mode selection screen"
+
+
+def test_fingerprint_ignores_selection_but_not_layout():
+    preset = lr.MODE_PRESETS['main']
+    base = lr.layout_fingerprint(_screen(), preset)
+    assert lr.layout_fingerprint(_screen(selected=2, ranked_on=True), preset) == base
+    assert lr.layout_fingerprint(_screen(team_y=390), preset) != base
+    assert lr.layout_fingerprint(_screen(), lr.MODE_PRESETS['o g']) != base
+    assert lr.layout_fingerprint(np.zeros((100, 100, 3), dtype=np.uint8), preset) is None
+
+
+def test_layout_reused_while_fingerprint_matches(monkeypatch):
+    layout, selected = lr.find_layout(_screen())
+    assert selected == 'Duo'
+    assert layout['team_y'] == 330  # top row of the buttons
+    assert set(layout['buttons']) == {'Solo', 'Duo', 'Trio', 'Squad'}
+
+    scans = []
+    original = lr._scan_team_clusters
+    monkeypatch.setattr(lr, '_scan_team_clusters', lambda *a: scans.append(1) or original(*a))
+
+    cached, selected = lr.find_layout(_screen(selected=3))
+    assert cached is layout
+    assert selected == 'Squad'
+    assert scans == []
+
+    moved, selected = lr.find_layout(_screen(selected=0, team_y=390))
+    assert scans == [1]
+    assert moved['team_y'] == 370
+    assert selected == 'Solo'
+
+
+def test_cached_layout_reads_match_full_scan():
+    for selected in range(4):
+        for ranked_on in (False, True):
+            screen = _screen(selected=selected, ranked_on=ranked_on)
+            lr.clear_layout_cache()
+            fresh, _ = lr.summarize_mode_status(screen)
+            cached, _ = lr.summarize_mode_status(screen)
+            assert cached == fresh
+
+
+def test_warm_status_age_and_invalidation():
+    assert lr.prepare_mode_status(_screen(), now=100.0) == "Build, Ranked Off, Duo, Fill"
+    assert lr.warm_mode_status(now=100.0 + lr.WARM_STATUS_MAX_AGE / 2) == "Build, Ranked Off, Duo, Fill"
+    assert lr.warm_mode_status(now=100.0 + lr.WARM_STATUS_MAX_AGE + 0.1) is None
+    lr.invalidate_warm_status()
+    assert lr.warm_mode_status(now=100.0) is None
+
+
+def test_unchanged_screen_only_refreshes_age(monkeypatch):
+    screen = _screen()
+    lr.prepare_mode_status(screen, now=100.0)
+    calls = []
+    original = lr.summarize_mode_status
+    monkeypatch.setattr(lr, 'summarize_mode_status', lambda s: calls.append(1) or original(s))
+
+    lr.prepare_mode_status(screen.copy(), now=101.0)
+    assert calls == []
+    assert lr.warm_mode_status(now=102.0) == "Build, Ranked Off, Duo, Fill"
+
+    assert lr.prepare_mode_status(_screen(selected=0), now=103.0) == "Build, Ranked Off, Solo"
+    assert calls == [1]
+
+
+def _animate(screen, seed):
+    """Shimmer the lobby background the way the animated backdrop does."""
+    rng = np.random.default_rng(seed)
+    out = screen.astype(np.int16)
+    background = np.all(screen == BACKGROUND, axis=-1)
+    out[background] += rng.integers(-12, 13, size=(int(background.sum()), 3))
+    return np.clip(out, 0, 255).astype(np.uint8)
+
+
+def test_fingerprint_ignores_animated_background():
+    base = lr.status_fingerprint(_screen())
+    assert lr.status_fingerprint(_animate(_screen(), 1)) == base
+    assert lr.status_fingerprint(_animate(_screen(), 2)) == base
+    assert lr.status_fingerprint(_screen(selected=2)) != base
+    assert lr.status_fingerprint(_screen(fill_on=False)) != base
+    assert lr.status_fingerprint(np.zeros((100, 100, 3), dtype=np.uint8)) is None
+
+
+def _status_only(screen):
+    """What ``capture_status_screen`` returns for ``screen``."""
+    frames = {name: screen[r['top']:r['top'] + r['height'], r['left']:r['left'] + r['width']]
+              for name, r in lr.status_regions().items()}
+    return lr.compose_status_screen(frames)
+
+
+def test_status_regions_hold_everything_the_summary_reads():
+    for screen in (_screen(), _screen(selected=0), _screen(fill_on=False)):
+        status = _status_only(screen)
+        assert lr.summarize_mode_status(status) == lr.summarize_mode_status(screen)
+        assert lr.status_fingerprint(status) == lr.status_fingerprint(screen)
+    assert lr.compose_status_screen({'panel': np.zeros((620, 700, 3), dtype=np.uint8)}) is None
+
+
+def test_read_mode_status_checks_panel_before_speaking(monkeypatch):
+    spoken, calls = [], []
+    original = lr.summarize_mode_status
+    monkeypatch.setattr(lr, 'safe_speak', spoken.append)
+    monkeypatch.setattr(lr, '_build_debug_composite', lambda *a: None)
+    monkeypatch.setattr(lr, 'summarize_mode_status', lambda s: calls.append(1) or original(s))
+
+    lr.prepare_mode_status(_screen())
+    assert calls == [1]
+
+    # Same settings, different background frame: the warm summary is spoken.
+    monkeypatch.setattr(lr, 'capture_status_screen', lambda: _status_only(_animate(_screen(), 3)))
+    lr.read_mode_status()
+    assert spoken == ["Build, Ranked Off, Duo, Fill"] and calls == [1]
+
+    # Changed in game (no FA11y click to invalidate): the screen is re-read.
+    monkeypatch.setattr(lr, 'capture_status_screen', lambda: _status_only(_screen(selected=0)))
+    lr.read_mode_status()
+    assert spoken[-1] == "Build, Ranked Off, Solo" and calls == [1, 1]
@@ -0,0 +1,259 @@
+"""Tests for lib/monitors/scheduler.py — shared monitor scheduler."""
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from lib.monitors import scheduler as scheduler_module
+from lib.monitors.base import BaseMonitor
+from lib.monitors.scheduler import (
+    PRIORITY_HIGH, PRIORITY_LOW, MonitorScheduler, merge_rects,
+)
+
+MATERIAL_ICON_AREA = {'left': 480, 'top': 675, 'width': 63, 'height': 51}
+MATERIAL_COUNT_AREA = {'left': 544, 'top': 673, 'width': 79, 'height': 47}
+CROSSHAIR = {'left': 810, 'top': 390, 'width': 300, 'height': 300}
+
+
+class FakeScreen:
+    """Capture stub: a deterministic BGRA 'screen' that counts grabs."""
+
+    def __init__(self):
+        ys, xs = np.mgrid[:1080, :1920]
+        self.screen = np.dstack([xs % 256, ys % 256, (xs // 256 + ys // 256) % 256,
+                                 np.full_like(xs, 255)]).astype(np.uint8)
+        self.grabs = []
+
+    def __call__(self, region):
+        self.grabs.append(region)
+        l, t = region['left'], region['top']
+        return self.screen[t:t + region['height'], l:l + region['width']].copy()
+
+    def expected(self, region):
+        l, t = region['left'], region['top']
+        return self.screen[t:t + region['height'], l:l + region['width']]
+
+
+def _sync(**kwargs):
+    return MonitorScheduler(workers=0, **kwargs)
+
+
+class TestMergeRects:
+    def test_adjacent_regions_merge(self):
+        rects = [(480, 675, 543, 726), (544, 673, 623, 720)]
+        assert merge_rects(rects) == [(480, 673, 623, 726)]
+
+    def test_distant_regions_stay_apart(self):
+        rects = [(0, 0, 10, 10), (500, 500, 510, 510)]
+        assert merge_rects(rects) == rects
+
+    def test_duplicates_collapse(self):
+        assert merge_rects([(0, 0, 5, 5), (0, 0, 5, 5)]) == [(0, 0, 5, 5)]
+
+
+class TestMonitorScheduler:
+    def test_runs_due_tasks_with_sliced_frames(self):
+        screen = FakeScreen()
+        sched = _sync(capture=screen)
+        seen = {}
+        sched.register(lambda frames, now: seen.update(frames), 0.3,
+                       regions=lambda: {'icon': MATERIAL_ICON_AREA, 'count': MATERIAL_COUNT_AREA})
+        sched.run_due(time.monotonic() + 0.01)
+        assert len(screen.grabs) == 1
+        assert np.array_equal(seen['icon'], screen.expected(MATERIAL_ICON_AREA))
+        assert np.array_equal(seen['count'], screen.expected(MATERIAL_COUNT_AREA))
+
+    def test_shared_region_grabbed_once(self):
+        screen = FakeScreen()
+        sched = _sync(capture=screen)
+        got = []
+        for _ in range(3):
+            sched.register(lambda frames, now: got.append(frames['x']), 0.1,
+                           regions=lambda: {'x': CROSSHAIR})
+        started = sched.run_due(time.monotonic() + 0.01)
+        assert len(started) == 3
+        assert len(screen.grabs) == 1
+        assert all(np.array_equal(f, screen.expected(CROSSHAIR)) for f in got)
+
+    def test_convert_format(self):
+        screen = FakeScreen()
+        sched = _sync(capture=screen)
+        seen = {}
+        sched.register(lambda frames, now: seen.update(frames), 0.1,
+                       regions=lambda: {'x': CROSSHAIR}, convert_format='rgb')
+        sched.run_due(time.monotonic() + 0.01)
+        raw = screen.expected(CROSSHAIR)
+        assert seen['x'].shape == (300, 300, 3)
+        assert np.array_equal(seen['x'], raw[:, :, 2::-1])
+
+    def test_no_regions_no_capture(self):
+        screen = FakeScreen()
+        sched = _sync(capture=screen)
+        calls = []
+        sched.register(lambda frames, now: calls.append(frames), 0.1, regions=lambda: {})
+        sched.run_due(time.monotonic() + 0.01)
+        assert calls == [{}]
+        assert screen.grabs == []
+
+    def test_period_and_return_delay(self):
+        sched = _sync(capture=FakeScreen())
+        start = time.monotonic()
+        task = sched.register(lambda frames, now: 2.0, 0.1)
+        sched.run_due(start + 0.01)
+        assert task.runs == 1
+        assert sched.run_due(start + 1.0) == []
+        assert sched.run_due(start + 2.1) == [task]
+
+    def test_cancelled_task_not_run(self):
+        sched = _sync(capture=FakeScreen())
+        task = sched.register(lambda frames, now: None, 0.1)
+        task.cancel()
+        assert sched.run_due(time.monotonic() + 1.0) == []
+
+    def test_errors_are_counted_and_rescheduled(self):
+        sched = _sync(capture=FakeScreen())
+        start = time.monotonic()
+
+        def boom(frames, now):
+            raise RuntimeError("boom")
+        task = sched.register(boom, 0.1)
+        sched.run_due(start + 0.01)
+        assert task.errors == 1
+        assert sched.run_due(start + 0.5) == [task]
+
+    def test_governor_stretches_low_priority_period(self):
+        sched = _sync(capture=FakeScreen(), budget=0.01)
+        start = time.monotonic()
+        high = sched.register(lambda frames, now: None, 0.1, priority=PRIORITY_HIGH)
+        low = sched.register(lambda frames, now: None, 0.1, priority=PRIORITY_LOW)
+        sched.governor.record('spin', PRIORITY_LOW, 1.0, 1.0, start)
+        sched.run_due(start + 0.01)
+        assert sched.governor.stretch(PRIORITY_LOW) > 1.0
+        assert sched.governor.stretch(PRIORITY_HIGH) == 1.0
+        assert low.due > high.due
+        stats = sched.get_stats()
+        assert stats['budget'] == 0.01
+        assert 'spin' in stats['monitors']
+
+    def test_suspend_and_resume(self):
+        sched = _sync(capture=FakeScreen())
+        start = time.monotonic()
+        task = sched.register(lambda frames, now: None, 0.1)
+        sched.suspend(task, start)
+        assert sched.run_due(start + 1.0) == []
+        sched.resume(task, start + 1.0)
+        assert task.suspended_seconds() == pytest.approx(1.0)
+        # Due immediately, and only once despite the stale heap entry.
+        assert sched.run_due(start + 1.0) == [task]
+        assert sched.run_due(start + 1.05) == []
+        assert sched.run_due(start + 1.11) == [task]
+
+    def test_threaded_dispatch(self):
+        sched = MonitorScheduler(workers=2, capture=FakeScreen())
+        fired = threading.Event()
+        counts = []
+
+        def cb(frames, now):
+            counts.append(now)
+            if len(counts) >= 3:
+                fired.set()
+        try:
+            sched.register(cb, 0.01, regions=lambda: {'x': CROSSHAIR})
+            assert fired.wait(2.0)
+            assert sched.get_stats()['grabs'] >= 3
+        finally:
+            sched.shutdown()
+
+    def test_slow_blocking_ticks_do_not_starve_fast_tasks(self):
+        # Two OCR-style ticks that each hold a thread for a second would
+        # take both shared workers; the 50 ms task must keep its cadence.
+        sched = MonitorScheduler(workers=2, capture=FakeScreen())
+        slow_started = threading.Barrier(3)
+        fast_runs = []
+
+        def slow(frames, now):
+            try:
+                slow_started.wait(timeout=2.0)
+            except threading.BrokenBarrierError:
+                pass
+            time.sleep(1.0)
+
+        try:
+            sched.register(slow, 0.05, name='ocr-a', blocking=True)
+            sched.register(slow, 0.05, name='ocr-b', blocking=True)
+            sched.register(lambda frames, now: fast_runs.append(time.monotonic()), 0.05,
+                           priority=PRIORITY_HIGH, name='fast')
+            slow_started.wait(timeout=2.0)
+            start = time.monotonic()
+            time.sleep(0.6)
+            during = [t for t in fast_runs if t >= start]
+            assert len(during) >= 4
+            gaps = np.diff([start] + during)
+            assert gaps.max() < 0.3
+            assert sched.get_stats()['tasks']['ocr-a']['blocking']
+        finally:
+            sched.shutdown()
+
+
+class _TickMonitor(BaseMonitor):
+    _SCHEDULE_PERIOD = 0.1
+
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    def capture_regions(self):
+        return {'crosshair': CROSSHAIR}
+
+    def tick(self, frames, now):
+        self.frames.append(frames)
+
+
+class TestScheduledBaseMonitor:
+    @pytest.fixture
+    def sched(self, monkeypatch):
+        sched = _sync(capture=FakeScreen())
+        monkeypatch.setattr(scheduler_module, '_scheduler', sched)
+        return sched
+
+    def test_registers_instead_of_thread(self, sched):
+        mon = _TickMonitor()
+        mon.start_monitoring()
+        assert mon.running and mon.thread is None and mon.task is not None
+        sched.run_due(time.monotonic() + 0.01)
+        assert mon.frames[0]['crosshair'].shape == (300, 300, 4)
+        mon.stop_monitoring()
+        assert not mon.running and mon.task is None
+        assert sched.run_due(time.monotonic() + 1.0) == []
+
+    def test_start_is_idempotent(self, sched):
+        mon = _TickMonitor()
+        mon.start_monitoring()
+        mon.start_monitoring()
+        assert len(sched._tasks) == 1
+        mon.stop_monitoring()
+
+
+class TestMonitorSchedulerBenchmark:
+    def test_batched_grabs_vs_per_monitor(self):
+        """Grabs over 3 s of simulated ticks: per-monitor loops vs batched."""
+        screen = FakeScreen()
+        sched = _sync(capture=screen)
+        regions = {
+            'bloom': (0.1, {'crosshair': CROSSHAIR}),
+            'material': (0.3, {'icon': MATERIAL_ICON_AREA, 'count': MATERIAL_COUNT_AREA}),
+            'bloom_twin': (0.1, {'crosshair': CROSSHAIR}),
+        }
+        legacy_grabs = 0
+        for name, (period, regs) in regions.items():
+            sched.register(lambda frames, now: None, period, regions=lambda r=regs: r, name=name)
+            legacy_grabs += int(3.0 / period) * len(regs)
+        start = time.monotonic()
+        t = start
+        while t < start + 3.0:
+            t += 0.01
+            sched.run_due(t)
+        stats = sched.get_stats()
+        assert stats['grabs'] < legacy_grabs * 0.6, \
+            f"per-monitor grabs {legacy_grabs}, batched grabs {stats['grabs']}"
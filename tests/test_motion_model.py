@@ -0,0 +1,81 @@
+"""Tests for lib/detection/motion_model.py — pose dead-reckoning between fixes."""
+import pytest
+
+from lib.detection.motion_model import MotionModel
+
+
+class TestPositionExtrapolation:
+    def test_no_data_predicts_nothing(self):
+        model = MotionModel()
+        assert model.predict(0.0) == (None, None)
+
+    def test_constant_velocity_is_extrapolated(self):
+        model = MotionModel()
+        for i in range(5):
+            model.add_position_fix((100 + 4 * i, 200), timestamp=i * 0.5)
+        position, _ = model.predict(2.0 + 0.25)
+        assert position[0] == pytest.approx(118.0)
+        assert position[1] == pytest.approx(200.0)
+
+    def test_extrapolation_is_capped(self):
+        model = MotionModel(max_extrapolation=1.0, stale_after=10.0)
+        model.add_position_fix((0, 0), timestamp=0.0)
+        model.add_position_fix((5, 0), timestamp=0.5)
+        near, _ = model.predict(1.5)
+        far, _ = model.predict(5.0)
+        assert near == far
+
+    def test_jump_resets_velocity(self):
+        model = MotionModel()
+        model.add_position_fix((0, 0), timestamp=0.0)
+        model.add_position_fix((2, 0), timestamp=0.5)
+        model.add_position_fix((500, 500), timestamp=1.0)
+        assert model.velocity == (0.0, 0.0)
+        position, _ = model.predict(1.4)
+        assert position == (500.0, 500.0)
+
+    def test_stale_fix_is_dropped(self):
+        model = MotionModel(stale_after=3.0)
+        model.add_position_fix((10, 10), timestamp=0.0)
+        position, _ = model.predict(3.5)
+        assert position is None
+
+
+class TestHeadingPrediction:
+    def test_heading_holds_without_turns(self):
+        model = MotionModel()
+        model.add_heading_sample(90.0, timestamp=0.0)
+        _, heading = model.predict(0.4)
+        assert heading == pytest.approx(90.0)
+
+    def test_turn_is_spread_over_duration(self):
+        model = MotionModel(degrees_per_pixel=1.0)
+        model.add_heading_sample(0.0, timestamp=0.0)
+        model.add_turn_command(40, duration=0.2, timestamp=0.1)
+        assert model.predict(0.1)[1] == pytest.approx(0.0)
+        assert model.predict(0.2)[1] == pytest.approx(20.0)
+        assert model.predict(0.5)[1] == pytest.approx(40.0)
+
+    def test_left_turn_wraps(self):
+        model = MotionModel(degrees_per_pixel=1.0)
+        model.add_heading_sample(10.0, timestamp=0.0)
+        model.add_turn_command(-30, duration=0.0, timestamp=0.1)
+        assert model.predict(0.2)[1] == pytest.approx(340.0)
+
+    def test_sample_absorbs_finished_turns(self):
+        model = MotionModel(degrees_per_pixel=1.0)
+        model.add_heading_sample(0.0, timestamp=0.0)
+        model.add_turn_command(45, duration=0.05, timestamp=0.1)
+        model.add_heading_sample(45.0, timestamp=0.5)
+        assert model.predict(0.6)[1] == pytest.approx(45.0)
+
+    def test_gain_is_learned_from_bracketing_samples(self):
+        model = MotionModel(degrees_per_pixel=1.0)
+        heading = 0.0
+        for i in range(20):
+            t = i * 0.5
+            model.add_heading_sample(heading, timestamp=t)
+            model.add_turn_command(50, duration=0.05, timestamp=t + 0.1)
+            heading = (heading + 25.0) % 360.0
+        assert model.gain_samples > 0
+        assert model.degrees_per_pixel == pytest.approx(0.5, abs=0.02)
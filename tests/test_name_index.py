@@ -0,0 +1,126 @@
+"""Tests for lib/detection/name_index.py — trigram shortlist for OCR'd item
+names, checked against the full difflib scan on noisy reads."""
+import difflib
+import glob
+import os
+import random
+import time
+
+import pytest
+
+from lib.detection.name_index import NameIndex, trigrams
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Typical EasyOCR confusions on the hotbar font.
+CONFUSIONS = {'l': 'i', 'i': 'l', 'o': '0', 'e': 'c', 'r': 'n', 'm': 'rn', 'g': 'q', 's': '5'}
+
+
+def _loot_items():
+    items = set()
+    for path in glob.glob(os.path.join(ROOT, 'data', 'maps', 'map_*_loot.txt')):
+        with open(path, encoding='utf-8') as f:
+            items.update(line.strip() for line in f if line.strip())
+    return sorted(items)
+
+
+def _noisy(name, rng):
+    chars = list(name.lower())
+    for _ in range(rng.randint(1, 2)):
+        i = rng.randrange(len(chars))
+        op = rng.random()
+        if op < 0.5 and chars[i] in CONFUSIONS:
+            chars[i] = CONFUSIONS[chars[i]]
+        elif op < 0.75 and len(chars) > 4:
+            del chars[i]
+        else:
+            chars.insert(i, rng.choice('abcdefghijklmnopqrstuvwxyz '))
+    return ''.join(chars)
+
+
+def _difflib_match(query, names_lower, cutoff):
+    """The per-read scan the index replaces."""
+    best, best_ratio = None, 0.0
+    for i, name in enumerate(names_lower):
+        ratio = difflib.SequenceMatcher(None, name, query).ratio()
+        if ratio >= cutoff and ratio > best_ratio:
+            best, best_ratio = i, ratio
+    return best
+
+
+@pytest.fixture(scope='module')
+def items():
+    names = _loot_items()
+    if not names:
+        pytest.skip("no loot lists in data/maps")
+    return names
+
+
+def test_trigrams_pad_word_edges():
+    assert trigrams('ar') == {'  a', ' ar', 'ar '}
+
+
+def test_exact_and_noisy_reads(items):
+    index = NameIndex(items)
+    for name in items:
+        assert index.match(name).name == name
+    assert index.match('Ranger Asault Rifle').name == 'Ranger Assault Rifle'
+    assert index.match('zzzzqqqq') is None
+    assert index.match('   ') is None
+
+
+def test_strict_cutoff_excludes_exact_ratio():
+    # 'abfgh' scores exactly 0.4 against 'abcde' (2 * 2 matched / 10 chars).
+    index = NameIndex(['abcde'])
+    assert index.match('abfgh', cutoff=0.4).ratio == 0.4
+    assert index.match('abfgh', cutoff=0.4, strict=True) is None
+    assert index.match('abcdh', cutoff=0.4, strict=True).name == 'abcde'
+
+
+def test_shortlist_is_small(items):
+    index = NameIndex(items, shortlist=5)
+    assert len(index.shortlist('assault rifle')) == 5
+    assert index.shortlist('###') == []
+
+
+def test_memoized(items):
+    index = NameIndex(items)
+    first = index.match('Tacticai Pist0l')
+    assert index.match('tacticai  pist0l') is first
+    stats = index.stats()
+    assert (stats['lookups'], stats['memo_hits']) == (2, 1)
+
+
+def _queries(items, count=400):
+    rng = random.Random(7)
+    return [_noisy(rng.choice(items), rng) for _ in range(count)]
+
+
+def test_agrees_with_full_scan(items):
+    queries = _queries(items)
+    names_lower = [name.lower() for name in items]
+    expected = [_difflib_match(q, names_lower, 0.5) for q in queries]
+    index = NameIndex(items, memo_size=0)
+    got = [index.match(q, cutoff=0.5) for q in queries]
+    agree = sum((m.index if m else None) == e for m, e in zip(got, expected))
+    assert agree >= 0.98 * len(queries), f"agreement {agree}/{len(queries)}"
+
+
+@pytest.mark.benchmark
+def test_faster_than_full_scan(items):
+    queries = _queries(items)
+    names_lower = [name.lower() for name in items]
+
+    start = time.perf_counter()
+    for q in queries:
+        _difflib_match(q, names_lower, 0.5)
+    scan = time.perf_counter() - start
+
+    index = NameIndex(items, memo_size=0)
+    start = time.perf_counter()
+    for q in queries:
+        index.match(q, cutoff=0.5)
+    indexed = time.perf_counter() - start
+
+    assert indexed < scan, (f"{len(items)} names: scan {scan / len(queries) * 1e3:.3f} ms/read, "
+                            f"index {indexed / len(queries) * 1e3:.3f} ms/read")
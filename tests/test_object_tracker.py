@@ -0,0 +1,167 @@
+"""Tests for lib/detection/object_tracker.py — temporally coherent detection."""
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection.object_tracker import ObjectTrackCache
+from lib.detection.template_bank import TemplateBank
+
+
+SCALES = (0.8, 0.9, 1.0)
+NAMES = [f"icon_{i}" for i in range(6)]
+
+
+def _make_icon(seed, size=24):
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, (4, 4, 3), dtype=np.uint8)
+    return cv2.resize(blocks, (size, size), interpolation=cv2.INTER_NEAREST)
+
+
+def _frame(icons, positions, size=(300, 300), seed=99):
+    """Minimap-like frame with ``icons[name]`` pasted at each top-left."""
+    rng = np.random.default_rng(seed)
+    screen = rng.integers(60, 120, (size[1], size[0], 3), dtype=np.uint8)
+    screen = cv2.GaussianBlur(screen, (9, 9), 0)
+    for name, (x, y) in positions.items():
+        icon = icons[name]
+        screen[y:y + icon.shape[0], x:x + icon.shape[1]] = icon
+    return screen
+
+
+@pytest.fixture
+def scene():
+    icons = {name: _make_icon(i) for i, name in enumerate(NAMES)}
+    bank = TemplateBank(SCALES, max_workers=1)
+    for name, icon in icons.items():
+        bank.add(name, icon)
+    start = {"icon_0": (20, 20), "icon_1": (120, 40), "icon_2": (220, 200)}
+    yield bank, icons, start
+    bank.close()
+
+
+def _drift(positions, step):
+    """Icons scroll a few pixels per cycle as the player moves."""
+    return {name: (x + 3 * step, y + 2 * step) for name, (x, y) in positions.items()}
+
+
+def _centers(positions):
+    return {name: (x + 12, y + 12) for name, (x, y) in positions.items()}
+
+
+class TestTemporalCoherence:
+    def test_drifting_icons_are_followed_locally(self, scene):
+        bank, icons, start = scene
+        cache = ObjectTrackCache(bank, global_every=4, timeout=8.0)
+        for step in range(8):
+            positions = _drift(start, step)
+            found = cache.detect(_frame(icons, positions), list(start), now=float(step))
+            assert found == _centers(positions)
+        stats = cache.get_stats()
+        # Only the first cycle searches globally; everything else is local.
+        assert stats['global_searches'] == 1
+        assert stats['local_misses'] == 0
+        assert stats['local_hits'] == 3 * 7
+        assert stats['hit_rate'] == 1.0
+
+    def test_new_object_found_on_first_cycle(self, scene):
+        bank, icons, start = scene
+        cache = ObjectTrackCache(bank, global_every=4)
+        cache.detect(_frame(icons, start), NAMES, now=0.0)
+        with_new = dict(start, icon_3=(60, 200))
+        found = cache.detect(_frame(icons, with_new), NAMES, now=1.0)
+        assert found["icon_3"] == (72, 212)
+
+    def test_lost_track_retried_every_n_cycles(self, scene):
+        bank, icons, start = scene
+        cache = ObjectTrackCache(bank, global_every=3, timeout=100.0)
+        names = list(start)
+        cache.detect(_frame(icons, start), names, now=0.0)
+        hidden = {k: v for k, v in start.items() if k != "icon_2"}
+        searches = []
+        for step in range(1, 8):
+            cache.detect(_frame(icons, hidden), names, now=float(step))
+            searches.append(cache.get_stats()['global_searches'])
+        # Global retries on the first miss, then every third cycle.
+        assert searches == [2, 2, 2, 3, 3, 3, 4]
+        assert "icon_2" in cache.tracked
+
+    def test_jump_triggers_global_search_on_miss(self, scene):
+        bank, icons, start = scene
+        cache = ObjectTrackCache(bank, global_every=100)
+        cache.detect(_frame(icons, start), NAMES, now=0.0)
+        moved = dict(start, icon_0=(200, 100))
+        found = cache.detect(_frame(icons, moved), NAMES, now=1.0)
+        assert found["icon_0"] == (212, 112)
+        stats = cache.get_stats()
+        assert stats['local_misses'] == 1
+        assert stats['global_searches'] == 2
+
+    def test_unseen_objects_age_out(self, scene):
+        bank, icons, start = scene
+        cache = ObjectTrackCache(bank, global_every=100, timeout=5.0)
+        cache.detect(_frame(icons, start), NAMES, now=0.0)
+        gone = {k: v for k, v in start.items() if k != "icon_2"}
+        assert "icon_2" not in cache.detect(_frame(icons, gone), NAMES, now=2.0)
+        assert "icon_2" in cache.tracked
+        cache.detect(_frame(icons, gone), NAMES, now=6.0)
+        assert "icon_2" not in cache.tracked
+        assert cache.get_stats()['aged_out'] == 1
+
+    def test_disabled_objects_are_dropped(self, scene):
+        bank, icons, start = scene
+        cache = ObjectTrackCache(bank)
+        cache.detect(_frame(icons, start), NAMES, now=0.0)
+        found = cache.detect(_frame(icons, start), ["icon_0"], now=1.0)
+        assert set(found) == {"icon_0"}
+        assert set(cache.tracked) == {"icon_0"}
+
+
+class TestTrackCacheWork:
+    def test_local_cycles_correlate_fewer_pixels(self, scene, monkeypatch):
+        """Steady-state local cycle vs a from-scratch search of every icon,
+        in matchTemplate work (result pixels times template pixels)."""
+        bank, icons, start = scene
+        frame = _frame(icons, start)
+        names = list(start)
+        cache = ObjectTrackCache(bank, global_every=1000)
+        cache.detect(frame, names, now=0.0)
+
+        cost = [0]
+        match = cv2.matchTemplate
+
+        def counted(image, templ, method, *args, **kwargs):
+            result = match(image, templ, method, *args, **kwargs)
+            cost[0] += result.size * templ.shape[0] * templ.shape[1]
+            return result
+
+        monkeypatch.setattr(cv2, 'matchTemplate', counted)
+        cache.detect(frame, names, now=1.0)
+        local = cost[0]
+        cost[0] = 0
+        bank.match_instances(frame, names, top_k=1, parallel=False)
+        assert local < cost[0] * 0.5
+
+
+@pytest.mark.benchmark
+class TestTrackCacheBenchmark:
+    def test_local_cycles_cheaper_than_global(self, scene):
+        """Steady-state local cycle vs a from-scratch search of every icon."""
+        bank, icons, start = scene
+        frame = _frame(icons, start)
+        names = list(start)
+        cache = ObjectTrackCache(bank, global_every=1000)
+        cache.detect(frame, names, now=0.0)
+
+        local, full = [], []
+        for i in range(3):
+            t0 = time.perf_counter()
+            cache.detect(frame, names, now=float(i + 1))
+            local.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            bank.match_instances(frame, names, top_k=1, parallel=False)
+            full.append(time.perf_counter() - t0)
+
+        assert min(local) < min(full) * 0.5, \
+            f"global {min(full) * 1000:.2f} ms/cycle, cached {min(local) * 1000:.2f} ms/cycle"
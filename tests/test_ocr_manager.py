@@ -0,0 +1,113 @@
+"""Tests for lib/managers/ocr_manager.py — the OCR result cache."""
+import numpy as np
+import pytest
+
+from lib.managers.ocr_manager import OCRManager
+
+
+class _FakeReader:
+    def __init__(self, text='999'):
+        self.text = text
+        self.calls = 0
+
+    def readtext(self, image, **kwargs):
+        self.calls += 1
+        return [([[0, 0], [1, 0], [1, 1], [0, 1]], self.text, 0.95)]
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    mgr = OCRManager()
+    reader = _FakeReader()
+    monkeypatch.setattr(mgr, 'reader', reader)
+    monkeypatch.setattr(mgr, 'number_reader', reader, raising=False)
+    monkeypatch.setattr(mgr, 'is_ready', lambda timeout=0.1: True)
+    mgr.clear_cache()
+    monkeypatch.setattr(mgr, 'cache_hits', 0)
+    monkeypatch.setattr(mgr, 'cache_misses', 0)
+    monkeypatch.setattr(mgr, 'cache_saved_ms', 0.0)
+    yield mgr, reader
+    mgr.clear_cache()
+
+
+def _crop(seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.random((20, 60)) > 0.5).astype(np.uint8) * 255
+
+
+def test_same_crop_hits_cache(manager):
+    mgr, reader = manager
+    crop = _crop()
+    first = mgr.read_numbers(crop, allowlist='0123456789')
+    second = mgr.read_numbers(crop.copy(), allowlist='0123456789')
+    assert first == second
+    assert reader.calls == 1
+    stats = mgr.cache_stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+    assert stats['hit_rate'] == 0.5
+    assert stats['saved_ms'] >= 0.0
+
+
+def test_key_includes_reader_and_kwargs(manager):
+    mgr, reader = manager
+    crop = _crop()
+    mgr.read_numbers(crop, allowlist='0123456789')
+    mgr.read_numbers(crop, allowlist='0123')
+    mgr.read_text(crop, allowlist='0123456789')
+    assert reader.calls == 3
+
+
+def test_cached_results_are_copies(manager):
+    mgr, reader = manager
+    crop = _crop()
+    mgr.read_text(crop).clear()
+    assert mgr.read_text(crop)[0][1] == '999'
+
+
+def test_near_duplicate_mode(manager):
+    mgr, reader = manager
+    gray = np.full((20, 60), 200, dtype=np.uint8)
+    gray[5:15, 10:50] = 40
+    noisy = gray.copy()
+    noisy[0, 0] += 3
+    noisy[7, 20] -= 2
+
+    mgr.read_text(gray)
+    mgr.read_text(noisy)
+    assert reader.calls == 2          # exact keys differ
+
+    mgr.read_text(gray, near_duplicate=True)
+    mgr.read_text(noisy, near_duplicate=True)
+    assert reader.calls == 3
+
+
+def test_lru_eviction(manager, monkeypatch):
+    mgr, reader = manager
+    monkeypatch.setattr(OCRManager, 'CACHE_SIZE', 2)
+    a, b, c = _crop(1), _crop(2), _crop(3)
+    mgr.read_text(a)
+    mgr.read_text(b)
+    mgr.read_text(a)      # a is now most recent
+    mgr.read_text(c)      # evicts b
+    assert mgr.cache_stats()['entries'] == 2
+    calls = reader.calls
+    mgr.read_text(a)
+    assert reader.calls == calls
+    mgr.read_text(b)
+    assert reader.calls == calls + 1
+
+
+def test_reads_go_through_queue_and_honor_tokens(manager):
+    from lib.managers.ocr_queue import CancelToken, PRIORITY_USER
+    mgr, reader = manager
+    future = mgr.submit_text(_crop(5), priority=PRIORITY_USER)
+    assert future.result(timeout=5)[0][1] == '999'
+    assert reader.calls == 1
+
+    token = CancelToken()
+    token.cancel()
+    assert mgr.read_text(_crop(6), token=token) == []
+    assert reader.calls == 1
+    # A cached crop is answered without queueing, even for a stale caller.
+    assert mgr.read_text(_crop(5), token=token)[0][1] == '999'
+    assert mgr.queue_stats()['dropped'] >= 1
@@ -0,0 +1,118 @@
+"""Tests for lib/managers/ocr_queue.py — priorities, coalescing and
+cancellation of queued OCR requests."""
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from lib.managers.ocr_queue import (
+    CancelToken, OCRRequestQueue, PRIORITY_BACKGROUND, PRIORITY_USER,
+)
+
+
+@pytest.fixture
+def queue():
+    q = OCRRequestQueue(workers=1)
+    yield q
+    q.shutdown()
+
+
+def _block(queue):
+    """Occupy the worker until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def job():
+        started.set()
+        release.wait(5)
+        return 'blocker'
+    future = queue.submit(job)
+    assert started.wait(5)
+    return release, future
+
+
+def test_result_comes_back_as_future(queue):
+    assert queue.submit(lambda: [1, 2]).result(timeout=5) == [1, 2]
+
+    def boom():
+        raise ValueError("bad crop")
+    with pytest.raises(ValueError):
+        queue.submit(boom).result(timeout=5)
+
+
+def test_user_requests_run_before_background(queue):
+    release, blocker = _block(queue)
+    order = []
+    background = [queue.submit(lambda i=i: order.append(('bg', i)), PRIORITY_BACKGROUND)
+                  for i in range(2)]
+    user = queue.submit(lambda: order.append(('user', 0)), PRIORITY_USER)
+    assert queue.stats()['depth_by_priority'] == {'background': 2, 'user': 1}
+    release.set()
+    for future in background + [user, blocker]:
+        future.result(timeout=5)
+    assert order == [('user', 0), ('bg', 0), ('bg', 1)]
+
+
+def test_identical_pending_requests_coalesce(queue):
+    release, _ = _block(queue)
+    runs = []
+    first = queue.submit(lambda: runs.append(1) or 'text', key='crop')
+    second = queue.submit(lambda: runs.append(2) or 'text', PRIORITY_USER, key='crop')
+    assert second is first
+    release.set()
+    assert first.result(timeout=5) == 'text'
+    assert runs == [1]
+    stats = queue.stats()
+    assert stats['coalesced'] == 1
+    # The shared request was promoted to user priority.
+    assert stats['waits']['user']['runs'] == 1
+
+
+def test_cancelled_request_is_dropped_before_running(queue):
+    release, _ = _block(queue)
+    token = CancelToken()
+    runs = []
+    future = queue.submit(lambda: runs.append(1), token=token)
+    token.cancel()
+    assert future.cancelled()
+    with pytest.raises(CancelledError):
+        future.result(timeout=5)
+    release.set()
+    queue.submit(lambda: None).result(timeout=5)
+    assert runs == []
+    assert queue.stats()['dropped'] == 1
+
+
+def test_coalesced_request_runs_while_any_caller_wants_it(queue):
+    release, _ = _block(queue)
+    stale, live = CancelToken(), CancelToken()
+    future = queue.submit(lambda: 'slot 2', key='crop', token=stale)
+    queue.submit(lambda: 'slot 2', key='crop', token=live)
+    stale.cancel()
+    assert not future.cancelled()
+    release.set()
+    assert future.result(timeout=5) == 'slot 2'
+
+    untracked = queue.submit(lambda: 'x', key='other')
+    queue.submit(lambda: 'x', key='other', token=live)
+    live.cancel()
+    assert untracked.result(timeout=5) == 'x'
+
+
+def test_already_cancelled_token(queue):
+    token = CancelToken()
+    token.cancel()
+    assert queue.submit(lambda: 'late', token=token).cancelled()
+
+
+def test_metrics_and_shutdown(queue):
+    release, _ = _block(queue)
+    pending = queue.submit(lambda: None)
+    stats = queue.stats()
+    assert stats['depth'] == 1
+    assert stats['max_depth'] >= 1
+    assert stats['submitted'] == 2
+    queue.shutdown()
+    release.set()
+    assert pending.cancelled()
+    assert queue.submit(lambda: None).cancelled()
+    assert queue.stats()['waits']['background']['runs'] == 1
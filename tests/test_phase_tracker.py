@@ -0,0 +1,142 @@
+"""Tests for lib/detection/phase_tracker.py — PPI phase-correlation fast path.
+
+Synthetic minimap sequences: a textured grayscale "map", captures cut out
+of it at a fixed minimap scale with noise and a player icon, and a player
+walking across it. The feature path (``feature_matcher.match`` with SIFT)
+is the accuracy / latency baseline.
+"""
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection import feature_matcher
+from lib.detection.phase_tracker import PhaseTracker, corners_box, window_corners
+
+CAP = 250
+SCALE = 1.2          # map px per capture px
+HALF = (CAP - 1) * SCALE / 2
+
+
+@pytest.fixture(scope="module")
+def game_map():
+    rng = np.random.default_rng(0)
+    base = rng.random((128, 128)).astype(np.float32)
+    img = cv2.GaussianBlur(cv2.resize(base, (1024, 1024), interpolation=cv2.INTER_CUBIC), (0, 0), 2)
+    img = cv2.normalize(img, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+    for _ in range(60):
+        center = tuple(int(v) for v in rng.integers(0, 1024, 2))
+        cv2.circle(img, center, int(rng.integers(3, 20)), int(rng.integers(0, 255)), -1)
+    return img
+
+
+def _capture(game_map, cx, cy, seed=0):
+    """Minimap capture centered on map point (cx, cy)."""
+    affine = np.float32([[SCALE, 0, cx - HALF], [0, SCALE, cy - HALF]])
+    img = cv2.warpAffine(game_map, affine, (CAP, CAP),
+                         flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP)
+    noise = np.random.default_rng(seed).integers(-8, 8, img.shape)
+    img = np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    cv2.circle(img, (CAP // 2, CAP // 2), 6, 255, -1)   # player icon
+    return img
+
+
+def _anchor_at(tracker, cx, cy):
+    tracker.anchor(window_corners(cx - HALF, cy - HALF, cx + HALF, cy + HALF))
+
+
+def _center(corners):
+    return corners.reshape(-1, 2).mean(axis=0)
+
+
+def _walk(steps=20, start=(500.0, 500.0), step=(3.3, -1.7)):
+    return [(start[0] + step[0] * i, start[1] + step[1] * i) for i in range(1, steps + 1)]
+
+
+def test_window_corners_round_trip():
+    corners = window_corners(10.5, 20.0, 110.5, 220.0)
+    assert corners.shape == (4, 1, 2)
+    assert corners_box(corners) == (10.5, 20.0, 110.5, 220.0)
+
+
+def test_unanchored_returns_none(game_map):
+    assert PhaseTracker().track(_capture(game_map, 500, 500), game_map) is None
+
+
+def test_tracks_walk_without_drift(game_map):
+    tracker = PhaseTracker()
+    _anchor_at(tracker, 500.0, 500.0)
+    for i, (cx, cy) in enumerate(_walk(), start=1):
+        corners = tracker.track(_capture(game_map, cx, cy, seed=i), game_map)
+        assert corners is not None
+        assert np.hypot(*(_center(corners) - (cx, cy))) < 0.5
+    # Scale is kept from the anchor.
+    x0, y0, x1, y1 = corners_box(corners)
+    assert x1 - x0 == pytest.approx(2 * HALF, abs=1.0)
+
+
+def test_rejects_unrelated_capture(game_map):
+    tracker = PhaseTracker()
+    _anchor_at(tracker, 300.0, 300.0)
+    assert tracker.track(_capture(game_map, 700, 650), game_map) is None
+    assert tracker.last_response < tracker.response_threshold
+
+
+def test_rejects_window_off_map(game_map):
+    tracker = PhaseTracker()
+    _anchor_at(tracker, 40.0, 40.0)
+    assert tracker.track(_capture(game_map, 200, 200), game_map) is None
+
+
+def test_chain_budget_forces_feature_match(game_map):
+    tracker = PhaseTracker(max_chained=3)
+    _anchor_at(tracker, 500.0, 500.0)
+    path = _walk(steps=4)
+    for cx, cy in path[:3]:
+        assert tracker.track(_capture(game_map, cx, cy), game_map) is not None
+    assert tracker.track(_capture(game_map, *path[3]), game_map) is None
+    _anchor_at(tracker, *path[2])
+    assert tracker.track(_capture(game_map, *path[3]), game_map) is not None
+
+
+def test_disabled_and_reset(game_map):
+    tracker = PhaseTracker()
+    _anchor_at(tracker, 500.0, 500.0)
+    tracker.enabled = False
+    assert tracker.track(_capture(game_map, 503, 500), game_map) is None
+    tracker.enabled = True
+    tracker.reset()
+    assert not tracker.anchored
+    assert tracker.track(_capture(game_map, 503, 500), game_map) is None
+
+
+@pytest.mark.benchmark
+def test_phase_vs_feature_path(game_map):
+    """Fast path matches feature-path accuracy at a fraction of the cost."""
+    cfg = feature_matcher.MatcherConfig.from_name('sift')
+    keypoints, descriptors = feature_matcher.build_map_detector(cfg).detectAndCompute(game_map, None)
+    detector = feature_matcher.build_capture_detector(cfg)
+    matcher = feature_matcher.build_matcher(cfg)
+
+    tracker = PhaseTracker()
+    _anchor_at(tracker, 500.0, 500.0)
+    phase_time = feature_time = 0.0
+    phase_err, feature_err = [], []
+    path = _walk(steps=10)
+    for i, (cx, cy) in enumerate(path, start=1):
+        capture = _capture(game_map, cx, cy, seed=i)
+        start = time.perf_counter()
+        corners = tracker.track(capture, game_map)
+        phase_time += time.perf_counter() - start
+        start = time.perf_counter()
+        outcome = feature_matcher.match(capture, keypoints, descriptors, cfg, detector, matcher)
+        feature_time += time.perf_counter() - start
+        assert corners is not None
+        phase_err.append(np.hypot(*(_center(corners) - (cx, cy))))
+        if outcome.corners_on_map is not None:
+            feature_err.append(np.hypot(*(_center(outcome.corners_on_map) - (cx, cy))))
+
+    assert max(phase_err) < 0.5
+    assert phase_time < feature_time, \
+        f"phase: {phase_time / len(path) * 1e3:.2f} ms, feature: {feature_time / len(path) * 1e3:.2f} ms"
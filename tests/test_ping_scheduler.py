@@ -0,0 +1,127 @@
+"""Tests for lib/audio/ping_scheduler.py — one thread for every audio ping."""
+import threading
+import time
+
+import pytest
+
+from lib.audio.ping_scheduler import PingScheduler
+
+
+@pytest.fixture
+def scheduler():
+    sched = PingScheduler()
+    yield sched
+    sched.shutdown()
+
+
+def _recorder():
+    calls = []
+
+    def callback(pose):
+        calls.append((time.monotonic(), pose))
+
+    return calls, callback
+
+
+class TestScheduling:
+    def test_periodic_job_repeats(self, scheduler):
+        calls, callback = _recorder()
+        scheduler.schedule(callback, 0.02)
+        time.sleep(0.15)
+        assert 5 <= len(calls) <= 9
+
+    def test_one_shot_runs_once(self, scheduler):
+        calls, callback = _recorder()
+        job = scheduler.schedule_once(callback, 0.02)
+        time.sleep(0.1)
+        assert len(calls) == 1
+        assert not job.active
+        assert scheduler.scheduled_count == 0
+
+    def test_cancel_stops_job(self, scheduler):
+        calls, callback = _recorder()
+        job = scheduler.schedule(callback, 0.02)
+        time.sleep(0.05)
+        job.cancel()
+        seen = len(calls)
+        time.sleep(0.08)
+        assert len(calls) == seen
+        assert scheduler.scheduled_count == 0
+
+    def test_callback_return_sets_next_delay(self, scheduler):
+        calls = []
+
+        def callback(pose):
+            calls.append(time.monotonic())
+            return 0.06
+
+        scheduler.schedule(callback, 0.01)
+        time.sleep(0.2)
+        assert 3 <= len(calls) <= 5
+        gaps = [b - a for a, b in zip(calls, calls[1:])]
+        assert min(gaps) >= 0.05
+
+    def test_failing_callback_keeps_running(self, scheduler):
+        calls = []
+
+        def callback(pose):
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        scheduler.schedule(callback, 0.02)
+        time.sleep(0.1)
+        assert len(calls) >= 3
+        assert scheduler.get_stats()['errors'] == len(calls)
+
+
+class TestSharedThread:
+    def test_many_pingers_use_one_thread(self, scheduler):
+        before = threading.active_count()
+        counts = [0] * 40
+
+        def make(i):
+            def callback(pose):
+                counts[i] += 1
+            return callback
+
+        jobs = [scheduler.schedule(make(i), 0.03) for i in range(40)]
+        time.sleep(0.12)
+        assert threading.active_count() == before + 1
+        assert scheduler.scheduled_count == 40
+        assert all(c >= 2 for c in counts)
+        for job in jobs:
+            job.cancel()
+        assert scheduler.scheduled_count == 0
+
+    def test_pose_read_once_per_tick(self, scheduler):
+        reads = []
+
+        def provider():
+            reads.append(1)
+            return (100, 200), 90.0
+
+        scheduler.set_pose_provider(provider)
+        poses = []
+        scheduler.schedule_once(poses.append, 0.03)
+        scheduler.schedule_once(poses.append, 0.03)
+        scheduler.schedule_once(poses.append, 0.03)
+        time.sleep(0.1)
+        assert poses == [((100, 200), 90.0)] * 3
+        assert len(reads) <= 2
+
+    def test_missing_pose_provider_passes_none(self, scheduler):
+        calls, callback = _recorder()
+        scheduler.schedule_once(callback, 0.0)
+        time.sleep(0.05)
+        assert calls[0][1] == (None, None)
+
+    def test_jitter_is_reported(self, scheduler):
+        calls, callback = _recorder()
+        scheduler.schedule(callback, 0.01)
+        time.sleep(0.1)
+        stats = scheduler.get_stats()
+        assert stats['fired'] == len(calls)
+        assert stats['scheduled'] == 1
+        assert 0.0 <= stats['jitter_avg_ms'] <= stats['jitter_max_ms']
+        # A sleeping scheduler should wake close to the due time.
+        assert stats['jitter_avg_ms'] < 20.0
@@ -0,0 +1,161 @@
+"""Tests for lib/detection/position_scheduler.py — adaptive PPI update rate."""
+import pytest
+
+import threading
+import time
+
+from lib.detection.position_scheduler import AdaptivePositionScheduler, HeadingSampler
+
+
+# A recorded session: (timestamp, position or None, lobby, overlay open).
+# Stands still after landing, runs north, opens the map, then returns to
+# the lobby after the match.
+RECORDED_SESSION = (
+    [(0.5 * i, (640, 480), False, False) for i in range(6)]
+    + [(3.0 + 0.25 * i, (640, 480 - 3 * i), False, False) for i in range(1, 7)]
+    + [(4.5 + 2.0 * i, None, False, True) for i in range(1, 3)]
+    + [(9.0, None, True, False)]
+)
+
+
+class _Flags:
+    def __init__(self):
+        self.lobby = False
+        self.overlay = False
+
+
+@pytest.fixture
+def replay():
+    flags = _Flags()
+    scheduler = AdaptivePositionScheduler(
+        base_interval=0.5, cpu_budget=0.05,
+        is_lobby=lambda: flags.lobby,
+        is_overlay_open=lambda: flags.overlay,
+    )
+
+    def run(session):
+        decisions = []
+        for t, position, lobby, overlay in session:
+            flags.lobby, flags.overlay = lobby, overlay
+            run_fix, delay = scheduler.next_delay()
+            if run_fix:
+                scheduler.record_fix(position, cpu_seconds=0.005, timestamp=t)
+            decisions.append((scheduler.state, run_fix, delay))
+        return decisions
+
+    return scheduler, run
+
+
+class TestRecordedSession:
+    def test_states_follow_the_recording(self, replay):
+        scheduler, run = replay
+        states = [state for state, _, _ in run(RECORDED_SESSION)]
+        # Fresh tracker starts at the configured rate and drops to idle
+        # once enough still fixes have arrived.
+        assert states[0] == 'normal'
+        assert states[5] == 'idle'
+        # The first moving fix promotes to active.
+        assert states[7] == 'active'
+        assert states[11] == 'active'
+        assert states[12:14] == ['overlay', 'overlay']
+        assert states[14] == 'paused'
+
+    def test_rates_per_state(self, replay):
+        scheduler, run = replay
+        decisions = run(RECORDED_SESSION)
+        by_state = {state: delay for state, _, delay in decisions}
+        assert by_state['active'] == pytest.approx(0.25)
+        assert by_state['normal'] == pytest.approx(0.5)
+        assert by_state['idle'] == pytest.approx(1.0)
+        assert by_state['overlay'] == pytest.approx(2.0)
+
+    def test_lobby_skips_fixes(self, replay):
+        scheduler, run = replay
+        state, run_fix, delay = run(RECORDED_SESSION)[-1]
+        assert not run_fix
+        assert delay == AdaptivePositionScheduler.PAUSE_POLL
+        assert scheduler.current_rate == 0.0
+
+
+class TestDemandAndBudget:
+    def test_demand_forces_active_while_still(self, replay):
+        scheduler, run = replay
+        run(RECORDED_SESSION[:6])
+        assert scheduler.state == 'idle'
+        scheduler.set_demand('continuous_ping', True)
+        assert scheduler.next_delay() == (True, pytest.approx(0.25))
+        scheduler.set_demand('continuous_ping', False)
+        scheduler.next_delay()
+        assert scheduler.state == 'idle'
+
+    def test_budget_stretches_interval(self):
+        scheduler = AdaptivePositionScheduler(base_interval=0.5, cpu_budget=0.05)
+        scheduler.record_fix((0, 0), cpu_seconds=0.04, timestamp=0.0)
+        run_fix, delay = scheduler.next_delay()
+        assert run_fix
+        assert scheduler.state == 'normal'
+        # 40 ms per fix at 5% of a core -> at most one fix per 0.8 s.
+        assert delay == pytest.approx(0.8)
+
+    def test_budget_not_applied_while_active(self):
+        scheduler = AdaptivePositionScheduler(base_interval=0.1, cpu_budget=0.05)
+        for i in range(4):
+            scheduler.record_fix((i * 5, 0), cpu_seconds=0.1, timestamp=i * 0.1)
+        assert scheduler.next_delay() == (True, pytest.approx(0.1))
+        assert scheduler.state == 'active'
+
+        still = AdaptivePositionScheduler(base_interval=0.1, cpu_budget=0.05)
+        still.record_fix((0, 0), cpu_seconds=0.1, timestamp=0.0)
+        still.set_demand('navigation', True)
+        assert still.next_delay() == (True, pytest.approx(0.1))
+
+    def test_stats_report_rate_and_cost(self):
+        scheduler = AdaptivePositionScheduler(base_interval=0.5, cpu_budget=0.05)
+        scheduler.record_fix((0, 0), cpu_seconds=0.01, timestamp=0.0)
+        scheduler.next_delay()
+        stats = scheduler.get_stats()
+        assert stats['rate_hz'] == pytest.approx(2.0)
+        assert stats['avg_fix_cpu_ms'] == pytest.approx(10.0)
+        assert stats['cpu_fraction'] == pytest.approx(0.02)
+        assert stats['cpu_budget'] == 0.05
+
+
+class TestHeadingSampler:
+    def test_samples_only_while_demanded(self):
+        samples = []
+        sampled = threading.Event()
+
+        def sink(angle):
+            samples.append(angle)
+            sampled.set()
+
+        sampler = HeadingSampler(lambda: 90.0, sink, interval=0.01)
+        sampler.set_demand('poi_sound', True)
+        sampler.set_demand('storm', True)
+        assert sampled.wait(1.0)
+        sampler.set_demand('poi_sound', False)
+        assert sampler.active
+        sampler.set_demand('storm', False)
+        assert not sampler.active
+        deadline = time.monotonic() + 1.0
+        while sampler._thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sampler._thread is None
+        count = len(samples)
+        time.sleep(0.05)
+        assert len(samples) == count and set(samples) == {90.0}
+
+    def test_reader_errors_do_not_stop_sampling(self):
+        calls = []
+
+        def read():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("capture failed")
+            return 45.0
+
+        got = threading.Event()
+        sampler = HeadingSampler(read, lambda angle: got.set(), interval=0.01)
+        sampler.set_demand('ping', True)
+        assert got.wait(1.0)
+        sampler.set_demand('ping', False)
@@ -0,0 +1,86 @@
+"""Tests for lib/detection/rarity.py — LUT rarity classification on
+synthetic hotbar slots for every rarity color."""
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection.rarity import (
+    LEVELS, NONE_ID, RarityClassifier, border_pixels, palette_from_samples,
+)
+
+# The hotbar/inventory palette (RGB).
+RARITY_COLORS = {
+    'Common': (116, 122, 128), 'Uncommon': (0, 128, 5), 'Rare': (0, 88, 191),
+    'Epic': (118, 45, 211), 'Legendary': (191, 79, 0), 'Mythic': (191, 147, 35),
+    'Exotic': (118, 191, 255),
+}
+
+
+def _slot(rgb, seed=0, noise=6.0, size=(44, 63)):
+    """BGR slot: noisy rarity background with a grey weapon icon."""
+    rng = np.random.default_rng(seed)
+    img = np.empty(size + (3,), dtype=np.float32)
+    img[:] = rgb[::-1]
+    img += rng.normal(0.0, noise, img.shape)
+    cv2.rectangle(img, (8, 10), (54, 30), (200, 200, 200), -1)
+    return np.clip(img, 0, 255).astype(np.uint8)
+
+
+@pytest.fixture(scope='module')
+def classifier():
+    return RarityClassifier(RARITY_COLORS, tolerance=30)
+
+
+def test_lut_shape_and_palette_cells(classifier):
+    assert classifier.lut.shape == (LEVELS, LEVELS, LEVELS)
+    for i, rgb in enumerate(RARITY_COLORS.values()):
+        assert classifier.ids(np.array([rgb]))[0] == i
+    assert classifier.ids(np.array([[0, 0, 0]]))[0] == NONE_ID
+
+
+@pytest.mark.parametrize("rarity", list(RARITY_COLORS))
+def test_every_rarity_slot(classifier, rarity):
+    for seed in range(5):
+        result = classifier.classify_slot(_slot(RARITY_COLORS[rarity], seed))
+        assert result is not None and result.rarity == rarity
+        assert result.confidence > 0.9
+        assert result.margin > 0.9
+
+
+def test_icon_over_border_does_not_flip_rarity(classifier):
+    slot = _slot(RARITY_COLORS['Epic'])
+    slot[:, :20] = (200, 200, 200)      # icon reaching the left edge
+    assert classifier.classify_slot(slot).rarity == 'Epic'
+
+
+def test_empty_and_ambiguous_slots(classifier):
+    assert classifier.classify_slot(np.zeros((44, 63, 3), dtype=np.uint8)) is None
+    # Half Rare, half Legendary border: no clear winner.
+    slot = _slot(RARITY_COLORS['Rare'], noise=0)
+    slot[:, 32:] = RARITY_COLORS['Legendary'][::-1]
+    assert classifier.classify_slot(slot) is None
+
+
+def test_single_pixel_mode():
+    strict = RarityClassifier(RARITY_COLORS, tolerance=15, min_share=1.0, min_margin=1.0)
+    assert strict.classify(np.array([[5, 120, 10]], dtype=np.uint8)).rarity == 'Uncommon'
+    assert strict.classify(np.array([[60, 60, 60]], dtype=np.uint8)) is None
+
+
+def test_border_pixels_count():
+    assert len(border_pixels(np.zeros((44, 63, 3), dtype=np.uint8), 3)) == 2 * 3 * 63 + 2 * 3 * 38
+
+
+def test_palette_from_samples():
+    palette = palette_from_samples(RARITY_COLORS, {'Rare': [np.array([2, 90, 190]), np.array([4, 92, 194])],
+                                                   'Epic': []})
+    assert palette['Rare'] == (3, 91, 192)
+    assert palette['Epic'] == RARITY_COLORS['Epic']
+
+
+def test_classify_slots_matches_per_slot(classifier):
+    slots = [_slot(rgb, seed) for seed, rgb in enumerate(RARITY_COLORS.values())]
+    slots.append(np.zeros((44, 63, 3), dtype=np.uint8))
+    batch = classifier.classify_slots(slots)
+    assert batch == [classifier.classify_slot(s) for s in slots]
+    assert [r.rarity if r else None for r in batch] == list(RARITY_COLORS) + [None]
@@ -0,0 +1,132 @@
+"""Tests for lib/managers/reference_store.py — the memory-mapped hotbar
+reference store built from a synthetic image_cache.pkl."""
+import os
+import pickle
+import time
+import tracemalloc
+import zlib
+
+import cv2
+import numpy as np
+import pytest
+
+from lib.managers import reference_store
+from lib.managers.reference_store import ReferenceStore, decode_cached_image
+
+SLOT = (63, 44)  # width, height
+
+
+def _write_cache(path, count=120, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(count):
+        img = rng.integers(0, 256, (128, 128, 3), dtype=np.uint8)
+        ok, png = cv2.imencode('.png', img)
+        data[f"Rare Item {i}.png"] = {'data': zlib.compress(png.tobytes(), 6)}
+    with open(path, 'wb') as f:
+        pickle.dump(data, f)
+    return data
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    path = str(tmp_path / 'image_cache.pkl')
+    _write_cache(path)
+    return path
+
+
+def test_first_load_builds_then_maps(cache_file):
+    store = ReferenceStore(cache_file)
+    names, images = store.load(SLOT)
+    assert store.rebuilt
+    assert len(names) == 120 and names[0] == 'Rare Item 0'
+    assert os.path.exists(store.array_path) and os.path.exists(store.index_path)
+
+    again = ReferenceStore(cache_file)
+    names2, mapped = again.load(SLOT)
+    assert not again.rebuilt
+    assert names2 == names
+    assert isinstance(mapped, np.memmap)
+    assert mapped.shape == (120, SLOT[1], SLOT[0], 3)
+    np.testing.assert_array_equal(mapped, images)
+
+
+def test_matches_old_decode_and_resize(cache_file):
+    with open(cache_file, 'rb') as f:
+        data = pickle.load(f)
+    refs = ReferenceStore(cache_file).as_dict(SLOT)
+    expected = cv2.resize(decode_cached_image(data['Rare Item 7.png']), SLOT)
+    np.testing.assert_array_equal(refs['Rare Item 7'], expected)
+    assert not refs['Rare Item 7'].flags.writeable
+
+
+def test_rebuilds_on_source_or_slot_change(cache_file):
+    ReferenceStore(cache_file).load(SLOT)
+
+    store = ReferenceStore(cache_file)
+    store.load((60, 40))
+    assert store.rebuilt
+
+    # Touched but identical: accepted via the SHA-1.
+    os.utime(cache_file, ns=(1, 1))
+    store = ReferenceStore(cache_file)
+    store.load((60, 40))
+    assert not store.rebuilt
+
+    _write_cache(cache_file, count=10, seed=1)
+    store = ReferenceStore(cache_file)
+    names, _ = store.load((60, 40))
+    assert store.rebuilt and len(names) == 10
+
+
+def test_version_bump_and_corrupt_index(cache_file, monkeypatch):
+    store = ReferenceStore(cache_file)
+    store.load(SLOT)
+    monkeypatch.setattr(reference_store, 'STORE_VERSION', reference_store.STORE_VERSION + 1)
+    store.load(SLOT)
+    assert store.rebuilt
+    with open(store.index_path, 'w') as f:
+        f.write('{')
+    assert store.names()[0] == 'Rare Item 0'
+    store.load(SLOT)
+    assert store.rebuilt
+
+
+def test_missing_cache_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ReferenceStore(str(tmp_path / 'nope.pkl')).load(SLOT)
+
+
+def _old_load(cache_file):
+    """The previous startup path: unpickle, decompress, decode, resize."""
+    with open(cache_file, 'rb') as f:
+        data = pickle.load(f)
+    return {os.path.splitext(n)[0]: cv2.resize(decode_cached_image(e), SLOT) for n, e in data.items()}
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def test_startup_memory(cache_file):
+    ReferenceStore(cache_file).load(SLOT)  # build once
+
+    old, _, old_peak = _measure(lambda: _old_load(cache_file))
+    new, _, new_peak = _measure(lambda: ReferenceStore(cache_file).as_dict(SLOT))
+    assert list(old) == list(new)
+    assert new_peak < old_peak, f"old peak {old_peak / 1024:.0f} KiB, store peak {new_peak / 1024:.0f} KiB"
+
+
+@pytest.mark.benchmark
+def test_startup_time(cache_file):
+    ReferenceStore(cache_file).load(SLOT)  # build once
+
+    _, old_s, _ = _measure(lambda: _old_load(cache_file))
+    _, new_s, _ = _measure(lambda: ReferenceStore(cache_file).as_dict(SLOT))
+    assert new_s < old_s, f"old: {old_s * 1e3:.1f} ms, store: {new_s * 1e3:.1f} ms"
@@ -75,3 +75,103 @@ class TestScreenshotManagerCache:
         assert 'screenshots_taken' in self.mgr.stats
         assert 'cache_hits' in self.mgr.stats
         assert 'cache_misses' in self.mgr.stats
+
+
+class _FakeMss:
+    """mss stand-in: grabs from a deterministic BGRA 'screen'."""
+
+    def __init__(self):
+        ys, xs = np.mgrid[:1080, :1920]
+        self.screen = np.dstack([xs % 256, ys % 256, (xs + ys) % 256,
+                                 np.full_like(xs, 255)]).astype(np.uint8)
+        self.grabs = []
+
+    def grab(self, region):
+        self.grabs.append(region)
+        l, t = region['left'], region['top']
+        return self.screen[t:t + region['height'], l:l + region['width']].copy()
+
+    def rgb(self, x, y):
+        b, g, r = self.screen[y, x, :3]
+        return (int(r), int(g), int(b))
+
+
+class TestProbePixels:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        from lib.managers.screenshot_manager import ScreenshotManager
+        ScreenshotManager._instance = None
+        self.mgr = ScreenshotManager()
+        self.fake = _FakeMss()
+        monkeypatch.setattr(self.mgr, 'get_mss_instance', lambda: self.fake)
+
+    def test_nearby_points_share_one_grab(self):
+        points = [(1576, 319), (1586, 319), (1596, 319), (1599, 23)]
+        colors = self.mgr.probe_pixels(points)
+        assert len(self.fake.grabs) == 1
+        assert [tuple(int(v) for v in c) for c in colors] == [self.fake.rgb(x, y) for x, y in points]
+
+    def test_far_points_grabbed_separately(self):
+        points = [(10, 10), (1900, 1000)]
+        colors = self.mgr.probe_pixels(points)
+        assert len(self.fake.grabs) == 2
+        assert all(g['width'] == 1 and g['height'] == 1 for g in self.fake.grabs)
+        assert tuple(int(v) for v in colors[1]) == self.fake.rgb(1900, 1000)
+
+    def test_duplicates_and_order(self):
+        points = [(300, 200), (100, 100), (300, 200)]
+        colors = self.mgr.probe_pixels(points)
+        assert [tuple(int(v) for v in c) for c in colors] == [self.fake.rgb(x, y) for x, y in points]
+
+    def test_predicates(self):
+        from lib.managers.screenshot_manager import color_between, color_near
+        x, y = 400, 300
+        target = self.fake.rgb(x, y)
+        hits = self.mgr.probe_pixels([(x, y), (x + 7, y)], color_near(target, 2))
+        assert hits.dtype == bool and hits.tolist() == [True, False]
+        low = tuple(c - 1 for c in target)
+        hits = self.mgr.probe_pixels([(x, y)], color_between(low, target))
+        assert hits.tolist() == [True]
+
+    def test_get_pixel_uses_probe(self):
+        assert self.mgr.get_pixel(250, 60) == self.fake.rgb(250, 60)
+        assert self.mgr.get_stats()['pixel_probes'] == 1
+
+    def test_grab_failure_returns_none(self, monkeypatch):
+        def boom(region):
+            raise RuntimeError("no screen")
+        monkeypatch.setattr(self.fake, 'grab', boom)
+        assert self.mgr.probe_pixels([(1, 1)]) is None
+        assert self.mgr.get_pixel(1, 1) is None
+
+    def test_hotspot_probe_grab_count(self):
+        """17 map hotspot pixels: one grab per pixel before, a few now."""
+        hotspots = [
+            (683, 303), (955, 311), (1210, 245), (782, 405), (904, 417),
+            (1031, 461), (654, 511), (555, 618), (725, 641), (894, 625),
+            (1078, 639), (1232, 607), (585, 894), (957, 846), (1190, 876),
+            (764, 830), (1265, 776),
+        ]
+        colors = self.mgr.probe_pixels(hotspots)
+        assert len(self.fake.grabs) < len(hotspots) // 2
+        assert [tuple(int(v) for v in c) for c in colors] == [self.fake.rgb(x, y) for x, y in hotspots]
+
+
+class TestGroupPoints:
+    def test_cost_model(self):
+        from lib.managers.screenshot_manager import group_points
+        groups = group_points([(0, 0), (5, 5), (1000, 1000)], grab_cost=1000)
+        assert sorted(len(idx) for _, idx in groups) == [1, 2]
+        assert group_points([(0, 0), (5, 5)], grab_cost=0) == [((0, 0, 1, 1), [0]), ((5, 5, 6, 6), [1])]
+
+    def test_every_point_covered_once(self):
+        from lib.managers.screenshot_manager import group_points
+        rng = np.random.default_rng(2)
+        points = [tuple(p) for p in rng.integers(0, 1900, (40, 2))]
+        groups = group_points(points)
+        seen = sorted(i for _, idx in groups for i in idx)
+        assert seen == list(range(len(points)))
+        for rect, idx in groups:
+            for i in idx:
+                x, y = points[i]
+                assert rect[0] <= x < rect[2] and rect[1] <= y < rect[3]
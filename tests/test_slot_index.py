@@ -0,0 +1,112 @@
+"""Tests for lib/detection/slot_index.py — fingerprint shortlist for hotbar
+reference images, on synthetic 63x44 weapon icons with rarity variants."""
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection.slot_index import SlotIndex, perceptual_hash, pixel_match
+
+SLOT = (44, 63)
+RARITY_BACKGROUNDS = {
+    'Common': (128, 122, 116), 'Rare': (191, 88, 0), 'Epic': (211, 45, 118),
+    'Legendary': (0, 79, 191),
+}
+
+
+def _icon(seed, background):
+    """Random polygon 'weapon' in white/grey on a rarity-colored slot."""
+    rng = np.random.default_rng(seed)
+    img = np.zeros(SLOT + (3,), dtype=np.uint8)
+    img[:] = background
+    for _ in range(3):
+        pts = rng.integers([4, 4], [59, 40], size=(5, 2)).astype(np.int32)
+        shade = int(rng.integers(150, 256))
+        cv2.fillPoly(img, [pts], (shade, shade, shade))
+    return img
+
+
+@pytest.fixture(scope='module')
+def references():
+    return {
+        f"{rarity} Weapon {seed}": _icon(seed, bg)
+        for seed in range(25) for rarity, bg in RARITY_BACKGROUNDS.items()
+    }
+
+
+@pytest.fixture
+def index(references):
+    idx = SlotIndex()
+    idx.build(references)
+    return idx
+
+
+def test_hash_is_stable_under_noise(references):
+    img = references['Rare Weapon 3']
+    noisy = np.clip(img.astype(np.int16) + 5, 0, 255).astype(np.uint8)
+    flips = np.unpackbits(perceptual_hash(img) ^ perceptual_hash(noisy)).sum()
+    assert flips <= 4
+
+
+def test_hash_leaves_out_dc_term(references):
+    for img in list(references.values())[:20]:
+        phash = perceptual_hash(img)
+        assert phash.shape == (8,)
+        assert np.unpackbits(phash)[-1] == 0  # padding after the 63 AC bits
+
+
+def test_lookup_finds_reference_and_rarity(index, references):
+    for name in ('Common Weapon 0', 'Epic Weapon 0', 'Legendary Weapon 17'):
+        found, score = index.lookup(references[name])
+        assert found == name
+        assert score == 1.0
+
+
+def test_lookup_score_is_the_pixel_diff(index, references):
+    probe = references['Rare Weapon 9'].copy()
+    probe[:10] = 0
+    found, score = index.lookup(probe)
+    assert found == 'Rare Weapon 9'
+    assert score == pytest.approx(pixel_match(probe, references['Rare Weapon 9']))
+
+
+def test_empty_and_replace():
+    idx = SlotIndex()
+    assert idx.lookup(np.zeros(SLOT + (3,), dtype=np.uint8)) == (None, 0)
+    idx.add('a', _icon(1, (0, 0, 0)))
+    idx.add('a', _icon(2, (0, 0, 0)))
+    assert len(idx) == 1
+    assert idx.lookup(_icon(2, (0, 0, 0)))[1] == 1.0
+
+
+def test_evaluate_reports_accuracy(index):
+    report = index.evaluate()
+    assert report['references'] == 100
+    assert report['accuracy'] == 1.0
+    assert report['agreement'] == 1.0
+
+
+def test_lookup_verifies_only_the_shortlist(references):
+    calls = [0]
+
+    def counted(a, b):
+        calls[0] += 1
+        return pixel_match(a, b)
+
+    idx = SlotIndex(verify=counted, shortlist=5)
+    idx.build(references)
+    probe = references['Rare Weapon 3']
+    idx.lookup(probe)
+    assert calls[0] == 5
+    calls[0] = 0
+    idx.scan(probe)
+    assert calls[0] == len(references)
+
+
+@pytest.mark.benchmark
+def test_evaluate_latency(index):
+    report = index.evaluate()
+    assert report['index_ms'] < report['scan_ms'], report
+    stats = index.stats()
+    assert stats['references'] == 100
+    assert stats['avg_verified'] == 5
+    assert stats['fingerprint_bytes'] == 100 * (8 + 64 * 4)
@@ -0,0 +1,138 @@
+"""Tests for lib/detection/storm_mask.py — incremental storm mask."""
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection.storm_mask import IncrementalStormMask, compute_storm_mask
+
+
+SIZE = (250, 250)  # h, w of PPI_CAPTURE_REGION
+
+
+def _reference(seed=1):
+    rng = np.random.default_rng(seed)
+    ref = rng.integers(40, 160, (SIZE[0] // 8, SIZE[1] // 8, 3), dtype=np.uint8)
+    return cv2.resize(ref, (SIZE[1], SIZE[0]), interpolation=cv2.INTER_LINEAR)
+
+
+def _with_storm(ref, center, radius):
+    """Tint everything outside the safe circle purple, like the overlay."""
+    live = ref.astype(np.int16)
+    yy, xx = np.mgrid[:SIZE[0], :SIZE[1]]
+    outside = (xx - center[0]) ** 2 + (yy - center[1]) ** 2 > radius ** 2
+    live[outside, 0] += 80
+    live[outside, 2] += 80
+    live[outside, 1] -= 20
+    return np.clip(live, 0, 255).astype(np.uint8)
+
+
+def _blip(frame, x, y, size=6):
+    """A small HUD element (ping marker) drawn on the minimap."""
+    frame = frame.copy()
+    frame[y:y + size, x:x + size] = (250, 250, 40)
+    return frame
+
+
+class TestIncrementalStormMask:
+    def test_first_update_is_full(self):
+        ref = _reference()
+        live = _with_storm(ref, (125, 125), 115)
+        inc = IncrementalStormMask()
+        mask, changed = inc.update(live, ref, ref_key='a')
+        assert changed
+        assert inc.last_fraction == 1.0
+        assert np.array_equal(mask, compute_storm_mask(live, ref))
+
+    def test_unchanged_frame_recomputes_nothing(self):
+        ref = _reference()
+        live = _with_storm(ref, (125, 125), 115)
+        inc = IncrementalStormMask()
+        first, _ = inc.update(live, ref, ref_key='a')
+        first = first.copy()
+        mask, changed = inc.update(live.copy(), ref, ref_key='a')
+        assert not changed
+        assert inc.last_fraction == 0.0
+        assert np.array_equal(mask, first)
+
+    @pytest.mark.parametrize('x,y', [(5, 5), (120, 110), (240, 240), (90, 244)])
+    def test_local_change_matches_full_recompute(self, x, y):
+        ref = _reference()
+        live = _with_storm(ref, (125, 125), 115)
+        inc = IncrementalStormMask()
+        inc.update(live, ref, ref_key='a')
+        live2 = _blip(live, x, y)
+        mask, changed = inc.update(live2, ref, ref_key='a')
+        assert changed
+        assert 0.0 < inc.last_fraction < 0.1
+        assert np.array_equal(mask, compute_storm_mask(live2, ref))
+
+    def test_shrinking_storm_touches_only_boundary_tiles(self):
+        ref = _reference()
+        inc = IncrementalStormMask()
+        inc.update(_with_storm(ref, (125, 125), 115), ref, ref_key='a')
+        live = _with_storm(ref, (125, 125), 111)
+        mask, _ = inc.update(live, ref, ref_key='a')
+        assert inc.last_fraction < IncrementalStormMask.FULL_RECOMPUTE_FRACTION
+        assert np.array_equal(mask, compute_storm_mask(live, ref))
+
+    def test_new_reference_forces_comparison(self):
+        ref = _reference()
+        live = _with_storm(ref, (125, 125), 115)
+        inc = IncrementalStormMask()
+        inc.update(live, ref, ref_key='a')
+        other = _reference(seed=2)
+        mask, changed = inc.update(live, other, ref_key='b')
+        assert changed
+        assert inc.full_recomputes == 2
+        assert np.array_equal(mask, compute_storm_mask(live, other))
+
+    def test_stats(self):
+        ref = _reference()
+        live = _with_storm(ref, (125, 125), 115)
+        inc = IncrementalStormMask()
+        inc.update(live, ref, ref_key='a')
+        inc.update(live, ref, ref_key='a')
+        stats = inc.get_stats()
+        assert stats['updates'] == 2
+        assert stats['full_recomputes'] == 1
+        assert stats['avg_fraction'] == pytest.approx(0.5)
+
+
+class TestStormMaskWork:
+    def test_blips_recompute_few_tiles(self):
+        ref = _reference()
+        live = _with_storm(ref, (125, 125), 115)
+        inc = IncrementalStormMask()
+        inc.update(live, ref, ref_key='a')
+        for i in range(6):
+            inc.update(_blip(live, 20 + 30 * i, 40), ref, ref_key='a')
+            assert inc.last_fraction < 0.1
+
+
+@pytest.mark.benchmark
+class TestStormMaskBenchmark:
+    def test_steady_state_cheaper_than_full(self):
+        """Cycle with one HUD blip vs a full-frame recompute."""
+        ref = _reference()
+        live = _with_storm(ref, (125, 125), 115)
+        inc = IncrementalStormMask()
+        inc.update(live, ref, ref_key='a')
+        frames = [_blip(live, 20 + 30 * i, 40) for i in range(6)]
+
+        incremental, full = [], []
+        for _ in range(5):
+            start = time.perf_counter()
+            for frame in frames:
+                inc.update(frame, ref, ref_key='a')
+            incremental.append((time.perf_counter() - start) / len(frames))
+
+            start = time.perf_counter()
+            for frame in frames:
+                compute_storm_mask(frame, ref)
+            full.append((time.perf_counter() - start) / len(frames))
+        incremental, full = min(incremental), min(full)
+
+        assert incremental < full, \
+            f"full {full * 1000:.2f} ms/cycle, incremental {incremental * 1000:.2f} ms/cycle"
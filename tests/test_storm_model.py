@@ -0,0 +1,172 @@
+"""Tests for lib/detection/storm_model.py — storm circle fit and predictor."""
+import math
+
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection.storm_mask import compute_storm_mask
+from lib.detection.storm_model import (
+    StormCircle, StormPredictor, fit_circle, fit_storm_circle,
+)
+
+
+SIZE = (250, 250)  # h, w of PPI_CAPTURE_REGION
+
+
+def _reference(seed=1):
+    rng = np.random.default_rng(seed)
+    ref = rng.integers(40, 160, (SIZE[0] // 8, SIZE[1] // 8, 3), dtype=np.uint8)
+    return cv2.resize(ref, (SIZE[1], SIZE[0]), interpolation=cv2.INTER_LINEAR)
+
+
+def _storm_mask(center, radius, blips=()):
+    """Mask the monitor would compute for a safe circle at ``center``."""
+    ref = _reference()
+    live = ref.astype(np.int16)
+    yy, xx = np.mgrid[:SIZE[0], :SIZE[1]]
+    outside = (xx - center[0]) ** 2 + (yy - center[1]) ** 2 > radius ** 2
+    live[outside, 0] += 80
+    live[outside, 2] += 80
+    live[outside, 1] -= 20
+    for x, y in blips:
+        live[y:y + 6, x:x + 6] = (250, 250, 40)
+    return compute_storm_mask(np.clip(live, 0, 255).astype(np.uint8), ref)
+
+
+class TestCircleFit:
+    def test_fit_circle_exact_points(self):
+        angles = np.linspace(0, 2 * np.pi, 50, endpoint=False)
+        pts = np.column_stack((30 + 12 * np.cos(angles), -4 + 12 * np.sin(angles)))
+        circle = fit_circle(pts)
+        assert circle.center_x == pytest.approx(30)
+        assert circle.center_y == pytest.approx(-4)
+        assert circle.radius == pytest.approx(12)
+        assert circle.residual == pytest.approx(0, abs=1e-6)
+
+    def test_fit_circle_trims_outliers(self):
+        angles = np.linspace(0, np.pi, 60)
+        pts = np.column_stack((100 * np.cos(angles), 100 * np.sin(angles)))
+        pts = np.vstack((pts, [[0, 0], [5, 3], [-8, 2]]))
+        circle = fit_circle(pts)
+        assert circle.radius == pytest.approx(100, abs=0.5)
+
+    def test_too_few_points(self):
+        assert fit_circle(np.array([[0, 0], [1, 1]])) is None
+
+    @pytest.mark.parametrize('center,radius', [
+        ((125, 125), 110),   # whole circle in frame
+        ((140, 90), 70),     # small zone off-center
+        ((125, 400), 240),   # center below the minimap, arc only
+        ((-150, 125), 260),  # center left of the minimap
+    ])
+    def test_fits_drawn_storm(self, center, radius):
+        circle = fit_storm_circle(_storm_mask(center, radius))
+        assert circle is not None
+        # A short arc pins the edge down better than the center: allow the
+        # center/radius to slide by 1%, but the edge distance seen from the
+        # player (minimap center) must be within a pixel.
+        tolerance = max(1.5, radius * 0.01)
+        assert circle.center_x == pytest.approx(center[0], abs=tolerance)
+        assert circle.center_y == pytest.approx(center[1], abs=tolerance)
+        assert circle.radius == pytest.approx(radius, abs=tolerance)
+        _, distance, _ = circle.nearest_edge((125, 125))
+        _, true_distance, _ = StormCircle(center[0], center[1], radius).nearest_edge((125, 125))
+        assert distance == pytest.approx(true_distance, abs=1.0)
+
+    def test_hud_blips_do_not_move_fit(self):
+        mask = _storm_mask((125, 125), 100, blips=[(120, 120), (60, 200), (200, 40)])
+        circle = fit_storm_circle(mask)
+        assert circle.center_x == pytest.approx(125, abs=1.5)
+        assert circle.radius == pytest.approx(100, abs=1.5)
+
+    def test_no_storm(self):
+        assert fit_storm_circle(np.zeros(SIZE, np.uint8)) is None
+
+    def test_inverted_mask_rejected(self):
+        """Storm inside a circle is not a safe zone."""
+        mask = np.zeros(SIZE, np.uint8)
+        cv2.circle(mask, (125, 125), 80, 255, -1)
+        assert fit_storm_circle(mask) is None
+
+
+class TestNearestEdge:
+    def test_inside(self):
+        edge, distance, inside = StormCircle(0, 0, 100).nearest_edge((60, 0))
+        assert edge == (100, 0)
+        assert distance == pytest.approx(40)
+        assert inside
+
+    def test_outside(self):
+        edge, distance, inside = StormCircle(0, 0, 100).nearest_edge((0, -130))
+        assert edge == (0, -100)
+        assert distance == pytest.approx(30)
+        assert not inside
+
+    def test_center(self):
+        edge, distance, inside = StormCircle(10, 10, 50).nearest_edge((10, 10))
+        assert distance == pytest.approx(50)
+        assert math.hypot(edge[0] - 10, edge[1] - 10) == pytest.approx(50)
+        assert inside
+
+
+class TestStormPredictor:
+    def _predictor(self, step):
+        state = {'step': step}
+        return StormPredictor(storm_step=lambda: state['step']), state
+
+    def test_needs_first_fit(self):
+        predictor, _ = self._predictor(None)
+        assert predictor.needs_fit(0.0)
+        assert predictor.predict(0.0) is None
+
+    def test_holding_is_static(self):
+        predictor, _ = self._predictor('StormHolding')
+        predictor.add_fit(StormCircle(0, 0, 100), 0.0)
+        predictor.add_fit(StormCircle(0, 0, 98), 5.0)
+        assert predictor.rates() == (0.0, 0.0, 0.0)
+        assert predictor.predict(12.0).radius == 98
+        assert not predictor.needs_fit(5.0 + StormPredictor.REFIT_HOLDING - 1)
+        assert predictor.needs_fit(5.0 + StormPredictor.REFIT_HOLDING)
+
+    def test_shrinking_extrapolates(self):
+        predictor, _ = self._predictor('StormShrinking')
+        for t in range(4):
+            predictor.add_fit(StormCircle(100 + t, 50, 200 - 2 * t), float(t))
+        dcx, dcy, dr = predictor.rates()
+        assert dcx == pytest.approx(1.0)
+        assert dcy == pytest.approx(0.0)
+        assert dr == pytest.approx(-2.0)
+        circle = predictor.predict(8.0)
+        assert circle.center_x == pytest.approx(108)
+        assert circle.radius == pytest.approx(184)
+
+    def test_growth_is_noise(self):
+        predictor, _ = self._predictor('StormShrinking')
+        predictor.add_fit(StormCircle(0, 0, 100), 0.0)
+        predictor.add_fit(StormCircle(0, 0, 101), 3.0)
+        assert predictor.rates() == (0.0, 0.0, 0.0)
+
+    def test_step_change_drops_history_and_refits(self):
+        predictor, state = self._predictor('StormHolding')
+        predictor.add_fit(StormCircle(0, 0, 100), 0.0)
+        state['step'] = 'StormShrinking'
+        assert predictor.needs_fit(1.0)
+        predictor.add_fit(StormCircle(0, 0, 100), 1.0)
+        predictor.add_fit(StormCircle(0, 0, 94), 4.0)
+        assert predictor.rates()[2] == pytest.approx(-2.0)
+
+    def test_stale_model_expires(self):
+        predictor, _ = self._predictor(None)
+        predictor.add_fit(StormCircle(0, 0, 100), 0.0)
+        assert predictor.predict(StormPredictor.MAX_AGE + 1) is None
+
+    def test_tracks_drawn_shrink(self):
+        """Fits from rendered frames predict a later frame's circle."""
+        predictor, _ = self._predictor('StormShrinking')
+        for t, radius in enumerate((120, 116, 112)):
+            predictor.add_fit(fit_storm_circle(_storm_mask((125, 125), radius)), float(t))
+        predicted = predictor.predict(5.0)
+        actual = fit_storm_circle(_storm_mask((125, 125), 100))
+        assert predicted.radius == pytest.approx(actual.radius, abs=1.5)
+        assert predicted.center_x == pytest.approx(actual.center_x, abs=1.5)
@@ -0,0 +1,243 @@
+"""Tests for lib/detection/template_bank.py — batched dynamic-object matching."""
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from lib.detection.template_bank import TemplateBank
+
+
+SCALES = (0.8, 0.9, 1.0)
+
+
+def _make_icon(seed, size=24):
+    """Distinct blocky icon so TM_CCOEFF_NORMED has structure to lock onto."""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, (4, 4, 3), dtype=np.uint8)
+    return cv2.resize(blocks, (size, size), interpolation=cv2.INTER_NEAREST)
+
+
+def _make_minimap(icons, positions, size=(300, 300), seed=99):
+    """Smooth noisy background with each icon pasted at its top-left position."""
+    rng = np.random.default_rng(seed)
+    screen = rng.integers(60, 120, (size[1], size[0], 3), dtype=np.uint8)
+    screen = cv2.GaussianBlur(screen, (9, 9), 0)
+    for icon, (x, y) in zip(icons, positions):
+        h, w = icon.shape[:2]
+        screen[y:y + h, x:x + w] = icon
+    return screen
+
+
+def _legacy_match(screen, template, threshold=0.76):
+    """The pre-bank per-call resize loop, kept as the benchmark baseline."""
+    best = None
+    th, tw = template.shape[:2]
+    for scale in SCALES:
+        sw, sh = int(tw * scale), int(th * scale)
+        scaled = cv2.resize(template, (sw, sh), interpolation=cv2.INTER_AREA) if scale != 1.0 else template
+        result = cv2.matchTemplate(screen, scaled, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if best is None or max_val > best[2]:
+            best = (max_loc[0] + sw // 2, max_loc[1] + sh // 2, max_val, scale)
+    return best if best and best[2] >= threshold else None
+
+
+@pytest.fixture
+def icon_set():
+    icons = [_make_icon(i) for i in range(12)]
+    positions = [(20 + (i % 4) * 70, 20 + (i // 4) * 90) for i in range(8)]
+    screen = _make_minimap(icons[:8], positions)
+    bank = TemplateBank(SCALES)
+    for i, icon in enumerate(icons):
+        bank.add(f"icon_{i}", icon)
+    yield bank, icons, positions, screen
+    bank.close()
+
+
+class TestTemplateBank:
+    def test_templates_are_prescaled_once(self, icon_set):
+        bank, icons, _, _ = icon_set
+        assert len(bank) == len(icons)
+        assert bank.nbytes > 0
+        entries = bank._entries["icon_0"]
+        assert [e.scale for e in entries] == list(SCALES)
+        assert entries[0].image.shape[:2] == (19, 19)
+        assert all(e.image.flags['C_CONTIGUOUS'] for e in entries)
+
+    def test_finds_every_planted_icon_in_one_pass(self, icon_set):
+        bank, icons, positions, screen = icon_set
+        hits = {hit.name: hit for hit in bank.match_all(screen)}
+        for i, (x, y) in enumerate(positions):
+            hit = hits[f"icon_{i}"]
+            assert hit.scale == 1.0
+            assert (hit.center_x, hit.center_y) == (x + 12, y + 12)
+            assert hit.confidence > 0.99
+        # Icons that aren't on screen stay below threshold.
+        assert not any(f"icon_{i}" in hits for i in range(8, 12))
+
+    def test_matches_legacy_results(self, icon_set):
+        bank, icons, _, screen = icon_set
+        hits = {hit.name: hit for hit in bank.match_all(screen)}
+        for i, icon in enumerate(icons):
+            legacy = _legacy_match(screen, icon)
+            hit = hits.get(f"icon_{i}")
+            if legacy is None:
+                assert hit is None
+            else:
+                assert (hit.center_x, hit.center_y, hit.scale) == (legacy[0], legacy[1], legacy[3])
+                assert hit.confidence == pytest.approx(legacy[2], abs=1e-5)
+
+    def test_serial_and_parallel_agree(self, icon_set):
+        bank, _, _, screen = icon_set
+        serial = sorted(bank.match_all(screen, parallel=False))
+        parallel = sorted(bank.match_all(screen, parallel=True))
+        assert serial == parallel
+
+    def test_name_filter_and_bgra_screen(self, icon_set):
+        bank, _, _, screen = icon_set
+        bgra = cv2.cvtColor(screen, cv2.COLOR_BGR2BGRA)
+        hits = bank.match_all(bgra, ["icon_2", "missing"])
+        assert [hit.name for hit in hits] == ["icon_2"]
+
+    def test_template_larger_than_screen_is_skipped(self):
+        bank = TemplateBank(SCALES)
+        bank.add("big", _make_icon(1, size=64))
+        assert bank.match_all(np.zeros((32, 32, 3), dtype=np.uint8)) == []
+
+
+class TestPyramidSearch:
+    def test_finds_multiple_instances_of_one_icon(self):
+        icon = _make_icon(3)
+        positions = [(30, 40), (150, 60), (220, 220)]
+        screen = _make_minimap([icon] * 3, positions)
+        bank = TemplateBank(SCALES)
+        bank.add("chest", icon)
+        hits = bank.match_instances(screen, top_k=5, parallel=False)
+        centers = sorted((h.center_x, h.center_y) for h in hits)
+        assert centers == sorted((x + 12, y + 12) for x, y in positions)
+        assert all(h.name == "chest" and h.confidence > 0.99 for h in hits)
+        # The single-best pass can only ever report one of them.
+        assert len(bank.match_all(screen)) == 1
+
+    def test_top_k_limits_instances(self):
+        icon = _make_icon(4)
+        positions = [(20 + 60 * i, 20) for i in range(4)]
+        screen = _make_minimap([icon] * 4, positions)
+        bank = TemplateBank(SCALES)
+        bank.add("ammo", icon)
+        assert len(bank.match_instances(screen, top_k=2)) == 2
+
+    def test_agrees_with_exhaustive_best_hit(self, icon_set):
+        bank, _, positions, screen = icon_set
+        exhaustive = {h.name: h for h in bank.match_all(screen)}
+        pyramid = {h.name: h for h in bank.match_instances(screen, top_k=1)}
+        assert pyramid.keys() == exhaustive.keys()
+        for name, hit in exhaustive.items():
+            assert (pyramid[name].center_x, pyramid[name].center_y) == (hit.center_x, hit.center_y)
+
+    def test_small_templates_fall_back_to_full_resolution(self):
+        icon = _make_icon(5, size=12)
+        screen = _make_minimap([icon, icon], [(40, 40), (200, 100)])
+        bank = TemplateBank(SCALES)
+        bank.add("tiny", icon)
+        assert all(e.coarse is None for e in bank._entries["tiny"])
+        assert len(bank.match_instances(screen)) == 2
+
+
+class _MatchCounter:
+    """Wraps ``cv2.matchTemplate`` / ``cv2.resize`` to count the work done:
+    calls, and correlation cost as result pixels times template pixels."""
+
+    def __init__(self, monkeypatch):
+        self.matches = 0
+        self.resizes = 0
+        self.cost = 0
+        match, resize = cv2.matchTemplate, cv2.resize
+
+        def counted_match(image, templ, method, *args, **kwargs):
+            result = match(image, templ, method, *args, **kwargs)
+            self.matches += 1
+            self.cost += result.size * templ.shape[0] * templ.shape[1]
+            return result
+
+        def counted_resize(*args, **kwargs):
+            self.resizes += 1
+            return resize(*args, **kwargs)
+
+        monkeypatch.setattr(cv2, 'matchTemplate', counted_match)
+        monkeypatch.setattr(cv2, 'resize', counted_resize)
+
+    def reset(self):
+        self.matches = self.resizes = self.cost = 0
+
+
+class TestTemplateBankWork:
+    def test_bank_does_no_per_call_resizes(self, icon_set, monkeypatch):
+        bank, icons, _, screen = icon_set
+        counter = _MatchCounter(monkeypatch)
+        for icon in icons:
+            _legacy_match(screen, icon)
+        legacy = (counter.matches, counter.resizes)
+
+        counter.reset()
+        bank.match_all(screen, parallel=False)
+        assert counter.resizes == 0
+        assert counter.matches <= legacy[0]
+        assert legacy[1] == len(icons) * (len(SCALES) - 1)
+
+    def test_pyramid_correlates_fewer_pixels(self, icon_set, monkeypatch):
+        bank, _, _, screen = icon_set
+        counter = _MatchCounter(monkeypatch)
+        bank.match_all(screen, parallel=False)
+        full = counter.cost
+
+        counter.reset()
+        bank.match_instances(screen, parallel=False)
+        assert counter.cost < full * 0.25
+
+
+@pytest.mark.benchmark
+class TestTemplateBankBenchmark:
+    def test_bank_not_slower_than_per_call_resize(self, icon_set):
+        """Whole-set detection on a minimap-sized frame, bank vs legacy loop.
+
+        Best-of-N per-frame timings; the bank skips the per-call resizes and
+        fans out over spare cores, so it must never lose to the old loop.
+        """
+        bank, icons, _, screen = icon_set
+        rounds = 3
+
+        legacy = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for icon in icons:
+                _legacy_match(screen, icon)
+            legacy.append(time.perf_counter() - start)
+
+        bank.match_all(screen)  # warm the pool
+        batched = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            bank.match_all(screen)
+            batched.append(time.perf_counter() - start)
+
+        assert min(batched) <= min(legacy) * 1.1, \
+            f"bank {min(batched):.4f}s vs legacy {min(legacy):.4f}s"
+
+    def test_pyramid_cheaper_than_full_resolution(self, icon_set):
+        """Coarse-to-fine pass vs exhaustive full-resolution pass."""
+        bank, _, _, screen = icon_set
+        rounds = 3
+
+        full, pyramid = [], []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            bank.match_all(screen, parallel=False)
+            full.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            bank.match_instances(screen, parallel=False)
+            pyramid.append(time.perf_counter() - start)
+
+        assert min(pyramid) < min(full) * 0.75, \
+            f"pyramid {min(pyramid):.4f}s vs full-res {min(full):.4f}s"